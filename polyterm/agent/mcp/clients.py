@@ -0,0 +1,275 @@
+"""Server-scoped API clients and response cache for agent tools.
+
+Agent tools are plain functions that can run from the CLI, tests, or a
+long-running server. Called on their own they build a fresh client and
+close it when done. Inside ``server.main()`` or the FastMCP server a
+``ClientRegistry`` is active instead, and tools get long-lived clients that:
+
+- mount the process-wide HTTP pool, so TLS sessions to Gamma, CLOB and the
+  Data API stay warm between calls;
+- answer read calls from a TTL cache keyed by client, method and arguments,
+  so ``market.top`` -> ``market.resolve`` -> ``market.orderbook`` on the same
+  market reuse upstream responses;
+- coalesce concurrent identical calls, so parallel agent requests (or the
+  fan-out inside ``market.flips``) share one upstream fetch.
+
+Tools use the same two lines in both modes::
+
+    gamma = acquire(GammaClient)
+    try:
+        ...
+    finally:
+        release(gamma)
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ...api.http_pool import disable_shared_pool, enable_shared_pool
+
+# Seconds a cached response stays fresh, per client method. Methods not
+# listed here always go upstream.
+CACHE_TTLS: Dict[str, Dict[str, float]] = {
+    "GammaClient": {
+        "get_market": 30.0,
+        "get_markets": 15.0,
+        "search_markets": 30.0,
+        "get_trending_markets": 15.0,
+        "get_market_prices": 5.0,
+        "get_resolution": 60.0,
+    },
+    "CLOBClient": {
+        "get_order_book": 2.0,
+        "get_price_history": 60.0,
+        "get_price": 2.0,
+        "get_spread": 2.0,
+        "get_last_trade_price": 2.0,
+        "get_fee_rate": 300.0,
+    },
+    "DataAPIClient": {
+        "get_trades": 5.0,
+        "get_recent_trades": 5.0,
+        "get_positions": 15.0,
+        "get_activity": 15.0,
+        "get_closed_positions": 60.0,
+        "get_leaderboard": 60.0,
+        "get_holders": 30.0,
+        "get_value": 15.0,
+    },
+}
+
+# Upper bound on cached responses before expired entries are swept
+MAX_CACHE_ENTRIES = 2048
+
+
+class _Pending:
+    """An upstream fetch other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """Thread-safe TTL cache with request coalescing"""
+
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, _Pending] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any], ttl: float) -> Any:
+        """Return a fresh cached value for ``key`` or fetch it once.
+
+        Concurrent callers for the same missing key wait for the first
+        caller's fetch. Errors are raised to every waiter and never cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self.hits += 1
+                return entry[1]
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = _Pending()
+                owner = True
+                self.misses += 1
+            else:
+                owner = False
+                self.coalesced += 1
+
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = fetch()
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        else:
+            with self._lock:
+                if len(self._entries) >= self.max_entries:
+                    self._sweep()
+                self._entries[key] = (self._clock() + ttl, pending.value)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.done.set()
+        return pending.value
+
+    def _sweep(self) -> None:
+        now = self._clock()
+        expired = [key for key, (expires, _) in self._entries.items() if expires <= now]
+        for key in expired:
+            del self._entries[key]
+        if len(self._entries) >= self.max_entries:
+            # Still full of live entries: drop the ones expiring soonest.
+            ordered = sorted(self._entries, key=lambda key: self._entries[key][0])
+            for key in ordered[:len(ordered) // 2]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of call arguments for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class CachedClient:
+    """Proxy that serves a client's read methods through a ``ResponseCache``
+
+    Callers get deep copies, so a tool mutating a response cannot change
+    what the next tool sees.
+    """
+
+    def __init__(self, client: Any, cache: ResponseCache, ttls: Dict[str, float]):
+        self._client = client
+        self._cache = cache
+        self._ttls = ttls
+        self._name = type(client).__name__
+
+    @property
+    def client(self) -> Any:
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        ttl = self._ttls.get(name)
+        if ttl is None or not callable(attr):
+            return attr
+
+        def cached(*args: Any, **kwargs: Any) -> Any:
+            key = (self._name, name, _freeze(args), _freeze(kwargs))
+            value = self._cache.get_or_fetch(key, lambda: attr(*args, **kwargs), ttl)
+            return copy.deepcopy(value)
+
+        return cached
+
+
+class ClientRegistry:
+    """Long-lived API clients shared by every tool call in a server process"""
+
+    def __init__(self, cache: Optional[ResponseCache] = None, ttls: Optional[Dict[str, Dict[str, float]]] = None):
+        self.cache = cache or ResponseCache()
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+        self._lock = threading.Lock()
+        self._clients: Dict[Callable[[], Any], CachedClient] = {}
+        enable_shared_pool()
+
+    def get(self, factory: Callable[[], Any]) -> CachedClient:
+        """Return the registry's client for ``factory``, creating it once."""
+        with self._lock:
+            proxy = self._clients.get(factory)
+            if proxy is None:
+                client = factory()
+                ttls = self.ttls.get(type(client).__name__, {})
+                proxy = self._clients[factory] = CachedClient(client, self.cache, ttls)
+            return proxy
+
+    def owns(self, client: Any) -> bool:
+        with self._lock:
+            return any(proxy is client for proxy in self._clients.values())
+
+    def close(self) -> None:
+        with self._lock:
+            proxies, self._clients = list(self._clients.values()), {}
+        for proxy in proxies:
+            try:
+                proxy.client.close()
+            except Exception:
+                pass
+        self.cache.clear()
+        disable_shared_pool()
+
+
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def start_client_registry() -> ClientRegistry:
+    """Activate server-scoped clients (idempotent)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
+
+
+def stop_client_registry() -> None:
+    """Close server-scoped clients and drop cached responses."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
+
+
+def get_client_registry() -> Optional[ClientRegistry]:
+    return _registry
+
+
+def acquire(factory: Callable[[], Any]) -> Any:
+    """Client for one tool call: shared when a registry is active, else new."""
+    registry = _registry
+    if registry is not None:
+        return registry.get(factory)
+    return factory()
+
+
+def release(client: Any) -> None:
+    """Finish with a client from ``acquire``; only unshared clients close."""
+    registry = _registry
+    if registry is not None and registry.owns(client):
+        return
+    client.close()
@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional
 from ..contracts import envelope, error_envelope
 from ..registry import get_manifest
 from ..schemas import all_schemas, schema_for_tool
+from .clients import start_client_registry, stop_client_registry
 from .server import TOOL_HANDLERS
 
 try:  # pragma: no cover - exercised by CLI/integration tests when installed
@@ -152,6 +153,7 @@ def create_server() -> Any:
         active_only: bool = True,
         sample_size: int = 5000,
         rank_by: str = "largest_crossing_move",
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
         return _call_tool(
             "market.flips",
@@ -163,6 +165,7 @@ def create_server() -> Any:
             active_only=active_only,
             sample_size=sample_size,
             rank_by=rank_by,
+            max_workers=max_workers,
         )
 
     @mcp.tool(
@@ -333,7 +336,11 @@ def create_server() -> Any:
 def main(transport: str = "stdio", mount_path: Optional[str] = None) -> int:
     """Run PolyTerm's FastMCP server."""
     server = create_server()
-    server.run(transport=transport, mount_path=mount_path)
+    start_client_registry()
+    try:
+        server.run(transport=transport, mount_path=mount_path)
+    finally:
+        stop_client_registry()
     return 0
 
 
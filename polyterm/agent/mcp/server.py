@@ -11,6 +11,7 @@ from typing import Callable, Dict
 
 from ..contracts import envelope, error_envelope
 from ..registry import get_manifest
+from .clients import start_client_registry, stop_client_registry
 from .tools import alerts, analytics, answer, archive, flips, live, market, meta, scan, wallet, watch
 
 
@@ -64,16 +65,20 @@ def handle_request(request: dict) -> dict:
 
 def main() -> int:
     """Run a JSON-lines stdio server."""
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            request = json.loads(line)
-            response = handle_request(request)
-        except Exception as exc:
-            response = error_envelope(str(exc))
-        print(json.dumps(response, default=str), flush=True)
+    start_client_registry()
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+                response = handle_request(request)
+            except Exception as exc:
+                response = error_envelope(str(exc))
+            print(json.dumps(response, default=str), flush=True)
+    finally:
+        stop_client_registry()
     return 0
 
 
@@ -1,6 +1,7 @@
 """Analytics tools for agent adapters."""
 
 from ...contracts import envelope
+from ..clients import acquire, release
 from ....api.gamma import GammaClient
 from ....api.market_utils import market_probability_price
 from ....core.cross_venue import CrossVenueMonitor
@@ -18,16 +19,16 @@ def arbitrage(min_spread: float = 0.025, venues: str = "polymarket") -> dict:
 
 
 def thesis(market: str) -> dict:
-    gamma = GammaClient()
+    gamma = acquire(GammaClient)
     try:
         engine = TradeThesisEngine(gamma_client=gamma, database=Database())
         return envelope(engine.build(market), meta={"tool": "analytics.thesis"})
     finally:
-        gamma.close()
+        release(gamma)
 
 
 def risk(market: str) -> dict:
-    gamma = GammaClient()
+    gamma = acquire(GammaClient)
     try:
         try:
             market_data = gamma.get_market(market)
@@ -51,4 +52,4 @@ def risk(market: str) -> dict:
             meta={"tool": "analytics.risk"},
         )
     finally:
-        gamma.close()
+        release(gamma)
@@ -1,6 +1,7 @@
 """Natural-language answer tool for common agentic PolyTerm queries."""
 
 from ...contracts import envelope
+from ..clients import acquire, release
 from ....api.data_api import DataAPIClient
 from ....core.wallet_intelligence import WalletIntelligence
 from ....db.database import Database
@@ -44,7 +45,7 @@ def answer(query: str, hours: int = 48, limit: int = 3, min_notional: float = 10
             meta={"tool": "agent.answer"},
         )
 
-    data_api = DataAPIClient()
+    data_api = acquire(DataAPIClient)
     engine = WalletIntelligence(data_api=data_api, database=Database())
     try:
         whale_result = engine.whale_trades(
@@ -54,7 +55,7 @@ def answer(query: str, hours: int = 48, limit: int = 3, min_notional: float = 10
             sample_size=3000,
         )
     finally:
-        data_api.close()
+        release(data_api)
 
     trades = whale_result.get("trades", [])
     lines = []
@@ -1,14 +1,23 @@
 """CLOB-backed market flip detection for agent adapters."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...contracts import envelope
+from ..clients import acquire, release
 from ....api.clob import CLOBClient
 from ....api.gamma import GammaClient
 from ....api.market_utils import get_clob_token_ids, get_market_condition_id
 from ....utils.json_output import safe_float
 
+# Request rate is held by the shared CLOB limiter (``clob:history`` and
+# ``clob:book`` buckets in ``api/rate_limit.py``); the pool only bounds how
+# many lookups are in flight at once.
+DEFAULT_MAX_WORKERS = 8
+MAX_WORKERS_LIMIT = 16
+
 
 def market_flips(
     hours: int = 72,
@@ -19,18 +28,26 @@ def market_flips(
     active_only: bool = True,
     sample_size: int = 5000,
     rank_by: str = "largest_crossing_move",
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> dict:
-    """Return markets whose YES price crossed 50% in a CLOB history window."""
+    """Return markets whose YES price crossed 50% in a CLOB history window.
+
+    CLOB price history and order book lookups fan out over a bounded thread
+    pool; results are collected as they complete and ranked once the scan
+    finishes. Per-stage timings are reported in ``meta.timings_ms``.
+    """
+    started = time.perf_counter()
     safe_hours = max(int(hours), 1)
     safe_limit = min(max(int(limit), 1), 50)
     safe_sample_size = min(max(int(sample_size), safe_limit), 5000)
+    safe_workers = min(max(int(max_workers), 1), MAX_WORKERS_LIMIT)
     direction_filter = _normalize_direction(direction)
     rank_mode = _normalize_rank(rank_by)
     start_ts, end_ts = _build_time_bounds(safe_hours)
     interval, fidelity = _select_clob_granularity(safe_hours)
 
-    gamma = GammaClient()
-    clob = CLOBClient()
+    gamma = acquire(GammaClient)
+    clob = acquire(CLOBClient)
     scanned_markets = 0
     candidate_count = 0
     skipped = {
@@ -45,7 +62,9 @@ def market_flips(
             active=True if active_only else None,
             closed=False if active_only else None,
         )
-        flips = []
+        gamma_done = time.perf_counter()
+
+        candidates = []
         for market in markets if isinstance(markets, list) else []:
             scanned_markets += 1
             summary = _market_summary(market)
@@ -53,35 +72,29 @@ def market_flips(
                 continue
             candidate_count += 1
 
-            token_id = summary["clob_token_id"]
-            if not token_id:
+            if not summary["clob_token_id"]:
                 skipped["missing_clob_token_id"] += 1
                 continue
-
-            history = _price_history(clob, token_id, interval, fidelity, start_ts, end_ts)
-            if len(history) < 2:
-                skipped["missing_price_history"] += 1
-                continue
-
-            flip = _detect_flip(history, direction_filter)
-            if flip is None:
-                skipped["no_50_percent_crossing"] += 1
-                continue
-
-            orderbook = _orderbook_summary(clob, token_id)
-            flips.append({
-                **summary,
-                **flip,
-                **orderbook,
-                "hours": safe_hours,
-                "history_points": len(history),
-                "window_start": start_ts,
-                "window_start_iso": _timestamp_iso(start_ts),
-                "window_end": end_ts,
-                "window_end_iso": _timestamp_iso(end_ts),
-                "quality_flags": _quality_flags(history, orderbook, summary),
-            })
-
+            candidates.append(summary)
+
+        scan_args = (clob, direction_filter, safe_hours, interval, fidelity, start_ts, end_ts)
+        results = []
+        with ThreadPoolExecutor(max_workers=safe_workers) as executor:
+            futures = {
+                executor.submit(_scan_market, summary, *scan_args): index
+                for index, summary in enumerate(candidates)
+            }
+            for future in as_completed(futures):
+                outcome, row = future.result()
+                if outcome != "flip":
+                    skipped[outcome] += 1
+                    continue
+                results.append((futures[future], row))
+        clob_done = time.perf_counter()
+
+        # Restore candidate order first so ties rank the same as a serial scan.
+        results.sort(key=lambda item: item[0])
+        flips = [row for _, row in results]
         flips.sort(key=_rank_key(rank_mode), reverse=rank_mode != "near_50_after_flip")
         rows = [{**row, "rank": index + 1} for index, row in enumerate(flips[:safe_limit])]
         return envelope(
@@ -111,11 +124,55 @@ def market_flips(
                     "crossing_detected_at_50_percent",
                 ],
             },
-            meta={"tool": "market.flips"},
+            meta={
+                "tool": "market.flips",
+                "max_workers": safe_workers,
+                "timings_ms": {
+                    "gamma_markets": _elapsed_ms(started, gamma_done),
+                    "clob_fanout": _elapsed_ms(gamma_done, clob_done),
+                    "rank": _elapsed_ms(clob_done, time.perf_counter()),
+                    "total": _elapsed_ms(started, time.perf_counter()),
+                },
+            },
         )
     finally:
-        gamma.close()
-        clob.close()
+        release(gamma)
+        release(clob)
+
+
+def _scan_market(
+    summary: Dict[str, Any],
+    clob: CLOBClient,
+    direction: str,
+    hours: int,
+    interval: str,
+    fidelity: int,
+    start_ts: int,
+    end_ts: int,
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Fetch history for one candidate and return ``(outcome, flip_row)``."""
+    token_id = summary["clob_token_id"]
+    history = _price_history(clob, token_id, interval, fidelity, start_ts, end_ts)
+    if len(history) < 2:
+        return "missing_price_history", None
+
+    flip = _detect_flip(history, direction)
+    if flip is None:
+        return "no_50_percent_crossing", None
+
+    orderbook = _orderbook_summary(clob, token_id)
+    return "flip", {
+        **summary,
+        **flip,
+        **orderbook,
+        "hours": hours,
+        "history_points": len(history),
+        "window_start": start_ts,
+        "window_start_iso": _timestamp_iso(start_ts),
+        "window_end": end_ts,
+        "window_end_iso": _timestamp_iso(end_ts),
+        "quality_flags": _quality_flags(history, orderbook, summary),
+    }
 
 
 def _market_summary(market: Dict[str, Any]) -> Dict[str, Any]:
@@ -344,6 +401,10 @@ def _book_price(row: Dict[str, Any]) -> Optional[float]:
         return None
 
 
+def _elapsed_ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 1)
+
+
 def _timestamp_iso(timestamp: int) -> str:
     if not timestamp:
         return ""
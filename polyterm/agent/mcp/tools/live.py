@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional
 
 from ...contracts import envelope
+from ..clients import acquire, release
 from ....api.data_api import DataAPIClient
 from ....api.gamma import GammaClient
 from ....api.market_utils import (
@@ -14,12 +15,13 @@ from ....api.market_utils import (
     market_probability_price,
     parse_list_field,
 )
+from ....api.trade_tape import MAX_ROWS, PAGE_SIZE, tape_for
 from ....utils.json_output import safe_float
 
 
 def top_markets(limit: int = 3, sort: str = "volume24h") -> dict:
     """Return top active markets from live Gamma market data."""
-    gamma = GammaClient()
+    gamma = acquire(GammaClient)
     try:
         markets = gamma.get_trending_markets(limit=max(limit, 1) * 3)
         normalized = [_market_summary(m) for m in markets]
@@ -36,7 +38,7 @@ def top_markets(limit: int = 3, sort: str = "volume24h") -> dict:
             meta={"tool": "market.top"},
         )
     finally:
-        gamma.close()
+        release(gamma)
 
 
 def whale_trades(
@@ -46,19 +48,28 @@ def whale_trades(
     sample_size: int = 1000,
 ) -> dict:
     """Return top public trade rows by notional value over a recent window."""
-    data_api = DataAPIClient()
+    data_api = acquire(DataAPIClient)
     cutoff = int(time.time() - max(hours, 1) * 3600)
     try:
-        trades = data_api.get_trades(limit=min(max(sample_size, limit), 10000))
+        sample = min(max(sample_size, limit), MAX_ROWS)
+        page_size = min(sample, PAGE_SIZE)
+        tape = tape_for(data_api).read(
+            cutoff,
+            min_notional=min_notional,
+            page_size=page_size,
+            max_offset=sample - page_size,
+        )
         rows = []
-        for trade in trades if isinstance(trades, list) else []:
+        for trade in tape.rows:
             normalized = _trade_summary(trade)
-            if normalized["timestamp"] < cutoff:
-                continue
             if normalized["notional"] < min_notional:
                 continue
             rows.append(normalized)
         rows.sort(key=lambda item: item["notional"], reverse=True)
+        quality_flags = ["live_data_api_trades", "notional=size_times_price", "public_trade_rows_only"]
+        if sample_size > MAX_ROWS:
+            # The tape is paged and the Data API stops at offset 3,000
+            quality_flags.append("sample_capped_at_tape_depth")
         return envelope(
             {
                 "hours": hours,
@@ -66,16 +77,12 @@ def whale_trades(
                 "sample_size": sample_size,
                 "count": min(len(rows), limit),
                 "trades": rows[:limit],
-                "quality_flags": [
-                    "live_data_api_trades",
-                    "notional=size_times_price",
-                    "public_trade_rows_only",
-                ],
+                "quality_flags": quality_flags,
             },
             meta={"tool": "wallet.whale_trades"},
         )
     finally:
-        data_api.close()
+        release(data_api)
 
 
 def top_traders(
@@ -85,7 +92,7 @@ def top_traders(
     candidate_count: int = 25,
 ) -> dict:
     """Return active traders with recent volume and closed-position win-rate evidence."""
-    data_api = DataAPIClient()
+    data_api = acquire(DataAPIClient)
     cutoff = int(time.time() - max(hours, 1) * 3600)
     try:
         candidates = _recent_trade_candidates(data_api, cutoff, max(candidate_count, limit))
@@ -124,7 +131,7 @@ def top_traders(
             meta={"tool": "trader.leaderboard"},
         )
     finally:
-        data_api.close()
+        release(data_api)
 
 
 def market_movers(
@@ -133,7 +140,7 @@ def market_movers(
     min_abs_change: float = 0.05,
 ) -> dict:
     """Return active markets with the largest available price moves."""
-    gamma = GammaClient()
+    gamma = acquire(GammaClient)
     try:
         markets = gamma.get_markets(limit=500, active=True, closed=False)
         movers = []
@@ -168,7 +175,7 @@ def market_movers(
             meta={"tool": "market.movers"},
         )
     finally:
-        gamma.close()
+        release(gamma)
 
 
 def _market_summary(market: Dict[str, Any]) -> Dict[str, Any]:
@@ -220,17 +227,17 @@ def _trade_summary(trade: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _recent_trade_candidates(data_api: DataAPIClient, cutoff: int, limit: int) -> List[Dict[str, Any]]:
-    trades = data_api.get_trades(limit=min(max(limit * 20, 100), 10000))
+    sample = min(max(limit * 20, 100), MAX_ROWS)
+    page_size = min(sample, PAGE_SIZE)
+    trades = tape_for(data_api).read(cutoff, page_size=page_size, max_offset=sample - page_size).rows
     grouped: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
         "address": "",
         "user_name": "",
         "recent_trades": 0,
         "recent_notional": 0.0,
     })
-    for trade in trades if isinstance(trades, list) else []:
+    for trade in trades:
         summary = _trade_summary(trade)
-        if summary["timestamp"] < cutoff:
-            continue
         address = summary["wallet"]
         if not address:
             continue
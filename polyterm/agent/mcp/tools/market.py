@@ -3,6 +3,7 @@
 from datetime import datetime, timezone
 
 from ...contracts import envelope
+from ..clients import acquire, release
 from ....api.clob import CLOBClient
 from ....api.gamma import GammaClient
 from ....api.market_utils import get_clob_token_ids, get_market_condition_id, market_probability_price
@@ -14,16 +15,16 @@ from ....utils.json_output import format_orderbook_json
 
 
 def search(query: str, limit: int = 10) -> dict:
-    gamma = GammaClient()
+    gamma = acquire(GammaClient)
     try:
         markets = gamma.search_markets(query, limit=limit)
         return envelope({"query": query, "count": len(markets), "markets": markets}, meta={"tool": "market.search"})
     finally:
-        gamma.close()
+        release(gamma)
 
 
 def resolve(identifier: str) -> dict:
-    gamma = GammaClient()
+    gamma = acquire(GammaClient)
     try:
         try:
             market = gamma.get_market(identifier)
@@ -45,11 +46,11 @@ def resolve(identifier: str) -> dict:
         }
         return envelope(data, meta={"tool": "market.resolve"})
     finally:
-        gamma.close()
+        release(gamma)
 
 
 def orderbook(token_id: str, depth: int = 20) -> dict:
-    clob = CLOBClient()
+    clob = acquire(CLOBClient)
     try:
         analyzer = OrderBookAnalyzer(clob)
         analysis = analyzer.analyze(token_id, depth=depth)
@@ -63,12 +64,12 @@ def orderbook(token_id: str, depth: int = 20) -> dict:
             meta={"tool": "market.orderbook"},
         )
     finally:
-        clob.close()
+        release(clob)
 
 
 def price_history(market: str, hours: int = 24) -> dict:
-    gamma = GammaClient()
-    clob = CLOBClient()
+    gamma = acquire(GammaClient)
+    clob = acquire(CLOBClient)
     try:
         selected = _resolve_market(gamma, market)
         token_ids = get_clob_token_ids(selected)
@@ -113,8 +114,8 @@ def price_history(market: str, hours: int = 24) -> dict:
             meta={"tool": "market.price_history"},
         )
     finally:
-        gamma.close()
-        clob.close()
+        release(gamma)
+        release(clob)
 
 
 def research(
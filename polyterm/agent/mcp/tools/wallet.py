@@ -1,22 +1,23 @@
 """Wallet tools for agent adapters."""
 
 from ...contracts import envelope
+from ..clients import acquire, release
 from ....api.data_api import DataAPIClient
 from ....core.wallet_intelligence import WalletIntelligence
 from ....db.database import Database
 
 
 def inspect(address: str, limit: int = 100) -> dict:
-    data_api = DataAPIClient()
+    data_api = acquire(DataAPIClient)
     engine = WalletIntelligence(data_api=data_api, database=Database())
     try:
         return envelope(engine.analyze_wallet(address, limit=limit), meta={"tool": "wallet.inspect"})
     finally:
-        data_api.close()
+        release(data_api)
 
 
 def whales(min_notional: float = 10000, hours: int = 24, limit: int = 20) -> dict:
-    data_api = DataAPIClient()
+    data_api = acquire(DataAPIClient)
     engine = WalletIntelligence(data_api=data_api, database=Database())
     try:
         return envelope(
@@ -24,11 +25,11 @@ def whales(min_notional: float = 10000, hours: int = 24, limit: int = 20) -> dic
             meta={"tool": "wallet.whales"},
         )
     finally:
-        data_api.close()
+        release(data_api)
 
 
 def whale_trades(limit: int = 3, hours: int = 48, min_notional: float = 10000, sample_size: int = 3000) -> dict:
-    data_api = DataAPIClient()
+    data_api = acquire(DataAPIClient)
     engine = WalletIntelligence(data_api=data_api, database=Database())
     try:
         return envelope(
@@ -41,7 +42,7 @@ def whale_trades(limit: int = 3, hours: int = 48, min_notional: float = 10000, s
             meta={"tool": "wallet.whale_trades"},
         )
     finally:
-        data_api.close()
+        release(data_api)
 
 
 def smart_money(min_win_rate: float = 0.70, min_trades: int = 10, limit: int = 20) -> dict:
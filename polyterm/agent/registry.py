@@ -127,6 +127,7 @@ TOOLS: List[AgentTool] = [
             "active_only": "boolean",
             "sample_size": "integer",
             "rank_by": "string",
+            "max_workers": "integer",
         },
         schema="docs/schemas/market.flips.schema.json",
         examples=[
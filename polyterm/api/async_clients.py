@@ -0,0 +1,334 @@
+"""Async clients for the Gamma, CLOB and Data APIs
+
+``GammaClient``, ``CLOBClient`` and ``DataAPIClient`` are blocking
+``requests`` clients, so an ``await``-ing monitor that calls them stalls its
+event loop (and any WebSocket consumer on it) for every request and every
+``time.sleep`` backoff. The clients here are their async twins: the same
+endpoints, parameters and return shapes, built on ``aiohttp``.
+
+All async clients on an event loop share one ``aiohttp.ClientSession``
+whose connector caps total and per-host connections, so polling hundreds
+of markets with ``asyncio.gather`` reuses a bounded set of keep-alive
+connections. Requests draw from the same token buckets as the sync
+clients (``rate_limit.py``); retries and rate-limit waits use
+``asyncio.sleep``.
+
+Each sync client has an ``async_client()`` method that returns its twin
+configured with the same base URL (and API key).
+"""
+
+import asyncio
+import weakref
+from typing import Any, Dict, List, Optional
+
+from .market_utils import looks_like_slug
+from .rate_limit import TokenBucketLimiter, get_rate_limiter
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Connection limits for the shared session
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 20
+REQUEST_TIMEOUT = 15
+
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _require_aiohttp() -> None:
+    if not HAS_AIOHTTP:
+        raise RuntimeError("The 'aiohttp' package is required for async API clients. Install with: pip install aiohttp")
+
+
+def shared_session() -> "aiohttp.ClientSession":
+    """Return the running loop's shared ``ClientSession``, creating it on demand."""
+    _require_aiohttp()
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_shared_session() -> None:
+    """Close the running loop's shared session (call before the loop ends)."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+class AsyncTransport:
+    """Retrying JSON requests over the shared session
+
+    Mirrors the sync clients' ``_request``: 429 responses back off
+    (honouring ``Retry-After``), 408 and 5xx responses, timeouts and
+    connection errors are retried with exponential backoff, and the last
+    failure is raised as an ``Exception`` naming the URL.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        service: str,
+        headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        _require_aiohttp()
+        self.base_url = base_url.rstrip("/")
+        self.service = service
+        self.headers = dict(headers or {})
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self._session = session
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        return self._session if self._session is not None else shared_session()
+
+    async def request_json(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        retries: int = 3,
+    ) -> Any:
+        url = f"{self.base_url}{endpoint}"
+        query = _query_params(params)
+
+        for attempt in range(retries):
+            await self.rate_limiter.acquire_async(self.service, endpoint)
+            try:
+                async with self.session.request(method, url, params=query, headers=self.headers) as response:
+                    if response.status == 429:
+                        wait = _retry_after(response, attempt)
+                        self.rate_limiter.penalize(self.service, endpoint, wait)
+                        await asyncio.sleep(wait)
+                        continue
+                    if (response.status == 408 or response.status >= 500) and attempt < retries - 1:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    if response.status >= 400:
+                        raise Exception(f"API request failed: {response.status} Client Error for url: {url}")
+                    return await response.json(content_type=None)
+            except asyncio.TimeoutError:
+                if attempt < retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                raise Exception(f"API request timed out after {retries} attempts: {url}")
+            except aiohttp.ClientConnectionError:
+                if attempt < retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                raise Exception(f"Connection failed after {retries} attempts: {url}")
+            except aiohttp.ClientError as e:
+                raise Exception(f"API request failed: {e}")
+
+        raise Exception(f"API request failed after {retries} attempts: {url}")
+
+
+def _query_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """aiohttp only accepts str/int/float query values; match requests' encoding."""
+    if not params:
+        return None
+    return {
+        key: str(value).lower() if isinstance(value, bool) else str(value)
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+def _retry_after(response: Any, attempt: int) -> float:
+    wait = min(2 ** attempt * 2, 30)
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            wait = min(int(retry_after), 60)
+        except (ValueError, TypeError):
+            pass  # Keep default exponential backoff
+    return wait
+
+
+class AsyncGammaClient:
+    """Async twin of ``GammaClient`` for polling market metadata
+
+    Always reads the live API; the ``MarketCatalog`` is a cold-start cache
+    for the sync client and is not consulted here.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://gamma-api.polymarket.com",
+        api_key: str = "",
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.transport = AsyncTransport(
+            base_url,
+            "gamma",
+            headers=headers,
+            rate_limiter=rate_limiter,
+            session=session,
+        )
+        self._markets_keyset_supported = True
+
+    async def get_market(self, market_id: str) -> Dict[str, Any]:
+        """Get single market details by ID or slug."""
+        if looks_like_slug(str(market_id)):
+            return await self.transport.request_json("GET", f"/markets/slug/{market_id}")
+        return await self.transport.request_json("GET", f"/markets/{market_id}")
+
+    async def get_markets(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        tag: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get markets via keyset pagination (same defaults as the sync client)."""
+        from .gamma import GammaClient
+
+        params: Dict[str, Any] = {
+            "active": str(True if active is None else active).lower(),
+            "closed": str(False if closed is None else closed).lower(),
+        }
+        if tag:
+            params["tag"] = tag
+
+        if self._markets_keyset_supported:
+            try:
+                target_count = max(limit + max(offset, 0), limit, 1)
+                collected: List[Dict[str, Any]] = []
+                after_cursor = None
+                while len(collected) < target_count:
+                    page_params = dict(params, limit=min(target_count - len(collected), 1000))
+                    if after_cursor:
+                        page_params["after_cursor"] = after_cursor
+                    data = await self.transport.request_json("GET", "/markets/keyset", params=page_params)
+                    page = GammaClient._extract_markets_page(data)
+                    collected.extend(page)
+                    after_cursor = data.get("next_cursor") if isinstance(data, dict) else None
+                    if not page or not after_cursor:
+                        break
+                return collected[offset:offset + limit]
+            except Exception as exc:
+                if " 422 " in str(exc) or " 404 " in str(exc):
+                    self._markets_keyset_supported = False
+                else:
+                    raise
+
+        legacy_params = dict(params, limit=limit)
+        if offset:
+            legacy_params["offset"] = offset
+        return await self.transport.request_json("GET", "/markets", params=legacy_params)
+
+    async def get_many_markets(self, market_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several markets concurrently, skipping ones that fail."""
+        results = await asyncio.gather(
+            *(self.get_market(market_id) for market_id in market_ids),
+            return_exceptions=True,
+        )
+        return [market for market in results if isinstance(market, dict) and market]
+
+    async def close(self) -> None:
+        """No-op: the shared session outlives individual clients."""
+
+
+class AsyncCLOBClient:
+    """Async twin of ``CLOBClient``'s REST methods"""
+
+    def __init__(
+        self,
+        rest_endpoint: str = "https://clob.polymarket.com",
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        self.transport = AsyncTransport(rest_endpoint, "clob", rate_limiter=rate_limiter, session=session)
+
+    async def get_order_book(self, token_id: str, depth: int = 20) -> Dict[str, Any]:
+        """Get the order book for a token, trimmed to ``depth`` levels."""
+        try:
+            data = await self.transport.request_json("GET", "/book", params={"token_id": token_id})
+        except Exception as e:
+            raise Exception(f"Failed to get order book: {e}")
+        if depth and data.get("bids"):
+            data["bids"] = data["bids"][:depth]
+        if depth and data.get("asks"):
+            data["asks"] = data["asks"][:depth]
+        return data
+
+    async def get_price_history(
+        self,
+        token_id: str,
+        interval: str = "1h",
+        fidelity: int = 60,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get ``{"t", "p"}`` price history points for a token."""
+        params: Dict[str, Any] = {"market": token_id, "interval": interval, "fidelity": fidelity}
+        if start_ts is not None:
+            params["startTs"] = start_ts
+        if end_ts is not None:
+            params["endTs"] = end_ts
+        try:
+            data = await self.transport.request_json("GET", "/prices-history", params=params)
+        except Exception as e:
+            raise Exception(f"Failed to get price history: {e}")
+        return data.get("history", [])
+
+    async def get_last_trade_price(self, token_id: str) -> Dict[str, Any]:
+        return await self.transport.request_json("GET", "/last-trade-price", params={"token_id": token_id})
+
+    async def close(self) -> None:
+        """No-op: the shared session outlives individual clients."""
+
+
+class AsyncDataAPIClient:
+    """Async twin of ``DataAPIClient``'s trade and wallet reads"""
+
+    BASE_URL = "https://data-api.polymarket.com"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        self.transport = AsyncTransport(base_url or self.BASE_URL, "data", rate_limiter=rate_limiter, session=session)
+
+    async def get_trades(self, address=None, limit=100, market=None, before=None):
+        """Get trades, optionally for one wallet and/or market."""
+        params = {"limit": limit, "user": address, "market": market, "before": before}
+        return await self.transport.request_json("GET", "/trades", params=params)
+
+    async def get_recent_trades(self, limit=1000, offset=0, filter_type=None, filter_amount=None, taker_only=True):
+        """Get recent public trades from the global trade tape."""
+        params = {"limit": limit, "offset": offset, "takerOnly": str(taker_only).lower()}
+        if filter_type and filter_amount is not None:
+            params["filterType"] = filter_type
+            params["filterAmount"] = filter_amount
+        data = await self.transport.request_json("GET", "/trades", params=params)
+        return data if isinstance(data, list) else []
+
+    async def get_positions(self, address, limit=100, offset=0, sort_by="CURRENT"):
+        params = {"user": address, "limit": limit, "offset": offset, "sortBy": sort_by}
+        return await self.transport.request_json("GET", "/positions", params=params)
+
+    async def get_activity(self, address, limit=100, offset=0):
+        params = {"user": address, "limit": limit, "offset": offset}
+        return await self.transport.request_json("GET", "/activity", params=params)
+
+    async def close(self) -> None:
+        """No-op: the shared session outlives individual clients."""
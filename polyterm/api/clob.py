@@ -7,13 +7,10 @@ import requests
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 
-logger = logging.getLogger(__name__)
+from .http_pool import mount_shared_pool
+from .rate_limit import get_rate_limiter
 
-try:
-    import websockets
-    HAS_WEBSOCKETS = True
-except ImportError:
-    HAS_WEBSOCKETS = False
+logger = logging.getLogger(__name__)
 
 try:
     from dateutil import parser
@@ -24,7 +21,12 @@ except ImportError:
 
 class CLOBClient:
     """Client for PolyMarket CLOB API (REST and WebSocket)"""
-    
+
+    # Tokens per ``POST /midpoints`` request
+    MIDPOINT_BATCH_SIZE = 500
+    # Tokens per ``POST /books`` and ``POST /last-trades-prices`` request
+    BOOK_BATCH_SIZE = 500
+
     def __init__(
         self,
         rest_endpoint: str = "https://clob.polymarket.com",
@@ -32,11 +34,14 @@ class CLOBClient:
     ):
         self.rest_endpoint = rest_endpoint.rstrip("/")
         self.ws_endpoint = ws_endpoint
-        self.session = requests.Session()
-        self.ws_connection = None
-        self.clob_ws = None
+        self.session = mount_shared_pool(requests.Session())
+        self.rate_limiter = get_rate_limiter()
         self.subscriptions = {}
         self._ws_permanently_failed = False
+        self._market_hub = None
+        self._hub_task = None
+        self._hub_feeds = []
+        self._trade_sub = None
 
     def _request(self, method: str, url: str, retries: int = 3, **kwargs) -> requests.Response:
         """Make request with retry logic and backoff"""
@@ -44,6 +49,7 @@ class CLOBClient:
         kwargs.setdefault('timeout', 15)
 
         for attempt in range(retries):
+            self.rate_limiter.acquire("clob", url)
             try:
                 response = self.session.request(method, url, **kwargs)
 
@@ -55,6 +61,7 @@ class CLOBClient:
                             wait = min(int(retry_after), 60)
                         except (ValueError, TypeError):
                             pass  # Keep default exponential backoff
+                    self.rate_limiter.penalize("clob", url, wait)
                     _time.sleep(wait)
                     continue
 
@@ -153,6 +160,84 @@ class CLOBClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to get price: {e}")
 
+    def get_midpoints(self, token_ids: List[str]) -> Dict[str, float]:
+        """Get midpoint prices for many tokens with ``POST /midpoints``.
+
+        Tokens are sent in chunks of ``MIDPOINT_BATCH_SIZE``. Tokens with
+        no book (or an unparseable price) are left out of the result.
+
+        Returns:
+            Dict of token id to midpoint price
+        """
+        midpoints: Dict[str, float] = {}
+        for data in self._post_token_batches("midpoints", token_ids, self.MIDPOINT_BATCH_SIZE):
+            if not isinstance(data, dict):
+                continue
+            for token_id, value in data.items():
+                if isinstance(value, dict):
+                    value = value.get("mid")
+                try:
+                    midpoints[str(token_id)] = float(value)
+                except (TypeError, ValueError):
+                    continue
+        return midpoints
+
+    def get_order_books(self, token_ids: List[str], depth: int = 20) -> Dict[str, Dict[str, Any]]:
+        """Get order books for many tokens with ``POST /books``.
+
+        Tokens are sent in chunks of ``BOOK_BATCH_SIZE``. Tokens with no
+        book are left out of the result.
+
+        Args:
+            token_ids: Token IDs
+            depth: Price levels kept per side, as in ``get_order_book``
+
+        Returns:
+            Dict of token id to order book
+        """
+        books: Dict[str, Dict[str, Any]] = {}
+        for data in self._post_token_batches("books", token_ids, self.BOOK_BATCH_SIZE):
+            for book in data if isinstance(data, list) else []:
+                if not isinstance(book, dict) or not book.get("asset_id"):
+                    continue
+                if depth:
+                    book["bids"] = (book.get("bids") or [])[:depth]
+                    book["asks"] = (book.get("asks") or [])[:depth]
+                books[str(book["asset_id"])] = book
+        return books
+
+    def get_last_trade_prices(self, token_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get last trade price and side for many tokens with ``POST /last-trades-prices``.
+
+        Returns:
+            Dict of token id to ``{'price', 'side'}``; tokens that have not
+            traded are left out
+        """
+        prices: Dict[str, Dict[str, Any]] = {}
+        for data in self._post_token_batches("last-trades-prices", token_ids, self.BOOK_BATCH_SIZE):
+            for entry in data if isinstance(data, list) else []:
+                if isinstance(entry, dict) and entry.get("token_id"):
+                    prices[str(entry["token_id"])] = {
+                        "price": entry.get("price", "0"),
+                        "side": entry.get("side", ""),
+                    }
+        return prices
+
+    def _post_token_batches(self, path: str, token_ids: List[str], batch_size: int):
+        """Yield the decoded response of each ``POST /{path}`` token chunk"""
+        url = f"{self.rest_endpoint}/{path}"
+        unique = [str(token_id) for token_id in dict.fromkeys(token_ids) if token_id]
+
+        for start in range(0, len(unique), batch_size):
+            chunk = unique[start:start + batch_size]
+            try:
+                response = self._request("POST", url, json=[{"token_id": token_id} for token_id in chunk])
+                response.raise_for_status()
+                data = response.json()
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Failed to get {path}: {e}")
+            yield data
+
     def get_spread(self, token_id: str) -> Dict[str, Any]:
         """Get the current bid/ask spread for a token."""
         url = f"{self.rest_endpoint}/spread"
@@ -281,22 +366,14 @@ class CLOBClient:
             total += price * size
         return total
     
-    # WebSocket Methods for Live Trading Data
-    
-    async def connect_websocket(self):
-        """Connect to the public CLOB market WebSocket."""
-        if not HAS_WEBSOCKETS:
-            raise Exception("websockets library not installed. Install with: pip install websockets")
-        
-        try:
-            self.ws_connection = await websockets.connect(self.ws_endpoint)
-            return True
-        except Exception as e:
-            raise Exception(f"Failed to connect to WebSocket: {e}")
-    
+    # Market WebSocket (trades and order books share one hub socket)
+
     async def subscribe_to_trades(self, token_ids: List[str], callback: Callable):
         """Subscribe to live trade executions for CLOB token IDs.
 
+        The subscription is attached to ``market_hub()``; run it with
+        ``listen_for_trades`` (or any other listener on this client).
+
         Args:
             token_ids: CLOB asset/token IDs to monitor.
             callback: Function to call when trade data is received
@@ -304,19 +381,45 @@ class CLOBClient:
         if not token_ids:
             raise ValueError("CLOB market websocket subscriptions require token IDs")
 
-        if not self.ws_connection:
-            await self.connect_websocket()
-
-        subscribe_msg = {
-            "assets_ids": [str(token_id) for token_id in token_ids],
-            "type": "market",
-            "custom_feature_enabled": True,
-        }
-        await self.ws_connection.send(json.dumps(subscribe_msg))
-
         for token_id in token_ids:
             self.subscriptions[str(token_id)] = callback
-    
+        hub = self.market_hub()
+        if self._trade_sub is None or self._trade_sub.closed:
+            # One hub subscription for every trade callback, so events
+            # without an asset id reach _dispatch_trade once
+            self._trade_sub = hub.subscribe(token_ids, event_types={"last_trade_price", "trades"})
+            self._attach(self._trade_sub, self._dispatch_trade)
+        else:
+            hub.update(self._trade_sub, add=token_ids)
+
+    async def _dispatch_trade(self, data: Dict[str, Any]):
+        """Hand one hub event to the trade callback registered for it."""
+        msg_type = data.get("event_type", data.get("type", ""))
+        if msg_type == "last_trade_price":
+            payload = self._normalize_clob_trade_payload(data)
+            callback = self.subscriptions.get(payload["asset_id"]) or self.subscriptions.get(payload["market"])
+            callback_data = {
+                "topic": "clob_market",
+                "type": "last_trade_price",
+                "payload": payload,
+            }
+        elif data.get("topic") == "activity" and msg_type == "trades":
+            payload = data.get("payload", {})
+            callback = (
+                self.subscriptions.get(payload.get("eventSlug", ""))
+                or self.subscriptions.get(payload.get("slug", ""))
+                or self.subscriptions.get("_all")
+            )
+            callback_data = data
+        else:
+            return
+
+        if callback:
+            result = callback(callback_data)
+            # Support both sync and async callbacks
+            if hasattr(result, '__await__'):
+                await result
+
     async def listen_for_trades(
         self,
         max_reconnects: int = 5,
@@ -324,8 +427,9 @@ class CLOBClient:
         on_error: Optional[Callable[[Exception], None]] = None,
         supervisor_retries: int = 3,
         supervisor_cooldown: float = 60.0,
+        on_connect: Optional[Callable[[], None]] = None,
     ):
-        """Listen for incoming CLOB market trade messages with auto-reconnection.
+        """Pump the market hub for trade subscribers with auto-reconnection.
 
         Features a two-tier resilience model:
         - Inner loop: reconnects up to max_reconnects on connection drops
@@ -335,172 +439,95 @@ class CLOBClient:
         Args:
             max_reconnects: Max reconnect attempts per supervisor cycle
             message_timeout: Seconds to wait for a message before forcing reconnect
-            on_error: Optional callback invoked on permanent failures
+            on_error: Optional callback invoked on supervisor restarts and
+                permanent failure
             supervisor_retries: Max supervisor restart cycles (0 = no supervisor)
             supervisor_cooldown: Seconds to wait between supervisor restarts
-        """
-        supervisor_attempts = 0
+            on_connect: Optional callback invoked each time the socket is
+                open and subscribed (including reconnects)
 
-        while True:
-            try:
-                await self._listen_for_trades_inner(max_reconnects, message_timeout)
-                # Inner loop exited cleanly (max_reconnects exhausted)
-            except Exception as exc:
-                logger.error("CLOB market listen_for_trades inner loop error: %s", exc)
-
-            # Check if supervisor should restart
-            supervisor_attempts += 1
-            if supervisor_attempts > supervisor_retries:
-                logger.error(
-                    "CLOB market websocket supervisor exhausted after %d retries, giving up",
-                    supervisor_retries,
-                )
-                self.subscriptions.clear()
-                self._ws_permanently_failed = True
-                if on_error:
-                    try:
-                        on_error(Exception(
-                            f"CLOB market websocket permanently failed after {supervisor_retries} supervisor retries"
-                        ))
-                    except Exception:
-                        pass
-                return
-
-            logger.error(
-                "CLOB market websocket reconnects exhausted, supervisor restarting in %.0fs (attempt %d/%d)",
-                supervisor_cooldown,
-                supervisor_attempts,
-                supervisor_retries,
+        When the hub gives up, ``_ws_permanently_failed`` is set and trade
+        callbacks are cleared so the caller can fall back to REST.
+        """
+        hub = self.market_hub()
+        if on_connect is not None:
+            hub.add_connect_listener(on_connect)
+            if hub.connected:
+                on_connect()
+        try:
+            failed = await self._run_hub(
+                max_reconnects,
+                message_timeout,
+                supervisor_retries=supervisor_retries,
+                supervisor_cooldown=supervisor_cooldown,
+                on_error=on_error,
             )
-            if on_error:
-                try:
-                    on_error(Exception(
-                        f"CLOB market websocket reconnects exhausted, supervisor restart {supervisor_attempts}/{supervisor_retries}"
-                    ))
-                except Exception:
-                    pass
-
-            await asyncio.sleep(supervisor_cooldown)
-
-            # Reset connection state for fresh start
-            self.ws_connection = None
-
-    async def _listen_for_trades_inner(self, max_reconnects: int, message_timeout: float):
-        """Inner reconnect loop for CLOB market trade listening."""
-        reconnect_attempts = 0
-
-        while reconnect_attempts <= max_reconnects:
-            if not self.ws_connection:
-                if reconnect_attempts > 0:
-                    wait = min(2 ** reconnect_attempts, 30)
-                    await asyncio.sleep(wait)
-                    try:
-                        await self.connect_websocket()
-                        # Re-subscribe after reconnecting
-                        if self.subscriptions:
-                            subscribe_msg = {
-                                "assets_ids": list(self.subscriptions.keys()),
-                                "type": "market",
-                                "custom_feature_enabled": True,
-                            }
-                            await self.ws_connection.send(json.dumps(subscribe_msg))
-                    except Exception:
-                        reconnect_attempts += 1
-                        continue
-                else:
-                    raise Exception("WebSocket not connected")
+        finally:
+            if on_connect is not None:
+                hub.remove_connect_listener(on_connect)
+        if failed:
+            self.subscriptions.clear()
+            self._ws_permanently_failed = True
 
-            try:
-                while True:
-                    try:
-                        message = await asyncio.wait_for(
-                            self.ws_connection.recv(),
-                            timeout=message_timeout,
-                        )
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            "CLOB market websocket message timeout (%.0fs), forcing reconnect",
-                            message_timeout,
-                        )
-                        # Force close stale connection
-                        try:
-                            await self.ws_connection.close()
-                        except Exception:
-                            pass
-                        self.ws_connection = None
-                        reconnect_attempts += 1
-                        break
-
-                    # Reset reconnect counter on successful message
-                    reconnect_attempts = 0
-
-                    try:
-                        # Handle ping messages
-                        if message == "PING":
-                            await self.ws_connection.send("PONG")
-                            continue
-
-                        # Skip empty messages
-                        if not message or message.strip() == "":
-                            continue
-
-                        raw_data = json.loads(message)
-                        messages = raw_data if isinstance(raw_data, list) else [raw_data]
-
-                        for data in messages:
-                            if not isinstance(data, dict):
-                                continue
-
-                            msg_type = data.get("event_type", data.get("type", ""))
-                            if msg_type == "last_trade_price":
-                                payload = self._normalize_clob_trade_payload(data)
-                                asset_id = payload.get("asset_id", "")
-                                market_id = payload.get("market", "")
-
-                                callback = self.subscriptions.get(asset_id) or self.subscriptions.get(market_id)
-                            elif data.get("topic") == "activity" and data.get("type") == "trades":
-                                payload = data.get("payload", {})
-                                event_slug = payload.get("eventSlug", "")
-                                market_slug = payload.get("slug", "")
-                                callback = (
-                                    self.subscriptions.get(event_slug)
-                                    or self.subscriptions.get(market_slug)
-                                    or self.subscriptions.get("_all")
-                                )
-                            else:
-                                callback = None
-
-                            if callback:
-                                if msg_type == "last_trade_price":
-                                    callback_data = {
-                                        "topic": "clob_market",
-                                        "type": "last_trade_price",
-                                        "payload": payload,
-                                    }
-                                else:
-                                    callback_data = data
-                                result = callback(callback_data)
-                                # Support both sync and async callbacks
-                                if hasattr(result, '__await__'):
-                                    await result
-
-                    except json.JSONDecodeError:
-                        continue
-                    except Exception:
-                        continue
-
-            except websockets.exceptions.ConnectionClosed:
-                self.ws_connection = None
-                reconnect_attempts += 1
-                if reconnect_attempts <= max_reconnects:
-                    continue
-                break
-            except Exception:
-                self.ws_connection = None
-                reconnect_attempts += 1
-                if reconnect_attempts <= max_reconnects:
-                    continue
-                break
+    async def subscribe_orderbook(self, token_ids, callback, resolution_callback=None):
+        """Subscribe to real-time order book updates
+
+        Message types: book, last_trade_price, price_change, tick_size_change,
+        market_resolved (when custom_feature_enabled is set). The
+        subscription is attached to ``market_hub()``; run it with
+        ``listen_orderbook`` (or any other listener on this client).
+
+        Args:
+            token_ids: List of CLOB token IDs to subscribe to
+            callback: Function to call with order book update data
+            resolution_callback: Optional callback for market_resolved events
+        """
+        from .market_hub import ORDERBOOK_EVENTS
+
+        async def dispatch(data: Dict[str, Any]):
+            msg_type = data.get("type", data.get("event_type", ""))
+            handler = resolution_callback if msg_type == "market_resolved" else callback
+            if handler:
+                result = handler(data)
+                if hasattr(result, '__await__'):
+                    await result
+
+        sub = self.market_hub().subscribe(token_ids, event_types=ORDERBOOK_EVENTS)
+        self._attach(sub, dispatch)
+
+    async def listen_orderbook(self, max_reconnects=5, message_timeout: float = 60.0):
+        """Pump the market hub for order book subscribers
+
+        Args:
+            max_reconnects: Max reconnect attempts before giving up
+            message_timeout: Seconds to wait for a message before forcing reconnect
+        """
+        await self._run_hub(max_reconnects, message_timeout)
+
+    def _attach(self, sub, handler: Callable):
+        """Start a task feeding ``sub`` to ``handler``; needs a running loop"""
+        task = asyncio.ensure_future(self.market_hub().consume(sub, handler))
+        self._hub_feeds.append((sub, task))
+
+    async def _run_hub(self, max_reconnects: int, message_timeout: float, **supervisor) -> bool:
+        """Run the shared hub, or wait on it if another listener already does.
+
+        Returns:
+            True when the hub gave up (reconnects and supervisor exhausted)
+        """
+        hub = self.market_hub()
+        if self._hub_task is None or self._hub_task.done():
+            hub.message_timeout = message_timeout
+            self._hub_task = asyncio.ensure_future(hub.run(max_reconnects=max_reconnects, **supervisor))
+        task = self._hub_task
+        try:
+            # Shielded so one listener being cancelled leaves the others running
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # close_websocket cancelling the hub ends every listener normally
+            if not task.cancelled():
+                raise
+        return hub.failed
 
     @staticmethod
     def _normalize_clob_trade_payload(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -521,35 +548,29 @@ class CLOBClient:
         }
     
     async def close_websocket(self):
-        """Close any active WebSocket connections."""
-        if self.ws_connection:
-            try:
-                await self.ws_connection.close()
-            except Exception:
-                pass
-            finally:
-                self.ws_connection = None
-
-        if self.clob_ws:
-            try:
-                await self.clob_ws.close()
-            except Exception:
-                pass
-            finally:
-                self.clob_ws = None
-
+        """Close the market hub socket and drop every subscription."""
+        feeds, self._hub_feeds = self._hub_feeds, []
+        self._trade_sub = None
+        for sub, task in feeds:
+            sub.hub.unsubscribe(sub)
+            task.cancel()
+        if self._market_hub is not None:
+            await self._market_hub.close()
+        task, self._hub_task = self._hub_task, None
+        if task is not None and not task.done():
+            task.cancel()
         self.subscriptions.clear()
-        if hasattr(self, '_ob_callback'):
-            self._ob_callback = None
-        if hasattr(self, '_ob_resolution_callback'):
-            self._ob_resolution_callback = None
-        if hasattr(self, '_ob_token_ids'):
-            self._ob_token_ids = []
     
+    def async_client(self):
+        """Return an ``AsyncCLOBClient`` for the same REST endpoint."""
+        from .async_clients import AsyncCLOBClient
+
+        return AsyncCLOBClient(rest_endpoint=self.rest_endpoint)
+
     def close(self):
-        """Close REST session and best-effort close active websockets."""
+        """Close REST session and best-effort close the market hub."""
         self.session.close()
-        if not self.ws_connection and not self.clob_ws:
+        if not self._hub_feeds and (self._market_hub is None or not self._market_hub.connected):
             return
 
         try:
@@ -562,142 +583,18 @@ class CLOBClient:
         else:
             asyncio.run(self.close_websocket())
 
-    # CLOB Order Book WebSocket Methods
-
-    CLOB_WS_ENDPOINT = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    def market_hub(self):
+        """Return this client's shared market-channel hub, creating it lazily.
 
-    async def connect_clob_websocket(self):
-        """Connect to CLOB order book WebSocket"""
-        if not HAS_WEBSOCKETS:
-            raise Exception("websockets library not installed. Install with: pip install websockets")
-
-        try:
-            self.clob_ws = await websockets.connect(self.CLOB_WS_ENDPOINT)
-            return True
-        except Exception as e:
-            raise Exception(f"Failed to connect to CLOB WebSocket: {e}")
-
-    async def subscribe_orderbook(self, token_ids, callback, resolution_callback=None):
-        """Subscribe to real-time order book updates
-
-        Message types: book, last_trade_price, price_change, tick_size_change,
-        market_resolved (when custom_feature_enabled is set)
-        Subscribe: {"assets_ids": [token_id1, ...], "type": "market", "custom_feature_enabled": true}
-
-        Args:
-            token_ids: List of CLOB token IDs to subscribe to
-            callback: Function to call with order book update data
-            resolution_callback: Optional callback for market_resolved events
-        """
-        if not hasattr(self, 'clob_ws') or not self.clob_ws:
-            await self.connect_clob_websocket()
-
-        subscribe_msg = {
-            "assets_ids": token_ids,
-            "type": "market",
-            "custom_feature_enabled": True,
-        }
-        await self.clob_ws.send(json.dumps(subscribe_msg))
-        self._ob_callback = callback
-        self._ob_resolution_callback = resolution_callback
-        self._ob_token_ids = token_ids
-
-    async def listen_orderbook(self, max_reconnects=5, message_timeout: float = 60.0):
-        """Listen for order book update messages from CLOB WebSocket
-
-        Handles message types:
-        - book: Full or partial order book update
-        - last_trade_price: Latest trade price change
-        - price_change: Market price movement
-
-        Args:
-            max_reconnects: Max reconnect attempts before giving up
-            message_timeout: Seconds to wait for a message before forcing reconnect
+        Trade and order book subscriptions on this client, and any feed
+        handed the hub directly (live order books, whale tracking), share
+        one socket. ``listen_for_trades`` / ``listen_orderbook`` run it;
+        callers that use the hub directly run ``hub.run()`` themselves.
         """
-        reconnect_attempts = 0
-
-        while reconnect_attempts <= max_reconnects:
-            if not hasattr(self, 'clob_ws') or not self.clob_ws:
-                if reconnect_attempts > 0:
-                    wait = min(2 ** reconnect_attempts, 30)
-                    await asyncio.sleep(wait)
-                    try:
-                        await self.connect_clob_websocket()
-                        if hasattr(self, '_ob_token_ids') and self._ob_token_ids:
-                            subscribe_msg = {
-                                "assets_ids": self._ob_token_ids,
-                                "type": "market",
-                                "custom_feature_enabled": True,
-                            }
-                            await self.clob_ws.send(json.dumps(subscribe_msg))
-                    except Exception:
-                        reconnect_attempts += 1
-                        continue
-                else:
-                    raise Exception("CLOB WebSocket not connected")
-
-            try:
-                while True:
-                    try:
-                        message = await asyncio.wait_for(
-                            self.clob_ws.recv(),
-                            timeout=message_timeout,
-                        )
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            "Orderbook message timeout (%.0fs), forcing reconnect",
-                            message_timeout,
-                        )
-                        try:
-                            await self.clob_ws.close()
-                        except Exception:
-                            pass
-                        self.clob_ws = None
-                        reconnect_attempts += 1
-                        break
-
-                    reconnect_attempts = 0
-
-                    try:
-                        if not message or message.strip() == "":
-                            continue
-
-                        raw_data = json.loads(message)
-                        messages = raw_data if isinstance(raw_data, list) else [raw_data]
-
-                        for data in messages:
-                            if not isinstance(data, dict):
-                                continue
-
-                            # Handle different message types
-                            msg_type = data.get("type", data.get("event_type", ""))
-                            if msg_type == "market_resolved":
-                                if hasattr(self, '_ob_resolution_callback') and self._ob_resolution_callback:
-                                    result = self._ob_resolution_callback(data)
-                                    if hasattr(result, '__await__'):
-                                        await result
-                            elif msg_type in ("book", "last_trade_price", "price_change", "tick_size_change"):
-                                if hasattr(self, '_ob_callback') and self._ob_callback:
-                                    result = self._ob_callback(data)
-                                    if hasattr(result, '__await__'):
-                                        await result
-                    except json.JSONDecodeError:
-                        continue
-                    except Exception:
-                        continue
-
-            except Exception:
-                if hasattr(self, 'clob_ws'):
-                    self.clob_ws = None
-                reconnect_attempts += 1
-                if reconnect_attempts <= max_reconnects:
-                    continue
-                break
-
-        if hasattr(self, '_ob_callback'):
-            self._ob_callback = None
-        if hasattr(self, '_ob_resolution_callback'):
-            self._ob_resolution_callback = None
+        if self._market_hub is None:
+            from .market_hub import MarketStreamHub
+            self._market_hub = MarketStreamHub(ws_endpoint=self.ws_endpoint)
+        return self._market_hub
 
     # Utility Methods
 
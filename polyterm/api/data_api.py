@@ -4,6 +4,10 @@ import json
 import requests
 from typing import Dict, List, Optional, Any
 
+from .http_pool import mount_shared_pool
+from .rate_limit import get_rate_limiter
+from .trade_tape import TradeTape
+
 
 class DataAPIClient:
     """Client for Polymarket Data API — real wallet positions, activity, trades"""
@@ -12,7 +16,9 @@ class DataAPIClient:
 
     def __init__(self, base_url=None):
         self.base_url = (base_url or self.BASE_URL).rstrip("/")
-        self.session = requests.Session()
+        self.session = mount_shared_pool(requests.Session())
+        self.rate_limiter = get_rate_limiter()
+        self._trade_tape = None
 
     def _request(self, method, endpoint, retries=3, **kwargs):
         """Make request with retry logic and backoff (same pattern as CLOBClient)"""
@@ -21,6 +27,7 @@ class DataAPIClient:
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(retries):
+            self.rate_limiter.acquire("data", endpoint)
             try:
                 response = self.session.request(method, url, **kwargs)
                 if response.status_code == 429:
@@ -31,6 +38,7 @@ class DataAPIClient:
                             wait = min(int(retry_after), 60)
                         except (ValueError, TypeError):
                             pass
+                    self.rate_limiter.penalize("data", endpoint, wait)
                     _time.sleep(wait)
                     continue
                 if response.status_code == 408 and attempt < retries - 1:
@@ -224,6 +232,18 @@ class DataAPIClient:
             "positions": positions,
         }
 
+    def trade_tape(self):
+        """Return this client's ``TradeTape``, whose cache lives as long as the client."""
+        if self._trade_tape is None:
+            self._trade_tape = TradeTape(self)
+        return self._trade_tape
+
+    def async_client(self):
+        """Return an ``AsyncDataAPIClient`` for the same API."""
+        from .async_clients import AsyncDataAPIClient
+
+        return AsyncDataAPIClient(base_url=self.base_url)
+
     def close(self):
         """Close the session"""
         self.session.close()
@@ -2,18 +2,22 @@
 
 import json
 import os
+import sqlite3
 import time
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
+from .http_pool import mount_shared_pool
+from .market_catalog import MarketCatalog, get_default_catalog
 from .market_utils import (
     get_market_condition_id,
     looks_like_slug,
     market_probability_price,
     parse_list_field,
 )
+from .rate_limit import get_rate_limiter
 
 try:
     from dateutil import parser
@@ -160,26 +164,42 @@ class SharedRateLimiter:
 
 
 class GammaClient:
-    """Client for Gamma Markets REST API"""
-    
-    def __init__(self, base_url: str = "https://gamma-api.polymarket.com", api_key: str = ""):
+    """Client for Gamma Markets REST API
+
+    ``get_markets`` and ``get_market`` are served from the shared local
+    ``MarketCatalog`` when it holds a fresh copy. Each client answers a
+    given listing or market from the catalog at most once; repeat calls
+    (polling loops) go to the API and refresh the catalog.
+    """
+
+    # Identifiers per bulk ``/markets`` request in ``get_markets_by_ids``
+    MARKET_BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        base_url: str = "https://gamma-api.polymarket.com",
+        api_key: str = "",
+        catalog: Optional[MarketCatalog] = None,
+        use_catalog: bool = True,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.rate_limiter = SharedRateLimiter(requests_per_minute=60)
-        self.session = requests.Session()
+        self.rate_limiter = get_rate_limiter()
+        self.session = mount_shared_pool(requests.Session())
         self._search_endpoint_supported = True
         self._markets_keyset_supported = True
+        self.catalog = (catalog or get_default_catalog()) if use_catalog else None
+        self._catalog_answered: set = set()
         
         if api_key:
             self.session.headers.update({"Authorization": f"Bearer {api_key}"})
     
     def _request(self, method: str, endpoint: str, retries: int = 3, **kwargs) -> Dict[str, Any]:
         """Make rate-limited request to API with retry logic"""
-        self.rate_limiter.wait_if_needed()
-
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(retries):
+            self.rate_limiter.acquire("gamma", endpoint)
             try:
                 response = self.session.request(method, url, timeout=15, **kwargs)
 
@@ -192,6 +212,7 @@ class GammaClient:
                             wait_time = min(int(retry_after), 60)
                         except (ValueError, TypeError):
                             pass  # Keep default exponential backoff
+                    self.rate_limiter.penalize("gamma", endpoint, wait_time)
                     import time
                     time.sleep(wait_time)
                     continue
@@ -264,6 +285,8 @@ class GammaClient:
 
         if self._markets_keyset_supported:
             try:
+                if self.catalog is not None:
+                    return self._get_markets_cached(limit=limit, offset=offset, params=params)
                 return self._get_markets_keyset(limit=limit, offset=offset, params=params)
             except Exception as exc:
                 err = str(exc)
@@ -294,8 +317,59 @@ class GammaClient:
     ) -> List[Dict[str, Any]]:
         """Fetch markets from /markets/keyset and preserve the old list return."""
         target_count = max(limit + max(offset, 0), limit, 1)
+        collected, _ = self._fetch_keyset_pages(target_count, params)
+        return collected[offset:offset + limit]
+
+    def _get_markets_cached(
+        self,
+        limit: int,
+        offset: int,
+        params: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Serve a listing from the catalog, extending or refetching it as needed.
+
+        A fresh listing that is long enough is returned directly. A fresh
+        but short one resumes from its saved keyset cursor and appends only
+        the missing pages. Anything else is fetched from the start.
+        """
+        offset = max(offset, 0)
+        target_count = max(limit + offset, limit, 1)
+        key = MarketCatalog.listing_key(params, scope=self.base_url)
+        first_use = key not in self._catalog_answered
+        self._catalog_answered.add(key)
+
+        try:
+            if first_use:
+                cached = self.catalog.get_listing(key, limit=limit, offset=offset)
+                if cached is not None:
+                    return cached
+                state = self.catalog.listing_state(key)
+                if state and state["next_cursor"]:
+                    delta, cursor = self._fetch_keyset_pages(
+                        target_count - state["size"], params, after_cursor=state["next_cursor"],
+                    )
+                    self.catalog.store_listing(key, delta, cursor, append=True)
+                    extended = self.catalog.get_listing(key, limit=limit, offset=offset)
+                    if extended is not None:
+                        return extended
+        except sqlite3.Error:
+            return self._get_markets_keyset(limit=limit, offset=offset, params=params)
+
+        collected, cursor = self._fetch_keyset_pages(target_count, params)
+        try:
+            self.catalog.store_listing(key, collected, cursor)
+        except sqlite3.Error:
+            pass
+        return collected[offset:offset + limit]
+
+    def _fetch_keyset_pages(
+        self,
+        target_count: int,
+        params: Dict[str, Any],
+        after_cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch up to ``target_count`` markets; returns (markets, next_cursor)."""
         collected: List[Dict[str, Any]] = []
-        after_cursor = None
 
         while len(collected) < target_count:
             page_params = params.copy()
@@ -307,11 +381,14 @@ class GammaClient:
             page_markets = self._extract_markets_page(data)
             collected.extend(page_markets)
 
+            if not page_markets:
+                after_cursor = None
+                break
             after_cursor = data.get("next_cursor") if isinstance(data, dict) else None
-            if not after_cursor or not page_markets:
+            if not after_cursor:
                 break
 
-        return collected[offset:offset + limit]
+        return collected, after_cursor
 
     @staticmethod
     def _extract_markets_page(data: Any) -> List[Dict[str, Any]]:
@@ -332,10 +409,102 @@ class GammaClient:
         Returns:
             Market dictionary with full details
         """
+        key = ("market", str(market_id))
+        first_use = key not in self._catalog_answered
+        if self.catalog is not None:
+            self._catalog_answered.add(key)
+            if first_use:
+                try:
+                    cached = self.catalog.get_market(market_id)
+                except sqlite3.Error:
+                    cached = None
+                if cached is not None:
+                    return cached
+
         if looks_like_slug(str(market_id)):
-            return self._request("GET", f"/markets/slug/{market_id}")
-        return self._request("GET", f"/markets/{market_id}")
-    
+            market = self._request("GET", f"/markets/slug/{market_id}")
+        else:
+            market = self._request("GET", f"/markets/{market_id}")
+
+        if self.catalog is not None and isinstance(market, dict):
+            try:
+                self.catalog.upsert_markets([market])
+            except sqlite3.Error:
+                pass
+        return market
+
+    def get_markets_by_ids(self, market_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get many markets in a few bulk requests.
+
+        Identifiers may mix Gamma ids, slugs and condition ids. Fresh
+        catalog copies are used first (once per client, as in
+        ``get_market``); the rest are requested from ``/markets`` in chunks
+        of ``MARKET_BATCH_SIZE`` filtered by ``id``, ``slug`` or
+        ``condition_ids``. Identifiers the bulk filter does not return fall
+        back to ``get_market``.
+
+        Args:
+            market_ids: Market identifiers
+
+        Returns:
+            Dict of each identifier that was found to its market
+        """
+        wanted = [str(market_id) for market_id in dict.fromkeys(market_ids) if market_id]
+        found: Dict[str, Dict[str, Any]] = {}
+
+        if self.catalog is not None:
+            first_use = [market_id for market_id in wanted if ("market", market_id) not in self._catalog_answered]
+            self._catalog_answered.update(("market", market_id) for market_id in wanted)
+            try:
+                found.update(self.catalog.get_markets(first_use))
+            except sqlite3.Error:
+                pass
+
+        by_filter: Dict[str, List[str]] = {"id": [], "slug": [], "condition_ids": []}
+        for market_id in wanted:
+            if market_id in found:
+                continue
+            if market_id.isdigit():
+                by_filter["id"].append(market_id)
+            elif market_id.startswith("0x"):
+                by_filter["condition_ids"].append(market_id)
+            else:
+                by_filter["slug"].append(market_id)
+
+        fetched: List[Dict[str, Any]] = []
+        for name, values in by_filter.items():
+            for start in range(0, len(values), self.MARKET_BATCH_SIZE):
+                chunk = values[start:start + self.MARKET_BATCH_SIZE]
+                params = [(name, value) for value in chunk] + [("limit", len(chunk))]
+                try:
+                    data = self._request("GET", "/markets", params=params)
+                except Exception:
+                    continue
+                for market in self._extract_markets_page(data):
+                    if not isinstance(market, dict):
+                        continue
+                    fetched.append(market)
+                    for key in (market.get("id"), market.get("slug"), get_market_condition_id(market)):
+                        if key is not None and str(key) in chunk:
+                            found[str(key)] = market
+
+        if self.catalog is not None and fetched:
+            try:
+                self.catalog.upsert_markets(fetched)
+            except sqlite3.Error:
+                pass
+
+        for market_id in wanted:
+            if market_id in found:
+                continue
+            try:
+                market = self.get_market(market_id)
+            except Exception:
+                continue
+            if isinstance(market, dict) and market:
+                found[market_id] = market
+        return found
+
     def get_market_prices(self, market_id: str) -> Dict[str, Any]:
         """Get current prices for a market from documented metadata fields.
         
@@ -727,6 +896,12 @@ class GammaClient:
             'status': status,
         }
 
+    def async_client(self):
+        """Return an ``AsyncGammaClient`` for the same API and key."""
+        from .async_clients import AsyncGammaClient
+
+        return AsyncGammaClient(base_url=self.base_url, api_key=self.api_key)
+
     def close(self):
         """Close the session"""
         self.session.close()
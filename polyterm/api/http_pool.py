@@ -0,0 +1,68 @@
+"""Process-wide HTTP connection pool for API clients
+
+Every API client owns its own ``requests.Session`` so headers and cookies
+stay per client. When the pool is enabled (the TUI does this for its whole
+lifetime) those sessions mount one shared adapter, so TLS connections to
+Gamma, CLOB and the Data API stay warm across clients and commands.
+Closing a client releases nothing; ``disable_shared_pool()`` does.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept per host; matches the number of API hosts we talk to
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 16
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """Adapter whose connection pool outlives the sessions that mount it"""
+
+    def close(self):
+        # Session.close() closes every mounted adapter; keep the pool warm.
+        pass
+
+    def release(self):
+        """Drop pooled connections"""
+        super().close()
+
+
+_lock = threading.Lock()
+_shared_adapter: Optional[PooledHTTPAdapter] = None
+
+
+def enable_shared_pool() -> PooledHTTPAdapter:
+    """Create (or return) the shared adapter that new sessions will mount."""
+    global _shared_adapter
+    with _lock:
+        if _shared_adapter is None:
+            _shared_adapter = PooledHTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+            )
+        return _shared_adapter
+
+
+def disable_shared_pool() -> None:
+    """Stop sharing and close the pooled connections."""
+    global _shared_adapter
+    with _lock:
+        adapter, _shared_adapter = _shared_adapter, None
+    if adapter is not None:
+        adapter.release()
+
+
+def shared_pool_enabled() -> bool:
+    return _shared_adapter is not None
+
+
+def mount_shared_pool(session: requests.Session) -> requests.Session:
+    """Mount the shared adapter on ``session`` when pooling is enabled."""
+    adapter = _shared_adapter
+    if adapter is not None:
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return session
@@ -0,0 +1,422 @@
+"""Local Gamma market catalog.
+
+A SQLite file shared by every PolyTerm process that caches Gamma market
+dicts together with indexed lookup columns (id, slug, condition id, CLOB
+token ids, event, tags, end date) and the market listings returned by
+``GammaClient.get_markets``. Listings remember their keyset cursor so a
+fresh but short listing is extended from where it stopped instead of
+being downloaded again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .market_utils import get_clob_token_ids, get_market_condition_id, parse_list_field
+
+# Seconds a cached market or listing is served without refetching
+DEFAULT_TTL_SECONDS = 300.0
+
+# Set to 0/false/off to disable the catalog for every GammaClient
+CATALOG_ENV_VAR = "POLYTERM_MARKET_CATALOG"
+
+# Identifiers per ``get_markets`` query (each is bound four times)
+LOOKUP_CHUNK_SIZE = 200
+
+
+def catalog_enabled() -> bool:
+    """Whether GammaClient should use the shared catalog by default."""
+    return os.environ.get(CATALOG_ENV_VAR, "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+class MarketCatalog:
+    """SQLite-backed cache of Gamma markets and market listings"""
+
+    _PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA temp_store = MEMORY",
+    )
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            self.db_path = Path.home() / ".polyterm" / "market_catalog.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._init_db()
+
+    # -- Connections --
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening after a fork"""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or getattr(local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in self._PRAGMAS:
+                try:
+                    conn.execute(pragma)
+                except sqlite3.DatabaseError:
+                    pass
+            with self._connections_lock:
+                self._connections.append(conn)
+            local.conn = conn
+            local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this instance"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def _init_db(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS markets (
+                    id TEXT PRIMARY KEY,
+                    slug TEXT,
+                    condition_id TEXT,
+                    event_id TEXT,
+                    event_slug TEXT,
+                    end_date TEXT,
+                    active INTEGER,
+                    closed INTEGER,
+                    fetched_at REAL NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_catalog_slug ON markets(slug);
+                CREATE INDEX IF NOT EXISTS idx_catalog_condition ON markets(condition_id);
+                CREATE INDEX IF NOT EXISTS idx_catalog_event ON markets(event_id);
+                CREATE INDEX IF NOT EXISTS idx_catalog_end_date ON markets(end_date);
+
+                CREATE TABLE IF NOT EXISTS market_tokens (
+                    token_id TEXT PRIMARY KEY,
+                    market_id TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_catalog_token_market ON market_tokens(market_id);
+
+                CREATE TABLE IF NOT EXISTS market_tags (
+                    tag TEXT NOT NULL,
+                    market_id TEXT NOT NULL,
+                    PRIMARY KEY (tag, market_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_catalog_tag_market ON market_tags(market_id);
+
+                CREATE TABLE IF NOT EXISTS listings (
+                    key TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL,
+                    next_cursor TEXT,
+                    complete INTEGER NOT NULL DEFAULT 0,
+                    size INTEGER NOT NULL DEFAULT 0
+                );
+
+                CREATE TABLE IF NOT EXISTS listing_members (
+                    key TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    market_id TEXT NOT NULL,
+                    PRIMARY KEY (key, position)
+                );
+            """)
+
+    # -- Markets --
+
+    @staticmethod
+    def _row_values(market: Dict[str, Any], fetched_at: float) -> Optional[Tuple]:
+        market_id = market.get("id")
+        if market_id in (None, ""):
+            return None
+        events = market.get("events") or []
+        event = events[0] if events and isinstance(events[0], dict) else {}
+        return (
+            str(market_id),
+            market.get("slug"),
+            get_market_condition_id(market),
+            str(event["id"]) if event.get("id") is not None else None,
+            event.get("slug"),
+            market.get("endDate") or market.get("end_date_iso") or market.get("endDateIso"),
+            _as_flag(market.get("active")),
+            _as_flag(market.get("closed")),
+            fetched_at,
+            json.dumps(market, separators=(",", ":")),
+        )
+
+    @staticmethod
+    def _market_tags(market: Dict[str, Any]) -> List[str]:
+        tags = []
+        for tag in parse_list_field(market.get("tags")):
+            if isinstance(tag, dict):
+                tag = tag.get("slug") or tag.get("label")
+            if tag:
+                tags.append(str(tag).lower())
+        return tags
+
+    def upsert_markets(self, markets: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None) -> int:
+        """Insert or refresh markets and their token/tag index rows."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows, tokens, tags, ids = [], [], [], []
+        for market in markets:
+            if not isinstance(market, dict):
+                continue
+            values = self._row_values(market, fetched_at)
+            if values is None:
+                continue
+            market_id = values[0]
+            ids.append((market_id,))
+            rows.append(values)
+            tokens.extend((token_id, market_id) for token_id in get_clob_token_ids(market))
+            tags.extend((tag, market_id) for tag in self._market_tags(market))
+        if not rows:
+            return 0
+
+        conn = self._connection()
+        with conn:
+            conn.executemany("""
+                INSERT INTO markets (id, slug, condition_id, event_id, event_slug, end_date,
+                                     active, closed, fetched_at, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    slug = excluded.slug,
+                    condition_id = excluded.condition_id,
+                    event_id = excluded.event_id,
+                    event_slug = excluded.event_slug,
+                    end_date = excluded.end_date,
+                    active = excluded.active,
+                    closed = excluded.closed,
+                    fetched_at = excluded.fetched_at,
+                    data = excluded.data
+            """, rows)
+            conn.executemany("DELETE FROM market_tags WHERE market_id = ?", ids)
+            conn.executemany(
+                "INSERT OR REPLACE INTO market_tokens (token_id, market_id) VALUES (?, ?)", tokens,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO market_tags (tag, market_id) VALUES (?, ?)", tags,
+            )
+        return len(rows)
+
+    def get_market(self, identifier: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return a fresh market by Gamma id, slug, condition id or token id."""
+        identifier = str(identifier)
+        cutoff = self._cutoff(max_age)
+        row = self._connection().execute("""
+            SELECT data FROM markets
+            WHERE fetched_at >= ? AND (
+                id = ? OR slug = ? OR condition_id = ?
+                OR id = (SELECT market_id FROM market_tokens WHERE token_id = ?)
+            )
+            ORDER BY fetched_at DESC LIMIT 1
+        """, (cutoff, identifier, identifier, identifier, identifier)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def get_markets(
+        self,
+        identifiers: Iterable[str],
+        max_age: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fresh markets for many identifiers at once.
+
+        Identifiers may mix Gamma ids, slugs, condition ids and token ids.
+        Returns a dict keyed by each identifier that was found.
+        """
+        wanted = list(dict.fromkeys(str(identifier) for identifier in identifiers))
+        cutoff = self._cutoff(max_age)
+        conn = self._connection()
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(wanted), LOOKUP_CHUNK_SIZE):
+            chunk = wanted[start:start + LOOKUP_CHUNK_SIZE]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(f"""
+                SELECT m.id, m.slug, m.condition_id, t.token_id, m.data FROM markets m
+                LEFT JOIN market_tokens t ON t.market_id = m.id AND t.token_id IN ({marks})
+                WHERE m.fetched_at >= ? AND (
+                    m.id IN ({marks}) OR m.slug IN ({marks}) OR m.condition_id IN ({marks})
+                    OR t.token_id IS NOT NULL
+                )
+                ORDER BY m.fetched_at
+            """, (*chunk, cutoff, *chunk, *chunk, *chunk)).fetchall()
+            lookup = set(chunk)
+            for row in rows:
+                market = json.loads(row["data"])
+                for key in (row["id"], row["slug"], row["condition_id"], row["token_id"]):
+                    if key in lookup:
+                        found[key] = market
+        return found
+
+    def find_markets(
+        self,
+        event_id: Optional[str] = None,
+        tag: Optional[str] = None,
+        end_before: Optional[str] = None,
+        active: Optional[bool] = None,
+        limit: int = 500,
+        max_age: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Query fresh cached markets by event, tag, end date or status."""
+        clauses = ["m.fetched_at >= ?"]
+        params: List[Any] = [self._cutoff(max_age)]
+        join = ""
+        if tag:
+            join = "JOIN market_tags t ON t.market_id = m.id"
+            clauses.append("t.tag = ?")
+            params.append(tag.lower())
+        if event_id is not None:
+            clauses.append("m.event_id = ?")
+            params.append(str(event_id))
+        if end_before:
+            clauses.append("m.end_date IS NOT NULL AND m.end_date <= ?")
+            params.append(end_before)
+        if active is not None:
+            clauses.append("m.active = ?")
+            params.append(int(active))
+        params.append(limit)
+        rows = self._connection().execute(f"""
+            SELECT m.data FROM markets m {join}
+            WHERE {' AND '.join(clauses)}
+            ORDER BY m.end_date
+            LIMIT ?
+        """, params).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    # -- Listings --
+
+    @staticmethod
+    def listing_key(params: Dict[str, Any], scope: str = "") -> str:
+        """Stable key for a listing query (filters plus the API base URL)."""
+        return json.dumps({"scope": scope, **params}, sort_keys=True)
+
+    def get_listing(
+        self,
+        key: str,
+        limit: int,
+        offset: int = 0,
+        max_age: Optional[float] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return ``limit`` markets of a fresh listing, or None on a miss.
+
+        A listing that is fresh but shorter than ``offset + limit`` only
+        counts as a hit when it was fetched to the end.
+        """
+        state = self.listing_state(key, max_age)
+        if state is None:
+            return None
+        if not state["complete"] and state["size"] < offset + limit:
+            return None
+        rows = self._connection().execute("""
+            SELECT m.data FROM listing_members l
+            JOIN markets m ON m.id = l.market_id
+            WHERE l.key = ? AND l.position >= ? AND l.position < ?
+            ORDER BY l.position
+        """, (key, offset, offset + limit)).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def listing_state(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return a fresh listing's cursor state, or None when absent or stale."""
+        row = self._connection().execute(
+            "SELECT fetched_at, next_cursor, complete, size FROM listings WHERE key = ? AND fetched_at >= ?",
+            (key, self._cutoff(max_age)),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def store_listing(
+        self,
+        key: str,
+        markets: List[Dict[str, Any]],
+        next_cursor: Optional[str],
+        append: bool = False,
+    ) -> None:
+        """Save a listing page run.
+
+        ``append`` extends the existing listing (a delta fetched from its
+        saved cursor) and keeps its original timestamp; otherwise the
+        listing is replaced.
+        """
+        now = time.time()
+        self.upsert_markets(markets, fetched_at=now)
+        conn = self._connection()
+        with conn:
+            start = 0
+            fetched_at = now
+            if append:
+                row = conn.execute("SELECT size, fetched_at FROM listings WHERE key = ?", (key,)).fetchone()
+                if row:
+                    start, fetched_at = row["size"], row["fetched_at"]
+            else:
+                conn.execute("DELETE FROM listing_members WHERE key = ?", (key,))
+
+            members = [
+                (key, start + index, str(market["id"]))
+                for index, market in enumerate(
+                    m for m in markets if isinstance(m, dict) and m.get("id") not in (None, "")
+                )
+            ]
+            conn.executemany(
+                "INSERT OR REPLACE INTO listing_members (key, position, market_id) VALUES (?, ?, ?)",
+                members,
+            )
+            conn.execute("""
+                INSERT INTO listings (key, fetched_at, next_cursor, complete, size)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    fetched_at = excluded.fetched_at,
+                    next_cursor = excluded.next_cursor,
+                    complete = excluded.complete,
+                    size = excluded.size
+            """, (key, fetched_at, next_cursor, int(not next_cursor), start + len(members)))
+
+    def clear(self) -> None:
+        """Drop every cached market and listing."""
+        conn = self._connection()
+        with conn:
+            for table in ("markets", "market_tokens", "market_tags", "listings", "listing_members"):
+                conn.execute(f"DELETE FROM {table}")
+
+    def _cutoff(self, max_age: Optional[float]) -> float:
+        return time.time() - (self.ttl_seconds if max_age is None else max_age)
+
+
+def _as_flag(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return int(value.strip().lower() == "true")
+    return int(bool(value))
+
+
+_default_catalog: Optional[MarketCatalog] = None
+_default_lock = threading.Lock()
+
+
+def get_default_catalog() -> Optional[MarketCatalog]:
+    """Process-wide catalog at ``~/.polyterm/market_catalog.db``.
+
+    Returns None when disabled through ``POLYTERM_MARKET_CATALOG`` or when
+    the file cannot be opened.
+    """
+    global _default_catalog
+    if not catalog_enabled():
+        return None
+    with _default_lock:
+        if _default_catalog is None:
+            try:
+                _default_catalog = MarketCatalog()
+            except (OSError, sqlite3.Error):
+                return None
+        return _default_catalog
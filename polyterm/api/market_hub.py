@@ -0,0 +1,478 @@
+"""Shared CLOB market-channel WebSocket hub.
+
+One socket, one ``json.loads`` per frame, fanned out to any number of
+subscribers through bounded asyncio queues. Subscribers filter by asset id
+and event type and can be added or removed while the socket stays open.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+try:
+    import websockets
+    HAS_WEBSOCKETS = True
+except ImportError:
+    HAS_WEBSOCKETS = False
+
+
+MARKET_WS_ENDPOINT = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+ORDERBOOK_EVENTS = frozenset({
+    "book",
+    "last_trade_price",
+    "price_change",
+    "tick_size_change",
+    "market_resolved",
+})
+
+_CLOSED = object()
+
+
+class HubSubscription:
+    """A subscriber's view of the hub: a bounded queue of decoded events.
+
+    Messages are the dicts decoded from the socket and are shared between
+    subscribers, so consumers must treat them as read-only. When the queue
+    is full the oldest message is dropped and counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        hub: "MarketStreamHub",
+        asset_ids: Optional[Iterable[str]],
+        event_types: Optional[Iterable[str]],
+        maxsize: int,
+    ):
+        self.hub = hub
+        self.asset_ids: Optional[Set[str]] = (
+            {str(asset_id) for asset_id in asset_ids} if asset_ids is not None else None
+        )
+        self.event_types: Optional[Set[str]] = set(event_types) if event_types else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+
+    def wants(self, event_type: str) -> bool:
+        return self.event_types is None or event_type in self.event_types
+
+    def offer(self, message: Any) -> None:
+        """Enqueue without blocking the reader, evicting the oldest on overflow."""
+        if self.closed:
+            return
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(message)
+        self.delivered += 1
+
+    def close(self) -> None:
+        """Stop iteration once queued messages are drained."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(_CLOSED)
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Return the next message, or None once the subscription is closed."""
+        message = await self.queue.get()
+        if message is _CLOSED:
+            # Leave the sentinel for any other waiter.
+            self.queue.put_nowait(_CLOSED)
+            return None
+        return message
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        message = await self.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class MarketStreamHub:
+    """Multiplexes the public CLOB market channel over a single socket.
+
+    Usage:
+        hub = MarketStreamHub()
+        books = hub.subscribe(token_ids, event_types=ORDERBOOK_EVENTS)
+        trades = hub.subscribe(token_ids, event_types={"last_trade_price"})
+        asyncio.create_task(hub.run())
+        async for message in books:
+            ...
+
+    Asset ids are reference counted across subscribers; the socket is only
+    told to subscribe or unsubscribe when the first subscriber arrives or
+    the last one leaves.
+    """
+
+    def __init__(
+        self,
+        ws_endpoint: str = MARKET_WS_ENDPOINT,
+        queue_size: int = 1000,
+        message_timeout: float = 60.0,
+        connect: Optional[Callable[[str], Awaitable[Any]]] = None,
+    ):
+        self.ws_endpoint = ws_endpoint
+        self.queue_size = queue_size
+        self.message_timeout = message_timeout
+        self._connect = connect
+        self._ws = None
+        self._running = False
+        self.failed = False
+        self._subscriptions: List[HubSubscription] = []
+        self._by_asset: Dict[str, List[HubSubscription]] = {}
+        self._wildcard: List[HubSubscription] = []
+        self._connect_listeners: List[Callable[[], None]] = []
+        self.frames_received = 0
+        self.messages_dispatched = 0
+
+    # -- Subscriber management --
+
+    @property
+    def asset_ids(self) -> List[str]:
+        return sorted(self._by_asset)
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    def add_connect_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` each time a socket is open and subscribed."""
+        self._connect_listeners.append(callback)
+
+    def remove_connect_listener(self, callback: Callable[[], None]) -> None:
+        if callback in self._connect_listeners:
+            self._connect_listeners.remove(callback)
+
+    def subscribe(
+        self,
+        token_ids: Optional[Iterable[str]] = None,
+        event_types: Optional[Iterable[str]] = None,
+        maxsize: Optional[int] = None,
+    ) -> HubSubscription:
+        """Register a subscriber.
+
+        Args:
+            token_ids: Asset ids to receive. ``None`` receives every event
+                the socket delivers (for assets other subscribers asked for).
+            event_types: ``event_type`` values to receive; all when omitted.
+            maxsize: Queue bound; defaults to the hub's ``queue_size``.
+        """
+        sub = HubSubscription(self, token_ids, event_types, maxsize or self.queue_size)
+        self._subscriptions.append(sub)
+        if sub.asset_ids is None:
+            self._wildcard.append(sub)
+        else:
+            self._add_assets(sub, sub.asset_ids)
+        return sub
+
+    def update(
+        self,
+        sub: HubSubscription,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Change a subscriber's asset set on the open socket."""
+        if sub.asset_ids is None:
+            raise ValueError("Wildcard subscriptions have no asset set to update")
+        added = {str(asset_id) for asset_id in add} - sub.asset_ids
+        removed = {str(asset_id) for asset_id in remove} & sub.asset_ids
+        sub.asset_ids |= added
+        sub.asset_ids -= removed
+        self._add_assets(sub, added)
+        self._remove_assets(sub, removed)
+
+    def unsubscribe(self, sub: HubSubscription) -> None:
+        """Remove a subscriber and close its queue."""
+        if sub not in self._subscriptions:
+            return
+        self._subscriptions.remove(sub)
+        if sub.asset_ids is None:
+            self._wildcard.remove(sub)
+        else:
+            self._remove_assets(sub, sub.asset_ids)
+        sub.close()
+
+    def _add_assets(self, sub: HubSubscription, asset_ids: Iterable[str]) -> None:
+        new_assets = []
+        for asset_id in asset_ids:
+            subscribers = self._by_asset.setdefault(asset_id, [])
+            if not subscribers:
+                new_assets.append(asset_id)
+            subscribers.append(sub)
+        if new_assets:
+            self._schedule_send({"assets_ids": new_assets, "operation": "subscribe"})
+
+    def _remove_assets(self, sub: HubSubscription, asset_ids: Iterable[str]) -> None:
+        gone = []
+        for asset_id in asset_ids:
+            subscribers = self._by_asset.get(asset_id, [])
+            if sub in subscribers:
+                subscribers.remove(sub)
+            if not subscribers:
+                self._by_asset.pop(asset_id, None)
+                gone.append(asset_id)
+        if gone:
+            self._schedule_send({"assets_ids": gone, "operation": "unsubscribe"})
+
+    def _schedule_send(self, payload: Dict[str, Any]) -> None:
+        """Send a subscription change if connected; ``run`` replays the rest."""
+        if self._ws is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(self._send(payload))
+
+    async def _send(self, payload: Dict[str, Any]) -> None:
+        ws = self._ws
+        if ws is None:
+            return
+        try:
+            await ws.send(json.dumps(payload))
+        except Exception as exc:
+            logger.debug("Market hub send failed: %s", exc)
+
+    # -- Socket loop --
+
+    async def _open(self):
+        if self._connect is not None:
+            return await self._connect(self.ws_endpoint)
+        if not HAS_WEBSOCKETS:
+            raise Exception("websockets library not installed. Install with: pip install websockets")
+        return await websockets.connect(self.ws_endpoint)
+
+    async def run(
+        self,
+        max_reconnects: int = 5,
+        supervisor_retries: int = 0,
+        supervisor_cooldown: float = 60.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Connect, subscribe, and pump frames until ``close`` or failure.
+
+        Reconnects with exponential backoff; the attempt counter resets
+        after any frame is received. When reconnects are exhausted the
+        supervisor waits ``supervisor_cooldown`` and starts a fresh cycle,
+        up to ``supervisor_retries`` times. After that ``failed`` is set
+        and every subscription is closed. ``on_error`` hears about each
+        supervisor restart and the final failure.
+
+        Without the ``websockets`` library (and no injected ``connect``)
+        the hub fails at once instead of retrying.
+        """
+        self._running = True
+        self.failed = False
+        restarts = 0
+
+        if self._connect is None and not HAS_WEBSOCKETS:
+            self._running = False
+            self.failed = True
+            _notify(on_error, Exception("websockets library not installed. Install with: pip install websockets"))
+            for sub in list(self._subscriptions):
+                sub.close()
+            return
+
+        while self._running:
+            await self._connect_cycle(max_reconnects)
+            if not self._running:
+                break
+
+            restarts += 1
+            if restarts > supervisor_retries:
+                self.failed = True
+                logger.error("Market hub gave up after %d reconnect attempts", max_reconnects)
+                _notify(on_error, Exception(
+                    f"CLOB market websocket permanently failed after {supervisor_retries} supervisor retries"
+                ))
+                break
+
+            logger.error(
+                "Market hub reconnects exhausted, supervisor restarting in %.0fs (attempt %d/%d)",
+                supervisor_cooldown, restarts, supervisor_retries,
+            )
+            _notify(on_error, Exception(
+                f"CLOB market websocket reconnects exhausted, supervisor restart {restarts}/{supervisor_retries}"
+            ))
+            await asyncio.sleep(supervisor_cooldown)
+
+        self._running = False
+        for sub in list(self._subscriptions):
+            sub.close()
+
+    async def _connect_cycle(self, max_reconnects: int) -> None:
+        """One reconnect loop; returns when reconnects run out or on ``close``."""
+        attempts = 0
+        while self._running:
+            if attempts:
+                if attempts > max_reconnects:
+                    return
+                await asyncio.sleep(min(2 ** attempts, 30))
+
+            # Counted from frames_received so a socket that delivered frames
+            # and then raised still resets the backoff
+            frames_before = self.frames_received
+            try:
+                self._ws = await self._open()
+                if self._by_asset:
+                    await self._send({
+                        "assets_ids": self.asset_ids,
+                        "type": "market",
+                        "custom_feature_enabled": True,
+                    })
+                for listener in list(self._connect_listeners):
+                    try:
+                        listener()
+                    except Exception as exc:
+                        logger.debug("Market hub connect listener error: %s", exc)
+                await self._pump()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Market hub connection error: %s", exc)
+            finally:
+                await self._drop_socket()
+
+            attempts = 1 if self.frames_received > frames_before else attempts + 1
+
+    async def _pump(self) -> int:
+        """Read frames until the socket closes or goes quiet."""
+        received = 0
+        while self._running:
+            try:
+                frame = await asyncio.wait_for(self._ws.recv(), timeout=self.message_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Market hub message timeout (%.0fs), reconnecting", self.message_timeout)
+                break
+            received += 1
+            self.frames_received += 1
+
+            if frame == "PING":
+                await self._ws.send("PONG")
+                continue
+            self.dispatch_frame(frame)
+        return received
+
+    async def _drop_socket(self) -> None:
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        """Stop the loop, close the socket, and end every subscription."""
+        self._running = False
+        await self._drop_socket()
+        for sub in list(self._subscriptions):
+            sub.close()
+
+    # -- Fan-out --
+
+    def dispatch_frame(self, frame: Any) -> int:
+        """Decode a raw frame once and fan it out. Returns messages routed."""
+        if not frame or (isinstance(frame, str) and not frame.strip()):
+            return 0
+        try:
+            decoded = json.loads(frame)
+        except (TypeError, ValueError):
+            return 0
+        routed = 0
+        for message in decoded if isinstance(decoded, list) else [decoded]:
+            if isinstance(message, dict):
+                routed += self.dispatch(message)
+        return routed
+
+    def dispatch(self, message: Dict[str, Any]) -> int:
+        """Route one decoded event to matching subscribers."""
+        event_type = message.get("event_type", message.get("type", ""))
+        targets: List[HubSubscription] = []
+        seen: Set[int] = set()
+
+        keys = self._routing_keys(message)
+        for key in keys:
+            for sub in self._by_asset.get(key, ()):
+                if id(sub) not in seen:
+                    seen.add(id(sub))
+                    targets.append(sub)
+
+        if not keys:
+            # Without an asset id (e.g. legacy activity frames) the event
+            # cannot be routed, so every asset subscriber gets it. Events
+            # for assets nobody subscribes to (in flight after an
+            # unsubscribe) are dropped.
+            targets = [sub for sub in self._subscriptions if sub.asset_ids is not None]
+            seen = {id(sub) for sub in targets}
+
+        targets.extend(sub for sub in self._wildcard if id(sub) not in seen)
+
+        delivered = 0
+        for sub in targets:
+            if sub.wants(event_type):
+                sub.offer(message)
+                delivered += 1
+        if delivered:
+            self.messages_dispatched += 1
+        return delivered
+
+    @staticmethod
+    def _routing_keys(message: Dict[str, Any]) -> List[str]:
+        keys = []
+        asset_id = message.get("asset_id")
+        if asset_id:
+            keys.append(str(asset_id))
+        for change in message.get("price_changes") or []:
+            if isinstance(change, dict) and change.get("asset_id"):
+                keys.append(str(change["asset_id"]))
+        market = message.get("market")
+        if market:
+            keys.append(str(market))
+        return keys
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # -- Consumer helper --
+
+    @staticmethod
+    async def consume(
+        sub: HubSubscription,
+        handler: Callable[[Dict[str, Any]], Any],
+    ) -> None:
+        """Feed every message of ``sub`` to ``handler`` until it closes."""
+        async for message in sub:
+            try:
+                result = handler(message)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                logger.debug("Market hub subscriber error: %s", exc)
+
+
+def _notify(on_error: Optional[Callable[[Exception], None]], exc: Exception) -> None:
+    if on_error is None:
+        return
+    try:
+        on_error(exc)
+    except Exception:
+        pass
@@ -0,0 +1,327 @@
+"""Token-bucket rate limiting for the Gamma, CLOB and Data APIs
+
+Every request takes one token from two buckets: its host's (``gamma``,
+``clob``, ``data``) and its endpoint class's (``gamma:markets``,
+``clob:book``, ...). Each bucket refills at ``rate`` tokens per second up to
+``burst`` tokens, so a 10-page keyset fetch runs as fast as the network
+allows while sustained polling is still held to the host's budget.
+
+Buckets are stored as their theoretical arrival time (GCRA, the time-based
+form of a token bucket): one float per bucket, which makes reservations
+atomic and lets callers sleep outside any lock. State is shared by every
+PolyTerm process through a small SQLite file (``~/.polyterm/rate_limits.db``)
+and falls back to in-process buckets if the file cannot be used.
+
+A 429 response ``penalize``s the bucket until its ``Retry-After`` passes, so
+other threads and processes back off too instead of each discovering the
+limit on their own.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Set to 0/false/off to keep buckets in-process (one set per client)
+RATE_LIMIT_ENV_VAR = "POLYTERM_RATE_LIMITS"
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Refill ``rate`` tokens per second, holding at most ``burst``"""
+
+    rate: float
+    burst: float
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        """How far ahead of ``now`` the bucket's arrival time may run"""
+        return (self.burst - 1) * self.interval
+
+
+# Host and endpoint-class budgets, well inside Polymarket's published limits
+DEFAULT_BUDGETS: Dict[str, Budget] = {
+    "gamma": Budget(rate=40, burst=100),
+    "gamma:markets": Budget(rate=10, burst=30),
+    "gamma:events": Budget(rate=10, burst=30),
+    "gamma:search": Budget(rate=5, burst=15),
+    "clob": Budget(rate=50, burst=150),
+    "clob:book": Budget(rate=20, burst=60),
+    "clob:history": Budget(rate=10, burst=30),
+    "clob:pricing": Budget(rate=20, burst=60),
+    "data": Budget(rate=15, burst=40),
+    "data:trades": Budget(rate=7, burst=20),
+    "data:wallet": Budget(rate=7, burst=20),
+}
+
+# Budget for a host or endpoint class without its own entry
+FALLBACK_BUDGET = Budget(rate=10, burst=20)
+
+# Path prefixes mapped to endpoint classes, first match wins
+ENDPOINT_CLASSES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "gamma": (
+        ("/markets", "markets"),
+        ("/events", "events"),
+        ("/public-search", "search"),
+        ("/search", "search"),
+    ),
+    "clob": (
+        ("/books", "book"),
+        ("/book", "book"),
+        ("/prices-history", "history"),
+        ("/price", "pricing"),
+        ("/midpoint", "pricing"),
+        ("/spread", "pricing"),
+        ("/last-trade-price", "pricing"),
+        ("/tick-size", "pricing"),
+    ),
+    "data": (
+        ("/trades", "trades"),
+        ("/positions", "wallet"),
+        ("/closed-positions", "wallet"),
+        ("/activity", "wallet"),
+        ("/value", "wallet"),
+        ("/holders", "wallet"),
+    ),
+}
+
+
+def shared_state_enabled() -> bool:
+    """Whether limiters share bucket state across processes."""
+    return os.environ.get(RATE_LIMIT_ENV_VAR, "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def endpoint_class(service: str, endpoint: str) -> str:
+    """Endpoint class for a path or full URL (``"other"`` if unlisted)."""
+    path = urlsplit(endpoint).path if "://" in endpoint else endpoint
+    for prefix, name in ENDPOINT_CLASSES.get(service, ()):
+        if path.startswith(prefix):
+            return name
+    return "other"
+
+
+class _MemoryBuckets:
+    """Bucket arrival times for one process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tat: Dict[str, float] = {}
+
+    def reserve(self, buckets: List[Tuple[str, Budget]], now: float) -> float:
+        with self._lock:
+            tats = [self._tat.get(key, 0.0) for key, _ in buckets]
+            wait, new_tats = _schedule(buckets, tats, now)
+            for (key, _), tat in zip(buckets, new_tats):
+                self._tat[key] = tat
+            return wait
+
+    def block(self, buckets: List[Tuple[str, Budget]], until: float) -> None:
+        with self._lock:
+            for key, budget in buckets:
+                self._tat[key] = max(self._tat.get(key, 0.0), until + budget.tolerance)
+
+    def arrival_times(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._tat)
+
+
+class _SQLiteBuckets:
+    """Bucket arrival times shared by every process through one SQLite file"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets (key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or getattr(local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(str(self.db_path), timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            # Bucket state is disposable; skip fsync on every request
+            conn.execute("PRAGMA synchronous = OFF")
+            local.conn = conn
+            local.pid = os.getpid()
+        return conn
+
+    def _update(self, buckets: List[Tuple[str, Budget]], apply) -> float:
+        conn = self._connection()
+        keys = [key for key, _ in buckets]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            placeholders = ",".join("?" * len(keys))
+            rows = dict(conn.execute(
+                f"SELECT key, tat FROM rate_buckets WHERE key IN ({placeholders})", keys
+            ).fetchall())
+            result, new_tats = apply([rows.get(key, 0.0) for key in keys])
+            conn.executemany(
+                "INSERT INTO rate_buckets (key, tat) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                list(zip(keys, new_tats)),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def reserve(self, buckets: List[Tuple[str, Budget]], now: float) -> float:
+        return self._update(buckets, lambda tats: _schedule(buckets, tats, now))
+
+    def block(self, buckets: List[Tuple[str, Budget]], until: float) -> None:
+        self._update(buckets, lambda tats: (None, [
+            max(tat, until + budget.tolerance) for tat, (_, budget) in zip(tats, buckets)
+        ]))
+
+    def arrival_times(self) -> Dict[str, float]:
+        return dict(self._connection().execute("SELECT key, tat FROM rate_buckets").fetchall())
+
+
+def _schedule(buckets: List[Tuple[str, Budget]], tats: List[float], now: float) -> Tuple[float, List[float]]:
+    """Earliest start satisfying every bucket, and the buckets' new arrival times."""
+    start = now
+    for (_, budget), tat in zip(buckets, tats):
+        start = max(start, tat - budget.tolerance)
+    new_tats = [max(tat, start) + budget.interval for (_, budget), tat in zip(buckets, tats)]
+    return start - now, new_tats
+
+
+class TokenBucketLimiter:
+    """Per-host and per-endpoint-class token buckets with shared state
+
+    Args:
+        budgets: Overrides for ``DEFAULT_BUDGETS`` (``"host"`` or
+            ``"host:class"`` keys)
+        db_path: SQLite state file; ``None`` keeps buckets in-process
+    """
+
+    def __init__(self, budgets: Optional[Dict[str, Budget]] = None, db_path: Optional[str] = None):
+        self.budgets = dict(DEFAULT_BUDGETS)
+        if budgets:
+            self.budgets.update(budgets)
+        self._memory = _MemoryBuckets()
+        self._state = self._memory
+        if db_path:
+            try:
+                self._state = _SQLiteBuckets(Path(db_path))
+            except (OSError, sqlite3.Error):
+                pass
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+    def _buckets(self, service: str, endpoint: str) -> List[Tuple[str, Budget]]:
+        class_key = f"{service}:{endpoint_class(service, endpoint)}"
+        return [
+            (service, self.budgets.get(service, FALLBACK_BUDGET)),
+            (class_key, self.budgets.get(class_key, FALLBACK_BUDGET)),
+        ]
+
+    def reserve(self, service: str, endpoint: str = "") -> float:
+        """Take a token for one request; returns the seconds to wait first."""
+        buckets = self._buckets(service, endpoint)
+        now = time.time()
+        try:
+            wait = self._state.reserve(buckets, now)
+        except sqlite3.Error:
+            # Degrade to in-process buckets rather than failing requests
+            self._state = self._memory
+            wait = self._state.reserve(buckets, now)
+        self._record(buckets[1][0], wait)
+        return wait
+
+    def acquire(self, service: str, endpoint: str = "") -> float:
+        """Block until a request to ``endpoint`` is within budget."""
+        wait = self.reserve(service, endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, service: str, endpoint: str = "") -> float:
+        """``acquire`` for coroutines: waits with ``asyncio.sleep``."""
+        wait = self.reserve(service, endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, service: str, endpoint: str, retry_after: float) -> None:
+        """Hold the request's buckets empty for ``retry_after`` seconds (after a 429)."""
+        buckets = self._buckets(service, endpoint)
+        until = time.time() + max(retry_after, 0.0)
+        try:
+            self._state.block(buckets, until)
+        except sqlite3.Error:
+            self._state = self._memory
+            self._state.block(buckets, until)
+        with self._metrics_lock:
+            self._entry(buckets[1][0])["throttled"] += 1
+
+    def _entry(self, key: str) -> Dict[str, float]:
+        return self._metrics.setdefault(key, {
+            "requests": 0, "delayed": 0, "wait_seconds": 0.0, "max_wait": 0.0, "throttled": 0,
+        })
+
+    def _record(self, key: str, wait: float) -> None:
+        with self._metrics_lock:
+            entry = self._entry(key)
+            entry["requests"] += 1
+            if wait > 0:
+                entry["delayed"] += 1
+                entry["wait_seconds"] += wait
+                entry["max_wait"] = max(entry["max_wait"], wait)
+
+    def tokens(self, key: str) -> float:
+        """Tokens currently available in bucket ``key`` (``"gamma"``, ``"clob:book"``)."""
+        budget = self.budgets.get(key, FALLBACK_BUDGET)
+        try:
+            tat = self._state.arrival_times().get(key, 0.0)
+        except sqlite3.Error:
+            tat = 0.0
+        ahead = max(tat - time.time(), 0.0)
+        return max(0.0, min(budget.burst, budget.burst - ahead / budget.interval))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per endpoint class: requests, delayed requests, wait time, 429s and tokens."""
+        with self._metrics_lock:
+            snapshot = {key: dict(entry) for key, entry in self._metrics.items()}
+        for key, entry in snapshot.items():
+            entry["tokens"] = round(self.tokens(key), 2)
+        return snapshot
+
+    def wait_if_needed(self) -> None:
+        """``RateLimiter``-compatible wait against the generic bucket."""
+        self.acquire("default")
+
+
+_default_limiter: Optional[TokenBucketLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucketLimiter:
+    """Process-wide limiter backed by ``~/.polyterm/rate_limits.db``.
+
+    With ``POLYTERM_RATE_LIMITS=0`` each call returns a new in-process
+    limiter instead.
+    """
+    global _default_limiter
+    if not shared_state_enabled():
+        return TokenBucketLimiter()
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = TokenBucketLimiter(
+                db_path=str(Path.home() / ".polyterm" / "rate_limits.db"),
+            )
+        return _default_limiter
@@ -0,0 +1,348 @@
+"""Concurrent, cutoff-aware reader of the Data API public trade tape.
+
+``/trades`` is a newest-first tape paged by ``offset`` (1,000 rows per page,
+offsets up to 3,000). Time-window questions ("who bet over $100k in the
+last 72h?") used to walk it one blocking page at a time. ``TradeTape``:
+
+- fetches pages in concurrent waves (1, then 2, then up to
+  ``concurrency`` pages), each request still drawing from the client's
+  token buckets;
+- stops at the first page that crosses the time cutoff or comes back empty;
+- dedupes rows by transaction hash, wallet, asset and side;
+- keeps a rolling cache per notional filter. A later read refreshes only
+  the head (rows newer than the cache) and, for a wider window, continues
+  the tail from the cached depth, so 24h -> 48h -> 72h fetch only the delta.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# Data API limits for the public trade tape
+PAGE_SIZE = 1000
+MAX_OFFSET = 3000
+MAX_ROWS = MAX_OFFSET + PAGE_SIZE
+
+# Pages in flight at once; well inside the ``data:trades`` burst
+DEFAULT_CONCURRENCY = 4
+
+# Seconds a cached head is served before newer rows are fetched
+REFRESH_SECONDS = 5.0
+
+# Rolling cache bounds, per notional filter and overall
+MAX_AGE_SECONDS = 7 * 86400
+MAX_SEGMENT_ROWS = 20000
+MAX_SEGMENTS = 8
+
+
+def _timestamp(row: Dict[str, Any]) -> int:
+    try:
+        return int(float(row.get("timestamp") or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def row_key(row: Dict[str, Any]) -> Hashable:
+    """Identity of a tape row: its transaction hash, wallet, asset and side"""
+    wallet = row.get("proxyWallet") or row.get("user") or row.get("wallet")
+    tx_hash = row.get("transactionHash")
+    if tx_hash:
+        return (tx_hash, wallet, row.get("asset"), row.get("side"))
+    return (wallet, row.get("asset"), row.get("side"), row.get("size"), row.get("price"), row.get("timestamp"))
+
+
+@dataclass
+class TapeWindow:
+    """Tape rows at or after a cutoff, newest first"""
+    rows: List[Dict[str, Any]]
+    pages_fetched: int = 0
+    rows_fetched: int = 0
+    # Tape rows the window was drawn from, including those past the cutoff
+    rows_scanned: int = 0
+    # Rows in ``rows`` that were already cached before this read
+    cached_rows: int = 0
+    # The window reached the cutoff or the end of the tape
+    covered: bool = False
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _Segment:
+    """Cached top of the tape for one notional filter"""
+    rows: Dict[Hashable, Dict[str, Any]] = field(default_factory=dict)
+    # Tape positions covered from the top, as of the last head refresh
+    depth: int = 0
+    exhausted: bool = False
+    refreshed_at: float = float("-inf")
+    # Bumped on every change; a scan started on an older version is dropped
+    version: int = 0
+
+    def oldest_timestamp(self) -> Optional[int]:
+        stamps = [ts for ts in map(_timestamp, self.rows.values()) if ts]
+        return min(stamps) if stamps else None
+
+    def covers(self, cutoff_ts: int) -> bool:
+        oldest = self.oldest_timestamp()
+        return self.exhausted or (oldest is not None and oldest < cutoff_ts)
+
+
+class TradeTape:
+    """Rolling cache over ``DataAPIClient.get_recent_trades``"""
+
+    def __init__(
+        self,
+        data_api: Any,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        refresh_seconds: float = REFRESH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.data_api = data_api
+        self.concurrency = max(int(concurrency), 1)
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._segments: Dict[float, _Segment] = {}
+
+    def read(
+        self,
+        cutoff_ts: int,
+        min_notional: float = 0,
+        page_size: int = PAGE_SIZE,
+        max_offset: int = MAX_OFFSET,
+    ) -> TapeWindow:
+        """Return tape rows with ``timestamp >= cutoff_ts`` (or no timestamp).
+
+        Args:
+            cutoff_ts: Window start, epoch seconds
+            min_notional: Server-side ``filterType=CASH`` amount; 0 reads
+                the unfiltered tape
+            page_size: Rows per request (at most 1,000)
+            max_offset: Deepest offset requested (at most 3,000)
+        """
+        page_size = max(1, min(int(page_size or PAGE_SIZE), PAGE_SIZE))
+        max_offset = max(0, min(int(max_offset), MAX_OFFSET))
+        key = float(min_notional or 0)
+        window = TapeWindow(rows=[])
+
+        # The lock guards the cache only; pages are fetched unlocked and
+        # applied only if no other read changed the segment meanwhile.
+        with self._lock:
+            segment = self._segments.pop(key, None)
+            self._segments[key] = segment = segment or _Segment()
+            while len(self._segments) > MAX_SEGMENTS:
+                self._segments.pop(next(iter(self._segments)))
+
+            known = set(segment.rows)
+            stale = self._clock() - segment.refreshed_at >= self.refresh_seconds
+            if stale and not segment.rows:
+                # Nothing cached to join: the tail scan reads the head
+                segment.depth, segment.exhausted = 0, False
+                segment.refreshed_at = self._clock()
+                segment.version += 1
+                stale = False
+            version, depth = segment.version, segment.depth
+            covered = segment.covers(cutoff_ts)
+
+        if stale:
+            fresh, overlap = self._scan_head(known, key, page_size, max_offset, window)
+            with self._lock:
+                if not window.errors and segment.version == version:
+                    self._apply_head(segment, fresh, overlap, page_size)
+                version, depth = segment.version, segment.depth
+                covered = segment.covers(cutoff_ts)
+
+        if not covered and not window.errors:
+            pages, exhausted = self._scan_tail(depth, key, cutoff_ts, page_size, max_offset, window)
+            with self._lock:
+                if segment.version == version:
+                    self._apply_tail(segment, pages, exhausted)
+
+        with self._lock:
+            window.covered = segment.covers(cutoff_ts)
+            window.rows_scanned = len(segment.rows)
+            for row_id, row in segment.rows.items():
+                ts = _timestamp(row)
+                if ts and ts < cutoff_ts:
+                    continue
+                window.rows.append(row)
+                window.cached_rows += row_id in known
+            self._trim(segment)
+
+        window.rows.sort(key=_timestamp, reverse=True)
+        return window
+
+    def clear(self) -> None:
+        with self._lock:
+            self._segments.clear()
+
+    # -- Fetching --
+
+    def _fetch(self, offset: int, page_size: int, min_notional: float) -> List[Dict[str, Any]]:
+        if min_notional > 0:
+            page = self.data_api.get_recent_trades(
+                limit=page_size,
+                offset=offset,
+                filter_type="CASH",
+                filter_amount=min_notional,
+            )
+        else:
+            page = self.data_api.get_recent_trades(limit=page_size, offset=offset)
+        return page if isinstance(page, list) else []
+
+    def _waves(
+        self,
+        start: int,
+        page_size: int,
+        max_offset: int,
+        min_notional: float,
+        window: TapeWindow,
+    ) -> Iterator[List[Tuple[int, List[Dict[str, Any]]]]]:
+        """Yield waves of ``(offset, rows)`` pages in offset order.
+
+        Waves grow 1, 2, 4, ... up to ``concurrency`` pages, since most
+        windows end within the first page. A failed page is recorded in
+        ``window.errors`` and ends the scan; later pages of its wave are
+        dropped so the cache stays contiguous.
+        """
+        offsets = list(range(start, max_offset + 1, page_size))
+        size = 1
+        while offsets:
+            batch, offsets = offsets[:size], offsets[size:]
+            size = min(size * 2, self.concurrency)
+            if len(batch) == 1:
+                results = [self._try_fetch(batch[0], page_size, min_notional)]
+            else:
+                with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+                    results = list(pool.map(lambda offset: self._try_fetch(offset, page_size, min_notional), batch))
+
+            wave = []
+            for offset, (rows, error) in zip(batch, results):
+                if error is not None:
+                    window.errors.append({"offset": offset, "error": str(error)})
+                    break
+                window.pages_fetched += 1
+                window.rows_fetched += len(rows)
+                wave.append((offset, rows))
+            if wave:
+                yield wave
+            if window.errors:
+                return
+
+    def _try_fetch(self, offset: int, page_size: int, min_notional: float):
+        try:
+            return self._fetch(offset, page_size, min_notional), None
+        except Exception as exc:
+            return [], exc
+
+    def _scan_tail(
+        self,
+        depth: int,
+        min_notional: float,
+        cutoff_ts: int,
+        page_size: int,
+        max_offset: int,
+        window: TapeWindow,
+    ) -> Tuple[List[Tuple[int, List[Dict[str, Any]]]], bool]:
+        """Page on from ``depth`` until the cutoff or the tape end.
+
+        Returns the non-empty ``(offset, rows)`` pages and whether the
+        tape ran out.
+        """
+        pages: List[Tuple[int, List[Dict[str, Any]]]] = []
+        for wave in self._waves(depth, page_size, max_offset, min_notional, window):
+            for offset, rows in wave:
+                if not rows:
+                    return pages, True
+                pages.append((offset, rows))
+                stamps = [ts for ts in map(_timestamp, rows) if ts]
+                if stamps and min(stamps) < cutoff_ts:
+                    return pages, False
+        return pages, False
+
+    def _apply_tail(
+        self,
+        segment: _Segment,
+        pages: List[Tuple[int, List[Dict[str, Any]]]],
+        exhausted: bool,
+    ) -> None:
+        for offset, rows in pages:
+            for row in rows:
+                segment.rows.setdefault(row_key(row), row)
+            segment.depth = offset + len(rows)
+        segment.exhausted = segment.exhausted or exhausted
+        segment.version += 1
+
+    def _scan_head(
+        self,
+        known: set,
+        min_notional: float,
+        page_size: int,
+        max_offset: int,
+        window: TapeWindow,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch rows newer than ``known``.
+
+        Returns the new rows, newest first, and their count if the scan
+        reached a known row (``None`` if it never did).
+        """
+        fresh: List[Dict[str, Any]] = []
+        overlap = None
+        for wave in self._waves(0, page_size, max_offset, min_notional, window):
+            for _, rows in wave:
+                for row in rows:
+                    if row_key(row) in known:
+                        overlap = len(fresh)
+                        break
+                    fresh.append(row)
+                if overlap is not None or not rows:
+                    break
+            if overlap is not None or not wave[-1][1]:
+                break
+        return fresh, overlap
+
+    def _apply_head(
+        self,
+        segment: _Segment,
+        fresh: List[Dict[str, Any]],
+        overlap: Optional[int],
+        page_size: int,
+    ) -> None:
+        """Add new head rows and shift the cached depth by their count"""
+        if overlap is None:
+            # More new rows than one scan reaches: the cache no longer
+            # joins the head, so start over from the fresh rows.
+            segment.rows.clear()
+            segment.exhausted = not fresh or len(fresh) < page_size
+            segment.depth = len(fresh)
+        else:
+            segment.depth += overlap
+        for row in fresh:
+            segment.rows.setdefault(row_key(row), row)
+        segment.refreshed_at = self._clock()
+        segment.version += 1
+
+    def _trim(self, segment: _Segment) -> None:
+        """Drop rows past the age or size bound, oldest first"""
+        if not segment.rows:
+            return
+        newest = max(map(_timestamp, segment.rows.values()))
+        ordered = sorted(segment.rows.items(), key=lambda item: _timestamp(item[1]), reverse=True)
+        keep = [
+            (row_id, row) for index, (row_id, row) in enumerate(ordered)
+            if index < MAX_SEGMENT_ROWS and (not _timestamp(row) or _timestamp(row) >= newest - MAX_AGE_SECONDS)
+        ]
+        if len(keep) == len(ordered):
+            return
+        segment.rows = dict(keep)
+        segment.depth = max(segment.depth - (len(ordered) - len(keep)), 0)
+        segment.exhausted = False
+        segment.version += 1
+
+
+def tape_for(data_api: Any) -> TradeTape:
+    """The client's shared tape (``DataAPIClient.trade_tape()``), or a new one"""
+    factory = getattr(data_api, "trade_tape", None)
+    tape = factory() if callable(factory) else None
+    return tape if isinstance(tape, TradeTape) else TradeTape(data_api)
@@ -7,6 +7,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ...db.database import Database
+from ..context import shared_database
 from ...api.gamma import GammaClient
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
@@ -37,7 +38,7 @@ def center(ctx, show_all, alert_type, clear, check, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # Clear all alerts
     if clear:
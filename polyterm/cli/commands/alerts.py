@@ -6,6 +6,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ...db.database import Database
+from ..context import shared_database
 from ...core.alert_engine import AlertEngine
 from ...core.notifications import NotificationConfig, NotificationManager
 from ...utils.json_output import print_json
@@ -31,7 +32,7 @@ def alerts(ctx, alert_type, limit, unread, ack, add_rule, market, above, below,
 
     config = ctx.obj["config"]
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     try:
         if add_rule:
@@ -10,6 +10,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -33,7 +34,7 @@ def analyze(ctx, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     gamma_client = GammaClient(
         base_url=config.gamma_base_url,
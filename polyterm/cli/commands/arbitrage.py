@@ -15,7 +15,8 @@ from rich.table import Table
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...db.database import Database
-from ...core.arbitrage import ArbitrageScanner, KalshiArbitrageScanner
+from ..context import shared_database
+from ...core.arbitrage import ArbitrageScanner, IncrementalArbitrage, KalshiArbitrageScanner
 from ...core.cross_venue import CrossVenueMonitor
 from ...core.orderbook import OrderBookAnalyzer, LiveOrderBook
 from ...utils.json_output import print_json
@@ -79,7 +80,7 @@ def _run_live_mode(config, console, min_spread, limit, include_kalshi, output_fo
     clob_client = CLOBClient(
         rest_endpoint=config.clob_rest_endpoint,
     )
-    db = Database()
+    db = shared_database(Database)
     analyzer = OrderBookAnalyzer(clob_client)
     stop_event = threading.Event()
 
@@ -100,13 +101,25 @@ def _run_live_mode(config, console, min_spread, limit, include_kalshi, output_fo
                 console.print("[yellow]No CLOB token IDs found in markets, falling back to REST mode.[/yellow]")
             return
 
+        # Create scanner with live analyzer; intra-market arbs are kept
+        # current from book updates instead of rescanned
+        scanner = ArbitrageScanner(
+            database=db,
+            gamma_client=gamma_client,
+            clob_client=clob_client,
+            min_spread=min_spread,
+            orderbook_analyzer=analyzer,
+        )
+        incremental = IncrementalArbitrage(scanner)
+        incremental.track(markets)
+
         # Start WS feed in background thread
         def _ws_thread():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
             async def _run():
-                await analyzer.start_live_feed(token_ids)
+                await incremental.start(analyzer)
                 try:
                     await clob_client.listen_orderbook(
                         max_reconnects=10,
@@ -155,25 +168,19 @@ def _run_live_mode(config, console, min_spread, limit, include_kalshi, output_fo
             else:
                 console.print("[yellow]WS feed not ready, using REST prices with live fallback.[/yellow]\n")
 
-        # Create scanner with live analyzer
-        scanner = ArbitrageScanner(
-            database=db,
-            gamma_client=gamma_client,
-            clob_client=clob_client,
-            min_spread=min_spread,
-            orderbook_analyzer=analyzer,
-        )
-
-        scan_interval = 3.0  # seconds between scans
+        scan_interval = 3.0  # seconds between correlated-market scans
         scan_count = 0
+        correlated = []
+        last_scan = 0.0
 
         try:
             with Live(console=console, refresh_per_second=1, screen=True) as live_display:
                 while True:
                     scan_count += 1
-                    all_opps = []
-                    all_opps.extend(scanner.scan_intra_market_arbitrage(markets))
-                    all_opps.extend(scanner.scan_correlated_markets(markets))
+                    if time.monotonic() - last_scan >= scan_interval:
+                        correlated = scanner.scan_correlated_markets(markets)
+                        last_scan = time.monotonic()
+                    all_opps = incremental.opportunities(limit) + correlated
                     all_opps.sort(key=lambda x: x.net_profit, reverse=True)
                     all_opps = all_opps[:limit]
 
@@ -222,7 +229,7 @@ def _run_live_mode(config, console, min_spread, limit, include_kalshi, output_fo
                         from rich.console import Group
                         live_display.update(Group(status_text, table) if all_opps else Group(status_text, Text("No opportunities found", style="dim")))
 
-                    time.sleep(scan_interval)
+                    time.sleep(1.0)
 
         except KeyboardInterrupt:
             if output_format != 'json':
@@ -301,7 +308,7 @@ def arbitrage(ctx, min_spread, limit, include_kalshi, venues, query, live, outpu
     clob_client = CLOBClient(
         rest_endpoint=config.clob_rest_endpoint,
     )
-    db = Database()
+    db = shared_database(Database)
 
     try:
         # Initialize scanner
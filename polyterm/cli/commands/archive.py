@@ -6,6 +6,7 @@ from rich.table import Table
 
 from ...core.archive import ArchiveCollector
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -20,7 +21,7 @@ def archive():
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
 def search(query, limit, output_format):
     """Search archived market research briefs"""
-    collector = ArchiveCollector(database=Database())
+    collector = ArchiveCollector(database=shared_database(Database))
     result = collector.search_research_briefs(query=query, limit=limit)
 
     if output_format == "json":
@@ -54,7 +55,7 @@ def search(query, limit, output_format):
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
 def status(query, market_id, max_age_hours, output_format):
     """Report local archive coverage and freshness"""
-    collector = ArchiveCollector(database=Database())
+    collector = ArchiveCollector(database=shared_database(Database))
     result = collector.status(query=query, market_id=market_id, max_age_hours=max_age_hours)
 
     if output_format == "json":
@@ -6,10 +6,12 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
-from datetime import datetime, timedelta
-import random
 
 from ...api.gamma import GammaClient
+from ...api.clob import CLOBClient
+from ...core.backtest import BacktestEngine, load_backtest_data
+from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -21,13 +23,19 @@ from ...utils.errors import handle_api_error
 @click.option("--period", "-p", type=click.Choice(["7d", "30d", "90d"]), default="30d", help="Backtest period")
 @click.option("--capital", "-c", type=float, default=1000, help="Starting capital ($)")
 @click.option("--position-size", type=float, default=0.1, help="Position size as fraction of capital")
+@click.option("--bar", "bar_minutes", type=int, default=60, help="Bar size in minutes")
+@click.option("--sweep", is_flag=True, help="Sweep the strategy's parameter grid and rank by Sharpe")
+@click.option("--workers", type=int, default=None, help="Sweep worker processes (default: CPU count)")
+@click.option("--top", type=int, default=10, help="Sweep results to show")
 @click.option("--interactive", "-i", is_flag=True, help="Interactive mode")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
 @click.pass_context
-def backtest(ctx, strategy, market, period, capital, position_size, interactive, output_format):
+def backtest(ctx, strategy, market, period, capital, position_size, bar_minutes, sweep, workers, top,
+             interactive, output_format):
     """Backtest trading strategies on historical data
 
-    Test different strategies to see how they would have performed.
+    Replays stored market snapshots and tracked trades (falling back to
+    CLOB price history) through a strategy, with taker fees on every fill.
     Helps validate trading approaches before risking real capital.
 
     Strategies:
@@ -40,6 +48,7 @@ def backtest(ctx, strategy, market, period, capital, position_size, interactive,
     Examples:
         polyterm backtest -s momentum -p 30d
         polyterm backtest -s whale-follow -m "bitcoin" -c 5000
+        polyterm backtest -s mean-reversion -p 90d --sweep --workers 8
         polyterm backtest -i
     """
     console = Console()
@@ -97,6 +106,8 @@ def backtest(ctx, strategy, market, period, capital, position_size, interactive,
         base_url=config.gamma_base_url,
         api_key=config.gamma_api_key,
     )
+    clob_client = CLOBClient(rest_endpoint=config.clob_rest_endpoint)
+    db = shared_database(Database)
 
     try:
         with Progress(
@@ -120,8 +131,37 @@ def backtest(ctx, strategy, market, period, capital, position_size, interactive,
                     console.print("[yellow]No markets found for backtest.[/yellow]")
                 return
 
-            # Run backtest simulation
-            results = _run_backtest(markets, strategy, period_days, capital, position_size)
+            data = load_backtest_data(db, markets, period_days, bar_minutes=bar_minutes, clob_client=clob_client)
+            if not data.markets:
+                if output_format == 'json':
+                    print_json({'success': False, 'error': 'No price history found for these markets'})
+                else:
+                    console.print("[yellow]No price history found for these markets.[/yellow]")
+                return
+
+            engine = BacktestEngine(data, capital=capital, position_size=position_size)
+            if sweep:
+                progress.add_task("Sweeping parameters...", total=None)
+                ranked = engine.sweep(strategy, workers=workers, top=top)
+            else:
+                results = engine.run(strategy)
+                results['data_sources'] = data.sources
+
+        if sweep:
+            if output_format == 'json':
+                print_json({
+                    'success': True,
+                    'strategy': strategy,
+                    'period': period,
+                    'starting_capital': capital,
+                    'position_size': position_size,
+                    'markets_tested': len(data.markets),
+                    'data_sources': data.sources,
+                    'sweep': ranked,
+                })
+            else:
+                _display_sweep(console, strategy, ranked, capital)
+            return
 
         if output_format == 'json':
             print_json({
@@ -166,6 +206,8 @@ def backtest(ctx, strategy, market, period, capital, position_size, interactive,
         summary.add_row("", "")
         summary.add_row("Max Drawdown:", f"[red]{results['max_drawdown']:.1f}%[/red]")
         summary.add_row("Sharpe Ratio:", f"{results['sharpe_ratio']:.2f}")
+        summary.add_row("Fees Paid:", f"${results['fees_paid']:,.2f}")
+        summary.add_row("Markets Tested:", f"{results['markets_tested']} ({', '.join(results['data_sources'])})")
 
         console.print(summary)
         console.print()
@@ -225,7 +267,7 @@ def backtest(ctx, strategy, market, period, capital, position_size, interactive,
 
         # Risk warning
         console.print("[yellow]Note: Past performance does not guarantee future results.[/yellow]")
-        console.print("[yellow]This is a simulation using estimated data. Real results may vary.[/yellow]")
+        console.print("[yellow]Fills assume the bar's last price; real fills also pay spread and slippage.[/yellow]")
         console.print()
 
     except Exception as e:
@@ -235,142 +277,44 @@ def backtest(ctx, strategy, market, period, capital, position_size, interactive,
             handle_api_error(console, e, "backtesting")
     finally:
         gamma_client.close()
+        clob_client.close()
 
 
-def _run_backtest(markets: list, strategy: str, days: int, capital: float, position_size: float) -> dict:
-    """Run backtest simulation"""
-    trades = []
-    equity = capital
-    equity_curve = [capital]
-    peak = capital
-
-    max_drawdown = 0
-    returns = []
-
-    # Simulate trading over the period
-    num_trades = min(days // 3, 30)  # Trade every ~3 days
-
-    random.seed(42 + hash(strategy))  # Consistent results per strategy
-
-    for i in range(num_trades):
-        market = random.choice(markets)
-        market_title = market.get('question', market.get('title', ''))[:30]
-
-        # Entry price (simulated)
-        base_price = 0.5
-        tokens = market.get('tokens', [])
-        for token in tokens:
-            if token.get('outcome', '').upper() == 'YES':
-                try:
-                    base_price = float(token.get('price', 0.5))
-                except Exception:
-                    pass
-                break
-
-        entry_price = base_price + random.uniform(-0.15, 0.15)
-        entry_price = max(0.1, min(0.9, entry_price))
-
-        # Determine trade direction based on strategy
-        if strategy == "momentum":
-            # Buy if trending up
-            trend = random.uniform(-0.1, 0.1)
-            side = "BUY" if trend > 0 else "SELL"
-        elif strategy == "mean-reversion":
-            # Buy if low, sell if high
-            side = "BUY" if entry_price < 0.35 else "SELL" if entry_price > 0.65 else random.choice(["BUY", "SELL"])
-        elif strategy == "whale-follow":
-            # Random with slight edge
-            side = "BUY" if random.random() > 0.45 else "SELL"
-        elif strategy == "contrarian":
-            # Opposite of crowd
-            side = "SELL" if entry_price > 0.5 else "BUY"
-        else:  # volume-spike
-            side = random.choice(["BUY", "SELL"])
-
-        # Exit price (simulated with strategy-specific edge)
-        edge = {
-            "momentum": 0.02,
-            "mean-reversion": 0.015,
-            "whale-follow": 0.025,
-            "contrarian": 0.01,
-            "volume-spike": 0.03,
-        }[strategy]
-
-        # Random outcome with strategy edge
-        win = random.random() < (0.5 + edge)
-        move = random.uniform(0.02, 0.15)
-
-        if side == "BUY":
-            exit_price = entry_price + move if win else entry_price - move
-        else:
-            exit_price = entry_price - move if win else entry_price + move
+def _display_sweep(console: Console, strategy: str, ranked: list, capital: float):
+    """Display ranked parameter sweep results"""
+    console.print()
+    console.print(Panel(f"[bold]Parameter Sweep: {strategy.title()} Strategy[/bold]", border_style="cyan"))
+    console.print()
 
-        exit_price = max(0.05, min(0.95, exit_price))
+    if not ranked:
+        console.print("[yellow]No sweep results.[/yellow]")
+        return
 
-        # Calculate P&L
-        trade_size = equity * position_size
-        if side == "BUY":
-            pnl = trade_size * ((exit_price - entry_price) / entry_price)
-        else:
-            pnl = trade_size * ((entry_price - exit_price) / entry_price)
-
-        equity += pnl
-        equity_curve.append(equity)
-
-        # Track drawdown
-        if equity > peak:
-            peak = equity
-        drawdown = ((peak - equity) / peak) * 100
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
-
-        # Track return
-        returns.append(pnl / trade_size if trade_size > 0 else 0)
-
-        trade_date = (datetime.now() - timedelta(days=days - (i * (days // num_trades)))).strftime("%Y-%m-%d")
-
-        trades.append({
-            'date': trade_date,
-            'market': market_title,
-            'side': side,
-            'entry': entry_price,
-            'exit': exit_price,
-            'pnl': pnl,
-        })
-
-    # Calculate stats
-    winning = [t for t in trades if t['pnl'] > 0]
-    losing = [t for t in trades if t['pnl'] < 0]
-
-    avg_win = sum(t['pnl'] for t in winning) / len(winning) if winning else 0
-    avg_loss = abs(sum(t['pnl'] for t in losing) / len(losing)) if losing else 1
-
-    total_wins = sum(t['pnl'] for t in winning)
-    total_losses = abs(sum(t['pnl'] for t in losing))
-
-    # Sharpe ratio (simplified)
-    import math
-    if returns:
-        avg_return = sum(returns) / len(returns)
-        std_return = math.sqrt(sum((r - avg_return) ** 2 for r in returns) / len(returns)) if len(returns) > 1 else 1
-        sharpe = (avg_return * math.sqrt(252)) / std_return if std_return > 0 else 0
-    else:
-        sharpe = 0
-
-    return {
-        'final_capital': equity,
-        'total_trades': len(trades),
-        'winning_trades': len(winning),
-        'losing_trades': len(losing),
-        'win_rate': (len(winning) / len(trades) * 100) if trades else 0,
-        'avg_win': avg_win,
-        'avg_loss': avg_loss,
-        'profit_factor': total_wins / total_losses if total_losses > 0 else float('inf'),
-        'max_drawdown': max_drawdown,
-        'sharpe_ratio': sharpe,
-        'trades': trades,
-        'equity_curve': equity_curve,
-    }
+    table = Table(show_header=True, header_style="bold cyan", box=None)
+    table.add_column("#", width=3, justify="right")
+    table.add_column("Parameters", width=40)
+    table.add_column("Return", width=9, justify="right")
+    table.add_column("Sharpe", width=7, justify="right")
+    table.add_column("Max DD", width=7, justify="right")
+    table.add_column("Trades", width=7, justify="right")
+    table.add_column("Win %", width=6, justify="right")
+
+    for rank, result in enumerate(ranked, 1):
+        total_return = (result['final_capital'] - capital) / capital * 100
+        return_color = "green" if total_return > 0 else "red" if total_return < 0 else "white"
+        params = ", ".join(f"{name}={value:g}" for name, value in result['params'].items())
+        table.add_row(
+            str(rank),
+            params,
+            f"[{return_color}]{total_return:+.1f}%[/{return_color}]",
+            f"{result['sharpe_ratio']:.2f}",
+            f"{result['max_drawdown']:.1f}%",
+            str(result['total_trades']),
+            f"{result['win_rate']:.0f}",
+        )
+
+    console.print(table)
+    console.print()
 
 
 def _display_equity_curve(console: Console, curve: list, start: float):
@@ -9,6 +9,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -32,7 +33,7 @@ def benchmark(ctx, period, detailed, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # Get date range
     now = datetime.now()
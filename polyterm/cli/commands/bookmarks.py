@@ -9,6 +9,7 @@ from rich.prompt import Prompt
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -30,7 +31,7 @@ def bookmarks(ctx, list_bookmarks, add, remove, notes, output_format):
         polyterm bookmarks --remove <market_id>  # Remove bookmark
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
     config = ctx.obj["config"]
 
     # If no options, show interactive menu or list
@@ -8,6 +8,7 @@ from rich.table import Table
 from rich.prompt import Prompt, Confirm
 
 from ...db.database import Database
+from ..context import shared_database
 from ...api.gamma import GammaClient
 from ...utils.json_output import print_json
 
@@ -36,7 +37,7 @@ def calibrate(ctx, add, resolve, list_preds, stats, output_format):
         polyterm calibrate --list             # See all predictions
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     # Ensure predictions table exists
     _ensure_table(db)
@@ -9,6 +9,7 @@ from rich.prompt import Prompt
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...db.database import Database
+from ..context import shared_database
 from ...core.charts import ASCIIChart, generate_price_chart
 from ...utils.json_output import print_json, safe_float
 from ...utils.errors import handle_api_error
@@ -88,7 +89,7 @@ def chart(ctx, market, time_hours, width, height, sparkline, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     if not market:
         console.print(Panel(
@@ -7,15 +7,18 @@ from rich.panel import Panel
 
 from ...core.cluster_detector import WalletClusterDetector
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
 
 @click.command()
 @click.option("--min-score", default=60, help="Minimum cluster score (0-100)")
+@click.option("--hours", default=168, type=click.IntRange(1, None), help="Hours of local trade tape for timing analysis (default: 168)")
+@click.option("--wallets", "wallet_limit", default=200, type=click.IntRange(2, None), help="Top wallets by volume to profile (default: 200)")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
 @click.pass_context
-def clusters(ctx, min_score, output_format):
+def clusters(ctx, min_score, hours, wallet_limit, output_format):
     """Detect wallet clusters (same entity controlling multiple wallets)
 
     Analyzes trading patterns to identify wallets that may be controlled
@@ -25,10 +28,11 @@ def clusters(ctx, min_score, output_format):
     Examples:
         polyterm clusters
         polyterm clusters --min-score 70
+        polyterm clusters --hours 720 --wallets 20000
         polyterm clusters --format json
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     try:
         if output_format != 'json':
@@ -43,12 +47,14 @@ def clusters(ctx, min_score, output_format):
             console.print("[dim]Analyzing wallet patterns...[/dim]")
 
         detector = WalletClusterDetector(db)
-        results = detector.detect_clusters(min_score=min_score)
+        results = detector.detect_clusters(min_score=min_score, hours=hours, wallet_limit=wallet_limit)
 
         if output_format == 'json':
             print_json({
                 'success': True,
                 'min_score': min_score,
+                'hours': hours,
+                'wallet_limit': wallet_limit,
                 'clusters': results,
                 'total_found': len(results),
             })
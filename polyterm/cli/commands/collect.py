@@ -6,6 +6,7 @@ from rich.console import Console
 from ...api.gamma import GammaClient
 from ...core.archive import ArchiveCollector
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.errors import handle_api_error
 from ...utils.json_output import print_json
 
@@ -35,7 +36,7 @@ def collect(ctx, market, interval, duration, output_format):
     gamma = GammaClient(base_url=config.gamma_base_url, api_key=config.gamma_api_key)
 
     try:
-        collector = ArchiveCollector(database=Database(), gamma_client=gamma)
+        collector = ArchiveCollector(database=shared_database(Database), gamma_client=gamma)
         interval_seconds = _parse_duration(interval)
         duration_seconds = _parse_duration(duration)
 
@@ -11,6 +11,7 @@ from ...api.gamma import GammaClient
 from ...agent.contracts import envelope, error_envelope
 from ...core.market_compare import MarketComparisonEngine
 from ...db.database import Database
+from ..context import shared_database
 from ...core.charts import ASCIIChart
 from ...utils.json_output import print_json
 
@@ -33,7 +34,7 @@ def compare(ctx, markets, time_hours, interactive, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     if output_format == 'json' and not interactive:
         if len(markets) < 2:
@@ -10,6 +10,7 @@ from rich.text import Text
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -30,7 +31,7 @@ def dashboard(ctx, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     gamma_client = GammaClient(
         base_url=config.gamma_base_url,
@@ -9,6 +9,7 @@ from rich.prompt import Prompt
 
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
+from ...core.impact import Ladder
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -189,10 +190,11 @@ def depth(ctx, search_term, size, levels, interactive, output_format):
         parsed_asks = [{'price': float(a.get('price', 0)), 'size': float(a.get('size', 0))} for a in asks if float(a.get('price', 0)) > 0]
         parsed_bids = [{'price': float(b.get('price', 0)), 'size': float(b.get('size', 0))} for b in bids if float(b.get('price', 0)) > 0]
 
-        for test_size in [100, 500, 1000, 5000, 10000]:
-            buy_test = _calculate_slippage(parsed_asks, test_size, analysis['mid_price'], 'buy')
-            sell_test = _calculate_slippage(parsed_bids, test_size, analysis['mid_price'], 'sell')
+        test_sizes = [100, 500, 1000, 5000, 10000]
+        buy_curve = _slippage_curve(parsed_asks, test_sizes, analysis['mid_price'], 'buy')
+        sell_curve = _slippage_curve(parsed_bids, test_sizes, analysis['mid_price'], 'sell')
 
+        for test_size, buy_test, sell_test in zip(test_sizes, buy_curve, sell_curve):
             avg_slip = (buy_test['slippage_pct'] + sell_test['slippage_pct']) / 2
 
             if not buy_test['fillable'] or not sell_test['fillable']:
@@ -322,50 +324,35 @@ def _aggregate_levels(orders: list, num_levels: int) -> list:
 
 def _calculate_slippage(orders: list, trade_size: float, mid_price: float, direction: str) -> dict:
     """Calculate slippage for a given trade size"""
-    if not orders or trade_size <= 0:
-        return {
-            'avg_price': 0,
-            'slippage_pct': 0,
-            'cost_impact': 0,
-            'fillable': False,
-            'available': 0,
-        }
-
-    remaining = trade_size
-    total_cost = 0
-    total_shares = 0
-
-    for order in orders:
-        if remaining <= 0:
-            break
-
-        order_value = order['price'] * order['size']
-        fill_value = min(remaining, order_value)
-        fill_shares = fill_value / order['price'] if order['price'] > 0 else 0
-
-        total_cost += fill_value
-        total_shares += fill_shares
-        remaining -= fill_value
-
-    fillable = remaining <= 0
-    available = trade_size - remaining
-
-    if total_shares > 0:
-        avg_price = total_cost / total_shares
-        slippage_pct = abs(avg_price - mid_price) / mid_price if mid_price > 0 else 0
-        cost_impact = abs(avg_price - mid_price) * total_shares
-    else:
-        avg_price = 0
-        slippage_pct = 0
-        cost_impact = 0
+    return _slippage_curve(orders, [trade_size], mid_price, direction)[0]
+
+
+def _slippage_curve(orders: list, trade_sizes: list, mid_price: float, direction: str) -> list:
+    """Calculate slippage for several dollar trade sizes in one ladder pass"""
+    ladder = Ladder.from_levels(orders, direction)
+    points = ladder.impact_curve(trade_sizes, by='notional', reference=mid_price)
+
+    results = []
+    for trade_size, point in zip(trade_sizes, points):
+        if not ladder or trade_size <= 0 or point['avg_price'] is None:
+            results.append({
+                'avg_price': 0,
+                'slippage_pct': 0,
+                'cost_impact': 0,
+                'fillable': False,
+                'available': 0,
+            })
+            continue
 
-    return {
-        'avg_price': avg_price,
-        'slippage_pct': slippage_pct,
-        'cost_impact': cost_impact,
-        'fillable': fillable,
-        'available': available,
-    }
+        impact = abs(point['avg_price'] - mid_price)
+        results.append({
+            'avg_price': point['avg_price'],
+            'slippage_pct': impact / mid_price if mid_price > 0 else 0,
+            'cost_impact': impact * point['shares'],
+            'fillable': point['fillable'],
+            'available': point['cost'],
+        })
+    return results
 
 
 def _display_depth_chart(console: Console, bid_levels: list, ask_levels: list):
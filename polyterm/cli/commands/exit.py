@@ -9,6 +9,7 @@ from rich.prompt import Prompt, Confirm
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -36,7 +37,7 @@ def exit(ctx, search_term, entry, shares, side, list_plans, delete, interactive,
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # List saved plans
     if list_plans:
@@ -12,6 +12,7 @@ from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...core.archive import ArchiveCollector
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.errors import handle_api_error
 
 
@@ -40,7 +41,7 @@ def export(ctx, market, dataset, output_format, hours, output):
 
     try:
         if dataset:
-            collector = ArchiveCollector(Database(), gamma_client)
+            collector = ArchiveCollector(shared_database(Database), gamma_client)
             output_data = collector.export_dataset(dataset=dataset, output_format=output_format)
             if output:
                 with open(output, "w") as f:
@@ -7,6 +7,7 @@ from rich.table import Table
 from rich.prompt import Prompt, Confirm
 
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -28,7 +29,7 @@ def follow(add, remove, list_followed, max_exposure, category, output_format):
         polyterm follow --remove 0x1234...        # Unfollow a wallet
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     # If no options, show interactive menu
     if not add and not remove and not list_followed:
@@ -9,6 +9,7 @@ from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
 
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -36,7 +37,7 @@ def journal(ctx, list_entries, add, view, delete, search, tag, limit, output_for
         polyterm journal --tag "lesson"       # Filter by tag
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     # Initialize journal table
     _init_journal_table(db)
@@ -9,6 +9,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from ...api.gamma import GammaClient
 from ...api.data_api import DataAPIClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -61,7 +62,7 @@ def leaderboard(ctx, board_type, period, limit, me, source, output_format):
             if source == "data-api":
                 traders = _fetch_data_api_leaderboard(data_api, board_type, period, limit)
             else:
-                traders = _build_local_trader_stats(Database(), limit=limit)
+                traders = _build_local_trader_stats(shared_database(Database), limit=limit)
 
         # Sort by type
         if board_type == "profit":
@@ -201,7 +202,7 @@ def _build_local_trader_stats(db: Database, limit: int = 20) -> list:
 
 def _show_my_ranking(console: Console, traders: list):
     """Show user's ranking compared to leaderboard"""
-    db = Database()
+    db = shared_database(Database)
 
     console.print("[bold]Your Performance:[/bold]")
     console.print()
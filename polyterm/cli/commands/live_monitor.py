@@ -19,6 +19,7 @@ from rich.layout import Layout
 from rich.align import Align
 from rich.markup import escape
 
+from ...api.async_clients import close_shared_session
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...api.aggregator import APIAggregator
@@ -138,6 +139,7 @@ class LiveMarketMonitor:
             rest_endpoint=config.clob_rest_endpoint,
             ws_endpoint=config.clob_endpoint,
         )
+        self._async_gamma = None
         # Initialize aggregator and scanner
         self.aggregator = APIAggregator(self.gamma_client, self.clob_client)
         self.scanner = MarketScanner(
@@ -287,6 +289,36 @@ class LiveMarketMonitor:
             handle_api_error(self.console, e, "fetching market data")
             return []
 
+    async def get_market_data_async(self) -> List[Dict[str, Any]]:
+        """``get_market_data`` for the polling loop without blocking the event loop"""
+        if not isinstance(self.gamma_client, GammaClient):
+            return await asyncio.to_thread(self.get_market_data)
+        if self._async_gamma is None:
+            self._async_gamma = self.gamma_client.async_client()
+        try:
+            if self.market_id:
+                market_data = await self._async_gamma.get_market(self.market_id)
+                result = [market_data] if market_data else []
+            elif self.category:
+                all_markets = await self._async_gamma.get_markets(limit=200, closed=False)
+                filtered = [m for m in all_markets if matches_category(m, self.category)]
+                result = filtered[:50]
+            else:
+                # The aggregator merges Gamma and CLOB data synchronously
+                result = await asyncio.to_thread(
+                    self.aggregator.get_live_markets,
+                    limit=20,
+                    require_volume=True,
+                    min_volume=0.01,
+                )
+            self._last_successful_refresh = datetime.now(timezone.utc)
+            self._refresh_failed = False
+            return result
+        except Exception as e:
+            self._refresh_failed = True
+            handle_api_error(self.console, e, "fetching market data")
+            return []
+
     def generate_live_table(self) -> Table:
         """Generate live market table with color indicators"""
         now = datetime.now()
@@ -644,26 +676,23 @@ class LiveMarketMonitor:
     async def _run_websocket_monitor(self, token_ids: List[str], market_titles: Dict[str, str]):
         """Run WebSocket monitoring for live trades."""
         try:
-            # Connect to WebSocket
-            self._ws_status = "reconnecting"
-            self._ws_reconnect_attempt = 1
-            await self.clob_client.connect_websocket()
-            self._ws_status = "connected"
-            self._ws_reconnect_attempt = 0
-            self._add_status_message("Connected to Polymarket CLOB market WebSocket", "green")
-
+            # Trades ride the CLOB client's shared market hub socket
             await self.clob_client.subscribe_to_trades(
                 token_ids,
                 lambda trade: self._handle_trade(trade, market_titles),
             )
-            self._add_status_message(
-                f"Subscribed to {len(token_ids)} token feeds",
-                "green",
+
+            # Status turns "connected" only once the socket is open
+            await self.clob_client.listen_for_trades(
+                on_error=self._handle_ws_error,
+                on_connect=lambda: self._handle_ws_connected(len(token_ids)),
             )
 
-            # Start listening for trades
-            await self.clob_client.listen_for_trades(on_error=self._handle_ws_error)
-            
+            if self.clob_client._ws_permanently_failed:
+                self._ws_status = "polling"
+                self._add_status_message("Falling back to REST polling mode", "yellow")
+                await self._run_polling_monitor(list(market_titles.keys()), market_titles)
+
         except Exception as e:
             self._ws_status = "polling"
             self._add_status_message(f"WebSocket error: {e}", "red")
@@ -672,6 +701,15 @@ class LiveMarketMonitor:
         finally:
             await self.clob_client.close_websocket()
 
+    def _handle_ws_connected(self, feed_count: int):
+        """Mark the dashboard connected once the hub socket is subscribed."""
+        self._ws_status = "connected"
+        self._ws_reconnect_attempt = 0
+        self._add_status_message(
+            f"Subscribed to {feed_count} token feeds on the CLOB market WebSocket",
+            "green",
+        )
+
     def _handle_ws_error(self, exc: Exception):
         """Update dashboard state when the CLOB client reports reconnect trouble."""
         self._ws_status = "reconnecting"
@@ -748,73 +786,76 @@ class LiveMarketMonitor:
         
         last_prices = {}
         
-        while self._running:
-            try:
-                markets = self.get_market_data()
-                current_time = datetime.now(timezone.utc).strftime("%H:%M:%S")
+        try:
+            while self._running:
+                try:
+                    markets = await self.get_market_data_async()
+                    current_time = datetime.now(timezone.utc).strftime("%H:%M:%S")
                 
-                for market in markets:
-                    market_id = market.get("id")
-                    if not market_id:
-                        continue
-
-                    # Check for market resolution
-                    if market_id not in self._resolved_markets:
-                        closed = market.get("closed", False)
-                        sub_markets = market.get("markets", [])
-                        if closed and sub_markets:
-                            outcome_prices = sub_markets[0].get("outcomePrices")
-                            if isinstance(outcome_prices, str):
-                                import json as _j
-                                try:
-                                    outcome_prices = _j.loads(outcome_prices)
-                                except Exception:
-                                    outcome_prices = None
-                            if outcome_prices and len(outcome_prices) >= 2:
-                                yes_p = float(outcome_prices[0])
-                                no_p = float(outcome_prices[1])
-                                if yes_p >= 0.95:
-                                    outcome = "YES"
-                                elif no_p >= 0.95:
-                                    outcome = "NO"
-                                else:
-                                    outcome = None
-                                if outcome:
-                                    self._resolved_markets[market_id] = outcome
-                                    mt = market_titles.get(market_id, "Unknown")
-                                    title_short = mt[:30] + "..." if len(mt) > 30 else mt
-                                    color = "green" if outcome == "YES" else "red"
-                                    self._add_status_message(
-                                        f"{current_time} {title_short}: resolved {outcome}",
-                                        color,
-                                    )
-
-                    # Get current price
-                    current_price = self._get_market_values(market)['price']
-                    previous_price = last_prices.get(market_id)
-
-                    if previous_price is not None and current_price != previous_price:
-                        # Price changed - simulate a trade
-                        direction = "BUY" if current_price > previous_price else "SELL"
-                        color = "green" if current_price > previous_price else "red"
-
-                        market_title = market_titles.get(market_id, "Unknown")
-                        title_short = market_title[:30] + "..." if len(market_title) > 30 else market_title
-
-                        self._add_status_message(
-                            f"{current_time} {title_short}: {direction} price "
-                            f"${previous_price:.4f} -> ${current_price:.4f}",
-                            color,
-                        )
-
-                    last_prices[market_id] = current_price
+                    for market in markets:
+                        market_id = market.get("id")
+                        if not market_id:
+                            continue
+
+                        # Check for market resolution
+                        if market_id not in self._resolved_markets:
+                            closed = market.get("closed", False)
+                            sub_markets = market.get("markets", [])
+                            if closed and sub_markets:
+                                outcome_prices = sub_markets[0].get("outcomePrices")
+                                if isinstance(outcome_prices, str):
+                                    import json as _j
+                                    try:
+                                        outcome_prices = _j.loads(outcome_prices)
+                                    except Exception:
+                                        outcome_prices = None
+                                if outcome_prices and len(outcome_prices) >= 2:
+                                    yes_p = float(outcome_prices[0])
+                                    no_p = float(outcome_prices[1])
+                                    if yes_p >= 0.95:
+                                        outcome = "YES"
+                                    elif no_p >= 0.95:
+                                        outcome = "NO"
+                                    else:
+                                        outcome = None
+                                    if outcome:
+                                        self._resolved_markets[market_id] = outcome
+                                        mt = market_titles.get(market_id, "Unknown")
+                                        title_short = mt[:30] + "..." if len(mt) > 30 else mt
+                                        color = "green" if outcome == "YES" else "red"
+                                        self._add_status_message(
+                                            f"{current_time} {title_short}: resolved {outcome}",
+                                            color,
+                                        )
+
+                        # Get current price
+                        current_price = self._get_market_values(market)['price']
+                        previous_price = last_prices.get(market_id)
+
+                        if previous_price is not None and current_price != previous_price:
+                            # Price changed - simulate a trade
+                            direction = "BUY" if current_price > previous_price else "SELL"
+                            color = "green" if current_price > previous_price else "red"
+
+                            market_title = market_titles.get(market_id, "Unknown")
+                            title_short = market_title[:30] + "..." if len(market_title) > 30 else market_title
+
+                            self._add_status_message(
+                                f"{current_time} {title_short}: {direction} price "
+                                f"${previous_price:.4f} -> ${current_price:.4f}",
+                                color,
+                            )
+
+                        last_prices[market_id] = current_price
                 
-                await asyncio.sleep(2)  # Poll every 2 seconds
+                    await asyncio.sleep(2)  # Poll every 2 seconds
                 
-            except Exception as e:
-                if self._running:
-                    self._add_status_message(f"Polling error: {e}", "red")
-                await asyncio.sleep(5)
+                except Exception as e:
+                    if self._running:
+                        self._add_status_message(f"Polling error: {e}", "red")
+                    await asyncio.sleep(5)
+        finally:
+            await close_shared_session()
     
     def cleanup(self):
         """Clean up resources and ensure complete termination"""
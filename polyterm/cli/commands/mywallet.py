@@ -11,6 +11,7 @@ from rich.prompt import Prompt, Confirm
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.config import Config
 
@@ -100,7 +101,7 @@ def mywallet(ctx, address, connect, disconnect, positions, show_history, pnl, in
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # Get saved wallet address from config
     saved_address = config.get("wallet.address")
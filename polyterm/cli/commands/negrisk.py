@@ -1,31 +1,162 @@
 """NegRisk Multi-Outcome Arbitrage Scanner"""
 
+import asyncio
+import queue
+import threading
+import time
+
 import click
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
-from ...core.negrisk import NegRiskAnalyzer
+from ...core.negrisk import NegRiskAnalyzer, NegRiskMonitor
+from ...core.orderbook import OrderBookAnalyzer
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
 
+def _build_basket_table(baskets, basket_size, limit):
+    """Rich table of live basket prices"""
+    table = Table(title=f"[LIVE] NegRisk Baskets ({basket_size:g} shares)")
+    table.add_column("Event", style="green", max_width=40)
+    table.add_column("Quoted", justify="right")
+    table.add_column("Top Sum", justify="right")
+    table.add_column("Exec Price", justify="right")
+    table.add_column("Edge", justify="right")
+    table.add_column("Signals", justify="right", style="dim")
+
+    for basket in baskets[:limit]:
+        executable = basket['executable']
+        top_sum = basket['top_of_book_sum']
+        edge_text = "-"
+        if executable:
+            color = "green" if executable['fee_adjusted_profit'] > 0 else "red"
+            edge_text = f"[{color}]{executable['fee_adjusted_profit']:+.2%}[/{color}]"
+        table.add_row(
+            basket['event_title'][:40],
+            f"{basket['quoted']}/{basket['num_outcomes']}",
+            f"${top_sum:.4f}" if top_sum is not None else "-",
+            f"${executable['executable_price']:.4f}" if executable else "-",
+            edge_text,
+            str(basket['signals']),
+        )
+    return table
+
+
+def _run_live(console, clob_client, analyzer, basket_size, min_edge, limit, output_format):
+    """Stream every multi-outcome event's ask ladders and print signals"""
+    if output_format != 'json':
+        console.print("[dim]Fetching multi-outcome events...[/dim]")
+    signals = queue.SimpleQueue()
+    monitor = NegRiskMonitor(analyzer, basket_size=basket_size, min_edge=min_edge, on_signal=signals.put)
+    tracked = monitor.add_events(analyzer.find_multi_outcome_events(limit=50))
+    if not tracked:
+        if output_format == 'json':
+            print_json({'success': False, 'error': 'No multi-outcome events with CLOB tokens found'})
+        else:
+            console.print("[yellow]No multi-outcome events with CLOB tokens found[/yellow]")
+        return
+
+    ob_analyzer = OrderBookAnalyzer(clob_client)
+    stop_event = threading.Event()
+
+    def _ws_thread():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        async def _run():
+            await monitor.start(ob_analyzer)
+            try:
+                await clob_client.listen_orderbook(max_reconnects=10, message_timeout=60.0)
+            except Exception:
+                pass
+
+        task = loop.create_task(_run())
+
+        async def _wait_for_stop():
+            while not stop_event.is_set():
+                await asyncio.sleep(0.25)
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+            await clob_client.close_websocket()
+
+        try:
+            loop.run_until_complete(_wait_for_stop())
+        except Exception:
+            pass
+        finally:
+            loop.close()
+
+    ws_thread = threading.Thread(target=_ws_thread, daemon=True)
+    ws_thread.start()
+
+    recent = []
+    try:
+        if output_format == 'json':
+            while True:
+                try:
+                    print_json({'success': True, 'signal': signals.get(timeout=0.5)})
+                except queue.Empty:
+                    continue
+        with Live(console=console, refresh_per_second=4, screen=True) as live_display:
+            while True:
+                while not signals.empty():
+                    recent.insert(0, signals.get())
+                del recent[5:]
+                status = Text()
+                status.append(f"{tracked} events | {len(monitor.token_ids)} outcome books", style="bold")
+                status.append(f" | Min edge: {min_edge:.2%} | {time.strftime('%H:%M:%S')}")
+                status.append(" | Press Ctrl+C to stop", style="dim")
+                lines = [
+                    Text(f"{s['timestamp'][11:19]}  {s['event_title'][:50]}  "
+                         f"edge {s['fee_adjusted_profit']:+.2%}  profit ${s['expected_profit']:.2f}",
+                         style="bold green")
+                    for s in recent
+                ]
+                live_display.update(Group(
+                    status,
+                    _build_basket_table(monitor.baskets(), basket_size, limit),
+                    *lines,
+                ))
+                time.sleep(0.25)
+    except KeyboardInterrupt:
+        if output_format != 'json':
+            console.print("\n[cyan]Stopping NegRisk monitor...[/cyan]")
+    finally:
+        stop_event.set()
+        ws_thread.join(timeout=5)
+        ob_analyzer.stop_live_feed()
+
+
 @click.command()
 @click.option("--min-spread", default=0.02, help="Minimum spread threshold (default: 0.02)")
 @click.option("--limit", default=20, help="Maximum opportunities to show")
+@click.option("--live", is_flag=True, help="Stream outcome order books and signal executable baskets")
+@click.option("--size", "basket_size", default=100.0, type=float, help="Basket size in shares per outcome (with --live)")
+@click.option("--min-edge", default=0.01, type=float, help="Fee-adjusted edge per share to signal (with --live)")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
 @click.pass_context
-def negrisk(ctx, min_spread, limit, output_format):
+def negrisk(ctx, min_spread, limit, live, basket_size, min_edge, output_format):
     """Scan multi-outcome markets for NegRisk arbitrage
 
     Finds markets where the sum of all YES outcome prices doesn't equal $1.00.
     If total < $1.00, buying all outcomes guarantees profit on resolution.
 
+    With --live, every outcome's order book is streamed and a basket of
+    --size shares is priced against the live ask ladders.
+
     Examples:
         polyterm negrisk
         polyterm negrisk --min-spread 0.03
+        polyterm negrisk --live --size 250 --min-edge 0.015
         polyterm negrisk --format json
     """
     console = Console()
@@ -38,6 +169,11 @@ def negrisk(ctx, min_spread, limit, output_format):
     clob_client = CLOBClient(rest_endpoint=config.clob_rest_endpoint)
 
     try:
+        analyzer = NegRiskAnalyzer(gamma_client, clob_client, polymarket_fee=config.get("arbitrage.polymarket_fee", 0.02))
+        if live:
+            _run_live(console, clob_client, analyzer, basket_size, min_edge, limit, output_format)
+            return
+
         if output_format != 'json':
             console.print()
             console.print(Panel(
@@ -49,7 +185,6 @@ def negrisk(ctx, min_spread, limit, output_format):
             console.print()
             console.print("[dim]Scanning markets...[/dim]")
 
-        analyzer = NegRiskAnalyzer(gamma_client, clob_client, polymarket_fee=config.get("arbitrage.polymarket_fee", 0.02))
         opportunities = analyzer.scan_all(min_spread=min_spread)
 
         if output_format == 'json':
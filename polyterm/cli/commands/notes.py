@@ -9,6 +9,7 @@ from rich.prompt import Prompt
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -33,7 +34,7 @@ def notes(ctx, list_notes, add_market, view_market, delete_market, output_format
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # Delete note
     if delete_market:
@@ -5,6 +5,7 @@ import click
 import time
 import threading
 from datetime import datetime
+from typing import Optional
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
@@ -12,6 +13,8 @@ from rich.table import Table
 
 from ...api.clob import CLOBClient
 from ...db.database import Database
+from ..context import shared_database
+from ...db.tick_journal import TickJournal
 from ...core.orderbook import OrderBookAnalyzer, LiveOrderBook
 from ...utils.json_output import print_json, format_orderbook_json
 from ...utils.errors import handle_api_error
@@ -54,13 +57,19 @@ def _render_live_panel(live_book: LiveOrderBook, depth: int = 20) -> Panel:
     return Panel(table, title="[bold cyan]Live Order Book[/bold cyan]", subtitle=subtitle)
 
 
-def _run_ws_loop(clob_client: CLOBClient, token_ids: list, analyzer: OrderBookAnalyzer, stop_event: threading.Event):
+def _run_ws_loop(
+    clob_client: CLOBClient,
+    token_ids: list,
+    analyzer: OrderBookAnalyzer,
+    stop_event: threading.Event,
+    journal: Optional[TickJournal] = None,
+):
     """Run the async WS event loop in a background thread."""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
     async def _run():
-        await analyzer.start_live_feed(token_ids)
+        await analyzer.start_live_feed(token_ids, journal=journal)
         # listen_orderbook blocks until disconnected or max reconnects
         try:
             await clob_client.listen_orderbook(
@@ -97,11 +106,12 @@ def _run_ws_loop(clob_client: CLOBClient, token_ids: list, analyzer: OrderBookAn
 @click.option("--chart", is_flag=True, help="Show ASCII depth chart")
 @click.option("--live", is_flag=True, help="Live WebSocket feed (updates in real-time)")
 @click.option("--refresh", default=1.0, type=float, help="Live refresh interval in seconds")
+@click.option("--journal", "record_ticks", is_flag=True, help="Record live ticks to the local tick journal (with --live)")
 @click.option("--slippage", default=None, type=float, help="Calculate slippage for order size")
 @click.option("--side", type=click.Choice(["buy", "sell"]), default="buy", help="Order side for slippage")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table", help="Output format")
 @click.pass_context
-def orderbook(ctx, market_id, depth, chart, live, refresh, slippage, side, output_format):
+def orderbook(ctx, market_id, depth, chart, live, refresh, record_ticks, slippage, side, output_format):
     """Analyze order book for a market
 
     MARKET_ID is the market token ID to analyze.
@@ -112,7 +122,7 @@ def orderbook(ctx, market_id, depth, chart, live, refresh, slippage, side, outpu
 
     # Initialize
     clob_client = CLOBClient(rest_endpoint=config.clob_rest_endpoint)
-    db = Database()
+    db = shared_database(Database)
     analyzer = OrderBookAnalyzer(clob_client)
 
     try:
@@ -122,10 +132,23 @@ def orderbook(ctx, market_id, depth, chart, live, refresh, slippage, side, outpu
                 console.print(f"[cyan]Starting live order book for {market_id[:30]}...[/cyan]")
                 console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
+            journal = None
+            if record_ticks:
+                try:
+                    journal = TickJournal().start()
+                except (OSError, RuntimeError) as e:
+                    if output_format == 'json':
+                        print_json({'success': False, 'error': str(e)})
+                    else:
+                        console.print(f"[red]Cannot record ticks: {e}[/red]")
+                    return
+                if output_format != 'json':
+                    console.print(f"[dim]Recording ticks to {journal.path}[/dim]")
+
             stop_event = threading.Event()
             ws_thread = threading.Thread(
                 target=_run_ws_loop,
-                args=(clob_client, [market_id], analyzer, stop_event),
+                args=(clob_client, [market_id], analyzer, stop_event, journal),
                 daemon=True,
             )
             ws_thread.start()
@@ -141,6 +164,8 @@ def orderbook(ctx, market_id, depth, chart, live, refresh, slippage, side, outpu
             if live_book is None or not live_book.is_ready:
                 stop_event.set()
                 ws_thread.join(timeout=5)
+                if journal is not None:
+                    journal.close()
                 if output_format == 'json':
                     print_json({'success': False, 'error': 'No data received from WebSocket'})
                 else:
@@ -178,6 +203,8 @@ def orderbook(ctx, market_id, depth, chart, live, refresh, slippage, side, outpu
                 stop_event.set()
                 ws_thread.join(timeout=5)
                 analyzer.stop_live_feed()
+                if journal is not None:
+                    journal.close()
             return
 
         # --- Static (REST) mode ---
@@ -8,6 +8,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -28,7 +29,7 @@ def pnl(ctx, period, detailed, output_format):
         polyterm pnl --detailed        # Show each trade
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     # Get date range
     now = datetime.now()
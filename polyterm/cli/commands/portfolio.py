@@ -7,8 +7,11 @@ from rich.table import Table
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...core.analytics import AnalyticsEngine
+from ...core.portfolio import PortfolioAnalytics
+from ...db.database import Database
 from ...utils.json_output import safe_float
 from ...utils.errors import handle_api_error
+from ..context import shared_database
 
 
 def _extract_position_fields(position):
@@ -56,10 +59,83 @@ def _extract_position_fields(position):
     }
 
 
+def _positions_table():
+    table = Table(title="Positions")
+
+    table.add_column("Market", style="cyan", no_wrap=False, max_width=50)
+    table.add_column("Outcome", justify="center")
+    table.add_column("Shares", justify="right", style="yellow")
+    table.add_column("Avg Price", justify="right")
+    table.add_column("Value", justify="right", style="green")
+    table.add_column("P&L", justify="right")
+    return table
+
+
+def _add_position_row(table, market_name, normalized):
+    outcome = normalized["outcome"]
+    if outcome == "YES":
+        outcome_text = f"[green]{outcome}[/green]"
+    elif outcome == "NO":
+        outcome_text = f"[red]{outcome}[/red]"
+    elif outcome:
+        outcome_text = outcome
+    else:
+        outcome_text = "N/A"
+
+    total_pnl = normalized["total_pnl"]
+    pnl_style = "green" if total_pnl >= 0 else "red"
+    pnl_text = f"[{pnl_style}]${total_pnl:,.2f}[/{pnl_style}]"
+
+    table.add_row(
+        market_name,
+        outcome_text,
+        f"{normalized['shares']:.2f}",
+        f"${normalized['avg_price']:.4f}",
+        f"${normalized['current_value']:,.2f}",
+        pnl_text,
+    )
+
+
+def _show_local_portfolio(console, wallet, gamma_client, clob_client):
+    """Positions from locally tracked trades, priced in one batch"""
+    analytics = PortfolioAnalytics(
+        shared_database(Database),
+        gamma_client=gamma_client,
+        clob_client=clob_client,
+    )
+    summary = analytics.get_portfolio(wallet)
+
+    if not summary.positions:
+        console.print("[yellow]No open positions in local trade history[/yellow]")
+        return
+
+    console.print("[bold]Portfolio Summary (local trades):[/bold]")
+    console.print(f"  Total Positions: {summary.total_positions}")
+    console.print(f"  Total Value: ${summary.total_current_value:,.2f}")
+    console.print(f"  Unrealized P&L: ${summary.total_unrealized_pnl:,.2f} ({summary.total_unrealized_pnl_pct:,.1f}%)")
+    console.print(f"  Realized P&L: ${summary.realized_pnl:,.2f}\n")
+
+    table = _positions_table()
+    for position in summary.positions:
+        _add_position_row(table, position.market_title[:50], {
+            "outcome": position.outcome.upper(),
+            "shares": position.shares,
+            "avg_price": position.avg_price,
+            "current_value": position.current_value,
+            "total_pnl": position.unrealized_pnl,
+        })
+    console.print(table)
+
+    default_priced = sum(1 for p in summary.positions if p.price_source == "default")
+    if default_priced:
+        console.print(f"[dim]{default_priced} position(s) had no live price and use the default[/dim]")
+
+
 @click.command()
 @click.option("--wallet", default=None, help="Wallet address (or use config)")
+@click.option("--local", "local_only", is_flag=True, help="Build positions from locally tracked trades")
 @click.pass_context
-def portfolio(ctx, wallet):
+def portfolio(ctx, wallet, local_only):
     """View portfolio and positions"""
     
     config = ctx.obj["config"]
@@ -89,6 +165,10 @@ def portfolio(ctx, wallet):
     console.print(f"[cyan]Loading portfolio for:[/cyan] {wallet}\n")
     
     try:
+        if local_only:
+            _show_local_portfolio(console, wallet, gamma_client, clob_client)
+            return
+
         # Get portfolio analytics
         portfolio_data = analytics.get_portfolio_analytics(wallet)
         
@@ -110,58 +190,33 @@ def portfolio(ctx, wallet):
         console.print(f"  Total P&L: ${portfolio_data['total_pnl']:,.2f}")
         console.print(f"  ROI: {portfolio_data['roi_percent']:,.1f}%\n")
         
-        # Display positions
-        table = Table(title="Positions")
-        
-        table.add_column("Market", style="cyan", no_wrap=False, max_width=50)
-        table.add_column("Outcome", justify="center")
-        table.add_column("Shares", justify="right", style="yellow")
-        table.add_column("Avg Price", justify="right")
-        table.add_column("Value", justify="right", style="green")
-        table.add_column("P&L", justify="right")
-        
-        for position in portfolio_data["positions"]:
-            normalized = _extract_position_fields(position)
-
+        normalized_positions = [
+            _extract_position_fields(position) for position in portfolio_data["positions"]
+        ]
+
+        # Look up every missing title in one batch
+        untitled = [p["market_id"] for p in normalized_positions if not p["title"] and p["market_id"]]
+        try:
+            markets = gamma_client.get_markets_by_ids(untitled) if untitled else {}
+        except Exception:
+            markets = {}
+
+        table = _positions_table()
+        for normalized in normalized_positions:
             market_id = normalized["market_id"]
             market_name = normalized["title"][:50] if normalized["title"] else ""
 
             if not market_name and market_id:
-                try:
-                    market_data = gamma_client.get_market(market_id)
+                market_data = markets.get(market_id)
+                if market_data:
                     market_name = market_data.get("question", "Unknown")[:50]
-                except Exception:
+                else:
                     market_name = market_id[:30]
             elif not market_name:
                 market_name = "Unknown"
 
-            outcome = normalized["outcome"]
-            shares = normalized["shares"]
-            avg_price = normalized["avg_price"]
-            value = normalized["current_value"]
-            total_pnl = normalized["total_pnl"]
-
-            if outcome == "YES":
-                outcome_text = f"[green]{outcome}[/green]"
-            elif outcome == "NO":
-                outcome_text = f"[red]{outcome}[/red]"
-            elif outcome:
-                outcome_text = outcome
-            else:
-                outcome_text = "N/A"
-
-            pnl_style = "green" if total_pnl >= 0 else "red"
-            pnl_text = f"[{pnl_style}]${total_pnl:,.2f}[/{pnl_style}]"
-
-            table.add_row(
-                market_name,
-                outcome_text,
-                f"{shares:.2f}",
-                f"${avg_price:.4f}",
-                f"${value:,.2f}",
-                pnl_text,
-            )
-        
+            _add_position_row(table, market_name, normalized)
+
         console.print(table)
     
     except Exception as e:
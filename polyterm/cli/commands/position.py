@@ -9,6 +9,7 @@ from rich.prompt import Prompt, FloatPrompt, Confirm
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -41,7 +42,7 @@ def position(ctx, list_positions, show_open, show_closed, add_market, close_id,
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # Delete position
     if delete_id:
@@ -8,6 +8,7 @@ from rich.panel import Panel
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...core.predictions import PredictionEngine, Direction
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error, show_error
@@ -35,7 +36,7 @@ def predict(ctx, market, limit, horizon, min_confidence, output_format):
         base_url=config.gamma_base_url,
         api_key=config.gamma_api_key,
     )
-    db = Database()
+    db = shared_database(Database)
     engine = PredictionEngine(db)
 
     try:
@@ -65,18 +66,17 @@ def predict(ctx, market, limit, horizon, min_confidence, output_format):
             with console.status("[bold green]Fetching markets for prediction analysis..."):
                 markets_data = gamma_client.get_markets(limit=limit, active=True, closed=False)
 
-            for m in markets_data:
-                market_id = m.get('id', '')
-                title = m.get('title', m.get('question', ''))
-
-                if not market_id:
-                    continue
-
-                # Pass market data to engine for API-based signals
-                pred = engine.generate_prediction(market_id, title, horizon, market_data=m)
+            market_data = {m['id']: m for m in markets_data if m.get('id')}
+            titles = {
+                market_id: m.get('title', m.get('question', ''))
+                for market_id, m in market_data.items()
+            }
 
-                if pred.confidence >= min_confidence:
-                    predictions.append(pred)
+            # One batch: DB signals load once for all markets, API data first
+            batch = engine.generate_predictions(
+                list(market_data), horizon, titles=titles, market_data=market_data,
+            )
+            predictions.extend(p for p in batch if p.confidence >= min_confidence)
 
         # Sort by confidence
         predictions.sort(key=lambda p: p.confidence, reverse=True)
@@ -11,6 +11,7 @@ from rich.table import Table
 from rich.prompt import Prompt, Confirm
 
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -36,7 +37,7 @@ def presets(ctx, list_presets, save_name, run_name, delete_name, view_name, inte
         polyterm presets --delete "old-preset"     # Delete a preset
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     # Delete preset
     if delete_name:
@@ -9,6 +9,7 @@ from rich.prompt import Prompt, FloatPrompt, Confirm
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -35,7 +36,7 @@ def pricealert(ctx, list_alerts, add_market, remove_id, check, show_all, interac
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     # Remove alert
     if remove_id:
@@ -295,8 +295,9 @@ def _quick_info(console: Console, market: dict, price: float, volume: float, liq
 def _quick_watch(console: Console, title: str, market_id: str, price: float):
     """Quick add to bookmarks (watchlist)"""
     from ...db.database import Database
+    from ..context import shared_database
 
-    db = Database()
+    db = shared_database(Database)
 
     # Check if already bookmarked
     bookmarks = db.get_bookmarks()
@@ -8,6 +8,7 @@ from rich.table import Table
 from rich.prompt import Prompt
 
 from ...db.database import Database
+from ..context import shared_database
 from ...api.gamma import GammaClient
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
@@ -33,7 +34,7 @@ def recent(ctx, limit, most_viewed, clear, open_market, output_format):
         polyterm recent -o 1              # Open first market
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     if clear:
         db.clear_recent_history()
@@ -7,21 +7,82 @@ from rich.table import Table
 
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
+from ...core.orderbook import LiveOrderBook, detect_replenishment
+from ...db.tick_journal import TickJournal
 from ...utils.formatting import format_timestamp, format_probability
 from ...utils.errors import handle_api_error
 
 
+def _replay_ticks(console: Console, token_id: str, hours: int, journal_dir=None):
+    """Replay journaled order book ticks for one token into a LiveOrderBook."""
+    journal = TickJournal(journal_dir)
+    book = LiveOrderBook(token_id)
+    book_messages = []
+    spreads = []
+    first_ts = last_ts = None
+
+    started = time.perf_counter()
+    for ts, message in journal.replay(asset_ids=[token_id], start=time.time() - hours * 3600):
+        book.handle_message(message)
+        if message["event_type"] == "book":
+            book_messages.append(message)
+            spread = book.get_top_of_book()["spread"]
+            if spread is not None:
+                spreads.append(spread)
+        first_ts = ts if first_ts is None else first_ts
+        last_ts = ts
+    elapsed = time.perf_counter() - started
+
+    if first_ts is None:
+        console.print(f"[yellow]No recorded ticks for {token_id[:30]} in the last {hours} hours[/yellow]")
+        console.print("[dim]Record ticks with: polyterm orderbook TOKEN_ID --live --journal[/dim]")
+        return
+
+    span = last_ts - first_ts
+    top = book.get_top_of_book()
+    table = Table(title=f"Tick Replay: {token_id[:30]}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row("Messages", f"{book.message_count:,}")
+    table.add_row("Recorded span", f"{format_timestamp(int(first_ts))} → {format_timestamp(int(last_ts))}")
+    table.add_row("Replay time", f"{elapsed:.3f}s")
+    if elapsed > 0 and span > 0:
+        table.add_row("Speed", f"{span / elapsed:,.0f}x")
+    for label, value in (("Best bid", top["best_bid"]), ("Best ask", top["best_ask"]),
+                         ("Last trade", top["last_trade_price"])):
+        table.add_row(label, f"${value:.4f}" if value is not None else "—")
+    if spreads:
+        table.add_row("Spread min / avg / max", (
+            f"{min(spreads):.4f} / {sum(spreads) / len(spreads):.4f} / {max(spreads):.4f}"
+        ))
+    console.print(table)
+
+    icebergs = detect_replenishment(book_messages)
+    if icebergs:
+        console.print("\n[bold]Replenishing levels (possible icebergs):[/bold]")
+        for level in icebergs[:10]:
+            console.print(
+                f"  {level['side'].upper():<4} ${level['price']:.4f}  "
+                f"refilled {level['count']}x, ~{level['hidden_volume']:,.0f} shares hidden"
+            )
+
+
 @click.command()
-@click.option("--market", required=True, help="Market ID or search term")
+@click.option("--market", required=True, help="Market ID or search term (CLOB token ID with --ticks)")
 @click.option("--hours", default=24, help="Hours of history to show")
 @click.option("--speed", default=1.0, help="Playback speed multiplier")
 @click.option("--trades", is_flag=True, help="Show individual trades")
+@click.option("--ticks", is_flag=True, help="Replay recorded order book ticks from the local journal")
 @click.pass_context
-def replay(ctx, market, hours, speed, trades):
+def replay(ctx, market, hours, speed, trades, ticks):
     """Replay historical market data"""
     
     config = ctx.obj["config"]
     console = Console()
+
+    if ticks:
+        _replay_ticks(console, market, hours)
+        return
     
     # Initialize clients
     gamma_client = GammaClient(
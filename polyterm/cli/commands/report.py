@@ -10,6 +10,7 @@ from pathlib import Path
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -202,7 +203,7 @@ def _generate_weekly_report(gamma: GammaClient) -> dict:
 
 def _generate_portfolio_report(gamma: GammaClient, config) -> dict:
     """Generate portfolio report"""
-    db = Database()
+    db = shared_database(Database)
 
     # Get positions
     positions = db.get_all_positions()
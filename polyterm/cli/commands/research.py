@@ -9,6 +9,7 @@ from ...api.gamma import GammaClient
 from ...core.market_research import MarketResearchEngine
 from ...core.trade_thesis import TradeThesisEngine
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.errors import handle_api_error
 from ...utils.json_output import print_json
 
@@ -31,7 +32,7 @@ def research(ctx, market, prefetch_whales, min_notional, hours, limit, brief, pe
     clob = CLOBClient(rest_endpoint=config.clob_rest_endpoint, ws_endpoint=config.clob_endpoint)
 
     try:
-        database = Database()
+        database = shared_database(Database)
         thesis_engine = TradeThesisEngine(gamma_client=gamma, clob_client=clob, database=database)
         engine = MarketResearchEngine(thesis_engine=thesis_engine, database=database)
         result = engine.build(
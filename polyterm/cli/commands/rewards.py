@@ -7,6 +7,7 @@ from rich.panel import Panel
 
 from ...core.rewards import RewardsCalculator
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json, safe_float
 from ...utils.errors import handle_api_error
 
@@ -28,7 +29,7 @@ def rewards(ctx, wallet, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
     calc = RewardsCalculator()
 
     wallet_address = wallet or config.get("wallet.address")
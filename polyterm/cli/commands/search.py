@@ -9,6 +9,7 @@ from rich.prompt import Prompt
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -41,7 +42,7 @@ def search(ctx, query, category, min_volume, max_volume, min_liquidity, min_pric
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     if interactive:
         filters = _interactive_mode(console)
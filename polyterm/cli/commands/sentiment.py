@@ -11,6 +11,7 @@ from rich.prompt import Prompt
 from ...api.gamma import GammaClient
 from ...api.clob import CLOBClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -50,7 +51,7 @@ def sentiment(ctx, search_term, interactive, output_format):
         ws_endpoint=config.clob_endpoint,
     )
 
-    db = Database()
+    db = shared_database(Database)
 
     try:
         with Progress(
@@ -10,6 +10,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ...api.gamma import GammaClient
 from ...utils.json_output import print_json
+from ...utils.text_index import build_index
 
 
 @click.command()
@@ -69,9 +70,23 @@ def similar(ctx, market_search, limit, match_type, output_format):
             # Get candidate markets
             all_markets = gamma_client.get_markets(limit=200, active=True)
 
+            # Only score markets sharing a title token with the source (or
+            # its category, when category matches count)
+            index = build_index(
+                (position, market.get('question', market.get('title', '')))
+                for position, market in enumerate(all_markets)
+            )
+            positions = set(index.candidates(source_title))
+            if match_type in ['category', 'all'] and source.get('category'):
+                positions.update(
+                    position for position, market in enumerate(all_markets)
+                    if market.get('category') == source.get('category')
+                )
+
             # Score similarity
             scored = []
-            for market in all_markets:
+            for position in sorted(positions):
+                market = all_markets[position]
                 market_id = market.get('id', market.get('condition_id', ''))
                 if market_id == source_id:
                     continue
@@ -10,6 +10,7 @@ from rich.prompt import Prompt
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...core.charts import ASCIIChart
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
@@ -31,7 +32,7 @@ def stats(ctx, market, time_hours, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     if not market:
         console.print(Panel(
@@ -7,6 +7,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 
 
@@ -25,7 +26,7 @@ def streak(ctx, detailed, output_format):
         polyterm streak --detailed   # Full streak history
     """
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     # Get closed positions
     positions = db.get_positions(status='closed')
@@ -8,6 +8,7 @@ from ...api.clob import CLOBClient
 from ...api.gamma import GammaClient
 from ...core.trade_thesis import TradeThesisEngine
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.errors import handle_api_error
 from ...utils.json_output import print_json
 
@@ -25,7 +26,7 @@ def thesis(ctx, market, brief, output_format):
     clob = CLOBClient(rest_endpoint=config.clob_rest_endpoint, ws_endpoint=config.clob_endpoint)
 
     try:
-        engine = TradeThesisEngine(gamma_client=gamma, clob_client=clob, database=Database())
+        engine = TradeThesisEngine(gamma_client=gamma, clob_client=clob, database=shared_database(Database))
         result = engine.build(market)
 
         if output_format == "json":
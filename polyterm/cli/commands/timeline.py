@@ -11,6 +11,7 @@ from rich.prompt import Prompt
 
 from ...api.gamma import GammaClient
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error
 
@@ -35,7 +36,7 @@ def timeline(ctx, days, category, bookmarked, limit, output_format):
     """
     console = Console()
     config = ctx.obj["config"]
-    db = Database()
+    db = shared_database(Database)
 
     gamma_client = GammaClient(
         base_url=config.gamma_base_url,
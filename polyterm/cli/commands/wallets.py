@@ -6,6 +6,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ...db.database import Database
+from ..context import shared_database
 from ...db.models import Wallet
 from ...api.data_api import DataAPIClient
 from ...core.whale_tracker import InsiderDetector
@@ -30,7 +31,7 @@ def wallets(ctx, wallet_type, limit, analyze, refresh, min_win_rate, min_trades,
 
     config = ctx.obj["config"]
     console = Console()
-    db = Database()
+    db = shared_database(Database)
 
     try:
         # Handle tracking operations
@@ -10,6 +10,7 @@ from ...api.clob import CLOBClient
 from ...core.analytics import AnalyticsEngine
 from ...core.wallet_intelligence import WalletIntelligence
 from ...db.database import Database
+from ..context import shared_database
 from ...utils.formatting import format_timestamp, format_volume
 from ...utils.json_output import print_json
 from ...utils.errors import handle_api_error, show_error
@@ -31,7 +32,7 @@ def whales(ctx, min_amount, market, hours, limit, wallets, local, output_format)
     console = Console()
 
     if wallets:
-        intelligence = WalletIntelligence(database=Database())
+        intelligence = WalletIntelligence(database=shared_database(Database))
         if local:
             result = intelligence.local_whales(min_notional=min_amount, hours=hours)
             result["wallets"] = result["wallets"][:limit]
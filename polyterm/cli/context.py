@@ -0,0 +1,32 @@
+"""Resources shared with the host that runs a command
+
+The TUI runs commands in-process against one ``AppContext``
+(``tui/dispatch.py``), passed as ``ctx.obj["app"]``. Commands ask for
+their database through ``shared_database`` so they reuse the host's
+already-initialised handle there, and open their own when run from the
+shell.
+"""
+
+from typing import Any, Callable, Optional
+
+import click
+
+
+def app_context() -> Optional[Any]:
+    """The ``AppContext`` of the running command, if a host provided one."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None or not isinstance(ctx.obj, dict):
+        return None
+    return ctx.obj.get("app")
+
+
+def shared_database(factory: Callable[[], Any]) -> Any:
+    """Return the host's ``Database``, or a new one from ``factory``.
+
+    Commands pass the ``Database`` class they imported, so tests that
+    patch it per command module keep working.
+    """
+    app = app_context()
+    if app is not None:
+        return app.database
+    return factory()
@@ -8,7 +8,9 @@ Scans for arbitrage opportunities:
 """
 
 import asyncio
+import heapq
 import json
+import threading
 import time
 from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
@@ -19,11 +21,31 @@ from ..db.database import Database
 from ..db.models import ArbitrageOpportunity
 from ..api.gamma import GammaClient
 from ..api.clob import CLOBClient
+from ..utils.text_index import build_index, jaccard, tokenize
 
 if TYPE_CHECKING:
     from .orderbook import OrderBookAnalyzer
 
 
+def _live_price(top: Optional[Dict[str, Optional[float]]]) -> Optional[float]:
+    """Mid price from a top-of-book dict, falling back to the best ask."""
+    if not top:
+        return None
+    return top.get('mid_price') or top.get('best_ask')
+
+
+def _pair_prices(yes_price: Optional[float], no_price: Optional[float]) -> Optional[Dict[str, float]]:
+    """YES/NO prices, deriving a missing side as 1 - the other."""
+    if yes_price is not None and no_price is None:
+        no_price = 1.0 - yes_price
+    elif no_price is not None and yes_price is None:
+        yes_price = 1.0 - no_price
+
+    if yes_price is not None and no_price is not None:
+        return {'yes': yes_price, 'no': no_price}
+    return None
+
+
 @dataclass
 class ArbitrageResult:
     """Arbitrage opportunity result"""
@@ -112,25 +134,7 @@ class ArbitrageScanner:
         yes_info = live_data.get(yes_tid) if yes_tid else None
         no_info = live_data.get(no_tid) if no_tid else None
 
-        # Use mid_price when available, fall back to best_bid/best_ask
-        yes_price = None
-        no_price = None
-
-        if yes_info:
-            yes_price = yes_info.get('mid_price') or yes_info.get('best_ask')
-        if no_info:
-            no_price = no_info.get('mid_price') or no_info.get('best_ask')
-
-        # If we have YES but not NO, derive NO = 1 - YES (and vice versa)
-        if yes_price is not None and no_price is None:
-            no_price = 1.0 - yes_price
-        elif no_price is not None and yes_price is None:
-            yes_price = 1.0 - no_price
-
-        if yes_price is not None and no_price is not None:
-            return {'yes': yes_price, 'no': no_price}
-
-        return None
+        return _pair_prices(_live_price(yes_info), _live_price(no_info))
 
     def scan_intra_market_arbitrage(
         self,
@@ -159,66 +163,80 @@ class ArbitrageScanner:
                 if not market_id:
                     continue
 
-                # Prefer live WS prices when available
-                live = self._get_live_prices_for_market(market)
-                if live:
-                    yes_price = live['yes']
-                    no_price = live['no']
-                else:
-                    # Fall back to Gamma snapshot prices
-                    outcome_prices = market.get('outcomePrices', [])
-                    if isinstance(outcome_prices, str):
-                        try:
-                            outcome_prices = json.loads(outcome_prices)
-                        except Exception:
-                            continue
-
-                    if len(outcome_prices) < 2:
-                        continue
+                # Prefer live WS prices when available, else Gamma snapshot prices
+                prices = self._get_live_prices_for_market(market) or self._gamma_prices(market)
+                if not prices:
+                    continue
 
-                    try:
-                        yes_price = float(outcome_prices[0])
-                        no_price = float(outcome_prices[1])
-                    except (ValueError, IndexError):
-                        continue
+                result = self._intra_market_result(event, market, market_id, prices['yes'], prices['no'])
+                if result:
+                    opportunities.append(result)
 
-                # Check for arbitrage
-                total = yes_price + no_price
+                    # Store in database
+                    self._store_opportunity(result)
 
-                if total < (1.0 - self.min_spread):
-                    # Buying YES + NO costs less than $1, guaranteed profit
-                    spread = 1.0 - total
-                    gross_profit_pct = (spread / total) * 100
+        return sorted(opportunities, key=lambda x: x.net_profit, reverse=True)
 
-                    # Calculate net profit after fees
-                    # You buy both sides for $total, get $1 back
-                    # Fee is 2% on winnings of the winning contract
-                    # Worst case: the cheaper side wins (highest individual profit)
-                    fee_on_winning = self.polymarket_fee * (1.0 - min(yes_price, no_price))
-                    net_profit = spread - fee_on_winning
+    @staticmethod
+    def _gamma_prices(market: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """YES/NO prices from a Gamma market's ``outcomePrices``."""
+        outcome_prices = market.get('outcomePrices', [])
+        if isinstance(outcome_prices, str):
+            try:
+                outcome_prices = json.loads(outcome_prices)
+            except Exception:
+                return None
 
-                    if net_profit > 0:
-                        result = ArbitrageResult(
-                            type='intra_market',
-                            market1_id=market_id,
-                            market2_id=market_id,
-                            market1_title=event.get('title', market.get('question', '')),
-                            market2_title=event.get('title', market.get('question', '')),
-                            market1_yes_price=yes_price,
-                            market1_no_price=no_price,
-                            spread=spread,
-                            expected_profit_pct=gross_profit_pct,
-                            expected_profit_usd=net_profit * 100,  # for $100 bet
-                            fees=self.polymarket_fee * 100,
-                            net_profit=net_profit * 100,
-                            confidence='high' if spread > 0.05 else 'medium',
-                        )
-                        opportunities.append(result)
+        if len(outcome_prices) < 2:
+            return None
 
-                        # Store in database
-                        self._store_opportunity(result)
+        try:
+            return {'yes': float(outcome_prices[0]), 'no': float(outcome_prices[1])}
+        except (ValueError, IndexError, TypeError):
+            return None
 
-        return sorted(opportunities, key=lambda x: x.net_profit, reverse=True)
+    def _intra_market_result(
+        self,
+        event: Dict[str, Any],
+        market: Dict[str, Any],
+        market_id: str,
+        yes_price: float,
+        no_price: float,
+    ) -> Optional[ArbitrageResult]:
+        """Opportunity for one market's YES/NO prices, or None."""
+        total = yes_price + no_price
+        if total >= (1.0 - self.min_spread):
+            return None
+
+        # Buying YES + NO costs less than $1, guaranteed profit
+        spread = 1.0 - total
+        gross_profit_pct = (spread / total) * 100
+
+        # Calculate net profit after fees
+        # You buy both sides for $total, get $1 back
+        # Fee is 2% on winnings of the winning contract
+        # Worst case: the cheaper side wins (highest individual profit)
+        fee_on_winning = self.polymarket_fee * (1.0 - min(yes_price, no_price))
+        net_profit = spread - fee_on_winning
+        if net_profit <= 0:
+            return None
+
+        title = event.get('title', market.get('question', ''))
+        return ArbitrageResult(
+            type='intra_market',
+            market1_id=market_id,
+            market2_id=market_id,
+            market1_title=title,
+            market2_title=title,
+            market1_yes_price=yes_price,
+            market1_no_price=no_price,
+            spread=spread,
+            expected_profit_pct=gross_profit_pct,
+            expected_profit_usd=net_profit * 100,  # for $100 bet
+            fees=self.polymarket_fee * 100,
+            net_profit=net_profit * 100,
+            confidence='high' if spread > 0.05 else 'medium',
+        )
 
     def scan_correlated_markets(
         self,
@@ -266,94 +284,77 @@ class ArbitrageScanner:
 
             category_markets[category].append(event)
 
-        # Compare markets within same category
+        # Compare markets within same category; the title index only
+        # scores pairs that can reach the similarity threshold.
         for category, cat_markets in category_markets.items():
             if len(cat_markets) < 2:
                 continue
 
-            for i, market1 in enumerate(cat_markets):
-                for market2 in cat_markets[i + 1:]:
-                    # Check if markets are related
-                    similarity = self._calculate_title_similarity(
-                        market1.get('title', ''),
-                        market2.get('title', ''),
-                    )
-
-                    if similarity < similarity_threshold:
-                        continue
+            index = build_index(
+                (position, market.get('title', ''))
+                for position, market in enumerate(cat_markets)
+            )
+            for first, second, _ in index.similar_pairs(similarity_threshold):
+                market1 = cat_markets[first]
+                market2 = cat_markets[second]
 
-                    # Get prices
-                    m1_prices = self._get_market_prices(market1)
-                    m2_prices = self._get_market_prices(market2)
+                # Get prices
+                m1_prices = self._get_market_prices(market1)
+                m2_prices = self._get_market_prices(market2)
 
-                    if not m1_prices or not m2_prices:
-                        continue
+                if not m1_prices or not m2_prices:
+                    continue
 
-                    # Check for price discrepancy
-                    price_diff = abs(m1_prices['yes'] - m2_prices['yes'])
-
-                    if price_diff >= self.min_spread:
-                        # Arbitrage: buy low, sell high
-                        if m1_prices['yes'] < m2_prices['yes']:
-                            buy_market = market1
-                            sell_market = market2
-                            buy_price = m1_prices['yes']
-                            sell_price = m2_prices['yes']
-                            buy_prices = m1_prices
-                            sell_prices = m2_prices
-                        else:
-                            buy_market = market2
-                            sell_market = market1
-                            buy_price = m2_prices['yes']
-                            sell_price = m1_prices['yes']
-                            buy_prices = m2_prices
-                            sell_prices = m1_prices
-
-                        spread = sell_price - buy_price
-                        # Fee on winning position's profit (assumes the buy-side wins)
-                        fee_cost = self.polymarket_fee * (1.0 - buy_price)
-                        gross_profit = spread - fee_cost
-
-                        if gross_profit > 0:
-                            result = ArbitrageResult(
-                                type='correlated',
-                                market1_id=buy_market.get('id', ''),
-                                market2_id=sell_market.get('id', ''),
-                                market1_title=buy_market.get('title', ''),
-                                market2_title=sell_market.get('title', ''),
-                                market1_yes_price=buy_price,
-                                market1_no_price=buy_prices['no'],
-                                market2_yes_price=sell_price,
-                                market2_no_price=sell_prices['no'],
-                                spread=spread,
-                                expected_profit_pct=(gross_profit / buy_price * 100) if buy_price > 0 else 0,
-                                expected_profit_usd=gross_profit * 100,
-                                fees=fee_cost * 100,
-                                net_profit=gross_profit * 100,
-                                confidence='low',  # Correlated arb is riskier
-                            )
-                            opportunities.append(result)
+                # Check for price discrepancy
+                price_diff = abs(m1_prices['yes'] - m2_prices['yes'])
+
+                if price_diff >= self.min_spread:
+                    # Arbitrage: buy low, sell high
+                    if m1_prices['yes'] < m2_prices['yes']:
+                        buy_market = market1
+                        sell_market = market2
+                        buy_price = m1_prices['yes']
+                        sell_price = m2_prices['yes']
+                        buy_prices = m1_prices
+                        sell_prices = m2_prices
+                    else:
+                        buy_market = market2
+                        sell_market = market1
+                        buy_price = m2_prices['yes']
+                        sell_price = m1_prices['yes']
+                        buy_prices = m2_prices
+                        sell_prices = m1_prices
+
+                    spread = sell_price - buy_price
+                    # Fee on winning position's profit (assumes the buy-side wins)
+                    fee_cost = self.polymarket_fee * (1.0 - buy_price)
+                    gross_profit = spread - fee_cost
+
+                    if gross_profit > 0:
+                        result = ArbitrageResult(
+                            type='correlated',
+                            market1_id=buy_market.get('id', ''),
+                            market2_id=sell_market.get('id', ''),
+                            market1_title=buy_market.get('title', ''),
+                            market2_title=sell_market.get('title', ''),
+                            market1_yes_price=buy_price,
+                            market1_no_price=buy_prices['no'],
+                            market2_yes_price=sell_price,
+                            market2_no_price=sell_prices['no'],
+                            spread=spread,
+                            expected_profit_pct=(gross_profit / buy_price * 100) if buy_price > 0 else 0,
+                            expected_profit_usd=gross_profit * 100,
+                            fees=fee_cost * 100,
+                            net_profit=gross_profit * 100,
+                            confidence='low',  # Correlated arb is riskier
+                        )
+                        opportunities.append(result)
 
         return sorted(opportunities, key=lambda x: x.net_profit, reverse=True)
 
     def _calculate_title_similarity(self, title1: str, title2: str) -> float:
-        """Calculate similarity between two market titles"""
-        # Simple word overlap similarity
-        words1 = set(title1.lower().split())
-        words2 = set(title2.lower().split())
-
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'will', 'be', 'by', 'in', 'on', 'to', 'of', '?'}
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union) if union else 0.0
+        """Calculate similarity between two market titles (token Jaccard)"""
+        return jaccard(tokenize(title1), tokenize(title2))
 
     def _get_market_prices(self, event: Dict[str, Any]) -> Optional[Dict[str, float]]:
         """Extract YES/NO prices from market event, preferring live WS data."""
@@ -363,33 +364,11 @@ class ArbitrageScanner:
 
         market = nested_markets[0]
 
-        # Try live prices first
-        live = self._get_live_prices_for_market(market)
-        if live:
-            return live
-
-        # Fall back to Gamma snapshot prices
-        outcome_prices = market.get('outcomePrices', [])
-
-        if isinstance(outcome_prices, str):
-            try:
-                outcome_prices = json.loads(outcome_prices)
-            except Exception:
-                return None
-
-        if len(outcome_prices) < 2:
-            return None
-
-        try:
-            return {
-                'yes': float(outcome_prices[0]),
-                'no': float(outcome_prices[1]),
-            }
-        except (ValueError, IndexError):
-            return None
+        # Try live prices first, then Gamma snapshot prices
+        return self._get_live_prices_for_market(market) or self._gamma_prices(market)
 
-    def _store_opportunity(self, result: ArbitrageResult) -> None:
-        """Store arbitrage opportunity in database"""
+    def _store_opportunity(self, result: ArbitrageResult) -> int:
+        """Store arbitrage opportunity in database, returning its row id"""
         arb = ArbitrageOpportunity(
             market1_id=result.market1_id,
             market2_id=result.market2_id,
@@ -402,7 +381,7 @@ class ArbitrageScanner:
             timestamp=result.timestamp,
             status='open',
         )
-        self.db.insert_arbitrage(arb)
+        return self.db.insert_arbitrage(arb)
 
     async def scan_all(self) -> Dict[str, List[ArbitrageResult]]:
         """
@@ -451,6 +430,154 @@ class ArbitrageScanner:
         return "\n".join(lines)
 
 
+@dataclass
+class _MarketCosts:
+    """One row of the incremental YES/NO cost table"""
+    event: Dict[str, Any]
+    market: Dict[str, Any]
+    market_id: str
+    live_yes: Optional[float] = None
+    live_no: Optional[float] = None
+    gamma: Optional[Dict[str, float]] = None
+    result: Optional[ArbitrageResult] = None
+    arb_id: Optional[int] = None
+    version: int = 0
+
+
+class IncrementalArbitrage:
+    """Intra-market arbitrage kept current from live book updates
+
+    Holds a YES/NO cost table keyed by condition id. Each
+    ``LiveOrderBook`` update re-prices only the market that book belongs
+    to, with the same pricing and thresholds as
+    ``ArbitrageScanner.scan_intra_market_arbitrage``. Current
+    opportunities sit in a max-heap by net profit (stale entries are
+    dropped lazily), so ``best()`` is O(1) amortized. A row is written to
+    ``arbitrage_opportunities`` when a market's opportunity opens and
+    closed when it disappears, not on every tick.
+    """
+
+    def __init__(self, scanner: ArbitrageScanner):
+        self.scanner = scanner
+        self._lock = threading.Lock()
+        self._rows: Dict[str, _MarketCosts] = {}
+        # token id -> (condition id, True for the YES token)
+        self._tokens: Dict[str, Tuple[str, bool]] = {}
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._sequence = 0
+        self.updates = 0
+
+    @property
+    def token_ids(self) -> List[str]:
+        return list(self._tokens)
+
+    def track(self, markets: List[Dict[str, Any]]) -> int:
+        """Add the nested markets of Gamma events; returns markets tracked
+
+        Markets are priced from Gamma ``outcomePrices`` until their books
+        deliver live prices.
+        """
+        tracked = 0
+        with self._lock:
+            for event in markets:
+                for market in event.get('markets', []):
+                    market_id = market.get('id', market.get('conditionId', ''))
+                    if not market_id:
+                        continue
+                    key = str(market.get('conditionId') or market_id)
+                    row = _MarketCosts(
+                        event=event,
+                        market=market,
+                        market_id=market_id,
+                        gamma=self.scanner._gamma_prices(market),
+                    )
+                    self._rows[key] = row
+                    token_ids = self.scanner._extract_token_ids(market)
+                    for index, token_id in enumerate(token_ids[:2]):
+                        self._tokens[token_id] = (key, index == 0)
+                    self._evaluate(key, row)
+                    tracked += 1
+        return tracked
+
+    def attach(self, books: Dict[str, Any]) -> None:
+        """Register ``on_book`` on existing live books and price them now"""
+        for token_id, book in books.items():
+            if token_id in self._tokens:
+                book.set_on_update(self.on_book)
+                if book.is_ready:
+                    self.on_book(book)
+
+    async def start(self, orderbook_analyzer: "OrderBookAnalyzer", hub=None):
+        """Subscribe every tracked token; pump with ``listen_orderbook`` or ``hub.run``"""
+        return await orderbook_analyzer.start_live_feed(self.token_ids, on_update=self.on_book, hub=hub)
+
+    def on_book(self, book) -> None:
+        """``LiveOrderBook`` update callback"""
+        entry = self._tokens.get(book.token_id)
+        if entry is None:
+            return
+        key, is_yes = entry
+        price = _live_price(book.get_top_of_book())
+        with self._lock:
+            row = self._rows[key]
+            if is_yes:
+                if row.live_yes == price:
+                    return
+                row.live_yes = price
+            else:
+                if row.live_no == price:
+                    return
+                row.live_no = price
+            self.updates += 1
+            self._evaluate(key, row)
+
+    def _evaluate(self, key: str, row: _MarketCosts) -> None:
+        """Re-price one market and persist open/close transitions (lock held)"""
+        prices = _pair_prices(row.live_yes, row.live_no) or row.gamma
+        result = None
+        if prices:
+            result = self.scanner._intra_market_result(
+                row.event, row.market, row.market_id, prices['yes'], prices['no'],
+            )
+
+        was_open = row.result is not None
+        row.result = result
+        row.version += 1
+        if result is not None:
+            self._sequence += 1
+            heapq.heappush(self._heap, (-result.net_profit, self._sequence, key, row.version))
+            if not was_open:
+                row.arb_id = self.scanner._store_opportunity(result)
+        elif was_open and row.arb_id is not None:
+            self.scanner.db.close_arbitrage(row.arb_id, 'closed')
+            row.arb_id = None
+
+        if len(self._heap) > 64 and len(self._heap) > 4 * len(self._rows):
+            self._compact()
+
+    def _is_current(self, entry: Tuple[float, int, str, int]) -> bool:
+        row = self._rows.get(entry[2])
+        return row is not None and row.version == entry[3] and row.result is not None
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._is_current(entry)]
+        heapq.heapify(self._heap)
+
+    def best(self) -> Optional[ArbitrageResult]:
+        """Most profitable current opportunity"""
+        with self._lock:
+            while self._heap and not self._is_current(self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._rows[self._heap[0][2]].result if self._heap else None
+
+    def opportunities(self, limit: Optional[int] = None) -> List[ArbitrageResult]:
+        """Current opportunities, most profitable first"""
+        with self._lock:
+            current = [entry for entry in self._heap if self._is_current(entry)]
+            ranked = heapq.nsmallest(limit, current) if limit is not None else sorted(current)
+            return [self._rows[entry[2]].result for entry in ranked]
+
+
 class KalshiArbitrageScanner:
     """
     Cross-platform arbitrage scanner for Polymarket vs Kalshi.
@@ -458,6 +585,11 @@ class KalshiArbitrageScanner:
     Requires Kalshi API access.
     """
 
+    # Minimum title match score for a PM/Kalshi pair
+    MATCH_THRESHOLD = 0.7
+    # Terms that boost the match score when both titles mention them
+    KEY_TERMS = ('trump', 'biden', 'election', 'bitcoin', 'fed', 'rate', 'president')
+
     def __init__(
         self,
         database: Database,
@@ -519,17 +651,26 @@ class KalshiArbitrageScanner:
         Returns list of (pm_market, kalshi_market, similarity_score) tuples.
         """
         matches = []
+        kalshi_index = build_index(
+            (position, kalshi.get('title', kalshi.get('ticker', '')))
+            for position, kalshi in enumerate(kalshi_markets)
+        )
 
         for pm_event in pm_markets:
             pm_title = pm_event.get('title', '').lower()
 
-            for kalshi in kalshi_markets:
+            # Each shared key term adds 0.2, so titles with key terms need
+            # less token overlap to reach the match threshold.
+            boosts = sum(1 for term in self.KEY_TERMS if term in pm_title)
+            needed = max(0.0, self.MATCH_THRESHOLD - 0.2 * boosts)
+
+            for position in sorted(kalshi_index.candidates(pm_title, threshold=needed)):
+                kalshi = kalshi_markets[position]
                 kalshi_title = kalshi.get('title', kalshi.get('ticker', '')).lower()
 
-                # Calculate similarity
                 similarity = self._calculate_match_score(pm_title, kalshi_title)
 
-                if similarity >= 0.7:
+                if similarity >= self.MATCH_THRESHOLD:
                     matches.append((pm_event, kalshi, similarity))
 
         # Sort by similarity
@@ -537,26 +678,10 @@ class KalshiArbitrageScanner:
 
     def _calculate_match_score(self, title1: str, title2: str) -> float:
         """Calculate match score between two market titles"""
-        # Extract key terms
-        words1 = set(title1.lower().split())
-        words2 = set(title2.lower().split())
-
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'will', 'be', 'by', 'in', 'on', 'to', 'of', '?', '-', 'yes', 'no'}
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1 & words2
-        union = words1 | words2
-
-        base_score = len(intersection) / len(union) if union else 0.0
+        base_score = jaccard(tokenize(title1), tokenize(title2))
 
         # Boost for key term matches
-        key_terms = ['trump', 'biden', 'election', 'bitcoin', 'fed', 'rate', 'president']
-        for term in key_terms:
+        for term in self.KEY_TERMS:
             if term in title1 and term in title2:
                 base_score = min(1.0, base_score + 0.2)
 
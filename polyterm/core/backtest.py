@@ -0,0 +1,637 @@
+"""
+Historical Strategy Backtester
+
+Replays stored market snapshots, tracked trades and CLOB price history
+through the backtest strategies.
+
+- Each market is loaded once into columnar NumPy arrays on a shared bar grid
+- Strategy signals are evaluated vectorized over a whole market series
+- Fills happen one bar after the signal and pay CLOB taker fees on entry
+  and exit (``core/fees.py``)
+- Parameter sweeps fan combinations out over a process pool
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..api.market_utils import (
+    get_clob_token_ids,
+    get_market_condition_id,
+    get_primary_clob_token_id,
+)
+from ..db.database import Database
+from .fees import FeeSchedule, GENERIC_FEE_SCHEDULE, estimate_taker_fee, fee_schedule_from_market
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+STRATEGIES = ("momentum", "mean-reversion", "whale-follow", "contrarian", "volume-spike")
+
+# Default parameters per strategy. Windows and holds are in bars.
+DEFAULT_PARAMS: Dict[str, Dict[str, float]] = {
+    "momentum": {"lookback": 6, "threshold": 0.03, "hold": 12},
+    "mean-reversion": {"window": 24, "z_entry": 1.5, "hold": 12},
+    "whale-follow": {"window": 6, "min_flow": 5000.0, "hold": 12},
+    "contrarian": {"lookback": 6, "threshold": 0.08, "hold": 12},
+    "volume-spike": {"window": 24, "multiplier": 3.0, "hold": 6},
+}
+
+# Grids used by ``BacktestEngine.sweep`` when none is given
+DEFAULT_SWEEP_GRIDS: Dict[str, Dict[str, List[float]]] = {
+    "momentum": {
+        "lookback": [2, 3, 6, 12, 24],
+        "threshold": [0.01, 0.02, 0.03, 0.05, 0.08],
+        "hold": [3, 6, 12, 24, 48],
+    },
+    "mean-reversion": {
+        "window": [6, 12, 24, 48, 96],
+        "z_entry": [1.0, 1.5, 2.0, 2.5, 3.0],
+        "hold": [3, 6, 12, 24, 48],
+    },
+    "whale-follow": {
+        "window": [1, 3, 6, 12, 24],
+        "min_flow": [1000.0, 2500.0, 5000.0, 10000.0, 25000.0],
+        "hold": [3, 6, 12, 24, 48],
+    },
+    "contrarian": {
+        "lookback": [2, 3, 6, 12, 24],
+        "threshold": [0.03, 0.05, 0.08, 0.12, 0.2],
+        "hold": [3, 6, 12, 24, 48],
+    },
+    "volume-spike": {
+        "window": [6, 12, 24, 48, 96],
+        "multiplier": [2.0, 2.5, 3.0, 4.0, 5.0],
+        "hold": [1, 3, 6, 12, 24],
+    },
+}
+
+# Trades at or above this notional count towards whale flow
+WHALE_TRADE_NOTIONAL = 10000.0
+
+# Equity curves are downsampled to this many points in results
+EQUITY_CURVE_POINTS = 200
+
+
+@dataclass
+class MarketSeries:
+    """Columnar bar data for one market"""
+    market_id: str
+    title: str
+    price: Any  # YES price per bar, NaN before the first observation
+    volume: Any  # Traded notional per bar
+    whale_flow: Any  # Signed whale notional per bar (+ = buying YES)
+    fee_schedule: FeeSchedule = GENERIC_FEE_SCHEDULE
+    source: str = "snapshots"
+
+
+@dataclass
+class BacktestData:
+    """Bar-aligned series for every market in a backtest"""
+    start_ts: int
+    bar_seconds: int
+    bars: int
+    markets: List[MarketSeries] = field(default_factory=list)
+
+    def bar_time(self, index: int) -> datetime:
+        return datetime.fromtimestamp(self.start_ts + index * self.bar_seconds)
+
+    @property
+    def sources(self) -> List[str]:
+        return sorted({series.source for series in self.markets})
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise RuntimeError("The 'numpy' package is required for backtesting. Install with: pip install numpy")
+
+
+def _to_epoch(value: Any) -> Optional[float]:
+    """Seconds since the epoch for DB timestamps (ISO strings or datetimes)."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _bucket_last(idx, values, bars: int):
+    """Last value per bar, forward-filled; NaN before the first observation."""
+    out = np.full(bars, np.nan)
+    if len(idx):
+        # Points are time-ordered, so later writes to a bar win.
+        out[idx] = values
+    seen = np.where(~np.isnan(out), np.arange(bars), -1)
+    np.maximum.accumulate(seen, out=seen)
+    filled = np.where(seen >= 0, out[np.maximum(seen, 0)], np.nan)
+    return filled
+
+
+def _bar_index(timestamps: Any, start_ts: int, bar_seconds: int, bars: int):
+    idx = (np.asarray(timestamps, dtype=float) - start_ts) // bar_seconds
+    idx = idx.astype(np.int64)
+    return idx, (idx >= 0) & (idx < bars)
+
+
+def _market_aliases(market: Dict[str, Any]) -> List[str]:
+    """Identifiers a market may be stored under in snapshots and trades."""
+    aliases = [str(market.get("id", ""))]
+    condition_id = get_market_condition_id(market)
+    if condition_id:
+        aliases.append(condition_id)
+    if market.get("slug"):
+        aliases.append(str(market["slug"]))
+    aliases.extend(get_clob_token_ids(market))
+    return [alias for alias in dict.fromkeys(aliases) if alias]
+
+
+def load_backtest_data(
+    db: Database,
+    markets: List[Dict[str, Any]],
+    days: int,
+    bar_minutes: int = 60,
+    clob_client: Any = None,
+    whale_notional: float = WHALE_TRADE_NOTIONAL,
+    now: Optional[float] = None,
+) -> BacktestData:
+    """Load stored history for ``markets`` onto a common bar grid.
+
+    Prices come from ``market_snapshots``. Markets with fewer than two
+    snapshot bars fall back to CLOB price history when ``clob_client`` is
+    given. Tracked trades supply per-bar volume and whale flow.
+
+    Args:
+        db: Database with snapshots and trades
+        markets: Gamma market dicts to test
+        days: Length of the backtest window
+        bar_minutes: Bar size
+        clob_client: Optional ``CLOBClient`` for price history fallback
+        whale_notional: Minimum trade notional counted as whale flow
+        now: End of the window (epoch seconds), defaults to now
+
+    Returns:
+        BacktestData holding one MarketSeries per market with prices
+    """
+    _require_numpy()
+    bar_seconds = max(int(bar_minutes), 1) * 60
+    end_ts = int(now if now is not None else datetime.now().timestamp())
+    bars = max(int(days * 86400 // bar_seconds), 1)
+    start_ts = end_ts - bars * bar_seconds
+    hours = days * 24
+
+    alias_owner: Dict[str, str] = {}
+    for market in markets:
+        for alias in _market_aliases(market):
+            alias_owner.setdefault(alias, str(market.get("id", "")))
+
+    prices: Dict[str, Tuple[List[float], List[float]]] = {}
+    for market_id, ts, probability in db.get_market_price_points(list(alias_owner), hours=hours):
+        epoch = _to_epoch(ts)
+        owner = alias_owner.get(str(market_id))
+        if epoch is None or owner is None or probability is None:
+            continue
+        times, values = prices.setdefault(owner, ([], []))
+        times.append(epoch)
+        values.append(float(probability))
+
+    flows: Dict[str, Tuple[List[float], List[float], List[float]]] = {}
+    for market_id, ts, side, outcome, price, notional in db.get_trade_points(list(alias_owner), hours=hours):
+        epoch = _to_epoch(ts)
+        owner = alias_owner.get(str(market_id))
+        if epoch is None or owner is None:
+            continue
+        notional = float(notional or 0)
+        # Buying YES or selling NO both push the YES price up.
+        bullish = (str(side).upper() == "BUY") != (str(outcome).upper() == "NO")
+        times, volumes, signed = flows.setdefault(owner, ([], [], []))
+        times.append(epoch)
+        volumes.append(notional)
+        signed.append(notional if bullish else -notional)
+
+    data = BacktestData(start_ts=start_ts, bar_seconds=bar_seconds, bars=bars)
+    for market in markets:
+        market_id = str(market.get("id", ""))
+        title = market.get("question", market.get("title", "")) or market_id
+        source = "snapshots"
+
+        times, values = prices.get(market_id, ([], []))
+        # Rows for different aliases arrive in separate runs; restore time order.
+        order = np.argsort(np.asarray(times, dtype=float), kind="stable")
+        idx, keep = _bar_index(np.asarray(times, dtype=float)[order], start_ts, bar_seconds, bars)
+        values = np.asarray(values, dtype=float)[order]
+        if len(np.unique(idx[keep])) >= 2:
+            price = _bucket_last(idx[keep], values[keep], bars)
+        elif clob_client is not None:
+            price = _clob_prices(clob_client, market, start_ts, end_ts, bar_seconds, bars)
+            source = "clob"
+        else:
+            price = None
+        if price is None or np.count_nonzero(~np.isnan(price)) < 2:
+            continue
+
+        volume = np.zeros(bars)
+        whale_flow = np.zeros(bars)
+        times, volumes, signed = flows.get(market_id, ([], [], []))
+        if times:
+            idx, keep = _bar_index(times, start_ts, bar_seconds, bars)
+            volumes = np.asarray(volumes)[keep]
+            signed = np.asarray(signed)[keep]
+            volume = np.bincount(idx[keep], weights=volumes, minlength=bars)
+            whale = np.abs(signed) >= whale_notional
+            whale_flow = np.bincount(idx[keep][whale], weights=signed[whale], minlength=bars)
+
+        data.markets.append(MarketSeries(
+            market_id=market_id,
+            title=title,
+            price=price,
+            volume=volume,
+            whale_flow=whale_flow,
+            fee_schedule=fee_schedule_from_market(market),
+            source=source,
+        ))
+
+    return data
+
+
+def _clob_prices(clob_client, market, start_ts: int, end_ts: int, bar_seconds: int, bars: int):
+    """YES price bars from CLOB price history, or None when unavailable."""
+    token_id = get_primary_clob_token_id(market)
+    if not token_id:
+        return None
+    try:
+        history = clob_client.get_price_history(
+            token_id,
+            interval="max",
+            fidelity=max(bar_seconds // 60, 1),
+            start_ts=start_ts,
+            end_ts=end_ts,
+        )
+    except Exception:
+        return None
+
+    times, values = [], []
+    for point in history or []:
+        try:
+            times.append(float(point["t"]))
+            values.append(float(point["p"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    if not times:
+        return None
+    order = np.argsort(times, kind="stable")
+    idx, keep = _bar_index(np.asarray(times)[order], start_ts, bar_seconds, bars)
+    return _bucket_last(idx[keep], np.asarray(values)[order][keep], bars)
+
+
+# -- Signals --
+
+def _lagged(values, periods: int):
+    """``values`` shifted forward by ``periods`` bars, NaN-padded."""
+    out = np.full(len(values), np.nan)
+    if 0 < periods < len(values):
+        out[periods:] = values[:-periods]
+    elif periods == 0:
+        out[:] = values
+    return out
+
+
+def _rolling_sum(values, window: int):
+    """Trailing sum over ``window`` bars including the current bar."""
+    window = max(int(window), 1)
+    csum = np.cumsum(np.concatenate(([0.0], np.nan_to_num(values))))
+    out = csum[1:].copy()
+    out[window:] -= csum[1:-window] if window < len(values) else 0
+    return out
+
+
+def _rolling_mean_std(values, window: int):
+    """Trailing mean and std over complete windows; NaN elsewhere."""
+    window = max(int(window), 2)
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n < window:
+        return mean, std
+    valid = ~np.isnan(values)
+    clean = np.where(valid, values, 0.0)
+    s1 = np.cumsum(np.concatenate(([0.0], clean)))
+    s2 = np.cumsum(np.concatenate(([0.0], clean * clean)))
+    cnt = np.cumsum(np.concatenate(([0], valid.astype(np.int64))))
+    total = s1[window:] - s1[:-window]
+    total_sq = s2[window:] - s2[:-window]
+    full = (cnt[window:] - cnt[:-window]) == window
+    m = total / window
+    var = np.maximum(total_sq / window - m * m, 0.0)
+    mean[window - 1:] = np.where(full, m, np.nan)
+    std[window - 1:] = np.where(full, np.sqrt(var), np.nan)
+    return mean, std
+
+
+def _signal_momentum(series: MarketSeries, lookback: float, threshold: float, **_):
+    change = series.price - _lagged(series.price, int(lookback))
+    return np.where(change > threshold, 1, np.where(change < -threshold, -1, 0))
+
+
+def _signal_mean_reversion(series: MarketSeries, window: float, z_entry: float, **_):
+    mean, std = _rolling_mean_std(series.price, int(window))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(std > 0, (series.price - mean) / std, 0.0)
+    z = np.nan_to_num(z)
+    return np.where(z < -z_entry, 1, np.where(z > z_entry, -1, 0))
+
+
+def _signal_whale_follow(series: MarketSeries, window: float, min_flow: float, **_):
+    flow = _rolling_sum(series.whale_flow, int(window))
+    return np.where(flow >= min_flow, 1, np.where(flow <= -min_flow, -1, 0))
+
+
+def _signal_contrarian(series: MarketSeries, lookback: float, threshold: float, **_):
+    change = series.price - _lagged(series.price, int(lookback))
+    return np.where(change > threshold, -1, np.where(change < -threshold, 1, 0))
+
+
+def _signal_volume_spike(series: MarketSeries, window: float, multiplier: float, **_):
+    window = max(int(window), 1)
+    # Baseline excludes the current bar so a spike can't raise its own bar.
+    baseline = _lagged(_rolling_sum(series.volume, window), 1) / window
+    spike = (series.volume > multiplier * baseline) & (baseline > 0)
+    move = np.sign(np.nan_to_num(series.price - _lagged(series.price, 1)))
+    return np.where(spike, move, 0).astype(np.int64)
+
+
+SIGNALS = {
+    "momentum": _signal_momentum,
+    "mean-reversion": _signal_mean_reversion,
+    "whale-follow": _signal_whale_follow,
+    "contrarian": _signal_contrarian,
+    "volume-spike": _signal_volume_spike,
+}
+
+
+def target_positions(series: MarketSeries, strategy: str, params: Dict[str, float]):
+    """Per-bar target position (+1 long YES, -1 long NO, 0 flat).
+
+    A signal on bar ``t`` is filled at bar ``t + 1`` and held for ``hold``
+    bars unless a newer signal replaces it.
+    """
+    _require_numpy()
+    signal = SIGNALS[strategy](series, **params)
+    signal = np.where(np.isnan(series.price), 0, signal).astype(np.int64)
+    bars = len(signal)
+    hold = max(int(params.get("hold", 1)), 1)
+
+    fire = np.where(signal != 0, np.arange(bars), -1)
+    last = np.maximum.accumulate(fire)
+    active = (last >= 0) & (np.arange(bars) - last < hold)
+    positions = np.where(active, signal[np.maximum(last, 0)], 0)
+
+    filled = np.zeros(bars, dtype=np.int64)
+    filled[1:] = positions[:-1]
+    return filled
+
+
+# -- Execution --
+
+class BacktestEngine:
+    """Event-driven backtester over bar-aligned market series"""
+
+    def __init__(self, data: BacktestData, capital: float = 1000.0, position_size: float = 0.1):
+        _require_numpy()
+        self.data = data
+        self.capital = float(capital)
+        self.position_size = float(position_size)
+
+    def run(
+        self,
+        strategy: str,
+        params: Optional[Dict[str, float]] = None,
+        include_trades: bool = True,
+    ) -> Dict[str, Any]:
+        """Backtest one strategy and parameter set.
+
+        Capital is split evenly across markets. Each position stakes
+        ``position_size`` of its market's current equity; shorts are
+        modelled as buying NO at ``1 - price``.
+
+        Returns:
+            Dict with the summary metrics, trade log and equity curve
+        """
+        if strategy not in SIGNALS:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        merged = dict(DEFAULT_PARAMS[strategy])
+        merged.update(params or {})
+
+        data = self.data
+        sleeve = self.capital / len(data.markets) if data.markets else self.capital
+        equity = np.full(data.bars, self.capital if not data.markets else 0.0)
+        trades: List[Dict[str, Any]] = []
+        fees_paid = 0.0
+
+        for series in data.markets:
+            positions = target_positions(series, strategy, merged)
+            sleeve_equity, sleeve_trades, sleeve_fees = self._execute(series, positions, sleeve)
+            equity += sleeve_equity
+            trades.extend(sleeve_trades)
+            fees_paid += sleeve_fees
+
+        trades.sort(key=lambda trade: trade["exit_bar"])
+        return self._summarize(strategy, merged, equity, trades, fees_paid, include_trades)
+
+    def _execute(self, series: MarketSeries, positions, sleeve: float):
+        """Walk position changes for one market; mark to market in between."""
+        price = series.price
+        bars = len(price)
+        equity = np.full(bars, sleeve)
+        trades = []
+        fees = 0.0
+
+        cash = sleeve
+        side = 0
+        shares = 0.0
+        entry_px = 0.0
+        entry_bar = 0
+        stake = 0.0
+
+        changes = np.flatnonzero(np.diff(positions, prepend=0))
+        events = list(changes) + [bars]
+        segment_start = 0
+
+        for bar in events:
+            # Mark the open position to market up to this event.
+            if side:
+                marks = price[segment_start:bar] if side > 0 else 1.0 - price[segment_start:bar]
+                equity[segment_start:bar] = cash + shares * marks
+            else:
+                equity[segment_start:bar] = cash
+            if bar >= bars:
+                break
+
+            px = price[bar]
+            target = int(positions[bar])
+            if side and not np.isnan(px):
+                exit_px = px if side > 0 else 1.0 - px
+                proceeds = shares * exit_px
+                fee = estimate_taker_fee(proceeds, exit_px, series.fee_schedule)
+                cash += proceeds - fee
+                fees += fee
+                trades.append({
+                    "market": series.title,
+                    "side": "BUY" if side > 0 else "SELL",
+                    "entry_bar": entry_bar,
+                    "exit_bar": int(bar),
+                    "entry": entry_px if side > 0 else 1.0 - entry_px,
+                    "exit": float(px),
+                    "pnl": proceeds - fee - stake,
+                })
+                side = 0
+                shares = 0.0
+
+            if target and not side and not np.isnan(px):
+                fill_px = px if target > 0 else 1.0 - px
+                if 0.0 < fill_px < 1.0:
+                    stake = cash * self.position_size
+                    fee = estimate_taker_fee(stake, fill_px, series.fee_schedule)
+                    shares = (stake - fee) / fill_px
+                    cash -= stake
+                    fees += fee
+                    side = target
+                    entry_px = fill_px
+                    entry_bar = int(bar)
+            segment_start = bar
+
+        if side:
+            exit_px = price[-1] if side > 0 else 1.0 - price[-1]
+            proceeds = shares * exit_px
+            fee = estimate_taker_fee(proceeds, exit_px, series.fee_schedule)
+            cash += proceeds - fee
+            fees += fee
+            equity[-1] = cash
+            trades.append({
+                "market": series.title,
+                "side": "BUY" if side > 0 else "SELL",
+                "entry_bar": entry_bar,
+                "exit_bar": bars - 1,
+                "entry": entry_px if side > 0 else 1.0 - entry_px,
+                "exit": float(price[-1]),
+                "pnl": proceeds - fee - stake,
+            })
+
+        return equity, trades, fees
+
+    def _summarize(self, strategy, params, equity, trades, fees_paid, include_trades) -> Dict[str, Any]:
+        pnls = np.array([trade["pnl"] for trade in trades], dtype=float)
+        wins = pnls[pnls > 0]
+        losses = pnls[pnls < 0]
+        total_wins = float(wins.sum())
+        total_losses = float(-losses.sum())
+
+        peaks = np.maximum.accumulate(equity)
+        drawdowns = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+
+        returns = np.diff(equity) / equity[:-1] if len(equity) > 1 else np.array([])
+        returns = returns[np.isfinite(returns)]
+        std = float(returns.std()) if len(returns) > 1 else 0.0
+        bars_per_year = 365 * 86400 / self.data.bar_seconds
+        sharpe = float(returns.mean()) / std * math.sqrt(bars_per_year) if std > 0 else 0.0
+
+        if total_losses > 0:
+            profit_factor = total_wins / total_losses
+        else:
+            profit_factor = float("inf") if total_wins > 0 else 0.0
+
+        results = {
+            "final_capital": float(equity[-1]),
+            "total_trades": len(trades),
+            "winning_trades": int(len(wins)),
+            "losing_trades": int(len(losses)),
+            "win_rate": len(wins) / len(trades) * 100 if trades else 0,
+            "avg_win": float(wins.mean()) if len(wins) else 0,
+            "avg_loss": float(-losses.mean()) if len(losses) else 0,
+            "profit_factor": profit_factor,
+            "max_drawdown": float(drawdowns.max()) * 100,
+            "sharpe_ratio": sharpe,
+            "fees_paid": fees_paid,
+            "markets_tested": len(self.data.markets),
+            "bars": self.data.bars,
+            "params": params,
+        }
+        if include_trades:
+            results["trades"] = [
+                {
+                    "date": self.data.bar_time(trade["exit_bar"]).strftime("%Y-%m-%d"),
+                    "market": trade["market"][:30],
+                    "side": trade["side"],
+                    "entry": trade["entry"],
+                    "exit": trade["exit"],
+                    "pnl": trade["pnl"],
+                }
+                for trade in trades
+            ]
+            step = max(-(-len(equity) // EQUITY_CURVE_POINTS), 1)
+            curve = [self.capital] + equity[step - 1::step].tolist()
+            if curve[-1] != float(equity[-1]):
+                curve.append(float(equity[-1]))
+            results["equity_curve"] = curve
+        return results
+
+    def sweep(
+        self,
+        strategy: str,
+        grid: Optional[Dict[str, Iterable[float]]] = None,
+        workers: Optional[int] = None,
+        top: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Run every parameter combination in ``grid`` and rank by Sharpe.
+
+        Combinations are spread over a process pool; each worker receives
+        the series once and returns summary metrics only. ``workers=1``
+        runs inline.
+
+        Returns:
+            The ``top`` results, best Sharpe ratio first
+        """
+        if strategy not in SIGNALS:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        grid = grid or DEFAULT_SWEEP_GRIDS[strategy]
+        names = list(grid)
+        combos = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+        tasks = [(strategy, combo) for combo in combos]
+
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(tasks) <= 1:
+            results = [self.run(strategy, combo, include_trades=False) for _, combo in tasks]
+        else:
+            chunksize = max(len(tasks) // (workers * 4), 1)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_sweep_worker,
+                initargs=(self.data, self.capital, self.position_size),
+            ) as pool:
+                results = list(pool.map(_sweep_task, tasks, chunksize=chunksize))
+
+        results.sort(key=lambda result: (result["sharpe_ratio"], result["final_capital"]), reverse=True)
+        return results[:top] if top else results
+
+
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def _init_sweep_worker(data: BacktestData, capital: float, position_size: float) -> None:
+    global _worker_engine
+    _worker_engine = BacktestEngine(data, capital=capital, position_size=position_size)
+
+
+def _sweep_task(task: Tuple[str, Dict[str, float]]) -> Dict[str, Any]:
+    strategy, params = task
+    return _worker_engine.run(strategy, params, include_trades=False)
@@ -7,6 +7,8 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from ..utils.timeseries import align_values
+
 
 @dataclass
 class ChartPoint:
@@ -271,6 +273,10 @@ def generate_comparison_chart(
 ) -> str:
     """Generate a comparison sparkline for two markets
 
+    When both markets have data, market 2 is aligned onto market 1's
+    timestamps (last known price at or before each point) so the two
+    sparklines share a time axis.
+
     Args:
         market1_prices: Prices for first market
         market2_prices: Prices for second market
@@ -286,20 +292,25 @@ def generate_comparison_chart(
     lines.append("Market Comparison")
     lines.append("")
 
+    values1 = [p for _, p in market1_prices]
+    values2 = [p for _, p in market2_prices]
+    if market1_prices and market2_prices:
+        aligned1, aligned2 = align_values(market1_prices, market2_prices, direction="backward")
+        if len(aligned1) >= 2:
+            values1, values2 = aligned1, aligned2
+
     # Market 1
-    if market1_prices:
-        values1 = [p for _, p in market1_prices]
+    if values1:
         spark1 = chart.generate_sparkline(values1, width=30)
-        current1 = values1[-1] * 100 if values1 else 0
-        change1 = ((values1[-1] - values1[0]) / values1[0] * 100) if values1 and values1[0] > 0 else 0
+        current1 = values1[-1] * 100
+        change1 = ((values1[-1] - values1[0]) / values1[0] * 100) if values1[0] > 0 else 0
         lines.append(f"{market1_name[:20]:<20} {spark1} {current1:.0f}% ({change1:+.1f}%)")
 
     # Market 2
-    if market2_prices:
-        values2 = [p for _, p in market2_prices]
+    if values2:
         spark2 = chart.generate_sparkline(values2, width=30)
-        current2 = values2[-1] * 100 if values2 else 0
-        change2 = ((values2[-1] - values2[0]) / values2[0] * 100) if values2 and values2[0] > 0 else 0
+        current2 = values2[-1] * 100
+        change2 = ((values2[-1] - values2[0]) / values2[0] * 100) if values2[0] > 0 else 0
         lines.append(f"{market2_name[:20]:<20} {spark2} {current2:.0f}% ({change2:+.1f}%)")
 
     return '\n'.join(lines)
@@ -4,11 +4,62 @@ Identifies wallets likely controlled by the same entity based on:
 - Timing correlation (trades within seconds of each other)
 - Market overlap (trading the same niche markets)
 - Size patterns (identical position sizes)
+
+Pairs are only ever generated from shared buckets -- the same market
+inside a sliding time window, or the same market / trade size in an
+inverted index -- so work grows with co-occurrence rather than with the
+square of the number of trades or wallets.
 """
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set, Iterable
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import combinations
+
+from ..utils.text_index import MinHasher
+
+# Timing scan over the local tape
+TAPE_HOURS = 168
+MAX_TAPE_TRADES = 200_000
+MIN_TIMING_MATCHES = 3
+
+# Wallet profiles for overlap / size signals
+WALLET_LIMIT = 200
+TRADES_PER_WALLET = 500
+
+# Exact inverted-index pair counting is used while the number of pair
+# updates stays under this budget; beyond it market overlap switches to
+# MinHash LSH candidates.
+EXACT_PAIR_BUDGET = 2_000_000
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+
+# Sizes shared by more wallets than this (e.g. 100.0) say nothing about
+# common ownership and are skipped.
+MAX_SIZE_BUCKET_WALLETS = 500
+
+
+class WalletProfile:
+    """Markets and trade sizes seen for one wallet"""
+
+    __slots__ = ('markets', 'sizes')
+
+    def __init__(self, markets: Set[str], sizes: Set[float]):
+        self.markets = markets
+        self.sizes = sizes
+
+    @classmethod
+    def from_points(cls, points: Iterable[Tuple[str, float]]) -> 'WalletProfile':
+        """Build from ``(market_id, size)`` pairs."""
+        points = list(points)
+        return cls(
+            markets=set(market_id for market_id, _ in points),
+            sizes=set(round(size, 2) for _, size in points if size > 0),
+        )
+
+
+def _pair(wallet1: str, wallet2: str) -> Tuple[str, str]:
+    return (wallet1, wallet2) if wallet1 <= wallet2 else (wallet2, wallet1)
 
 
 class WalletClusterDetector:
@@ -33,123 +84,233 @@ class WalletClusterDetector:
             for wallet1, wallet2, count in timing_clusters
         }
 
-    def find_timing_clusters(self, window_seconds=30):
+    def load_wallet_profiles(
+        self,
+        wallet_limit: int = WALLET_LIMIT,
+        trades_per_wallet: int = TRADES_PER_WALLET,
+    ) -> Dict[str, WalletProfile]:
+        """Load market and size profiles for the top wallets in one batch."""
+        wallets = self.db.get_all_wallets(limit=wallet_limit)
+        if len(wallets) < 2:
+            return {}
+        return self._load_profiles([wallet.address for wallet in wallets], trades_per_wallet)
+
+    def _load_profiles(
+        self,
+        addresses: List[str],
+        trades_per_wallet: int = TRADES_PER_WALLET,
+    ) -> Dict[str, WalletProfile]:
+        """Profiles for ``addresses`` from one batched trade query."""
+        points = defaultdict(list)
+        for address, market_id, size in self.db.get_wallet_trade_points(
+            addresses, limit_per_wallet=trades_per_wallet,
+        ):
+            points[address].append((market_id, size))
+        return {address: WalletProfile.from_points(points.get(address, ())) for address in addresses}
+
+    def _ensure_profiles(
+        self,
+        wallets: Iterable[str],
+        profiles: Optional[Dict[str, WalletProfile]],
+    ) -> Dict[str, WalletProfile]:
+        """Add profiles for any of ``wallets`` missing from ``profiles``.
+
+        Missing wallets are loaded together in one query. ``profiles`` is
+        updated in place (or created) and returned.
+        """
+        if profiles is None:
+            profiles = {}
+        missing = [wallet for wallet in dict.fromkeys(wallets) if wallet not in profiles]
+        if missing:
+            profiles.update(self._load_profiles(missing))
+        return profiles
+
+    def find_timing_clusters(
+        self,
+        window_seconds=30,
+        hours: int = TAPE_HOURS,
+        max_trades: int = MAX_TAPE_TRADES,
+    ):
         """Find wallets that consistently trade within seconds of each other.
 
-        Looks at trade timestamps and groups wallets that frequently trade
-        within the specified time window.
+        Trades are bucketed by market and swept in time order with a sliding
+        window, so each trade is only compared with other wallets active in
+        the same market within ``window_seconds``. A trade counts at most
+        once per other wallet in its window.
 
         Returns list of (wallet1, wallet2, correlation_count) tuples
         """
-        trades = self.db.get_recent_trades(hours=168, limit=5000)  # 1 week
+        trades = self.db.get_recent_trades(hours=hours, limit=max_trades)
         if len(trades) < 2:
             return []
 
-        # Ensure newest->oldest ordering so we can short-circuit once outside window.
-        trades = sorted(trades, key=lambda trade: trade.timestamp, reverse=True)
+        by_market = defaultdict(list)
+        for trade in trades:
+            by_market[trade.market_id].append((trade.timestamp.timestamp(), trade.wallet_address))
 
-        # Group trades by timestamp windows
         pairs = defaultdict(int)
-        for i, t1 in enumerate(trades):
-            for t2 in trades[i+1:]:
-                delta = (t1.timestamp - t2.timestamp).total_seconds()
-                if delta > window_seconds:
-                    break
-                if t1.wallet_address == t2.wallet_address:
-                    continue
-                pair = tuple(sorted([t1.wallet_address, t2.wallet_address]))
-                pairs[pair] += 1
+        for market_trades in by_market.values():
+            if len(market_trades) < 2:
+                continue
+            market_trades.sort(key=lambda item: item[0])
+            window = deque()
+            active = defaultdict(int)  # wallet -> trades inside the window
+            for ts, wallet in market_trades:
+                while window and ts - window[0][0] > window_seconds:
+                    _, expired = window.popleft()
+                    active[expired] -= 1
+                    if not active[expired]:
+                        del active[expired]
+                for other in active:
+                    if other != wallet:
+                        pairs[_pair(wallet, other)] += 1
+                window.append((ts, wallet))
+                active[wallet] += 1
 
         # Filter pairs with enough correlated trades (3+)
-        results = []
-        for (w1, w2), count in pairs.items():
-            if count >= 3:
-                results.append((w1, w2, count))
-
+        results = [
+            (w1, w2, count)
+            for (w1, w2), count in pairs.items()
+            if count >= MIN_TIMING_MATCHES
+        ]
         return sorted(results, key=lambda x: x[2], reverse=True)
 
-    def find_market_overlap_clusters(self, min_overlap=0.7):
+    def find_market_overlap_clusters(
+        self,
+        min_overlap=0.7,
+        profiles: Optional[Dict[str, WalletProfile]] = None,
+        wallet_limit: int = WALLET_LIMIT,
+    ):
         """Find wallets trading the same niche markets.
 
-        Calculates Jaccard similarity of market sets between wallets.
+        Calculates Jaccard similarity of market sets between wallets that
+        share at least one market (inverted index). When that would touch
+        too many pairs, MinHash LSH picks candidates and exact Jaccard
+        confirms them.
 
         Returns list of (wallet1, wallet2, overlap_score) tuples
         """
-        wallets = self.db.get_all_wallets(limit=200)
-        if len(wallets) < 2:
+        if profiles is None:
+            profiles = self.load_wallet_profiles(wallet_limit)
+
+        # Need at least 2 markets for meaningful overlap
+        wallet_markets = {
+            address: profile.markets
+            for address, profile in profiles.items()
+            if len(profile.markets) >= 2
+        }
+        if len(wallet_markets) < 2:
             return []
 
-        # Build market sets for each wallet
-        wallet_markets = {}
-        for wallet in wallets:
-            trades = self.db.get_trades_by_wallet(wallet.address, limit=500)
-            markets = set(t.market_id for t in trades)
-            if len(markets) >= 2:  # Need at least 2 markets for meaningful overlap
-                wallet_markets[wallet.address] = markets
+        index = self._inverted_index(wallet_markets)
+        pair_updates = sum(len(wallets) * (len(wallets) - 1) // 2 for wallets in index.values())
+        if pair_updates <= EXACT_PAIR_BUDGET:
+            intersections = self._count_shared(index)
+        else:
+            intersections = {
+                pair: len(wallet_markets[pair[0]] & wallet_markets[pair[1]])
+                for pair in self._minhash_candidates(wallet_markets)
+            }
 
-        # Compare all pairs
         results = []
-        addresses = list(wallet_markets.keys())
-        for i, addr1 in enumerate(addresses):
-            for addr2 in addresses[i+1:]:
-                markets1 = wallet_markets[addr1]
-                markets2 = wallet_markets[addr2]
-
-                intersection = markets1 & markets2
-                union = markets1 | markets2
-
-                if not union:
-                    continue
-
-                overlap = len(intersection) / len(union)
-                if overlap >= min_overlap:
-                    results.append((addr1, addr2, round(overlap, 3)))
+        for (addr1, addr2), shared in intersections.items():
+            union = len(wallet_markets[addr1]) + len(wallet_markets[addr2]) - shared
+            if not union:
+                continue
+            overlap = shared / union
+            if overlap >= min_overlap:
+                results.append((addr1, addr2, round(overlap, 3)))
 
         return sorted(results, key=lambda x: x[2], reverse=True)
 
-    def find_size_pattern_clusters(self):
+    def find_size_pattern_clusters(
+        self,
+        profiles: Optional[Dict[str, WalletProfile]] = None,
+        wallet_limit: int = WALLET_LIMIT,
+    ):
         """Find wallets using identical position sizes.
 
         Wallets controlled by the same entity often use round numbers
-        or identical trade sizes across accounts.
+        or identical trade sizes across accounts. Pairs come from a
+        size -> wallets index; sizes used by very many wallets are ignored.
 
         Returns list of (wallet1, wallet2, matching_sizes_count) tuples
         """
-        wallets = self.db.get_all_wallets(limit=200)
-        if len(wallets) < 2:
-            return []
+        if profiles is None:
+            profiles = self.load_wallet_profiles(wallet_limit)
 
-        # Build size profiles
-        wallet_sizes = {}
-        for wallet in wallets:
-            trades = self.db.get_trades_by_wallet(wallet.address, limit=200)
-            sizes = [round(t.size, 2) for t in trades if t.size > 0]
-            if sizes:
-                wallet_sizes[wallet.address] = sizes
+        wallet_sizes = {
+            address: profile.sizes
+            for address, profile in profiles.items()
+            if profile.sizes
+        }
+        if len(wallet_sizes) < 2:
+            return []
 
-        # Compare size profiles
-        results = []
-        addresses = list(wallet_sizes.keys())
-        for i, addr1 in enumerate(addresses):
-            for addr2 in addresses[i+1:]:
-                sizes1 = set(wallet_sizes[addr1])
-                sizes2 = set(wallet_sizes[addr2])
+        index = {
+            size: wallets
+            for size, wallets in self._inverted_index(wallet_sizes).items()
+            if len(wallets) <= MAX_SIZE_BUCKET_WALLETS
+        }
+        results = [
+            (addr1, addr2, common)
+            for (addr1, addr2), common in self._count_shared(index).items()
+            if common >= 3  # At least 3 matching sizes
+        ]
+        return sorted(results, key=lambda x: x[2], reverse=True)
 
-                common = sizes1 & sizes2
-                if len(common) >= 3:  # At least 3 matching sizes
-                    results.append((addr1, addr2, len(common)))
+    @staticmethod
+    def _inverted_index(wallet_items: Dict[str, Set]) -> Dict[Any, List[str]]:
+        """Map each market / size to the sorted wallets that have it."""
+        index = defaultdict(list)
+        for address in sorted(wallet_items):
+            for item in wallet_items[address]:
+                index[item].append(address)
+        return index
+
+    @staticmethod
+    def _count_shared(index: Dict[Any, List[str]]) -> Dict[Tuple[str, str], int]:
+        """Count shared items for every pair that co-occurs in a bucket."""
+        shared = defaultdict(int)
+        for wallets in index.values():
+            for pair in combinations(wallets, 2):
+                shared[pair] += 1
+        return shared
+
+    @staticmethod
+    def _minhash_candidates(
+        wallet_items: Dict[str, Set[str]],
+        bands: int = MINHASH_BANDS,
+        rows: int = MINHASH_ROWS,
+    ) -> Set[Tuple[str, str]]:
+        """Candidate pairs whose MinHash signatures agree on a whole band.
+
+        With 16 bands of 4 rows a pair at Jaccard 0.7 becomes a candidate
+        with ~99% probability and one at 0.3 with ~12%.
+        """
+        hasher = MinHasher(bands, rows)
+        buckets = defaultdict(list)
+        for address in sorted(wallet_items):
+            for key in hasher.band_keys(wallet_items[address]):
+                buckets[key].append(address)
 
-        return sorted(results, key=lambda x: x[2], reverse=True)
+        candidates = set()
+        for wallets in buckets.values():
+            candidates.update(combinations(wallets, 2))
+        return candidates
 
     def calculate_cluster_score(
         self,
         wallet1,
         wallet2,
         timing_lookup: Optional[Dict[Tuple[str, str], int]] = None,
+        profiles: Optional[Dict[str, WalletProfile]] = None,
     ):
         """Score 0-100 likelihood that two wallets are same entity.
 
         Combines all detection signals into a single confidence score.
+        Wallets missing from ``profiles`` are loaded from the database in
+        one query and added to it.
         """
         score = 0
         signals = []
@@ -168,11 +329,12 @@ class WalletClusterDetector:
             signals.append(f"timing:{timing_count}")
 
         # Market overlap (up to 35 points)
-        w1_trades = self.db.get_trades_by_wallet(wallet1, limit=500)
-        w2_trades = self.db.get_trades_by_wallet(wallet2, limit=500)
+        profiles = self._ensure_profiles((wallet1, wallet2), profiles)
+        profile1 = profiles[wallet1]
+        profile2 = profiles[wallet2]
 
-        markets1 = set(t.market_id for t in w1_trades)
-        markets2 = set(t.market_id for t in w2_trades)
+        markets1 = profile1.markets
+        markets2 = profile2.markets
 
         if markets1 and markets2:
             overlap = len(markets1 & markets2) / len(markets1 | markets2)
@@ -182,9 +344,7 @@ class WalletClusterDetector:
                 signals.append(f"overlap:{overlap:.1%}")
 
         # Size pattern (up to 25 points)
-        sizes1 = set(round(t.size, 2) for t in w1_trades if t.size > 0)
-        sizes2 = set(round(t.size, 2) for t in w2_trades if t.size > 0)
-        common_sizes = sizes1 & sizes2
+        common_sizes = profile1.sizes & profile2.sizes
         if len(common_sizes) >= 2:
             size_score = min(len(common_sizes) * 5, 25)
             score += size_score
@@ -196,27 +356,40 @@ class WalletClusterDetector:
             'risk': 'high' if score >= 70 else 'medium' if score >= 40 else 'low',
         }
 
-    def detect_clusters(self, min_score=60):
+    def detect_clusters(
+        self,
+        min_score=60,
+        hours: int = TAPE_HOURS,
+        wallet_limit: int = WALLET_LIMIT,
+    ):
         """Run all detection methods, return grouped clusters.
 
+        The trade tape is scanned once for timing and wallet profiles are
+        loaded once and shared by the overlap, size and scoring steps.
+
         Returns list of cluster dicts with wallets and confidence scores.
         """
         # Get all wallet pairs from each method
         all_pairs = set()
 
-        timing = self.find_timing_clusters()
+        timing = self.find_timing_clusters(hours=hours)
         timing_lookup = self._build_timing_lookup(timing)
         for w1, w2, _ in timing:
             all_pairs.add(tuple(sorted([w1, w2])))
 
-        overlap = self.find_market_overlap_clusters()
+        profiles = self.load_wallet_profiles(wallet_limit)
+
+        overlap = self.find_market_overlap_clusters(profiles=profiles)
         for w1, w2, _ in overlap:
             all_pairs.add(tuple(sorted([w1, w2])))
 
-        size = self.find_size_pattern_clusters()
+        size = self.find_size_pattern_clusters(profiles=profiles)
         for w1, w2, _ in size:
             all_pairs.add(tuple(sorted([w1, w2])))
 
+        # Timing-only pairs can involve wallets outside the top list
+        self._ensure_profiles((wallet for pair in all_pairs for wallet in pair), profiles)
+
         # Score each pair
         clusters = []
         for w1, w2 in all_pairs:
@@ -224,6 +397,7 @@ class WalletClusterDetector:
                 w1,
                 w2,
                 timing_lookup=timing_lookup,
+                profiles=profiles,
             )
             if result['score'] >= min_score:
                 clusters.append({
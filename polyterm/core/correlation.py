@@ -9,14 +9,29 @@ Features:
 """
 
 import math
+import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 from ..db.database import Database
 from ..db.models import MarketSnapshot
 from ..api.gamma import GammaClient
+from ..utils.timeseries import asof_join
+
+try:
+    import numpy as np
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+# Minimum overlapping points before a correlation is reported
+MIN_SAMPLES = 5
+
+# Aligned price panels kept at once; the least recently used is evicted
+PANEL_CACHE_SIZE = 16
 
 
 @dataclass
@@ -107,6 +122,8 @@ class CorrelationEngine:
         # Cache for market data
         self._price_cache: Dict[str, List[Tuple[datetime, float]]] = {}
         self._cache_ttl = 300  # 5 minutes
+        # Aligned price panels keyed by (hours, resample_minutes, market ids)
+        self._panel_cache: "OrderedDict[Tuple[int, int, Tuple[str, ...]], Tuple[float, Any]]" = OrderedDict()
 
     def calculate_correlation(
         self,
@@ -185,39 +202,28 @@ class CorrelationEngine:
         """
         Align two time series by matching timestamps.
 
+        Each point of series1 is paired with the nearest point of series2
+        via a single merge pass over both series.
+
         Args:
             series1: First series
             series2: Second series
-            tolerance_minutes: Maximum time difference for matching
+            tolerance_minutes: Time difference for matching; a match must
+                be strictly closer than this
 
         Returns:
-            List of (timestamp, price1, price2) tuples
+            List of (timestamp, price1, price2) tuples in time order
         """
-        aligned = []
-        tolerance = timedelta(minutes=tolerance_minutes)
-
-        # Create lookup for series2
-        s2_dict = {ts: price for ts, price in series2}
-        s2_times = sorted(s2_dict.keys())
-
-        for ts1, price1 in series1:
-            # Find closest timestamp in series2
-            best_match = None
-            best_diff = tolerance
-
-            for ts2 in s2_times:
-                diff = abs(ts1 - ts2)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_match = ts2
-
-            if best_match is not None:
-                aligned.append((ts1, price1, s2_dict[best_match]))
-
-        return aligned
+        return asof_join(
+            series1,
+            series2,
+            tolerance=timedelta(minutes=tolerance_minutes),
+            direction="nearest",
+            inclusive=False,
+        )
 
+    @staticmethod
     def _pearson_correlation(
-        self,
         x: List[float],
         y: List[float],
     ) -> float:
@@ -299,6 +305,112 @@ class CorrelationEngine:
 
         return correlations[:max_results]
 
+    def load_price_panel(
+        self,
+        market_ids: List[str],
+        hours: int = 24,
+        resample_minutes: int = 5,
+        tolerance_minutes: int = 15,
+    ):
+        """
+        Load every market's prices in one query and align them on a time grid.
+
+        Snapshots are averaged into ``resample_minutes`` buckets and carried
+        forward for up to ``tolerance_minutes``, mirroring the matching
+        tolerance of ``_align_series``. Panels are cached per window for
+        ``_cache_ttl`` seconds, at most ``PANEL_CACHE_SIZE`` at a time.
+
+        Returns:
+            pandas DataFrame indexed by bucket time with one column per market
+            (NaN where a market has no price within tolerance). Raw snapshot
+            counts per market are kept in ``panel.attrs["observations"]``.
+        """
+        ids = list(dict.fromkeys(market_ids))
+        key = (hours, resample_minutes, tuple(ids))
+        cached = self._panel_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            self._panel_cache.move_to_end(key)
+            return cached[1]
+
+        rows = self.db.get_market_price_points(ids, hours=hours)
+        frame = pd.DataFrame(rows, columns=["market_id", "timestamp", "probability"])
+        if frame.empty:
+            panel = pd.DataFrame(columns=ids, dtype=float)
+        else:
+            frame["timestamp"] = pd.to_datetime(
+                frame["timestamp"], format="ISO8601", utc=True, errors="coerce",
+            )
+            frame = frame.dropna(subset=["timestamp"])
+            observations = frame.groupby("market_id").size()
+            freq = f"{resample_minutes}min"
+            frame["bucket"] = frame["timestamp"].dt.floor(freq)
+            panel = frame.pivot_table(
+                index="bucket", columns="market_id", values="probability", aggfunc="mean",
+            )
+            if not panel.empty:
+                grid = pd.date_range(panel.index.min(), panel.index.max(), freq=freq)
+                fill_limit = max(tolerance_minutes // resample_minutes, 0)
+                panel = panel.reindex(grid).ffill(limit=fill_limit or None)
+            panel = panel.reindex(columns=ids)
+            panel.attrs["observations"] = observations.reindex(ids, fill_value=0).to_dict()
+
+        self._store_panel(key, panel)
+        return panel
+
+    def _store_panel(self, key: Tuple[int, int, Tuple[str, ...]], panel: Any) -> None:
+        """Cache ``panel``, dropping expired panels and the least recently used"""
+        now = time.monotonic()
+        for stale in [k for k, (stored, _) in self._panel_cache.items() if now - stored >= self._cache_ttl]:
+            del self._panel_cache[stale]
+        self._panel_cache[key] = (now, panel)
+        self._panel_cache.move_to_end(key)
+        while len(self._panel_cache) > PANEL_CACHE_SIZE:
+            self._panel_cache.popitem(last=False)
+
+    def _matrix_arrays(
+        self,
+        market_ids: List[str],
+        hours: int,
+    ) -> Tuple[Any, Any]:
+        """
+        Pairwise-complete Pearson correlations for all markets at once.
+
+        Missing values are masked, so every pair uses exactly the buckets
+        where both markets have a price. All sums come from a handful of
+        matrix products rather than a Python loop over pairs.
+
+        Returns:
+            (correlation matrix, overlap count matrix) as NumPy arrays
+        """
+        panel = self.load_price_panel(market_ids, hours)
+        values = panel.to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        mask = present.astype(float)
+        x = np.where(present, values, 0.0)
+
+        counts = mask.T @ mask
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sum_x = x.T @ mask              # [i, j] = sum of x_i where both present
+            sum_xx = (x * x).T @ mask
+            sum_xy = x.T @ x
+            mean_i = sum_x / counts
+            mean_j = mean_i.T
+            cov = sum_xy / counts - mean_i * mean_j
+            var_i = sum_xx / counts - mean_i ** 2
+            var_j = var_i.T
+            corr = cov / np.sqrt(var_i * var_j)
+
+        # Mirror calculate_correlation: markets with too few raw snapshots,
+        # flat series and undersampled pairs all read as 0.
+        observations = panel.attrs.get("observations", {})
+        sampled = np.array([observations.get(m, 0) >= MIN_SAMPLES for m in panel.columns])
+        counts = np.where(np.outer(sampled, sampled), counts, 0.0)
+        flat = (var_i <= 1e-15) | (var_j <= 1e-15)
+        corr = np.where((counts < MIN_SAMPLES) | flat | ~np.isfinite(corr), 0.0, corr)
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, 1.0)
+        return corr, counts
+
     def calculate_correlation_matrix(
         self,
         market_ids: List[str],
@@ -307,6 +419,9 @@ class CorrelationEngine:
         """
         Calculate correlation matrix for multiple markets.
 
+        With pandas available all series are loaded in one query, aligned on
+        a shared time grid, and correlated in a single vectorized pass.
+
         Args:
             market_ids: List of market IDs
             hours: Time window
@@ -314,6 +429,14 @@ class CorrelationEngine:
         Returns:
             Nested dict of correlations: {market1: {market2: correlation}}
         """
+        if HAS_PANDAS:
+            ids = list(dict.fromkeys(market_ids))
+            corr, _ = self._matrix_arrays(ids, hours)
+            return {
+                m1: {m2: float(corr[i, j]) for j, m2 in enumerate(ids)}
+                for i, m1 in enumerate(ids)
+            }
+
         matrix: Dict[str, Dict[str, float]] = defaultdict(dict)
 
         for i, m1 in enumerate(market_ids):
@@ -419,7 +542,9 @@ class CorrelationEngine:
         """
         Detect when correlation between markets breaks down.
 
-        Compares short-term vs long-term correlation.
+        Compares short-term vs long-term correlation. With pandas available
+        both windows come from the aligned price panel (one query each)
+        instead of loading every series per window.
 
         Args:
             market1_id: First market
@@ -431,33 +556,92 @@ class CorrelationEngine:
         Returns:
             Break detection result or None
         """
-        short_corr = self.calculate_correlation(market1_id, market2_id, short_window)
-        long_corr = self.calculate_correlation(market1_id, market2_id, long_window)
-
-        if not short_corr or not long_corr:
-            return None
+        if HAS_PANDAS:
+            ids = [market1_id, market2_id]
+            short_corr, short_n = self._matrix_arrays(ids, short_window)
+            long_corr, long_n = self._matrix_arrays(ids, long_window)
+            if short_n[0, 1] < MIN_SAMPLES or long_n[0, 1] < MIN_SAMPLES:
+                return None
+            short_value, long_value = float(short_corr[0, 1]), float(long_corr[0, 1])
+        else:
+            short_result = self.calculate_correlation(market1_id, market2_id, short_window)
+            long_result = self.calculate_correlation(market1_id, market2_id, long_window)
+            if not short_result or not long_result:
+                return None
+            short_value, long_value = short_result.correlation, long_result.correlation
 
-        diff = short_corr.correlation - long_corr.correlation
-
-        if abs(diff) >= threshold:
-            return {
-                'market1_id': market1_id,
-                'market2_id': market2_id,
-                'short_term_correlation': short_corr.correlation,
-                'long_term_correlation': long_corr.correlation,
-                'difference': diff,
-                'direction': 'strengthening' if diff > 0 else 'weakening',
-                'alert': True,
-                'message': f"Correlation {'strengthened' if diff > 0 else 'weakened'} by {abs(diff):.2f}",
-            }
+        result = self._break_result(market1_id, market2_id, short_value, long_value)
+        if abs(result['difference']) >= threshold:
+            return result
 
         return {
             'alert': False,
-            'short_term_correlation': short_corr.correlation,
-            'long_term_correlation': long_corr.correlation,
+            'short_term_correlation': short_value,
+            'long_term_correlation': long_value,
+            'difference': result['difference'],
+        }
+
+    @staticmethod
+    def _break_result(
+        market1_id: str,
+        market2_id: str,
+        short_term: float,
+        long_term: float,
+    ) -> Dict[str, Any]:
+        """Alert payload for a pair whose correlation moved"""
+        diff = short_term - long_term
+        return {
+            'market1_id': market1_id,
+            'market2_id': market2_id,
+            'short_term_correlation': short_term,
+            'long_term_correlation': long_term,
             'difference': diff,
+            'direction': 'strengthening' if diff > 0 else 'weakening',
+            'alert': True,
+            'message': f"Correlation {'strengthened' if diff > 0 else 'weakened'} by {abs(diff):.2f}",
         }
 
+    def scan_correlation_breaks(
+        self,
+        market_ids: List[str],
+        short_window: int = 6,
+        long_window: int = 72,
+        threshold: float = 0.3,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run ``detect_correlation_breaks`` over every pair of markets.
+
+        Builds one short-window and one long-window matrix instead of four
+        series loads per pair. Only pairs with enough overlap in both windows
+        are compared.
+
+        Returns:
+            Alerting pairs sorted by absolute difference, largest first
+        """
+        ids = list(dict.fromkeys(market_ids))
+        if not HAS_PANDAS:
+            breaks = []
+            for i, m1 in enumerate(ids):
+                for m2 in ids[i + 1:]:
+                    result = self.detect_correlation_breaks(m1, m2, short_window, long_window, threshold)
+                    if result and result.get('alert'):
+                        breaks.append(result)
+            breaks.sort(key=lambda row: abs(row['difference']), reverse=True)
+            return breaks
+
+        short_corr, short_n = self._matrix_arrays(ids, short_window)
+        long_corr, long_n = self._matrix_arrays(ids, long_window)
+        diff = short_corr - long_corr
+        eligible = (short_n >= MIN_SAMPLES) & (long_n >= MIN_SAMPLES) & (np.abs(diff) >= threshold)
+        rows, cols = np.nonzero(np.triu(eligible, k=1))
+
+        breaks = [
+            self._break_result(ids[i], ids[j], float(short_corr[i, j]), float(long_corr[i, j]))
+            for i, j in zip(rows.tolist(), cols.tolist())
+        ]
+        breaks.sort(key=lambda row: abs(row['difference']), reverse=True)
+        return breaks
+
     def render_heatmap_ascii(
         self,
         market_ids: List[str],
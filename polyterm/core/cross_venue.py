@@ -8,6 +8,12 @@ import requests
 
 from ..api.gamma import GammaClient
 from ..api.market_utils import market_probability_price
+from ..utils.text_index import TitleIndex, jaccard, tokenize
+
+# Tokens shorter than this are ignored when matching titles across venues
+MATCH_MIN_TOKEN_LENGTH = 4
+# Minimum title match confidence for a cross-venue pair
+MATCH_THRESHOLD = 0.45
 
 
 @dataclass
@@ -53,12 +59,13 @@ class CrossVenueMonitor:
         if "kalshi" in venues:
             external.extend(self._kalshi_markets(query=query, limit=limit))
 
+        index = TitleIndex(min_token_length=MATCH_MIN_TOKEN_LENGTH)
+        index.add_many((position, other.title) for position, other in enumerate(external))
+
         opportunities = []
         for poly in polymarket:
-            for other in external:
-                confidence = self._match_confidence(poly.title, other.title)
-                if confidence < 0.45:
-                    continue
+            for position, confidence in index.search(poly.title, threshold=MATCH_THRESHOLD):
+                other = external[position]
                 spread = abs(poly.yes_price - other.yes_price)
                 if spread >= min_spread:
                     fee_adjusted_spread = max(spread - 0.02, 0)
@@ -125,11 +132,10 @@ class CrossVenueMonitor:
         return markets
 
     def _match_confidence(self, left: str, right: str) -> float:
-        left_words = {word for word in left.lower().replace("?", "").split() if len(word) > 3}
-        right_words = {word for word in right.lower().replace("?", "").split() if len(word) > 3}
-        if not left_words or not right_words:
-            return 0.0
-        return len(left_words & right_words) / len(left_words | right_words)
+        return jaccard(
+            tokenize(left, min_length=MATCH_MIN_TOKEN_LENGTH),
+            tokenize(right, min_length=MATCH_MIN_TOKEN_LENGTH),
+        )
 
     def _quality_flags(self, market: VenueMarket, confidence: float) -> List[str]:
         flags = []
@@ -3,7 +3,7 @@ Historical Data API Module
 
 Features:
 - Download historical trade data
-- OHLCV data generation
+- OHLCV candles read from the database's rollups
 - Exportable formats for ML training
 - Time range queries
 """
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from ..db.candles import CandleRow, base_interval, build_candles, parse_interval, rollup
 from ..db.database import Database
 from ..db.models import Trade, MarketSnapshot
 from ..api.gamma import GammaClient
@@ -174,100 +175,87 @@ class HistoricalDataAPI:
         end_time: Optional[datetime] = None,
     ) -> List[OHLCV]:
         """
-        Generate OHLCV candles from trade data.
+        Get OHLCV candles from the database's candle rollups.
+
+        Stored intervals (1m, 5m, 15m, 1h, 4h, 1d) are a single indexed
+        read; other intervals are merged from the coarsest stored
+        interval that divides them.
 
         Args:
             market_id: Market ID
-            interval: Candle interval (1m, 5m, 15m, 1h, 4h, 1d)
+            interval: Candle interval (1m, 5m, 15m, 1h, 4h, 1d, ...)
             start_time: Start time
             end_time: End time
 
         Returns:
             List of OHLCV candles
         """
-        # Parse interval
         interval_seconds = self._parse_interval(interval)
+        base = base_interval(interval_seconds)
 
-        # Get trades
-        trades = self.get_trades(
-            market_id=market_id,
-            start_time=start_time,
-            end_time=end_time,
+        rows = self.db.get_candles(
+            market_id,
+            base,
+            start=start_time.timestamp() if start_time else None,
+            end=end_time.timestamp() if end_time else None,
         )
+        rows = self._clip_candles(market_id, rows, base, start_time, end_time)
+        if base != interval_seconds:
+            rows = rollup(rows, interval_seconds)
+
+        return [
+            OHLCV(
+                timestamp=datetime.fromtimestamp(bucket),
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                trade_count=trade_count,
+            )
+            for bucket, open_, high, low, close, volume, trade_count, _, _ in rows
+        ]
 
-        if not trades:
-            return []
-
-        # Generate candles
-        candles = []
-        current_candle_start = None
-        current_trades = []
-
-        for trade in trades:
-            # Calculate candle timestamp (floor to interval)
-            candle_ts = self._floor_timestamp(trade.timestamp, interval_seconds)
-
-            if current_candle_start is None:
-                current_candle_start = candle_ts
-                current_trades = [trade]
-            elif candle_ts == current_candle_start:
-                current_trades.append(trade)
-            else:
-                # Finalize current candle
-                if current_trades:
-                    candle = self._create_candle(current_candle_start, current_trades)
-                    candles.append(candle)
-
-                # Start new candle
-                current_candle_start = candle_ts
-                current_trades = [trade]
-
-        # Finalize last candle
-        if current_trades:
-            candle = self._create_candle(current_candle_start, current_trades)
-            candles.append(candle)
-
-        return candles
+    def _clip_candles(
+        self,
+        market_id: str,
+        rows: List[CandleRow],
+        interval_seconds: int,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> List[CandleRow]:
+        """Rebuild the candles that hold trades outside the time range.
+
+        Stored candles cover whole buckets, so the first and last one can
+        straddle ``start_time``/``end_time``. Those are folded again from
+        just their in-range trades; a candle left with none is dropped.
+        """
+        start = start_time.timestamp() if start_time else None
+        end = end_time.timestamp() if end_time else None
+        clipped: List[CandleRow] = []
+        for row in rows:
+            bucket, first_ts, last_ts = row[0], row[7], row[8]
+            if (start is None or first_ts >= start) and (end is None or last_ts <= end):
+                clipped.append(row)
+                continue
+            low = max(bucket, start) if start is not None else bucket
+            high = min(bucket + interval_seconds, end) if end is not None else bucket + interval_seconds
+            trades = [
+                t for t in self.db.get_trades_between(
+                    market_id, datetime.fromtimestamp(low), datetime.fromtimestamp(high),
+                )
+                if t.timestamp.timestamp() < bucket + interval_seconds
+            ]
+            clipped.extend(build_candles(
+                [t.timestamp.timestamp() for t in trades],
+                [t.price for t in trades],
+                [t.notional for t in trades],
+            )[interval_seconds])
+        return clipped
 
     def _parse_interval(self, interval: str) -> int:
         """Parse interval string to seconds"""
-        multipliers = {
-            'm': 60,
-            'h': 3600,
-            'd': 86400,
-        }
-
-        unit = interval[-1]
-        value = int(interval[:-1])
-
-        return value * multipliers.get(unit, 3600)
-
-    def _floor_timestamp(self, ts: datetime, interval_seconds: int) -> datetime:
-        """Floor timestamp to interval boundary"""
-        epoch = ts.timestamp()
-        floored = (epoch // interval_seconds) * interval_seconds
-        return datetime.fromtimestamp(floored)
-
-    def _create_candle(self, timestamp: datetime, trades: List[Trade]) -> OHLCV:
-        """Create OHLCV candle from trades"""
-        prices = [t.price for t in trades if t.price > 0]
-
-        if not prices:
-            return OHLCV(
-                timestamp=timestamp,
-                open=0, high=0, low=0, close=0,
-                volume=0, trade_count=0,
-            )
-
-        return OHLCV(
-            timestamp=timestamp,
-            open=prices[0],
-            high=max(prices),
-            low=min(prices),
-            close=prices[-1],
-            volume=sum(t.notional for t in trades),
-            trade_count=len(trades),
-        )
+        return parse_interval(interval)
 
     def get_historical_data(
         self,
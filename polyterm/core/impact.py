@@ -0,0 +1,199 @@
+"""Order book ladders and market-impact curves
+
+A ``Ladder`` is one side of a book, best level first, with running
+cumulative size and notional. Filling an order of any size is then a
+binary search for the level where the cumulative total reaches it plus
+one partial level: ``fill`` answers one size and ``impact_curve`` answers
+many at once (a single ``numpy.searchsorted`` when NumPy is installed, a
+``bisect`` per size otherwise).
+
+Sizes are in shares by default or in dollars with ``by='notional'``.
+Ladders are built from REST snapshots (``{'bids': [...], 'asks': [...]}``)
+and from ``LiveOrderBook`` alike via ``Ladder.from_book``.
+"""
+
+import bisect
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..db.candles import NUMPY_MIN_BATCH
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+SIZE_UNITS = ('shares', 'notional')
+
+
+def _parse_level(level: Any) -> Optional[tuple]:
+    """``(price, size)`` from a ``{'price', 'size'}`` dict or a pair"""
+    try:
+        if isinstance(level, dict):
+            price = float(level.get('price', 0))
+            size = float(level.get('size', level.get('amount', 0)))
+        elif isinstance(level, (list, tuple)) and len(level) >= 2:
+            price, size = float(level[0]), float(level[1])
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    if price <= 0 or size <= 0:
+        return None
+    return price, size
+
+
+class Ladder:
+    """One side of an order book as seen by a taker
+
+    A ``buy`` ladder holds asks in ascending price order and a ``sell``
+    ladder holds bids in descending order, so index 0 is always the best
+    level.
+    """
+
+    def __init__(self, side: str, prices: Sequence[float], sizes: Sequence[float]):
+        self.side = side.lower()
+        self.prices = list(prices)
+        self.sizes = list(sizes)
+        self.cumulative_size = list(accumulate(self.sizes))
+        self.cumulative_notional = list(accumulate(p * s for p, s in zip(self.prices, self.sizes)))
+        self._arrays = None
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[Any], side: str) -> "Ladder":
+        """Build from raw levels in any order; invalid or empty levels are dropped
+
+        Args:
+            levels: Asks for a ``buy`` ladder, bids for a ``sell`` ladder
+            side: ``'buy'`` or ``'sell'``
+        """
+        parsed = [level for level in map(_parse_level, levels) if level is not None]
+        parsed.sort(key=lambda level: level[0], reverse=side.lower() != 'buy')
+        return cls(side, [price for price, _ in parsed], [size for _, size in parsed])
+
+    @classmethod
+    def from_book(cls, book: Any, side: str) -> "Ladder":
+        """Build from a REST order book dict or a ``LiveOrderBook``"""
+        if isinstance(book, dict):
+            return cls.from_levels(book.get('asks' if side.lower() == 'buy' else 'bids') or [], side)
+        return book.ladder(side)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def best_price(self) -> Optional[float]:
+        return self.prices[0] if self.prices else None
+
+    @property
+    def depth(self) -> float:
+        """Total shares on the ladder"""
+        return self.cumulative_size[-1] if self.cumulative_size else 0.0
+
+    @property
+    def notional(self) -> float:
+        """Total dollar value on the ladder"""
+        return self.cumulative_notional[-1] if self.cumulative_notional else 0.0
+
+    def fill(self, size: float, by: str = 'shares', reference: Optional[float] = None) -> Dict[str, Any]:
+        """Fill one order; see ``impact_curve`` for the result keys"""
+        return self.impact_curve([size], by=by, reference=reference)[0]
+
+    def impact_curve(
+        self,
+        sizes: Sequence[float],
+        by: str = 'shares',
+        reference: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fill every size against the ladder in one pass
+
+        Args:
+            sizes: Order sizes, in any order
+            by: ``'shares'`` or ``'notional'`` (dollars)
+            reference: Price slippage is measured from; the best price
+                when omitted (pass the mid price for mid-based slippage)
+
+        Returns:
+            One dict per size, in input order: ``size``, ``shares``,
+            ``cost``, ``avg_price`` (None when nothing fills),
+            ``slippage``, ``slippage_pct`` (percent of ``reference``),
+            ``levels_used``, ``fillable`` and ``available`` (ladder depth
+            in the units of ``by``)
+        """
+        if by not in SIZE_UNITS:
+            raise ValueError(f"by must be one of {SIZE_UNITS}, got {by!r}")
+        if reference is None:
+            reference = self.best_price
+
+        if not self.prices:
+            shares = costs = [0.0] * len(sizes)
+            levels = [0] * len(sizes)
+        elif HAS_NUMPY and len(sizes) >= NUMPY_MIN_BATCH:
+            shares, costs, levels = self._walk_numpy(sizes, by)
+        else:
+            shares, costs, levels = self._walk(sizes, by)
+
+        available = self.depth if by == 'shares' else self.notional
+        points = []
+        for size, filled, cost, used in zip(sizes, shares, costs, levels):
+            avg_price = cost / filled if filled > 0 else None
+            slippage = abs(avg_price - reference) if avg_price is not None and reference else 0.0
+            points.append({
+                'size': size,
+                'shares': filled,
+                'cost': cost,
+                'avg_price': avg_price,
+                'slippage': slippage,
+                'slippage_pct': slippage / reference * 100 if reference else 0.0,
+                'levels_used': used,
+                'fillable': size <= available,
+                'available': available,
+            })
+        return points
+
+    def _walk(self, sizes: Sequence[float], by: str):
+        """Per-size ``bisect`` over the cumulative totals"""
+        cumulative = self.cumulative_size if by == 'shares' else self.cumulative_notional
+        last = len(self.prices) - 1
+        shares, costs, levels = [], [], []
+        for size in sizes:
+            target = min(max(size, 0.0), cumulative[-1])
+            index = min(bisect.bisect_left(cumulative, target), last)
+            prev_size = self.cumulative_size[index - 1] if index else 0.0
+            prev_notional = self.cumulative_notional[index - 1] if index else 0.0
+            price = self.prices[index]
+            if by == 'shares':
+                filled = target
+                cost = prev_notional + (target - prev_size) * price
+            else:
+                cost = target
+                filled = prev_size + (target - prev_notional) / price
+            shares.append(filled)
+            costs.append(cost)
+            levels.append(index + 1 if target > 0 else 0)
+        return shares, costs, levels
+
+    def _walk_numpy(self, sizes: Sequence[float], by: str):
+        """The same walk for all sizes with one ``searchsorted``"""
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self.prices, dtype=np.float64),
+                np.asarray(self.cumulative_size, dtype=np.float64),
+                np.asarray(self.cumulative_notional, dtype=np.float64),
+            )
+        prices, cum_size, cum_notional = self._arrays
+        cumulative = cum_size if by == 'shares' else cum_notional
+
+        target = np.clip(np.asarray(sizes, dtype=np.float64), 0.0, cumulative[-1])
+        index = np.minimum(np.searchsorted(cumulative, target, side='left'), len(prices) - 1)
+        prev_size = np.where(index > 0, cum_size[index - 1], 0.0)
+        prev_notional = np.where(index > 0, cum_notional[index - 1], 0.0)
+        if by == 'shares':
+            shares = target
+            costs = prev_notional + (target - prev_size) * prices[index]
+        else:
+            costs = target
+            shares = prev_size + (target - prev_notional) / prices[index]
+        levels = np.where(target > 0, index + 1, 0)
+        return shares.tolist(), costs.tolist(), levels.tolist()
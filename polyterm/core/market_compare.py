@@ -2,12 +2,17 @@
 
 from datetime import datetime
 from itertools import combinations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..api.clob import CLOBClient
 from ..api.gamma import GammaClient
 from ..api.market_utils import get_clob_token_ids, get_market_condition_id, market_probability_price
-from .market_move import _prefer_active_market, _summarize_move
+from ..utils.timeseries import align_values
+from .correlation import CorrelationEngine
+from .market_move import _extract_price, _prefer_active_market, _summarize_move
+
+# CLOB history is requested at 60-minute fidelity; pair points within half a bar.
+HISTORY_ALIGN_TOLERANCE_SECONDS = 1800
 
 
 class MarketComparisonEngine:
@@ -23,8 +28,10 @@ class MarketComparisonEngine:
 
     def compare(self, markets: List[str], hours: int = 24) -> Dict[str, Any]:
         """Return a stable JSON-ready comparison for market identifiers."""
-        resolved = [self._market_summary(identifier, hours=hours) for identifier in markets]
-        pairwise = _pairwise_differences(resolved)
+        summaries = [self._market_summary(identifier, hours=hours) for identifier in markets]
+        resolved = [summary for summary, _ in summaries]
+        histories = [history for _, history in summaries]
+        pairwise = _pairwise_differences(resolved, histories)
         quality_flags = _quality_flags(resolved, pairwise)
 
         return {
@@ -52,14 +59,14 @@ class MarketComparisonEngine:
         except Exception:
             return {}
 
-    def _market_summary(self, identifier: str, hours: int) -> Dict[str, Any]:
+    def _market_summary(self, identifier: str, hours: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         market = self._resolve_market(identifier)
         token_ids = get_clob_token_ids(market)
         token_id = token_ids[0] if token_ids else ""
         history = self._price_history(token_id)
         orderbook = self._orderbook(token_id)
 
-        return {
+        summary = {
             "input": identifier,
             "gamma_market_id": market.get("id"),
             "slug": market.get("slug"),
@@ -74,6 +81,7 @@ class MarketComparisonEngine:
             "orderbook": orderbook,
             "history_points": len(history),
         }
+        return summary, history
 
     def _price_history(self, token_id: str) -> List[Dict[str, Any]]:
         if not token_id:
@@ -99,9 +107,16 @@ class MarketComparisonEngine:
             return {"available": False, "spread": None, "quality": str(exc)}
 
 
-def _pairwise_differences(markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _pairwise_differences(
+    markets: List[Dict[str, Any]],
+    histories: Optional[List[List[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
+    series = [_history_series(history) for history in histories] if histories else [[] for _ in markets]
     pairs = []
-    for left, right in combinations(markets, 2):
+    for (left, left_series), (right, right_series) in combinations(zip(markets, series), 2):
+        left_values, right_values = align_values(
+            left_series, right_series, tolerance=HISTORY_ALIGN_TOLERANCE_SECONDS,
+        )
         left_probability = _as_float(left.get("probability")) or 0.0
         right_probability = _as_float(right.get("probability")) or 0.0
         pairs.append(
@@ -112,11 +127,31 @@ def _pairwise_differences(markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]
                 "liquidity_gap": round(abs((_as_float(left.get("liquidity")) or 0.0) - (_as_float(right.get("liquidity")) or 0.0)), 2),
                 "volume_gap": round(abs((_as_float(left.get("volume")) or 0.0) - (_as_float(right.get("volume")) or 0.0)), 2),
                 "combined_probability": round(left_probability + right_probability, 4),
+                "aligned_points": len(left_values),
+                "history_correlation": _correlation(left_values, right_values),
             }
         )
     return pairs
 
 
+def _history_series(history: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+    """(unix seconds, price) pairs for history points carrying a timestamp."""
+    series = []
+    for point in history:
+        timestamp = _as_float(point.get("t"))
+        price = _extract_price(point)
+        if timestamp is not None and price is not None:
+            series.append((timestamp, price))
+    return series
+
+
+def _correlation(left: List[float], right: List[float]) -> Optional[float]:
+    """Pearson correlation of aligned prices, or None when undefined."""
+    if len(left) < 3 or len(set(left)) < 2 or len(set(right)) < 2:
+        return None
+    return round(CorrelationEngine._pearson_correlation(left, right), 4)
+
+
 def _headline(markets: List[Dict[str, Any]], pairwise: List[Dict[str, Any]]) -> str:
     if len(markets) < 2:
         return "Need at least two markets for comparison."
@@ -5,15 +5,22 @@ outcome YES prices doesn't equal $1.00.
 
 In NegRisk markets, multiple outcomes are mutually exclusive (e.g., "Who wins
 the election?" with 5+ candidates). The sum of all YES prices should be $1.00.
+
+``NegRiskAnalyzer`` scans Gamma mid-quotes on demand. ``NegRiskMonitor``
+follows the live CLOB ask ladders of every outcome and prices the basket
+that can actually be bought.
 """
 
 import json
-from typing import Dict, List, Optional, Any
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..api.gamma import GammaClient
 from ..api.clob import CLOBClient
 from ..utils.json_output import safe_float
+from .orderbook import PRICE_TICK_SCALE
 
 
 class NegRiskAnalyzer:
@@ -122,6 +129,18 @@ class NegRiskAnalyzer:
 
         return multi[:limit]
 
+    def fee_adjusted_profit(self, total_price, cheapest_price):
+        """Per-share profit of buying one share of every outcome
+
+        The fee is charged on the winnings of the one outcome that resolves
+        YES; the cheapest outcome winning is the worst case. An overpriced
+        basket (total >= $1.00) returns the loss without a fee.
+        """
+        if total_price >= 1.0:
+            return -(total_price - 1.0)
+        fee_on_winning = self.polymarket_fee * (1.0 - cheapest_price) if cheapest_price < 1.0 else 0
+        return (1.0 - total_price) - fee_on_winning
+
     def analyze_event(self, event):
         """Analyze a multi-outcome event for NegRisk arbitrage
 
@@ -170,12 +189,7 @@ class NegRiskAnalyzer:
         # Fee: 2% on winnings of the ONE outcome that resolves YES
         # Winning = 1.0 - cheapest_outcome_price (worst case for fees)
         cheapest = min(o['yes_price'] for o in outcomes) if outcomes else 0
-        fee_on_winning = self.polymarket_fee * (1.0 - cheapest) if cheapest < 1.0 else 0
-
-        if total_yes < 1.0:
-            net_profit = (1.0 - total_yes) - fee_on_winning
-        else:
-            net_profit = -(total_yes - 1.0)  # Loss if overpriced
+        net_profit = self.fee_adjusted_profit(total_yes, cheapest)
 
         return {
             'event_title': event.get('title', ''),
@@ -208,3 +222,195 @@ class NegRiskAnalyzer:
                 opportunities.append(result)
 
         return sorted(opportunities, key=lambda x: x['fee_adjusted_profit'], reverse=True)
+
+
+@dataclass
+class _Basket:
+    """Live state of one event's outcome basket"""
+    event_id: str
+    title: str
+    legs: List[Dict[str, str]]
+    # Best ask per leg in PRICE_TICK_SCALE ticks (None until quoted) and
+    # their integer sum, so each tick updates the sum exactly in O(1)
+    best_asks: List[Optional[int]] = field(default_factory=list)
+    ask_ticks: int = 0
+    unquoted: int = 0
+    signalled: bool = False
+    signals: int = 0
+    last: Optional[Dict[str, Any]] = None
+
+
+class NegRiskMonitor:
+    """Stream NegRisk baskets and signal when the executable edge appears
+
+    Subscribes the YES token of every outcome through
+    ``OrderBookAnalyzer.start_live_feed`` and keeps a running sum of the
+    best asks per event. Only when that top-of-book sum leaves room for
+    ``min_edge`` are the ask ladders walked to price a ``basket_size``
+    share basket; the fee-adjusted edge of that executable price decides
+    whether a signal fires. A basket signals once per crossing and re-arms
+    after the edge falls back below ``min_edge``.
+    """
+
+    def __init__(
+        self,
+        analyzer: NegRiskAnalyzer,
+        basket_size: float = 100.0,
+        min_edge: float = 0.01,
+        on_signal: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.analyzer = analyzer
+        self.basket_size = basket_size
+        self.min_edge = min_edge
+        self.on_signal = on_signal
+        self._lock = threading.Lock()
+        self._baskets: Dict[str, _Basket] = {}
+        self._legs: Dict[str, List[Tuple[_Basket, int]]] = {}
+        self._books: Dict[str, Any] = {}
+
+    @property
+    def token_ids(self) -> List[str]:
+        return list(self._legs)
+
+    def add_event(self, event: Dict[str, Any]) -> bool:
+        """Track one multi-outcome event; returns False if a leg has no token
+
+        A basket is only risk-free when every outcome is bought, so events
+        with an outcome that cannot be subscribed are skipped.
+        """
+        legs = []
+        for market in event.get('markets', []):
+            token_id = self.analyzer._extract_token_id(market)
+            if not token_id:
+                return False
+            legs.append({
+                'question': market.get('question', market.get('groupItemTitle', ''))[:60],
+                'market_id': market.get('id', market.get('conditionId', '')),
+                'token_id': token_id,
+            })
+        if len(legs) < 2:
+            return False
+
+        event_id = str(event.get('id', ''))
+        basket = _Basket(
+            event_id=event_id,
+            title=event.get('title', ''),
+            legs=legs,
+            best_asks=[None] * len(legs),
+            unquoted=len(legs),
+        )
+        with self._lock:
+            self._baskets[event_id] = basket
+            for index, leg in enumerate(legs):
+                self._legs.setdefault(leg['token_id'], []).append((basket, index))
+        return True
+
+    def add_events(self, events: List[Dict[str, Any]]) -> int:
+        """Track several events; returns how many were added"""
+        return sum(1 for event in events if self.add_event(event))
+
+    async def start(self, orderbook_analyzer, hub=None):
+        """Subscribe every tracked leg; pump with ``listen_orderbook`` or ``hub.run``"""
+        books = await orderbook_analyzer.start_live_feed(self.token_ids, on_update=self.on_book, hub=hub)
+        with self._lock:
+            self._books.update(books)
+        return books
+
+    def on_book(self, book) -> None:
+        """``LiveOrderBook`` update callback"""
+        legs = self._legs.get(book.token_id)
+        if not legs:
+            return
+        best_ask = book.get_top_of_book()['best_ask']
+        tick = int(round(best_ask * PRICE_TICK_SCALE)) if best_ask is not None else None
+
+        signals = []
+        with self._lock:
+            self._books[book.token_id] = book
+            for basket, index in legs:
+                previous = basket.best_asks[index]
+                if previous != tick:
+                    basket.best_asks[index] = tick
+                    basket.ask_ticks += (tick or 0) - (previous or 0)
+                    basket.unquoted += (tick is None) - (previous is None)
+                signal = self._update(basket)
+                if signal is not None:
+                    signals.append(signal)
+
+        if self.on_signal:
+            for signal in signals:
+                try:
+                    self.on_signal(signal)
+                except Exception:
+                    pass
+
+    def _update(self, basket: _Basket) -> Optional[Dict[str, Any]]:
+        """Re-price a basket after one of its legs moved (lock held)"""
+        # Executable prices are never below the best asks and the fee is
+        # never negative, so 1 - sum(best asks) bounds the edge from above
+        if basket.unquoted or 1.0 - basket.ask_ticks / PRICE_TICK_SCALE < self.min_edge:
+            basket.last = None
+            basket.signalled = False
+            return None
+
+        basket.last = self._price_basket(basket)
+        if basket.last is None or basket.last['fee_adjusted_profit'] < self.min_edge:
+            basket.signalled = False
+            return None
+        if basket.signalled:
+            return None
+        basket.signalled = True
+        basket.signals += 1
+        return basket.last
+
+    def _price_basket(self, basket: _Basket) -> Optional[Dict[str, Any]]:
+        """Walk every leg's ask ladder for ``basket_size`` shares"""
+        outcomes = []
+        total_cost = 0.0
+        for leg, best_ask in zip(basket.legs, basket.best_asks):
+            book = self._books.get(leg['token_id'])
+            fill = book.cost_to_fill(self.basket_size, side='buy') if book is not None else None
+            if fill is None:
+                return None  # a ladder too thin for the basket
+            cost, levels_used = fill
+            total_cost += cost
+            outcomes.append({
+                'question': leg['question'],
+                'market_id': leg['market_id'],
+                'token_id': leg['token_id'],
+                'best_ask': best_ask / PRICE_TICK_SCALE,
+                'avg_price': round(cost / self.basket_size, 6),
+                'levels_used': levels_used,
+            })
+
+        price = total_cost / self.basket_size
+        cheapest = min(outcome['avg_price'] for outcome in outcomes)
+        edge = self.analyzer.fee_adjusted_profit(price, cheapest)
+        return {
+            'event_title': basket.title,
+            'event_id': basket.event_id,
+            'num_outcomes': len(outcomes),
+            'basket_size': self.basket_size,
+            'top_of_book_sum': round(basket.ask_ticks / PRICE_TICK_SCALE, 4),
+            'executable_price': round(price, 4),
+            'basket_cost': round(total_cost, 2),
+            'fee_adjusted_profit': round(edge, 4),
+            'expected_profit': round(edge * self.basket_size, 2),
+            'profit_per_100': round(edge * 100, 2),
+            'outcomes': outcomes,
+            'timestamp': datetime.now().isoformat(),
+        }
+
+    def baskets(self) -> List[Dict[str, Any]]:
+        """Current state of every tracked basket, cheapest top of book first"""
+        with self._lock:
+            rows = [{
+                'event_id': basket.event_id,
+                'event_title': basket.title,
+                'num_outcomes': len(basket.legs),
+                'quoted': len(basket.legs) - basket.unquoted,
+                'top_of_book_sum': None if basket.unquoted else round(basket.ask_ticks / PRICE_TICK_SCALE, 4),
+                'executable': basket.last,
+                'signals': basket.signals,
+            } for basket in self._baskets.values()]
+        return sorted(rows, key=lambda row: (row['top_of_book_sum'] is None, row['top_of_book_sum'] or 0))
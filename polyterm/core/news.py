@@ -13,6 +13,8 @@ import requests
 
 from polyterm import __version__
 
+from ..utils.text_index import build_index, tokenize
+
 
 class NewsAggregator:
     """Aggregate market-relevant news from multiple RSS sources"""
@@ -222,32 +224,21 @@ class NewsAggregator:
             Dict mapping market titles to lists of matching articles
         """
         matches = {}
+        # Index headlines once; each market then only visits articles
+        # sharing at least one significant word with its title.
+        index = build_index(
+            (position, article.get('title', ''))
+            for position, article in enumerate(articles)
+        )
 
         for market in markets:
             market_title = market.get('title', market.get('question', ''))
             if not market_title:
                 continue
 
-            market_words = set(market_title.lower().split())
-            # Remove common words
-            stop_words = {'the', 'a', 'an', 'will', 'be', 'by', 'in', 'on', 'to', 'of', '?', 'is', 'it', 'and', 'or'}
-            market_words -= stop_words
-
-            if len(market_words) < 1:
-                continue
-
-            market_matches = []
-            for article in articles:
-                article_title = article.get('title', '').lower()
-                article_words = set(article_title.split()) - stop_words
-
-                # Check keyword overlap - require at least 1 significant word
-                overlap = market_words & article_words
-                if len(overlap) >= 1:
-                    market_matches.append(article)
-
-            if market_matches:
-                matches[market_title] = market_matches
+            positions = sorted(index.candidates(market_title))
+            if positions:
+                matches[market_title] = [articles[position] for position in positions]
 
         return matches
 
@@ -267,9 +258,7 @@ class NewsAggregator:
         if hours is not None:
             cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        market_words = set(market_title.lower().split())
-        stop_words = {'the', 'a', 'an', 'will', 'be', 'by', 'in', 'on', 'to', 'of', '?', 'is', 'it', 'and', 'or'}
-        market_words -= stop_words
+        market_words = tokenize(market_title)
 
         if len(market_words) < 1:
             return []
@@ -282,8 +271,7 @@ class NewsAggregator:
                 if pub_dt is None or pub_dt < cutoff:
                     continue
 
-            text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-            text_words = set(text.split()) - stop_words
+            text_words = tokenize(f"{article.get('title', '')} {article.get('summary', '')}")
 
             overlap = market_words & text_words
             # Match if we have at least 1 significant word overlap
@@ -11,15 +11,17 @@ Features:
 """
 
 import asyncio
+import bisect
 import logging
 import threading
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import math
 
 from ..api.clob import CLOBClient
 from ..utils.json_output import safe_float
+from .impact import Ladder
 
 logger = logging.getLogger(__name__)
 
@@ -61,21 +63,100 @@ class OrderBookAnalysis:
     warnings: List[str]
 
 
+# Fixed-point scale for price levels. Polymarket tick sizes go down to
+# 0.0001, so six decimals keeps every valid price on its own integer tick.
+PRICE_TICK_SCALE = 1_000_000
+
+
+def _price_to_tick(price: str) -> int:
+    return int(round(float(price) * PRICE_TICK_SCALE))
+
+
+class _BookSide:
+    """One side of a live book keyed by integer price ticks.
+
+    ``_ticks`` is kept sorted ascending with ``bisect`` so inserts and
+    removals are O(log n) searches plus a memmove, the best level is an
+    index lookup, and ordered/cumulative views are rebuilt lazily only
+    after the side changes.
+    """
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self._ticks: List[int] = []
+        # tick -> (price string, size string, size float)
+        self._levels: Dict[int, Tuple[str, str, float]] = {}
+        self._ordered: Optional[List[Tuple[str, str, float]]] = None
+        self._cumulative: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def apply(self, price: str, size: str) -> bool:
+        """Set or remove a level. Returns True if the side changed."""
+        try:
+            tick = _price_to_tick(price)
+            size_value = float(size)
+        except (TypeError, ValueError):
+            return False
+
+        if size_value == 0:
+            if tick not in self._levels:
+                return False
+            del self._levels[tick]
+            del self._ticks[bisect.bisect_left(self._ticks, tick)]
+        else:
+            if tick not in self._levels:
+                bisect.insort(self._ticks, tick)
+            self._levels[tick] = (price, size, size_value)
+
+        self._ordered = None
+        self._cumulative = None
+        return True
+
+    def best_price(self) -> Optional[float]:
+        if not self._ticks:
+            return None
+        tick = self._ticks[-1] if self.descending else self._ticks[0]
+        return tick / PRICE_TICK_SCALE
+
+    def ordered(self) -> List[Tuple[str, str, float]]:
+        """Levels in book order (best first)."""
+        if self._ordered is None:
+            ticks = reversed(self._ticks) if self.descending else self._ticks
+            self._ordered = [self._levels[tick] for tick in ticks]
+        return self._ordered
+
+    def cumulative(self) -> List[float]:
+        """Running size totals aligned with ``ordered()``."""
+        if self._cumulative is None:
+            total = 0.0
+            sums = []
+            for _, _, size_value in self.ordered():
+                total += size_value
+                sums.append(total)
+            self._cumulative = sums
+        return self._cumulative
+
+
 class LiveOrderBook:
     """In-memory order book state maintained by CLOB WebSocket updates.
 
     Accepts WS messages from ``CLOBClient.subscribe_orderbook`` and keeps
     a sorted book of bids and asks.  Thread-safe reads via a lock so the
     CLI refresh loop (sync) can query while the async WS listener writes.
+
+    Levels are stored as fixed-point integer ticks so top-of-book reads are
+    O(1) and level updates O(log n).  ``version`` increments on every state
+    change, letting render loops skip books that have not moved.
     """
 
     def __init__(self, token_id: str):
         self.token_id = token_id
         self._lock = threading.Lock()
-        # Bids: price -> size  (descending by price)
-        self._bids: Dict[str, str] = {}
-        # Asks: price -> size  (ascending by price)
-        self._asks: Dict[str, str] = {}
+        self._bids = _BookSide(descending=True)
+        self._asks = _BookSide(descending=False)
+        self._version: int = 0
         self._last_trade_price: Optional[float] = None
         self._last_price_change: Optional[float] = None
         self._last_update: Optional[datetime] = None
@@ -126,35 +207,27 @@ class LiveOrderBook:
         #   "bids": [{"price": "0.55", "size": "1200"}, ...],
         #   "asks": [{"price": "0.56", "size": "800"}, ...]}
         # A size of "0" means the level was removed.
-        for entry in data.get("bids", []):
-            price = str(entry.get("price", ""))
-            size = str(entry.get("size", "0"))
-            if not price:
-                continue
-            if float(size) == 0:
-                self._bids.pop(price, None)
-            else:
-                self._bids[price] = size
-
-        for entry in data.get("asks", []):
-            price = str(entry.get("price", ""))
-            size = str(entry.get("size", "0"))
-            if not price:
-                continue
-            if float(size) == 0:
-                self._asks.pop(price, None)
-            else:
-                self._asks[price] = size
+        changed = False
+        for side, entries in ((self._bids, data.get("bids", [])), (self._asks, data.get("asks", []))):
+            for entry in entries:
+                price = str(entry.get("price", ""))
+                if not price:
+                    continue
+                changed = side.apply(price, str(entry.get("size", "0"))) or changed
+        if changed:
+            self._version += 1
 
     def _apply_last_trade_price(self, data: Dict[str, Any]):
         try:
             self._last_trade_price = float(data.get("price", data.get("last_trade_price", 0)))
+            self._version += 1
         except (ValueError, TypeError):
             pass
 
     def _apply_price_change(self, data: Dict[str, Any]):
         try:
             self._last_price_change = float(data.get("price", data.get("new_price", 0)))
+            self._version += 1
         except (ValueError, TypeError):
             pass
 
@@ -167,6 +240,7 @@ class LiveOrderBook:
         except (ValueError, TypeError):
             self._resolution_price = 1.0
         self._resolved_at = datetime.now()
+        self._version += 1
 
     @property
     def resolved(self) -> bool:
@@ -191,18 +265,9 @@ class LiveOrderBook:
     def get_snapshot(self) -> Dict[str, Any]:
         """Return a REST-compatible order book snapshot (sorted bids/asks)."""
         with self._lock:
-            bids = sorted(
-                [{"price": p, "size": s} for p, s in self._bids.items()],
-                key=lambda x: float(x["price"]),
-                reverse=True,
-            )
-            asks = sorted(
-                [{"price": p, "size": s} for p, s in self._asks.items()],
-                key=lambda x: float(x["price"]),
-            )
             return {
-                "bids": bids,
-                "asks": asks,
+                "bids": [{"price": p, "size": s} for p, s, _ in self._bids.ordered()],
+                "asks": [{"price": p, "size": s} for p, s, _ in self._asks.ordered()],
                 "last_trade_price": self._last_trade_price,
                 "last_price_change": self._last_price_change,
                 "timestamp": self._last_update.isoformat() if self._last_update else None,
@@ -212,8 +277,9 @@ class LiveOrderBook:
     def get_top_of_book(self) -> Dict[str, Optional[float]]:
         """Return best bid, best ask, spread, and mid price."""
         with self._lock:
-            best_bid = max((float(p) for p in self._bids), default=None)
-            best_ask = min((float(p) for p in self._asks), default=None)
+            best_bid = self._bids.best_price()
+            best_ask = self._asks.best_price()
+            last_trade_price = self._last_trade_price
 
         spread = None
         mid = None
@@ -226,34 +292,68 @@ class LiveOrderBook:
             "best_ask": best_ask,
             "spread": spread,
             "mid_price": mid,
-            "last_trade_price": self._last_trade_price,
+            "last_trade_price": last_trade_price,
         }
 
     def get_depth(self, levels: int = 10) -> Dict[str, Any]:
         """Return top N bid/ask levels with cumulative size."""
-        snap = self.get_snapshot()
-        bids = snap["bids"][:levels]
-        asks = snap["asks"][:levels]
-
-        cum = 0.0
-        for b in bids:
-            cum += float(b["size"])
-            b["cumulative_size"] = cum
-        bid_depth = cum
-
-        cum = 0.0
-        for a in asks:
-            cum += float(a["size"])
-            a["cumulative_size"] = cum
-        ask_depth = cum
+        with self._lock:
+            bids = self._depth_rows(self._bids, levels)
+            asks = self._depth_rows(self._asks, levels)
 
         return {
             "bids": bids,
             "asks": asks,
-            "bid_depth": bid_depth,
-            "ask_depth": ask_depth,
+            "bid_depth": bids[-1]["cumulative_size"] if bids else 0.0,
+            "ask_depth": asks[-1]["cumulative_size"] if asks else 0.0,
         }
 
+    def ladder(self, side: str = "buy") -> Ladder:
+        """Snapshot one side as a ``Ladder`` (asks for buys, bids for sells)."""
+        with self._lock:
+            levels = (self._asks if side.lower() == "buy" else self._bids).ordered()
+            return Ladder(side, [float(price) for price, _, _ in levels], [size for _, _, size in levels])
+
+    def cost_to_fill(self, size: float, side: str = "buy") -> Optional[Tuple[float, int]]:
+        """Cost of taking ``size`` shares from the live book, best level first.
+
+        Buys walk the asks and sells walk the bids.
+
+        Returns:
+            ``(total cost, levels used)``, or None when the side holds
+            fewer than ``size`` shares
+        """
+        with self._lock:
+            book_side = self._asks if side.lower() == "buy" else self._bids
+            cumulative = book_side.cumulative()
+            if not cumulative or cumulative[-1] < size:
+                return None
+            used = bisect.bisect_left(cumulative, size) + 1
+            levels = book_side.ordered()[:used]
+
+        cost = 0.0
+        remaining = size
+        for price, _, level_size in levels:
+            take = min(level_size, remaining)
+            cost += take * float(price)
+            remaining -= take
+        return cost, used
+
+    @staticmethod
+    def _depth_rows(side: _BookSide, levels: int) -> List[Dict[str, Any]]:
+        ordered = side.ordered()[:levels]
+        cumulative = side.cumulative()
+        return [
+            {"price": price, "size": size, "cumulative_size": cumulative[index]}
+            for index, (price, size, _) in enumerate(ordered)
+        ]
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every book, price, or resolution change."""
+        with self._lock:
+            return self._version
+
     @property
     def is_ready(self) -> bool:
         """True once at least one book message has been received."""
@@ -271,6 +371,131 @@ class LiveOrderBook:
             return self._last_update
 
 
+# A level counts as drawn down below this share of its peak size ...
+ICEBERG_DEPLETION_RATIO = 0.5
+# ... and as replenished once it is back to this share of the peak
+ICEBERG_REFILL_RATIO = 0.8
+
+
+@dataclass
+class _LevelHistory:
+    size: float = 0.0
+    peak: float = 0.0
+    trough: float = 0.0
+    drawn_down: bool = False
+    refills: int = 0
+    hidden_volume: float = 0.0
+
+    def observe(self, new_size: float):
+        """Follow one size change of the level."""
+        if not self.drawn_down:
+            self.peak = max(self.peak, self.size)
+            if self.peak > 0 and new_size <= self.peak * ICEBERG_DEPLETION_RATIO:
+                self.drawn_down = True
+                self.trough = new_size
+        else:
+            self.trough = min(self.trough, new_size)
+            if new_size >= self.peak * ICEBERG_REFILL_RATIO:
+                self.refills += 1
+                self.hidden_volume += new_size - self.trough
+                self.drawn_down = False
+                self.peak = new_size
+        self.size = new_size
+
+
+# price_change sides name the resting order: BUY rests on the bid
+_CHANGE_SIDES = {"BUY": "bid", "SELL": "ask"}
+
+
+def _level_updates(message: Dict[str, Any], resting: Dict[str, set]):
+    """Yield ``(asset, side, tick, size)`` for every level a message sets.
+
+    ``book`` messages are full snapshots, so levels of the asset that were
+    resting before and are missing now come back with size 0. ``resting``
+    maps each asset to its non-empty ``(side, tick)`` levels and is kept
+    up to date here.
+    """
+    msg_type = message.get("type", message.get("event_type", ""))
+    asset = str(message.get("asset_id") or message.get("market") or "")
+
+    if msg_type == "book":
+        seen = {}
+        for side, entries in (("bid", message.get("bids") or []), ("ask", message.get("asks") or [])):
+            for entry in entries:
+                try:
+                    seen[(side, _price_to_tick(entry.get("price")))] = float(entry.get("size", 0))
+                except (TypeError, ValueError):
+                    continue
+        previous = resting.get(asset, set())
+        for side, tick in previous - seen.keys():
+            yield asset, side, tick, 0.0
+        for (side, tick), size in seen.items():
+            yield asset, side, tick, size
+        resting[asset] = {key for key, size in seen.items() if size > 0}
+
+    elif msg_type == "price_change":
+        changes = [c for c in message.get("price_changes") or [] if isinstance(c, dict)] or [message]
+        for change in changes:
+            side = _CHANGE_SIDES.get(str(change.get("side", "")).upper())
+            change_asset = str(change.get("asset_id") or asset)
+            try:
+                tick = _price_to_tick(change.get("price", change.get("new_price")))
+                size = float(change.get("size", 0))
+            except (TypeError, ValueError):
+                continue
+            if side is None:
+                continue
+            levels = resting.setdefault(change_asset, set())
+            if size > 0:
+                levels.add((side, tick))
+            else:
+                levels.discard((side, tick))
+            yield change_asset, side, tick, size
+
+
+def detect_replenishment(
+    messages: Iterable[Dict[str, Any]],
+    min_replenish_count: int = 3,
+) -> List[Dict[str, Any]]:
+    """Find price levels that keep refilling after being drawn down.
+
+    Replays ``book`` and ``price_change`` messages in time order (as
+    recorded by a ``TickJournal``) and follows each level's size. ``book``
+    messages are full snapshots, so a level missing from the next one is
+    treated as size 0. A level is drawn down when it falls to
+    ``ICEBERG_DEPLETION_RATIO`` of its peak or is removed, and replenished
+    when it climbs back to ``ICEBERG_REFILL_RATIO`` of that peak. Each
+    refill adds ``size - trough`` to the hidden volume estimate.
+
+    Returns:
+        One dict per flagged level, most refills first, with the keys of
+        the snapshot heuristic (``side``, ``size``, ``prices``, ``count``,
+        ``reason``) plus ``price`` and ``hidden_volume``
+    """
+    levels: Dict[Tuple[str, str, int], _LevelHistory] = {}
+    resting: Dict[str, set] = {}
+    for message in messages:
+        for asset, side, tick, size in _level_updates(message, resting):
+            levels.setdefault((asset, side, tick), _LevelHistory()).observe(size)
+
+    flagged = []
+    for (_, side, tick), level in levels.items():
+        if level.refills < min_replenish_count:
+            continue
+        price = tick / PRICE_TICK_SCALE
+        flagged.append({
+            'side': side,
+            'price': price,
+            'size': level.peak,
+            'prices': [price],
+            'count': level.refills,
+            'hidden_volume': level.hidden_volume,
+            'reason': 'Level replenished after fills',
+        })
+    flagged.sort(key=lambda item: (item['count'], item['hidden_volume']), reverse=True)
+    return flagged
+
+
 class OrderBookAnalyzer:
     """
     Analyzes order books for trading insights.
@@ -284,6 +509,7 @@ class OrderBookAnalyzer:
         self.clob = clob_client
         self.large_order_threshold = large_order_threshold
         self._live_books: Dict[str, LiveOrderBook] = {}
+        self._hub_feeds: List[Tuple[Any, "asyncio.Task"]] = []
 
     # -- Live WebSocket methods --
 
@@ -296,18 +522,26 @@ class OrderBookAnalyzer:
         token_ids: List[str],
         on_update: Optional[Callable[[LiveOrderBook], None]] = None,
         on_resolution: Optional[Callable[[Dict[str, Any]], None]] = None,
+        hub: Optional[Any] = None,
+        journal: Optional[Any] = None,
     ) -> Dict[str, LiveOrderBook]:
         """Start a live WebSocket feed for the given token IDs.
 
-        Creates ``LiveOrderBook`` instances, subscribes via CLOB WS,
-        and returns the live books.  The caller must also run
-        ``clob.listen_orderbook()`` in the event loop to pump messages.
+        Creates ``LiveOrderBook`` instances, subscribes them on the CLOB
+        client's market hub (the socket its trade feeds also use), and
+        returns the live books.  The caller must also run
+        ``clob.listen_orderbook()`` in the event loop to pump messages,
+        or ``hub.run()`` when a hub is passed explicitly.
 
         Args:
             token_ids: CLOB token IDs to subscribe to.
             on_update: Optional callback fired on each book update.
             on_resolution: Optional callback fired when a market resolves.
                 Receives the raw ``market_resolved`` WS message dict.
+            hub: Optional ``MarketStreamHub`` to attach to instead of
+                the CLOB client's own hub.
+            journal: Optional ``TickJournal`` that records every message
+                (queued for its writer thread) before it is applied.
 
         Returns:
             Dict mapping token_id -> LiveOrderBook.
@@ -322,6 +556,8 @@ class OrderBookAnalyzer:
 
         def _dispatch(data: Dict[str, Any]):
             """Route WS message to the correct LiveOrderBook."""
+            if journal is not None:
+                journal.record(data)
             asset_id = data.get("market", data.get("asset_id", ""))
             target = books.get(asset_id)
             if target:
@@ -334,6 +570,8 @@ class OrderBookAnalyzer:
         def _resolution_dispatch(data: Dict[str, Any]):
             """Route market_resolved WS messages to the correct LiveOrderBook
             and invoke the user-supplied resolution callback."""
+            if journal is not None:
+                journal.record(data)
             asset_id = data.get("market", data.get("asset_id", ""))
             target = books.get(asset_id)
             if target:
@@ -344,6 +582,23 @@ class OrderBookAnalyzer:
                 except Exception:
                     pass
 
+        if hub is not None:
+            from ..api.market_hub import ORDERBOOK_EVENTS
+
+            def _hub_dispatch(data: Dict[str, Any]):
+                msg_type = data.get("type", data.get("event_type", ""))
+                if msg_type != "market_resolved":
+                    _dispatch(data)
+                elif on_resolution:
+                    _resolution_dispatch(data)
+                elif journal is not None:
+                    journal.record(data)
+
+            sub = hub.subscribe(token_ids, event_types=ORDERBOOK_EVENTS)
+            task = asyncio.ensure_future(hub.consume(sub, _hub_dispatch))
+            self._hub_feeds.append((sub, task))
+            return books
+
         await self.clob.subscribe_orderbook(
             token_ids, _dispatch,
             resolution_callback=_resolution_dispatch if on_resolution else None,
@@ -368,7 +623,15 @@ class OrderBookAnalyzer:
         return result
 
     def stop_live_feed(self):
-        """Clear live book references (caller should close WS separately)."""
+        """Clear live book references (caller should close WS separately).
+
+        Hub-backed feeds are unsubscribed so the shared socket keeps
+        serving other consumers.
+        """
+        for sub, task in self._hub_feeds:
+            sub.hub.unsubscribe(sub)
+            task.cancel()
+        self._hub_feeds.clear()
         self._live_books.clear()
 
     def analyze_live(self, token_id: str) -> Optional["OrderBookAnalysis"]:
@@ -551,59 +814,62 @@ class OrderBookAnalyzer:
         except Exception as e:
             return {'error': str(e)}
 
-        if side.lower() == 'buy':
-            levels = book.get('asks', [])
-        else:
-            levels = book.get('bids', [])
-
-        if not levels:
+        if not book.get('asks' if side.lower() == 'buy' else 'bids'):
             return {'error': 'No liquidity'}
 
-        parsed = self._parse_levels(levels)
-        if not parsed:
+        ladder = Ladder.from_book(book, side)
+        if not ladder:
             return {'error': 'Could not parse order book'}
 
-        # Calculate execution
-        remaining = size
-        total_cost = 0.0
-        filled_levels = []
-
-        for level in parsed:
-            if remaining <= 0:
-                break
-
-            fill_size = min(remaining, level.size)
-            total_cost += fill_size * level.price
-            remaining -= fill_size
-            filled_levels.append({
-                'price': level.price,
-                'size': fill_size,
-            })
-
-        if remaining > 0:
+        if size <= 0:
+            return {'error': 'Invalid size', 'available': 0}
+
+        point = ladder.fill(size)
+        if not point['fillable']:
             return {
                 'error': 'Insufficient liquidity',
-                'available': size - remaining,
+                'available': point['shares'],
             }
 
-        if size <= 0:
-            return {'error': 'Invalid size', 'available': 0}
-        avg_price = total_cost / size
-        best_price = parsed[0].price
-        slippage = abs(avg_price - best_price)
-        slippage_pct = (slippage / best_price) * 100 if best_price > 0 else 0
-
         return {
             'side': side,
             'size': size,
-            'best_price': best_price,
-            'avg_price': avg_price,
-            'slippage': slippage,
-            'slippage_pct': slippage_pct,
-            'total_cost': total_cost,
-            'levels_used': len(filled_levels),
+            'best_price': ladder.best_price,
+            'avg_price': point['avg_price'],
+            'slippage': point['slippage'],
+            'slippage_pct': point['slippage_pct'],
+            'total_cost': point['cost'],
+            'levels_used': point['levels_used'],
         }
 
+    def impact_curve(
+        self,
+        market_id: str,
+        side: str,
+        sizes: List[float],
+        by: str = 'shares',
+    ) -> List[Dict[str, Any]]:
+        """Fill many order sizes against one book in a single pass.
+
+        Uses the live book when a feed for ``market_id`` is running and a
+        REST snapshot otherwise.
+
+        Args:
+            market_id: Market ID (CLOB token id)
+            side: 'buy' or 'sell'
+            sizes: Order sizes
+            by: 'shares' or 'notional' (dollars)
+
+        Returns:
+            One ``Ladder.impact_curve`` point per size
+        """
+        live = self._live_books.get(market_id)
+        if live is not None and live.is_ready:
+            book = live
+        else:
+            book = self.get_order_book(market_id, depth=100)
+        return Ladder.from_book(book, side).impact_curve(sizes, by=by)
+
     def render_ascii_depth_chart(
         self,
         market_id: str,
@@ -718,6 +984,8 @@ class OrderBookAnalyzer:
         self,
         market_id: str,
         min_replenish_count: int = 3,
+        journal: Optional[Any] = None,
+        since: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Detect potential iceberg (hidden) orders.
@@ -725,17 +993,26 @@ class OrderBookAnalyzer:
         Icebergs are large orders split into smaller visible chunks
         that replenish as they're filled.
 
-        This requires monitoring the order book over time.
+        This requires monitoring the order book over time. With a
+        ``TickJournal`` holding ticks for the token, recorded book updates
+        are replayed and levels that refill after being drawn down are
+        flagged (``detect_replenishment``). Without one, a single REST
+        snapshot is checked for repeated sizes.
 
         Args:
-            market_id: Market ID
+            market_id: Market ID (CLOB token id)
             min_replenish_count: Minimum replenishments to flag as iceberg
+            journal: Optional ``TickJournal`` with recorded ticks
+            since: Earliest tick time (epoch seconds) to replay
 
         Returns:
             List of potential iceberg orders
         """
-        # Note: Real iceberg detection requires monitoring over time
-        # This is a simplified version that looks for suspicious patterns
+        if journal is not None:
+            messages = (message for _, message in journal.replay(asset_ids=[market_id], start=since))
+            return detect_replenishment(messages, min_replenish_count=min_replenish_count)
+
+        # Without book history, look for suspicious patterns in one snapshot
         try:
             book = self.get_order_book(market_id, depth=50)
         except Exception as e:
@@ -5,11 +5,11 @@ Rebuilt to work without deprecated Subgraph API.
 Uses:
 - Polygon RPC for on-chain data
 - Local database for cached positions
-- Gamma API for market data
+- Gamma API for market data, CLOB midpoints for current prices
 """
 
-import json
-from typing import Dict, List, Optional, Any
+import logging
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from decimal import Decimal
@@ -19,6 +19,33 @@ import requests
 from ..db.database import Database
 from ..db.models import Trade, Wallet
 from ..api.gamma import GammaClient
+from ..api.clob import CLOBClient
+from ..api.market_utils import get_clob_token_ids, parse_list_field
+
+logger = logging.getLogger(__name__)
+
+# Price used when neither the CLOB nor Gamma has one
+DEFAULT_PRICE = 0.5
+
+
+@dataclass
+class PriceQuote:
+    """Current price of one market outcome and where it came from"""
+    market_id: str
+    outcome: str
+    price: float
+    title: str
+    source: str  # 'clob' midpoint, 'gamma' outcome price or 'default'
+    as_of: datetime = field(default_factory=datetime.now)
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now() - self.as_of).total_seconds()
+
+    @property
+    def stale(self) -> bool:
+        """No live price was found and ``DEFAULT_PRICE`` stands in"""
+        return self.source == 'default'
 
 
 @dataclass
@@ -34,6 +61,8 @@ class Position:
     current_value: float
     unrealized_pnl: float
     unrealized_pnl_pct: float
+    price_source: str = ''
+    price_as_of: Optional[datetime] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -47,6 +76,8 @@ class Position:
             'current_value': self.current_value,
             'unrealized_pnl': self.unrealized_pnl,
             'unrealized_pnl_pct': self.unrealized_pnl_pct,
+            'price_source': self.price_source,
+            'price_as_of': self.price_as_of.isoformat() if self.price_as_of else None,
         }
 
 
@@ -81,6 +112,29 @@ class PortfolioSummary:
         }
 
 
+def _outcome_index(market: Dict[str, Any], outcome: str) -> int:
+    """Position of ``outcome`` in the market's outcome list (YES first, NO second)"""
+    names = [str(name).strip().upper() for name in parse_list_field(market.get('outcomes'))]
+    outcome = (outcome or 'YES').upper()
+    if outcome in names:
+        return names.index(outcome)
+    return 0 if outcome == 'YES' else 1
+
+
+def _gamma_outcome_price(market: Dict[str, Any], outcome: str) -> Optional[float]:
+    """Outcome price from Gamma's ``outcomePrices``, if listed"""
+    index = _outcome_index(market, outcome)
+    try:
+        prices = [float(price) for price in parse_list_field(market.get('outcomePrices'))]
+    except (TypeError, ValueError):
+        return None
+    if index < len(prices):
+        return prices[index]
+    if index == 1 and len(prices) == 1:
+        return 1 - prices[0]
+    return None
+
+
 class PolygonRPCClient:
     """
     Client for Polygon RPC to read on-chain data.
@@ -180,7 +234,8 @@ class PortfolioAnalytics:
     Since the Subgraph API is deprecated, we:
     1. Track positions from trade history in local DB
     2. Optionally verify on-chain via Polygon RPC
-    3. Get current prices from Gamma API
+    3. Get current prices in bulk: Gamma for market metadata, CLOB
+       midpoints for prices
     """
 
     def __init__(
@@ -188,13 +243,15 @@ class PortfolioAnalytics:
         database: Database,
         gamma_client: Optional[GammaClient] = None,
         polygon_rpc_url: Optional[str] = None,
+        clob_client: Optional[CLOBClient] = None,
     ):
         self.db = database
         self.gamma = gamma_client
+        self.clob = clob_client
         self.polygon = PolygonRPCClient(polygon_rpc_url) if polygon_rpc_url else None
 
-        # Cache for market prices
-        self._price_cache: Dict[str, Tuple[float, datetime]] = {}
+        # Cache for market prices, keyed by (market_id, outcome)
+        self._price_cache: Dict[Tuple[str, str], PriceQuote] = {}
         self._cache_ttl = 60  # 1 minute
 
     def get_portfolio(self, wallet_address: str) -> PortfolioSummary:
@@ -254,40 +311,40 @@ class PortfolioAnalytics:
 
             pos['trades'].append(trade)
 
-        # Calculate current values
+        # Price every open position in one batch
+        open_positions = [pos for pos in positions_map.values() if pos['shares'] > 0]
+        quotes = self.resolve_prices(
+            (pos['market_id'], pos['outcome']) for pos in open_positions
+        )
+
         positions = []
         total_cost = 0
         total_value = 0
 
-        for key, pos_data in positions_map.items():
-            if pos_data['shares'] <= 0:
-                continue  # Skip closed positions
-
+        for pos_data in open_positions:
             shares = pos_data['shares']
             cost_basis = max(0, pos_data['cost_basis'])
             avg_price = cost_basis / shares if shares > 0 else 0
 
-            # Get current price
-            current_price = self._get_current_price(pos_data['market_id'], pos_data['outcome'])
-            current_value = shares * current_price
+            quote = quotes[(pos_data['market_id'], pos_data['outcome'])]
+            current_value = shares * quote.price
 
             unrealized_pnl = current_value - cost_basis
             unrealized_pnl_pct = (unrealized_pnl / cost_basis * 100) if cost_basis > 0 else 0
 
-            # Get market title
-            market_title = self._get_market_title(pos_data['market_id'])
-
             position = Position(
                 market_id=pos_data['market_id'],
-                market_title=market_title,
+                market_title=quote.title,
                 outcome=pos_data['outcome'],
                 shares=shares,
                 avg_price=avg_price,
-                current_price=current_price,
+                current_price=quote.price,
                 cost_basis=cost_basis,
                 current_value=current_value,
                 unrealized_pnl=unrealized_pnl,
                 unrealized_pnl_pct=unrealized_pnl_pct,
+                price_source=quote.source,
+                price_as_of=quote.as_of,
             )
             positions.append(position)
 
@@ -316,48 +373,93 @@ class PortfolioAnalytics:
             positions=positions,
         )
 
-    def _get_current_price(self, market_id: str, outcome: str) -> float:
-        """Get current market price"""
-        # Check cache
-        cache_key = f"{market_id}:{outcome}"
-        if cache_key in self._price_cache:
-            price, cached_at = self._price_cache[cache_key]
-            if datetime.now() - cached_at < timedelta(seconds=self._cache_ttl):
-                return price
-
-        # Fetch from API
+    def resolve_prices(
+        self,
+        keys: Iterable[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], PriceQuote]:
+        """
+        Price many ``(market_id, outcome)`` pairs with a few bulk requests.
+
+        Quotes younger than the cache TTL are reused. For the rest, every
+        market is fetched at once through ``GammaClient.get_markets_by_ids``
+        (catalog first), then every outcome token is priced with one
+        ``CLOBClient.get_midpoints`` call. Gamma's outcome prices fill in
+        tokens without a midpoint, and ``DEFAULT_PRICE`` anything else.
+
+        Args:
+            keys: ``(market_id, outcome)`` pairs
+
+        Returns:
+            Dict of each pair to its PriceQuote
+        """
+        now = datetime.now()
+        quotes: Dict[Tuple[str, str], PriceQuote] = {}
+        missing: List[Tuple[str, str]] = []
+
+        for key in dict.fromkeys(keys):
+            cached = self._price_cache.get(key)
+            if cached and now - cached.as_of < timedelta(seconds=self._cache_ttl):
+                quotes[key] = cached
+            else:
+                missing.append(key)
+        if not missing:
+            return quotes
+
+        markets: Dict[str, Dict[str, Any]] = {}
         if self.gamma:
             try:
-                markets = self.gamma.get_markets(limit=1, market_id=market_id)
-                if markets:
-                    nested = markets[0].get('markets', [])
-                    if nested:
-                        outcome_prices = nested[0].get('outcomePrices', [])
-                        if isinstance(outcome_prices, str):
-                            outcome_prices = json.loads(outcome_prices)
-                        if outcome_prices:
-                            if outcome == 'YES':
-                                price = float(outcome_prices[0])
-                            else:
-                                price = float(outcome_prices[1]) if len(outcome_prices) > 1 else 1 - float(outcome_prices[0])
-
-                            self._price_cache[cache_key] = (price, datetime.now())
-                            return price
+                markets = self.gamma.get_markets_by_ids([market_id for market_id, _ in missing])
             except Exception as e:
-                print(f"Error fetching price: {e}")
+                logger.warning("Error fetching markets: %s", e)
+
+        tokens: Dict[Tuple[str, str], str] = {}
+        for market_id, outcome in missing:
+            market = markets.get(market_id)
+            index = _outcome_index(market, outcome) if market else None
+            token_ids = get_clob_token_ids(market) if market else []
+            if index is not None and index < len(token_ids):
+                tokens[(market_id, outcome)] = token_ids[index]
+
+        midpoints: Dict[str, float] = {}
+        if self.clob and tokens:
+            try:
+                midpoints = self.clob.get_midpoints(list(tokens.values()))
+            except Exception as e:
+                logger.warning("Error fetching midpoints: %s", e)
 
-        return 0.5  # Default to 50%
+        fetched_at = datetime.now()
+        for key in missing:
+            market_id, outcome = key
+            market = markets.get(market_id) or {}
+            title = market.get('question') or market.get('title') or market_id[:30]
+            token_id = tokens.get(key)
+
+            if token_id in midpoints:
+                price, source = midpoints[token_id], 'clob'
+            else:
+                price = _gamma_outcome_price(market, outcome) if market else None
+                source = 'gamma' if price is not None else 'default'
+
+            quote = PriceQuote(
+                market_id=market_id,
+                outcome=outcome,
+                price=DEFAULT_PRICE if price is None else price,
+                title=title,
+                source=source,
+                as_of=fetched_at,
+            )
+            if not quote.stale:
+                self._price_cache[key] = quote
+            quotes[key] = quote
+        return quotes
+
+    def _get_current_price(self, market_id: str, outcome: str) -> float:
+        """Get current market price"""
+        return self.resolve_prices([(market_id, outcome)])[(market_id, outcome)].price
 
     def _get_market_title(self, market_id: str) -> str:
         """Get market title"""
-        if self.gamma:
-            try:
-                markets = self.gamma.get_markets(limit=1, market_id=market_id)
-                if markets:
-                    return markets[0].get('title', markets[0].get('question', market_id))
-            except Exception:
-                pass
-        return market_id[:30]
+        return self.resolve_prices([(market_id, 'YES')])[(market_id, 'YES')].title
 
     def _calculate_realized_pnl(self, trades: List[Trade]) -> float:
         """Calculate realized P&L from trade history"""
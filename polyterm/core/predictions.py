@@ -10,16 +10,25 @@ Features:
 
 import json
 import math
-from typing import Dict, List, Optional, Any, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from collections import defaultdict
 from enum import Enum
 
+from ..db import retention
+from ..db.candles import to_epoch
 from ..db.database import Database
 from ..db.models import Trade, MarketSnapshot, Wallet, ResolutionOutcome
 
 
+# Default ``limit`` of ``Database.get_market_history``; batch panels are
+# downsampled the same way once a window holds this many points
+HISTORY_LIMIT = 1000
+
+
 class SignalType(Enum):
     """Types of prediction signals"""
     MOMENTUM = 'momentum'
@@ -94,6 +103,49 @@ class Prediction:
         }
 
 
+@dataclass
+class SignalInputs:
+    """One market's data for batch evaluation, loaded by ``generate_predictions``"""
+    market_id: str
+    market_title: str
+    # Signals computed from API market data, which take precedence over DB data
+    api_signals: Dict[SignalType, Signal] = field(default_factory=dict)
+    # Probabilities over the last 48h / 72h, oldest first
+    momentum_prices: List[float] = field(default_factory=list)
+    technical_prices: List[float] = field(default_factory=list)
+    # Newest 500 trades as (wallet, side, outcome, notional), oldest first
+    trades: List[Tuple[str, str, str, float]] = field(default_factory=list)
+    # Large trades of the last 24h as (side, outcome, notional)
+    whale_trades: List[Tuple[str, str, float]] = field(default_factory=list)
+
+
+def _flow_volumes(trades: Sequence[Tuple[str, str, float]]) -> Tuple[float, float]:
+    """(buy, sell) notional of (side, outcome, notional) trades.
+
+    Trades without a side count as buys of their outcome.
+    """
+    buy_volume = sum(n for side, outcome, n in trades if side == 'BUY' or (not side and outcome == 'YES'))
+    sell_volume = sum(n for side, outcome, n in trades if side == 'SELL' or (not side and outcome == 'NO'))
+    return buy_volume, sell_volume
+
+
+def _history_prices(points: Sequence[Tuple[float, float]], since: float, hours: int) -> List[float]:
+    """Probabilities ``get_market_history(hours=hours)`` would return, oldest first.
+
+    ``points`` are time-ordered (epoch, probability) pairs. A window with
+    ``HISTORY_LIMIT`` or more points is downsampled to the close of each
+    bucket of the tier ``get_market_history`` would pick.
+    """
+    window = [(ts, price) for ts, price in points if ts >= since]
+    if len(window) < HISTORY_LIMIT:
+        return [price for _, price in window]
+    resolution = retention.pick_resolution(hours * 3600, HISTORY_LIMIT)
+    closes: Dict[int, float] = {}
+    for ts, price in window:
+        closes[int(ts // resolution)] = price
+    return list(closes.values())[-HISTORY_LIMIT:]
+
+
 class PredictionEngine:
     """
     Multi-factor prediction engine for prediction markets.
@@ -184,18 +236,151 @@ class PredictionEngine:
             signals=signals,
         )
 
+    def generate_predictions(
+        self,
+        market_ids: List[str],
+        horizon_hours: int = 24,
+        titles: Optional[Dict[str, str]] = None,
+        market_data: Optional[Dict[str, Dict[str, Any]]] = None,
+        workers: Optional[int] = 1,
+    ) -> List[Prediction]:
+        """
+        Generate predictions for many markets at once.
+
+        Each market gets the same signals as ``generate_prediction``, but
+        snapshots, recent trades, large trades and smart money wallets are
+        loaded once for the whole batch and grouped by market instead of
+        being queried again for every market.
+
+        Args:
+            market_ids: Market IDs to predict
+            horizon_hours: Prediction horizon
+            titles: Optional market ID to display title
+            market_data: Optional market ID to API market data
+            workers: Processes evaluating signals; 1 runs inline, None
+                uses every CPU
+
+        Returns:
+            One Prediction per distinct market ID, in input order
+        """
+        ids = list(dict.fromkeys(str(market_id) for market_id in market_ids if market_id))
+        smart_wallets = self.db.get_smart_money_wallets(min_win_rate=0.70, min_trades=10)
+        win_rates = {w.address: w.win_rate for w in smart_wallets}
+        inputs = self._load_signal_inputs(ids, titles or {}, market_data or {}, load_all_trades=bool(win_rates))
+
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(inputs) <= 1:
+            return [self._predict_from_inputs(item, horizon_hours, win_rates) for item in inputs]
+
+        chunksize = max(len(inputs) // (workers * 4), 1)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_prediction_worker,
+            initargs=(self.weights, horizon_hours, win_rates),
+        ) as pool:
+            return list(pool.map(_prediction_task, inputs, chunksize=chunksize))
+
+    def _load_signal_inputs(
+        self,
+        market_ids: List[str],
+        titles: Dict[str, str],
+        market_data: Dict[str, Dict[str, Any]],
+        load_all_trades: bool,
+    ) -> List[SignalInputs]:
+        """Load batch inputs, querying only what API data does not cover"""
+        inputs = []
+        for market_id in market_ids:
+            data = market_data.get(market_id)
+            title = titles.get(market_id) or (data or {}).get('title') or (data or {}).get('question') or market_id
+            item = SignalInputs(market_id=market_id, market_title=title)
+            if data:
+                for signal in (
+                    self._calculate_momentum_signal_from_api(data),
+                    self._calculate_volume_signal_from_api(data),
+                    self._calculate_technical_signal_from_api(data),
+                ):
+                    if signal:
+                        item.api_signals[signal.signal_type] = signal
+            inputs.append(item)
+        by_id = {item.market_id: item for item in inputs}
+
+        # Snapshot panel: one 72h query covers momentum (48h) and RSI (72h)
+        price_ids = [
+            item.market_id for item in inputs
+            if SignalType.MOMENTUM not in item.api_signals or SignalType.TECHNICAL not in item.api_signals
+        ]
+        now = datetime.now().timestamp()
+        points: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+        for market_id, ts, probability in self.db.get_market_price_points(price_ids, hours=72):
+            epoch = to_epoch(ts)
+            if epoch is not None and probability is not None:
+                points[market_id].append((epoch, probability))
+        for market_id, series in points.items():
+            item = by_id[market_id]
+            if SignalType.MOMENTUM not in item.api_signals:
+                item.momentum_prices = _history_prices(series, now - 48 * 3600, 48)
+            if SignalType.TECHNICAL not in item.api_signals:
+                item.technical_prices = _history_prices(series, now - 72 * 3600, 72)
+
+        # Recent trades feed the volume signal and, when there are smart
+        # money wallets to match, the smart money signal
+        trade_ids = [
+            item.market_id for item in inputs
+            if load_all_trades or SignalType.VOLUME not in item.api_signals
+        ]
+        for market_id, _, wallet, side, outcome, notional in self.db.get_latest_trade_points(trade_ids, limit_per_market=500):
+            by_id[market_id].trades.append((wallet, side, outcome, notional))
+
+        for trade in self.db.get_large_trades(min_notional=10000, hours=24):
+            item = by_id.get(trade.market_id)
+            if item is not None:
+                item.whale_trades.append((trade.side, trade.outcome, trade.notional))
+
+        return inputs
+
+    def _predict_from_inputs(
+        self,
+        inputs: SignalInputs,
+        horizon_hours: int,
+        win_rates: Dict[str, float],
+    ) -> Prediction:
+        """Evaluate ``generate_prediction``'s signals over preloaded inputs"""
+        trades = inputs.trades
+        candidates = (
+            inputs.api_signals.get(SignalType.MOMENTUM) or self._momentum_signal(inputs.momentum_prices),
+            inputs.api_signals.get(SignalType.VOLUME) or self._volume_signal(
+                [t[1] for t in trades], [t[3] for t in trades],
+            ),
+            self._whale_signal(inputs.whale_trades),
+            self._smart_money_signal(trades[-200:], win_rates),
+            inputs.api_signals.get(SignalType.TECHNICAL) or self._technical_signal(inputs.technical_prices),
+        )
+        signals = [signal for signal in candidates if signal]
+
+        direction, prob_change, confidence = self._combine_signals(signals)
+
+        return Prediction(
+            market_id=inputs.market_id,
+            market_title=inputs.market_title,
+            direction=direction,
+            probability_change=prob_change,
+            confidence=confidence,
+            horizon_hours=horizon_hours,
+            signals=signals,
+        )
+
     def _calculate_momentum_signal(self, market_id: str) -> Optional[Signal]:
         """Calculate price momentum signal"""
         snapshots = self.db.get_market_history(market_id, hours=48)
 
-        if len(snapshots) < 5:
-            return None
-
         # Sort by timestamp
         snapshots = sorted(snapshots, key=lambda s: s.timestamp)
+        return self._momentum_signal([s.probability for s in snapshots])
 
-        # Calculate short-term and long-term price changes
-        prices = [s.probability for s in snapshots]
+    def _momentum_signal(self, prices: Sequence[float]) -> Optional[Signal]:
+        """Momentum signal from probabilities, oldest first"""
+        if len(prices) < 5:
+            return None
 
         # Short-term: last 6 hours (minimum lookback of 2 to avoid self-comparison)
         recent_count = max(2, min(6, len(prices) // 4))
@@ -222,7 +407,7 @@ class PredictionEngine:
             signal_type=SignalType.MOMENTUM,
             direction=direction,
             strength=strength,
-            confidence=min(1.0, len(snapshots) / 20),  # More data = more confidence
+            confidence=min(1.0, len(prices) / 20),  # More data = more confidence
             value=momentum,
             description=f"Price momentum: {momentum:+.1%}",
         )
@@ -231,19 +416,19 @@ class PredictionEngine:
         """Calculate volume acceleration signal"""
         trades = self.db.get_trades_by_market(market_id, limit=500)
 
-        if len(trades) < 10:
-            return None
-
         # Sort by timestamp
         trades = sorted(trades, key=lambda t: t.timestamp)
+        return self._volume_signal([t.side for t in trades], [t.notional for t in trades])
 
-        # Split into recent vs historical
-        midpoint = len(trades) // 2
-        recent_trades = trades[midpoint:]
-        old_trades = trades[:midpoint]
+    def _volume_signal(self, sides: Sequence[str], notionals: Sequence[float]) -> Optional[Signal]:
+        """Volume acceleration signal from trade sides and notionals, oldest first"""
+        if len(notionals) < 10:
+            return None
 
-        recent_volume = sum(t.notional for t in recent_trades)
-        old_volume = sum(t.notional for t in old_trades)
+        # Split into recent vs historical
+        midpoint = len(notionals) // 2
+        recent_volume = sum(notionals[midpoint:])
+        old_volume = sum(notionals[:midpoint])
 
         # Volume acceleration
         if old_volume > 0:
@@ -253,8 +438,9 @@ class PredictionEngine:
 
         # High volume often precedes price movements
         # Combine with recent trade direction
-        recent_buy_volume = sum(t.notional for t in recent_trades if t.side == 'BUY')
-        recent_sell_volume = sum(t.notional for t in recent_trades if t.side == 'SELL')
+        recent = list(zip(sides[midpoint:], notionals[midpoint:]))
+        recent_buy_volume = sum(n for side, n in recent if side == 'BUY')
+        recent_sell_volume = sum(n for side, n in recent if side == 'SELL')
 
         if recent_buy_volume > recent_sell_volume * 1.3:
             direction = Direction.BULLISH
@@ -280,13 +466,15 @@ class PredictionEngine:
         # Get large trades
         large_trades = self.db.get_large_trades(min_notional=10000, hours=24)
         market_trades = [t for t in large_trades if t.market_id == market_id]
+        return self._whale_signal([(t.side, t.outcome, t.notional) for t in market_trades])
 
-        if not market_trades:
+    def _whale_signal(self, trades: Sequence[Tuple[str, str, float]]) -> Optional[Signal]:
+        """Whale signal from one market's large (side, outcome, notional) trades"""
+        if not trades:
             return None
 
         # Analyze whale direction
-        buy_volume = sum(t.notional for t in market_trades if t.side == 'BUY' or (not t.side and t.outcome == 'YES'))
-        sell_volume = sum(t.notional for t in market_trades if t.side == 'SELL' or (not t.side and t.outcome == 'NO'))
+        buy_volume, sell_volume = _flow_volumes(trades)
         total_volume = buy_volume + sell_volume
 
         if total_volume == 0:
@@ -321,18 +509,31 @@ class PredictionEngine:
         if not smart_wallets:
             return None
 
-        smart_addresses = {w.address for w in smart_wallets}
+        win_rates = {w.address: w.win_rate for w in smart_wallets}
 
         # Get recent trades by smart money in this market
         trades = self.db.get_trades_by_market(market_id, limit=200)
-        smart_trades = [t for t in trades if t.wallet_address in smart_addresses]
+        return self._smart_money_signal(
+            [(t.wallet_address, t.side, t.outcome, t.notional) for t in trades],
+            win_rates,
+        )
+
+    def _smart_money_signal(
+        self,
+        trades: Sequence[Tuple[str, str, str, float]],
+        win_rates: Dict[str, float],
+    ) -> Optional[Signal]:
+        """Smart money signal from (wallet, side, outcome, notional) trades.
+
+        ``win_rates`` maps each smart money wallet to its win rate.
+        """
+        smart_trades = [t for t in trades if t[0] in win_rates]
 
         if not smart_trades:
             return None
 
         # Analyze smart money direction
-        buy_volume = sum(t.notional for t in smart_trades if t.side == 'BUY' or (not t.side and t.outcome == 'YES'))
-        sell_volume = sum(t.notional for t in smart_trades if t.side == 'SELL' or (not t.side and t.outcome == 'NO'))
+        buy_volume, sell_volume = _flow_volumes([t[1:] for t in smart_trades])
         total = buy_volume + sell_volume
 
         if total == 0:
@@ -348,9 +549,8 @@ class PredictionEngine:
             direction = Direction.NEUTRAL
 
         # Higher confidence for smart money signal
-        smart_trade_wallets = {t.wallet_address for t in smart_trades}
-        matching_wallets = [w for w in smart_wallets if w.address in smart_trade_wallets]
-        avg_win_rate = sum(w.win_rate for w in matching_wallets) / max(1, len(matching_wallets))
+        smart_trade_wallets = {t[0] for t in smart_trades}
+        avg_win_rate = sum(win_rates[w] for w in smart_trade_wallets) / max(1, len(smart_trade_wallets))
 
         return Signal(
             signal_type=SignalType.SMART_MONEY,
@@ -365,12 +565,14 @@ class PredictionEngine:
         """Calculate technical analysis signal (RSI-like)"""
         snapshots = self.db.get_market_history(market_id, hours=72)
 
-        if len(snapshots) < 14:
-            return None
-
         # Sort by timestamp
         snapshots = sorted(snapshots, key=lambda s: s.timestamp)
-        prices = [s.probability for s in snapshots]
+        return self._technical_signal([s.probability for s in snapshots])
+
+    def _technical_signal(self, prices: Sequence[float]) -> Optional[Signal]:
+        """RSI signal from probabilities, oldest first"""
+        if len(prices) < 14:
+            return None
 
         # Calculate gains and losses
         gains = []
@@ -803,3 +1005,18 @@ class PredictionEngine:
         lines.append(f"Signal Summary: {summary['bullish']} bullish, {summary['bearish']} bearish, {summary['neutral']} neutral")
 
         return "\n".join(lines)
+
+
+_worker_state: Optional[Tuple[PredictionEngine, int, Dict[str, float]]] = None
+
+
+def _init_prediction_worker(weights: Dict[SignalType, float], horizon_hours: int, win_rates: Dict[str, float]) -> None:
+    global _worker_state
+    engine = PredictionEngine(None)
+    engine.weights = weights
+    _worker_state = (engine, horizon_hours, win_rates)
+
+
+def _prediction_task(inputs: SignalInputs) -> Prediction:
+    engine, horizon_hours, win_rates = _worker_state
+    return engine._predict_from_inputs(inputs, horizon_hours, win_rates)
@@ -1,9 +1,13 @@
 """Market scanner for detecting shifts and anomalies"""
 
 import asyncio
+import hashlib
+import json
+import logging
 import time
-from typing import Dict, List, Optional, Any, Callable
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Callable
 from datetime import datetime, timezone
 
 from ..api.gamma import GammaClient
@@ -13,6 +17,8 @@ from ..api.aggregator import APIAggregator
 from ..api.market_utils import get_primary_clob_token_id, market_probability_price
 from .archive import ArchiveCollector
 
+logger = logging.getLogger(__name__)
+
 
 class MarketSnapshot:
     """Snapshot of market data at a point in time"""
@@ -73,16 +79,20 @@ class MarketScanner:
         # Initialize aggregator for live data with fallback
         self.aggregator = APIAggregator(gamma_client, clob_client)
         
-        # Storage for market snapshots
-        self.snapshots: Dict[str, List[MarketSnapshot]] = {}
+        # Storage for market snapshots (ring buffers of max_snapshots_per_market)
+        self.snapshots: Dict[str, Deque[MarketSnapshot]] = {}
         self.max_snapshots_per_market = 100
+
+        # Last CLOB book and last trade per market, with the Gamma
+        # fingerprint they were fetched under and when
+        self._clob_cache: Dict[str, tuple] = {}
+        self.clob_refresh_interval = 300
         
         # Callbacks
         self.shift_callbacks: List[Callable] = []
         
         # State
         self.running = False
-        self.executor = ThreadPoolExecutor(max_workers=10)
         
         # Data validation settings
         self.require_fresh_data = True
@@ -95,9 +105,7 @@ class MarketScanner:
     def get_market_snapshot(self, market_id: str) -> Optional[MarketSnapshot]:
         """Get aggregated market snapshot from all sources"""
         try:
-            # Fetch from multiple sources
             gamma_data = self.gamma_client.get_market(market_id)
-            gamma_prices = self.gamma_client.get_market_prices(market_id)
             token_id = get_primary_clob_token_id(gamma_data)
             
             # Get CLOB data
@@ -108,36 +116,124 @@ class MarketScanner:
                 clob_ticker = {}
                 clob_book = {}
 
-            price = safe_float(gamma_prices.get("price", market_probability_price(gamma_data)))
-
-            # Aggregate data
-            aggregated_data = {
-                "market_id": market_id,
-                "title": gamma_data.get("question", ""),
-                "probability": price * 100,
-                "price": price,
-                "volume": safe_float(gamma_data.get("volume", 0)),
-                "liquidity": safe_float(gamma_data.get("liquidity", 0)),
-                "last_trade_price": safe_float(clob_ticker.get("last", 0)) if clob_ticker else 0,
-                "spread": self.clob_client.calculate_spread(clob_book) if clob_book else 0,
-            }
-            
-            return MarketSnapshot(market_id, aggregated_data, time.time())
+            data = self._snapshot_data(market_id, gamma_data, clob_ticker, clob_book)
+            return MarketSnapshot(market_id, data, time.time())
             
         except Exception as e:
             print(f"Error getting snapshot for {market_id}: {e}")
             return None
+
+    def get_market_snapshots(
+        self,
+        market_ids: List[str],
+        markets: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, MarketSnapshot]:
+        """Build snapshots for many markets from bulk requests
+
+        Gamma payloads come from ``markets`` when the caller already has
+        them (e.g. from a market list), otherwise from one
+        ``get_markets_by_ids`` call, and every snapshot is rebuilt from
+        them. Markets whose payload is unchanged since the last cycle (same
+        ``updatedAt``, or the same payload hash when Gamma omits it) reuse
+        their cached CLOB book and last trade until it is
+        ``clob_refresh_interval`` seconds old. The rest share one batched
+        ``get_order_books`` and one ``get_last_trade_prices`` request set.
+
+        Args:
+            market_ids: Market identifiers
+            markets: Optional prefetched Gamma markets keyed by identifier
+
+        Returns:
+            Dict of market id to snapshot; markets Gamma did not return are
+            left out
+        """
+        if markets is None:
+            try:
+                markets = self.gamma_client.get_markets_by_ids(market_ids)
+            except Exception as e:
+                logger.warning("Error fetching markets: %s", e)
+                return {}
+
+        now = time.time()
+        resolved: Dict[str, tuple] = {}
+        stale_tokens: List[str] = []
+        for market_id in market_ids:
+            market = markets.get(market_id) or markets.get(str(market_id))
+            if not market:
+                continue
+            fingerprint = _market_fingerprint(market)
+            token_id = get_primary_clob_token_id(market)
+            resolved[market_id] = (market, fingerprint, token_id)
+            cached = self._clob_cache.get(market_id)
+            if token_id and not (
+                cached
+                and cached[0] == fingerprint
+                and now - cached[3] < self.clob_refresh_interval
+            ):
+                stale_tokens.append(token_id)
+
+        books: Dict[str, Dict[str, Any]] = {}
+        last_trades: Dict[str, Dict[str, Any]] = {}
+        fetched = False
+        if stale_tokens:
+            fetched = True
+            try:
+                books = self.clob_client.get_order_books(stale_tokens)
+            except Exception as e:
+                logger.warning("Error fetching order books: %s", e)
+                fetched = False
+            try:
+                last_trades = self.clob_client.get_last_trade_prices(stale_tokens)
+            except Exception as e:
+                logger.warning("Error fetching last trade prices: %s", e)
+                fetched = False
+
+        stale = set(stale_tokens)
+        snapshots: Dict[str, MarketSnapshot] = {}
+        for market_id, (market, fingerprint, token_id) in resolved.items():
+            if token_id in stale:
+                last_trade = {"last": last_trades[token_id].get("price", 0)} if token_id in last_trades else {}
+                book = books.get(token_id, {})
+                if fetched:
+                    self._clob_cache[market_id] = (fingerprint, last_trade, book, now)
+                else:
+                    # Retry the CLOB next cycle instead of caching a failure
+                    self._clob_cache.pop(market_id, None)
+            elif token_id:
+                _, last_trade, book, _ = self._clob_cache[market_id]
+            else:
+                last_trade, book = {}, {}
+            data = self._snapshot_data(market_id, market, last_trade, book)
+            snapshots[market_id] = MarketSnapshot(market_id, data, now)
+        return snapshots
+
+    def _snapshot_data(
+        self,
+        market_id: str,
+        gamma_data: Dict[str, Any],
+        clob_ticker: Dict[str, Any],
+        clob_book: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Aggregate one market's Gamma payload and CLOB data"""
+        price = safe_float(market_probability_price(gamma_data))
+        return {
+            "market_id": market_id,
+            "title": gamma_data.get("question", ""),
+            "probability": price * 100,
+            "price": price,
+            "volume": safe_float(gamma_data.get("volume", 0)),
+            "liquidity": safe_float(gamma_data.get("liquidity", 0)),
+            "last_trade_price": safe_float(clob_ticker.get("last", 0)) if clob_ticker else 0,
+            "spread": self.clob_client.calculate_spread(clob_book) if clob_book else 0,
+        }
     
     def store_snapshot(self, snapshot: MarketSnapshot):
-        """Store market snapshot with history limit"""
-        if snapshot.market_id not in self.snapshots:
-            self.snapshots[snapshot.market_id] = []
-        
-        self.snapshots[snapshot.market_id].append(snapshot)
-        
-        # Limit history
-        if len(self.snapshots[snapshot.market_id]) > self.max_snapshots_per_market:
-            self.snapshots[snapshot.market_id] = self.snapshots[snapshot.market_id][-self.max_snapshots_per_market:]
+        """Store market snapshot in the market's history ring buffer"""
+        history = self.snapshots.get(snapshot.market_id)
+        if history is None:
+            history = deque(maxlen=self.max_snapshots_per_market)
+            self.snapshots[snapshot.market_id] = history
+        history.append(snapshot)
     
     def get_previous_snapshot(self, market_id: str) -> Optional[MarketSnapshot]:
         """Get previous snapshot for comparison"""
@@ -192,52 +288,39 @@ class MarketScanner:
         thresholds: Dict[str, float],
     ) -> Optional[Dict[str, Any]]:
         """Scan a single market for shifts"""
-        # Get current snapshot
-        current = self.get_market_snapshot(market_id)
-        if not current:
-            return None
-        
-        # Get previous snapshot
-        previous = self.get_previous_snapshot(market_id)
-        
-        # Store current snapshot
-        self.store_snapshot(current)
-        
-        # Detect shift
-        shift = self.detect_shift(current, previous, thresholds)
-        
-        if shift:
-            # Call callbacks
-            for callback in self.shift_callbacks:
-                try:
-                    callback(shift)
-                except Exception as e:
-                    print(f"Error in shift callback: {e}")
-        
-        return shift
+        shifts = self.scan_markets([market_id], thresholds)
+        return shifts[0] if shifts else None
     
     def scan_markets(
         self,
         market_ids: List[str],
         thresholds: Dict[str, float],
+        markets: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        """Scan multiple markets concurrently"""
+        """Scan multiple markets from one bulk snapshot build
+
+        Args:
+            market_ids: Market identifiers
+            thresholds: Shift thresholds (see ``detect_shift``)
+            markets: Optional prefetched Gamma markets keyed by identifier
+        """
         shifts = []
         
-        # Use thread pool for concurrent scanning
-        futures = []
-        for market_id in market_ids:
-            future = self.executor.submit(self.scan_market, market_id, thresholds)
-            futures.append(future)
-        
-        # Collect results
-        for future in futures:
-            try:
-                result = future.result(timeout=10)
-                if result:
-                    shifts.append(result)
-            except Exception as e:
-                print(f"Error scanning market: {e}")
+        for market_id, current in self.get_market_snapshots(market_ids, markets).items():
+            history = self.snapshots.get(market_id)
+            previous = history[-1] if history else None
+            self.store_snapshot(current)
+            
+            shift = self.detect_shift(current, previous, thresholds)
+            if not shift:
+                continue
+            shifts.append(shift)
+            
+            for callback in self.shift_callbacks:
+                try:
+                    callback(shift)
+                except Exception as e:
+                    print(f"Error in shift callback: {e}")
         
         return shifts
     
@@ -265,8 +348,8 @@ class MarketScanner:
                 for issue in validation_report['issues'][:3]:  # Show first 3 issues
                     print(f"  - {issue}")
             
-            market_ids = [m.get("id") for m in markets if m.get("id")]
-            return self.scan_markets(market_ids, thresholds)
+            by_id = {str(m["id"]): m for m in markets if m.get("id")}
+            return self.scan_markets(list(by_id), thresholds, markets=by_id)
         except Exception as e:
             print(f"Error scanning all markets: {e}")
             return []
@@ -312,7 +395,8 @@ class MarketScanner:
         if market_id not in self.snapshots or len(self.snapshots[market_id]) < window:
             return 0.0
         
-        recent_snapshots = self.snapshots[market_id][-window:]
+        history = self.snapshots[market_id]
+        recent_snapshots = list(islice(history, len(history) - window, None))
         prob_changes = []
         
         for i in range(1, len(recent_snapshots)):
@@ -509,6 +593,15 @@ class MarketOpportunityScanner:
         return _dedupe(actions)
 
 
+def _market_fingerprint(market: Dict[str, Any]) -> str:
+    """``updatedAt`` when Gamma sends it, else a hash of the whole payload"""
+    updated_at = market.get("updatedAt") or market.get("updated_at")
+    if updated_at:
+        return f"updated:{updated_at}"
+    payload = json.dumps(market, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
 def _price_change_pct(current: float, previous: float) -> float:
     if previous <= 0:
         return 0.0
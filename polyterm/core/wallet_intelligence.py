@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from ..api.data_api import DataAPIClient
+from ..api.trade_tape import tape_for
 from ..db.database import Database
 from ..db.models import Trade, Wallet
 
@@ -280,81 +281,55 @@ class WalletIntelligence:
         sample_size = max(page_size, int(sample_size or page_size))
         max_offset = max(sample_size - page_size, 0)
 
+        tape = tape_for(self.data_api).read(
+            cutoff_ts,
+            min_notional=min_notional,
+            page_size=page_size,
+            max_offset=max_offset,
+        )
+
         trades: List[Dict[str, Any]] = []
-        errors: List[Dict[str, Any]] = []
-        pages_scanned = 0
-        rows_scanned = 0
-        stopped_at_cutoff = False
+        for raw in tape.rows:
+            timestamp = int(_as_float(raw.get("timestamp"), 0))
+            identifiers = {
+                str(raw.get("conditionId") or ""),
+                str(raw.get("slug") or ""),
+                str(raw.get("eventSlug") or ""),
+                str(raw.get("asset") or ""),
+            }
+            if market and market not in identifiers:
+                continue
 
-        for offset in range(0, max_offset + 1, page_size):
-            try:
-                page = self.data_api.get_recent_trades(
-                    limit=page_size,
-                    offset=offset,
-                    filter_type="CASH",
-                    filter_amount=min_notional,
-                )
-            except Exception as exc:
-                errors.append({"offset": offset, "error": str(exc)})
-                break
-
-            pages_scanned += 1
-            if not page:
-                stopped_at_cutoff = True
-                break
-
-            page_timestamps = []
-            rows_scanned += len(page)
-            for raw in page:
-                timestamp = int(_as_float(raw.get("timestamp"), 0))
-                if timestamp:
-                    page_timestamps.append(timestamp)
-                if timestamp and timestamp < cutoff_ts:
-                    continue
-
-                identifiers = {
-                    str(raw.get("conditionId") or ""),
-                    str(raw.get("slug") or ""),
-                    str(raw.get("eventSlug") or ""),
-                    str(raw.get("asset") or ""),
-                }
-                if market and market not in identifiers:
-                    continue
-
-                size = _as_float(raw.get("size"), 0.0)
-                price = _as_float(raw.get("price"), 0.0)
-                notional = size * price
-                if notional < min_notional:
-                    continue
-
-                trades.append({
-                    "wallet": raw.get("proxyWallet") or raw.get("user") or raw.get("wallet"),
-                    "name": raw.get("name"),
-                    "side": raw.get("side"),
-                    "asset": raw.get("asset"),
-                    "condition_id": raw.get("conditionId"),
-                    "size": size,
-                    "price": price,
-                    "notional": notional,
-                    "timestamp": timestamp,
-                    "timestamp_iso": datetime.fromtimestamp(timestamp, timezone.utc).isoformat() if timestamp else None,
-                    "market_title": raw.get("title"),
-                    "market_slug": raw.get("slug"),
-                    "event_slug": raw.get("eventSlug"),
-                    "outcome": raw.get("outcome"),
-                    "outcome_index": raw.get("outcomeIndex"),
-                    "transaction_hash": raw.get("transactionHash"),
-                })
+            size = _as_float(raw.get("size"), 0.0)
+            price = _as_float(raw.get("price"), 0.0)
+            notional = size * price
+            if notional < min_notional:
+                continue
 
-            if page_timestamps and min(page_timestamps) < cutoff_ts:
-                stopped_at_cutoff = True
-                break
+            trades.append({
+                "wallet": raw.get("proxyWallet") or raw.get("user") or raw.get("wallet"),
+                "name": raw.get("name"),
+                "side": raw.get("side"),
+                "asset": raw.get("asset"),
+                "condition_id": raw.get("conditionId"),
+                "size": size,
+                "price": price,
+                "notional": notional,
+                "timestamp": timestamp,
+                "timestamp_iso": datetime.fromtimestamp(timestamp, timezone.utc).isoformat() if timestamp else None,
+                "market_title": raw.get("title"),
+                "market_slug": raw.get("slug"),
+                "event_slug": raw.get("eventSlug"),
+                "outcome": raw.get("outcome"),
+                "outcome_index": raw.get("outcomeIndex"),
+                "transaction_hash": raw.get("transactionHash"),
+            })
 
         trades.sort(key=lambda row: (row["notional"], row.get("timestamp") or 0), reverse=True)
         quality_flags = ["live_data_api_trades", "notional=size_times_price", "notional_desc_sorted", "public_trade_rows_only"]
-        if errors:
+        if tape.errors:
             quality_flags.append("data_api_page_error")
-        if not stopped_at_cutoff:
+        if not tape.covered:
             quality_flags.append("data_api_recent_tape_window_limited")
 
         return {
@@ -363,9 +338,10 @@ class WalletIntelligence:
             "sample_size": sample_size,
             "cutoff": cutoff.isoformat(),
             "count": len(trades),
-            "rows_scanned": rows_scanned,
-            "pages_scanned": pages_scanned,
-            "errors": errors,
+            "rows_scanned": tape.rows_scanned,
+            "pages_scanned": tape.pages_fetched,
+            "cached_rows": tape.cached_rows,
+            "errors": tape.errors,
             "trades": trades[:limit],
             "quality_flags": quality_flags,
         }
@@ -377,7 +353,7 @@ class WalletIntelligence:
         limit: int = 20,
         market: Optional[str] = None,
         now: Optional[datetime] = None,
-        page_size: int = 100,
+        page_size: int = 1000,
         max_offset: int = 3000,
     ) -> Dict[str, Any]:
         """Return public Data API whale trades and wallet rollups.
@@ -392,64 +368,47 @@ class WalletIntelligence:
         cutoff = now_dt - timedelta(hours=hours)
         cutoff_ts = int(cutoff.timestamp())
 
+        tape = tape_for(self.data_api).read(
+            cutoff_ts,
+            min_notional=min_notional,
+            page_size=page_size,
+            max_offset=max_offset,
+        )
+        if tape.errors and not tape.rows:
+            raise RuntimeError(f"Data API trade tape unavailable: {tape.errors[0]['error']}")
+
         trades: List[Dict[str, Any]] = []
-        pages_scanned = 0
-        rows_scanned = 0
-        stopped_at_cutoff = False
-
-        for offset in range(0, max_offset + 1, page_size):
-            page = self.data_api.get_recent_trades(
-                limit=page_size,
-                offset=offset,
-                filter_type="CASH",
-                filter_amount=min_notional,
-            )
-            pages_scanned += 1
-            if not page:
-                break
-            rows_scanned += len(page)
-
-            page_timestamps = []
-            for raw in page:
-                timestamp = int(_as_float(raw.get("timestamp"), 0))
-                if timestamp:
-                    page_timestamps.append(timestamp)
-                if timestamp and timestamp < cutoff_ts:
-                    continue
-
-                identifiers = {
-                    str(raw.get("conditionId") or ""),
-                    str(raw.get("slug") or ""),
-                    str(raw.get("eventSlug") or ""),
-                    str(raw.get("asset") or ""),
-                }
-                if market and market not in identifiers:
-                    continue
-
-                size = _as_float(raw.get("size"), 0.0)
-                price = _as_float(raw.get("price"), 0.0)
-                notional = size * price
-                if notional < min_notional:
-                    continue
-
-                trades.append({
-                    "wallet": raw.get("proxyWallet") or raw.get("user") or raw.get("wallet"),
-                    "side": raw.get("side"),
-                    "market_title": raw.get("title"),
-                    "slug": raw.get("slug"),
-                    "condition_id": raw.get("conditionId"),
-                    "asset": raw.get("asset"),
-                    "outcome": raw.get("outcome"),
-                    "size": size,
-                    "price": price,
-                    "notional": notional,
-                    "timestamp": timestamp,
-                    "transaction_hash": raw.get("transactionHash"),
-                })
+        for raw in tape.rows:
+            timestamp = int(_as_float(raw.get("timestamp"), 0))
+            identifiers = {
+                str(raw.get("conditionId") or ""),
+                str(raw.get("slug") or ""),
+                str(raw.get("eventSlug") or ""),
+                str(raw.get("asset") or ""),
+            }
+            if market and market not in identifiers:
+                continue
+
+            size = _as_float(raw.get("size"), 0.0)
+            price = _as_float(raw.get("price"), 0.0)
+            notional = size * price
+            if notional < min_notional:
+                continue
 
-            if page_timestamps and min(page_timestamps) < cutoff_ts:
-                stopped_at_cutoff = True
-                break
+            trades.append({
+                "wallet": raw.get("proxyWallet") or raw.get("user") or raw.get("wallet"),
+                "side": raw.get("side"),
+                "market_title": raw.get("title"),
+                "slug": raw.get("slug"),
+                "condition_id": raw.get("conditionId"),
+                "asset": raw.get("asset"),
+                "outcome": raw.get("outcome"),
+                "size": size,
+                "price": price,
+                "notional": notional,
+                "timestamp": timestamp,
+                "transaction_hash": raw.get("transactionHash"),
+            })
 
         trades.sort(key=lambda row: (row["notional"], row["timestamp"]), reverse=True)
         displayed_trades = trades[:limit]
@@ -484,7 +443,9 @@ class WalletIntelligence:
         cached_trade_count = self._cache_live_whale_results(trades, wallets)
 
         quality_flags = ["public_data_api", "trade_direction_may_be_inferred"]
-        if not stopped_at_cutoff:
+        if tape.errors:
+            quality_flags.append("data_api_page_error")
+        if not tape.covered:
             quality_flags.append("data_api_recent_tape_window_limited")
 
         return {
@@ -494,8 +455,9 @@ class WalletIntelligence:
             "cutoff": cutoff.isoformat(),
             "trade_count": len(trades),
             "wallet_count": len(wallets),
-            "rows_scanned": rows_scanned,
-            "pages_scanned": pages_scanned,
+            "rows_scanned": tape.rows_scanned,
+            "pages_scanned": tape.pages_fetched,
+            "tape_cached_rows": tape.cached_rows,
             "cached_trade_count": cached_trade_count,
             "wallets": displayed_wallets,
             "trades": displayed_trades,
@@ -504,7 +466,7 @@ class WalletIntelligence:
 
     def _cache_live_whale_results(self, trades: List[Dict[str, Any]], wallets: List[Dict[str, Any]]) -> int:
         """Persist live Data API whale query results into the local SQLite cache."""
-        cached = 0
+        wallet_rows = []
         for item in wallets:
             address = str(item.get("address") or "")
             if not address or address == "unknown":
@@ -527,8 +489,9 @@ class WalletIntelligence:
             wallet.favorite_markets = sorted(set(wallet.favorite_markets) | set(favorite_markets))
             wallet.tags = sorted(tags)
             wallet.updated_at = datetime.now()
-            self.db.upsert_wallet(wallet)
+            wallet_rows.append(wallet)
 
+        trade_rows = []
         for trade in trades:
             wallet = str(trade.get("wallet") or "unknown")
             if not wallet or wallet == "unknown":
@@ -539,7 +502,7 @@ class WalletIntelligence:
             else:
                 trade_time = datetime.now()
 
-            self.db.insert_trade(
+            trade_rows.append(
                 Trade(
                     market_id=str(trade.get("condition_id") or trade.get("slug") or trade.get("asset") or ""),
                     market_slug=str(trade.get("slug") or ""),
@@ -554,9 +517,12 @@ class WalletIntelligence:
                     taker_address=wallet,
                 )
             )
-            cached += 1
 
-        return cached
+        # The whole tape goes in one executemany transaction per table
+        self.db.upsert_wallets_bulk(wallet_rows)
+        self.db.insert_trades_bulk(trade_rows)
+
+        return len(trade_rows)
 
     def consensus_moves(self, trades: List[Dict[str, Any]], min_wallets: int = 3) -> List[Dict[str, Any]]:
         """Find markets where multiple wallets recently traded the same outcome."""
@@ -50,6 +50,7 @@ class WhaleTracker:
 
         # Monitoring state
         self._monitoring = False
+        self._hub_subscription = None
 
     def add_whale_callback(self, callback: Callable[[Trade, Wallet], None]):
         """Add callback for whale trade events"""
@@ -113,11 +114,13 @@ class WhaleTracker:
             taker_address=taker_address,
         )
 
-        # Update wallet profile first (ensures wallet exists for FK constraint)
-        wallet = await self._update_wallet(wallet_address, trade)
+        # Wallet read/upsert and trade insert share one commit
+        with self.db.transaction():
+            # Update wallet profile first (ensures wallet exists for FK constraint)
+            wallet = await self._update_wallet(wallet_address, trade)
 
-        # Store trade in database (after wallet exists)
-        self.db.insert_trade(trade)
+            # Store trade in database (after wallet exists)
+            self.db.insert_trade(trade)
 
         # Update recent trades cache
         self.recent_trades.append(trade)
@@ -266,6 +269,7 @@ class WhaleTracker:
         self,
         market_slugs: List[str],
         poll_interval: float = 5.0,
+        hub=None,
     ):
         """Start monitoring markets for whale activity via WebSocket.
 
@@ -274,10 +278,20 @@ class WhaleTracker:
         Args:
             market_slugs: Market slugs to monitor
             poll_interval: Seconds between REST polls when in fallback mode
+            hub: Optional ``MarketStreamHub`` to share with other live feeds;
+                the caller is responsible for running it. Without one, trades
+                ride the CLOB client's own hub via ``subscribe_to_trades``.
         """
         self._monitoring = True
         ws_failed = False
 
+        if hub is not None:
+            await self._consume_hub(hub, market_slugs)
+            if hub.failed and self._monitoring:
+                logger.warning("WhaleTracker falling back to REST polling (interval=%.0fs)", poll_interval)
+                await self._run_rest_polling(market_slugs, poll_interval)
+            return
+
         def on_ws_error(exc: Exception):
             nonlocal ws_failed
             ws_failed = True
@@ -302,18 +316,24 @@ class WhaleTracker:
         """REST polling fallback for whale monitoring.
 
         Polls the public Data API for recent trades and processes them through
-        the same callback pipeline as WebSocket trades.
+        the same callback pipeline as WebSocket trades. The loop's shared
+        aiohttp session belongs to whoever runs the loop, which closes it.
         """
         seen_tx_hashes: set = set()
         MAX_SEEN = 5000
+        slugs = market_slugs or [""]
+        get_trades = self._async_trade_fetcher()
 
         while self._monitoring:
             try:
-                for slug in (market_slugs or [""]):
-                    try:
-                        trades = self.data_api.get_trades(market=slug or None, limit=50)
-                    except Exception as e:
-                        logger.debug("Data API trade poll failed for %s: %s", slug, e)
+                # Poll every market concurrently without blocking the loop
+                results = await asyncio.gather(
+                    *(get_trades(market=slug or None, limit=50) for slug in slugs),
+                    return_exceptions=True,
+                )
+                for slug, trades in zip(slugs, results):
+                    if isinstance(trades, Exception):
+                        logger.debug("Data API trade poll failed for %s: %s", slug, trades)
                         continue
 
                     for trade_data in trades:
@@ -339,9 +359,46 @@ class WhaleTracker:
 
             await asyncio.sleep(poll_interval)
 
+    def _async_trade_fetcher(self) -> Callable[..., Any]:
+        """Awaitable ``get_trades`` that never blocks the event loop.
+
+        Uses the aiohttp twin of a ``DataAPIClient``; any other client
+        (e.g. an injected stand-in) runs in a worker thread.
+        """
+        if isinstance(self.data_api, DataAPIClient):
+            return self.data_api.async_client().get_trades
+
+        async def get_trades(**kwargs):
+            return await asyncio.to_thread(self.data_api.get_trades, **kwargs)
+
+        return get_trades
+
+    async def _consume_hub(self, hub, token_ids: List[str]):
+        """Process ``last_trade_price`` events from a shared market hub."""
+        sub = hub.subscribe(token_ids, event_types={"last_trade_price"})
+        self._hub_subscription = sub
+        try:
+            async for data in sub:
+                if not self._monitoring:
+                    break
+                # Same envelope listen_for_trades hands to its callbacks
+                try:
+                    await self.process_trade({
+                        "topic": "clob_market",
+                        "type": "last_trade_price",
+                        "payload": CLOBClient._normalize_clob_trade_payload(data),
+                    })
+                except Exception as e:
+                    logger.debug("WhaleTracker hub trade failed: %s", e)
+        finally:
+            hub.unsubscribe(sub)
+            self._hub_subscription = None
+
     def stop_monitoring(self):
         """Stop monitoring (both WebSocket and REST polling)."""
         self._monitoring = False
+        if self._hub_subscription is not None:
+            self._hub_subscription.hub.unsubscribe(self._hub_subscription)
 
 
 class InsiderDetector:
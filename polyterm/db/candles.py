@@ -0,0 +1,167 @@
+"""OHLCV candle rollups
+
+Candles are stored at fixed intervals from 1 minute to 1 day. Every
+interval is derived from the one below it by merging: open from the
+earliest candle, close from the latest, high/low as the extremes and
+volume and trade count as sums. A trade is just a one-trade candle, so
+the same merge folds new trades into stored candles and builds coarser
+intervals from finer ones.
+
+Rows are plain tuples in ``CANDLE_COLUMNS`` order. ``build_candles`` folds
+arrays of trade epochs, prices and notionals with NumPy when it is
+installed (``reduceat`` over sorted buckets) and with a Python loop
+otherwise.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Stored intervals, finest first; each one divides the next
+CANDLE_INTERVALS: Dict[str, int] = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '1h': 3600,
+    '4h': 14400,
+    '1d': 86400,
+}
+
+CANDLE_COLUMNS = (
+    'bucket', 'open', 'high', 'low', 'close', 'volume', 'trade_count', 'first_ts', 'last_ts',
+)
+
+# Batch size from which NumPy's per-call overhead pays off over a Python
+# loop. Shared with ``core.impact``: the crossover is about 30 sizes for
+# an impact curve and about 100 trades for a candle fold.
+NUMPY_MIN_BATCH = 64
+
+CandleRow = Tuple[int, float, float, float, float, float, int, float, float]
+
+
+def parse_interval(interval: str) -> int:
+    """Interval string (``'15m'``, ``'4h'``, ``'1d'``) to seconds"""
+    multipliers = {'m': 60, 'h': 3600, 'd': 86400}
+    unit = interval[-1]
+    value = int(interval[:-1])
+    return value * multipliers.get(unit, 3600)
+
+
+def base_interval(interval_seconds: int) -> int:
+    """Coarsest stored interval that ``interval_seconds`` is a multiple of"""
+    divisors = [s for s in CANDLE_INTERVALS.values() if interval_seconds % s == 0]
+    return max(divisors) if divisors else CANDLE_INTERVALS['1m']
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """Seconds since the epoch for trade timestamps (datetimes, ISO strings, numbers)"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def rollup(rows: Iterable[CandleRow], interval_seconds: int) -> List[CandleRow]:
+    """Merge time-ordered candles into ``interval_seconds`` buckets"""
+    merged: List[CandleRow] = []
+    current: Optional[list] = None
+    for bucket, open_, high, low, close, volume, count, first_ts, last_ts in rows:
+        target = int(bucket // interval_seconds * interval_seconds)
+        if current is not None and current[0] == target:
+            current[2] = max(current[2], high)
+            current[3] = min(current[3], low)
+            current[4] = close
+            current[5] += volume
+            current[6] += count
+            current[8] = last_ts
+            continue
+        if current is not None:
+            merged.append(tuple(current))
+        current = [target, open_, high, low, close, volume, count, first_ts, last_ts]
+    if current is not None:
+        merged.append(tuple(current))
+    return merged
+
+
+def build_candles(
+    epochs: Sequence[float],
+    prices: Sequence[float],
+    notionals: Sequence[float],
+) -> Dict[int, List[CandleRow]]:
+    """Fold trades into candles for every stored interval.
+
+    Trades need not be sorted. Trades without a positive price carry no
+    price information and are skipped.
+
+    Returns:
+        Dict of interval seconds to candle rows, oldest first
+    """
+    if HAS_NUMPY and len(epochs) >= NUMPY_MIN_BATCH:
+        return _build_candles_numpy(epochs, prices, notionals)
+
+    trades = sorted(
+        ((ts, price, notional) for ts, price, notional in zip(epochs, prices, notionals) if price > 0),
+        key=lambda trade: trade[0],
+    )
+    rows: List[CandleRow] = [
+        (int(ts), price, price, price, price, notional, 1, ts, ts)
+        for ts, price, notional in trades
+    ]
+    result: Dict[int, List[CandleRow]] = {}
+    for seconds in CANDLE_INTERVALS.values():
+        rows = rollup(rows, seconds)
+        result[seconds] = rows
+    return result
+
+
+def _build_candles_numpy(epochs, prices, notionals) -> Dict[int, List[CandleRow]]:
+    ts = np.asarray(epochs, dtype=np.float64)
+    price = np.asarray(prices, dtype=np.float64)
+    notional = np.asarray(notionals, dtype=np.float64)
+    keep = price > 0
+    ts, price, notional = ts[keep], price[keep], notional[keep]
+    order = np.argsort(ts, kind='stable')
+    ts, price, notional = ts[order], price[order], notional[order]
+
+    cols = {
+        'bucket': ts, 'open': price, 'high': price, 'low': price, 'close': price,
+        'volume': notional, 'trade_count': np.ones(len(ts), dtype=np.int64),
+        'first_ts': ts, 'last_ts': ts,
+    }
+    result: Dict[int, List[CandleRow]] = {}
+    for seconds in CANDLE_INTERVALS.values():
+        cols = _rollup_arrays(cols, seconds)
+        result[seconds] = list(zip(
+            cols['bucket'].astype(np.int64).tolist(),
+            *(cols[name].tolist() for name in CANDLE_COLUMNS[1:]),
+        ))
+    return result
+
+
+def _rollup_arrays(cols: Dict[str, Any], interval_seconds: int) -> Dict[str, Any]:
+    """``rollup`` over column arrays: one ``reduceat`` per column"""
+    bucket = np.floor_divide(cols['bucket'], interval_seconds) * interval_seconds
+    if not len(bucket):
+        return dict(cols, bucket=bucket)
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    ends = np.concatenate((starts[1:], [len(bucket)])) - 1
+    return {
+        'bucket': bucket[starts],
+        'open': cols['open'][starts],
+        'high': np.maximum.reduceat(cols['high'], starts),
+        'low': np.minimum.reduceat(cols['low'], starts),
+        'close': cols['close'][ends],
+        'volume': np.add.reduceat(cols['volume'], starts),
+        'trade_count': np.add.reduceat(cols['trade_count'], starts),
+        'first_ts': cols['first_ts'][starts],
+        'last_ts': cols['last_ts'][ends],
+    }
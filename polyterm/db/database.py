@@ -1,18 +1,44 @@
 """SQLite database manager for persistent storage"""
 
+import os
 import sqlite3
 import json
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 
+from .candles import CANDLE_INTERVALS, CandleRow, build_candles, parse_interval, to_epoch
 from .models import Wallet, Trade, Alert, MarketSnapshot, ArbitrageOpportunity, ResolutionOutcome
+from . import retention
+from .retention import COMPACT_BATCH_SIZE, DEFAULT_RETENTION, ROLLUP_COLUMNS, RetentionPolicy
 
 
 class Database:
     """SQLite database manager for PolyTerm persistent storage"""
 
+    # Connection pragmas applied once per long-lived handle. WAL lets readers
+    # proceed while a writer commits, and NORMAL sync is durable under WAL
+    # except on power loss, which is acceptable for cached market data.
+    _PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -16000",
+        "PRAGMA mmap_size = 134217728",
+    )
+
+    # Database files already cleaned up by this process. Hosts that build
+    # several ``Database()`` objects for one file only pay for the row
+    # counts behind ``_auto_cleanup`` on the first.
+    _cleaned_paths: set = set()
+    _cleaned_lock = threading.Lock()
+
     def __init__(self, db_path: Optional[str] = None):
         if db_path:
             self.db_path = Path(db_path)
@@ -20,23 +46,114 @@ class Database:
             self.db_path = Path.home() / ".polyterm" / "data.db"
 
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Connection opened by each thread; entries of finished threads are
+        # closed and dropped whenever another thread opens one.
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
         self._init_db()
-        self._auto_cleanup()
+
+        key = str(self.db_path.resolve())
+        with Database._cleaned_lock:
+            cleaned = key in Database._cleaned_paths
+            Database._cleaned_paths.add(key)
+        if not cleaned:
+            self._auto_cleanup()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a tuned connection for the calling thread and register it"""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in self._PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.DatabaseError:
+                pass  # Unsupported pragma on this build; keep defaults
+        with self._connections_lock:
+            finished = [thread for thread in self._connections if not thread.is_alive()]
+            stale = [self._connections.pop(thread) for thread in finished]
+            self._connections[threading.current_thread()] = conn
+        for old in stale:
+            self._close_quietly(old)
+        return conn
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening after a fork"""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or getattr(local, "pid", None) != os.getpid():
+            conn = self._open_connection()
+            local.conn = conn
+            local.pid = os.getpid()
+            local.depth = 0
+        return conn
 
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
+        """Context manager for database connections
+
+        Each thread reuses one long-lived connection. The outermost block
+        commits on success and rolls back on error; blocks nested inside
+        ``transaction()`` join the enclosing transaction instead.
+        """
+        conn = self._thread_connection()
+        local = self._local
+        outermost = local.depth == 0
+        local.depth += 1
         try:
             yield conn
-            conn.commit()
+            if outermost:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if outermost:
+                conn.rollback()
             raise
         finally:
+            local.depth -= 1
+
+    @contextmanager
+    def transaction(self):
+        """Batch several operations into a single commit
+
+        Example:
+            with db.transaction():
+                db.upsert_wallet(wallet)
+                db.insert_trade(trade)
+        """
+        with self._get_connection() as conn:
+            yield conn
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
             conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the calling thread's connection
+
+        Other threads keep theirs; use ``close_all()`` at shutdown.
+        """
+        with self._connections_lock:
+            conn = self._connections.pop(threading.current_thread(), None)
+        if conn is not None:
+            self._close_quietly(conn)
+        self._local.conn = None
+
+    def close_all(self) -> None:
+        """Close every connection opened by this instance (shutdown only)"""
+        with self._connections_lock:
+            connections, self._connections = list(self._connections.values()), {}
+        for conn in connections:
+            self._close_quietly(conn)
+        self._local = threading.local()
+
+    def __del__(self):
+        try:
+            self.close_all()
+        except Exception:
+            pass
 
     def _init_db(self):
         """Initialize database schema"""
@@ -114,6 +231,30 @@ class Database:
                 )
             """)
 
+            # Aggregated snapshots kept after raw rows age out (see retention.py)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS snapshot_rollups (
+                    market_id TEXT NOT NULL,
+                    resolution INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    market_slug TEXT DEFAULT '',
+                    title TEXT DEFAULT '',
+                    open REAL NOT NULL,
+                    close REAL NOT NULL,
+                    low REAL NOT NULL,
+                    high REAL NOT NULL,
+                    volume_24h REAL DEFAULT 0.0,
+                    liquidity REAL DEFAULT 0.0,
+                    best_bid REAL DEFAULT 0.0,
+                    best_ask REAL DEFAULT 0.0,
+                    spread REAL DEFAULT 0.0,
+                    samples INTEGER NOT NULL DEFAULT 1,
+                    first_ts REAL NOT NULL,
+                    last_ts REAL NOT NULL,
+                    PRIMARY KEY (market_id, resolution, bucket)
+                ) WITHOUT ROWID
+            """)
+
             # Research briefs table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS research_briefs (
@@ -283,6 +424,7 @@ class Database:
             # Compound indexes for common query patterns
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_market_ts ON trades(market_id, timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_market_ts ON market_snapshots(market_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshot_rollups_market_ts ON snapshot_rollups(market_id, last_ts)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_research_briefs_market ON research_briefs(market_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_research_briefs_slug ON research_briefs(market_slug)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_research_briefs_generated ON research_briefs(generated_at)")
@@ -296,45 +438,120 @@ class Database:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_resolutions_resolved ON resolutions(resolved)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_resolutions_resolved_at ON resolutions(resolved_at)")
 
+            self._ensure_trade_natural_key(cursor)
+            self._ensure_candles(cursor)
+
+    def _ensure_trade_natural_key(self, cursor) -> None:
+        """Create the unique (tx_hash, wallet, market) index for hashed trades.
+
+        Databases written before the index existed may hold duplicate rows,
+        so keep the oldest copy of each natural key before creating it.
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_trades_natural_key'"
+        )
+        if cursor.fetchone():
+            return
+        cursor.execute("""
+            DELETE FROM trades
+            WHERE tx_hash != '' AND id NOT IN (
+                SELECT MIN(id) FROM trades
+                WHERE tx_hash != ''
+                GROUP BY tx_hash, wallet_address, market_id
+            )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX idx_trades_natural_key
+            ON trades(tx_hash, wallet_address, market_id)
+            WHERE tx_hash != ''
+        """)
+
+    def _ensure_candles(self, cursor) -> None:
+        """Create the candle rollup table, backfilling it from stored trades.
+
+        New trades are folded in as they are inserted, so the backfill only
+        runs for databases written before the table existed.
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candles'"
+        )
+        if cursor.fetchone():
+            return
+        cursor.execute("""
+            CREATE TABLE candles (
+                market_id TEXT NOT NULL,
+                interval INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                open REAL NOT NULL,
+                high REAL NOT NULL,
+                low REAL NOT NULL,
+                close REAL NOT NULL,
+                volume REAL NOT NULL DEFAULT 0.0,
+                trade_count INTEGER NOT NULL DEFAULT 0,
+                first_ts REAL NOT NULL,
+                last_ts REAL NOT NULL,
+                PRIMARY KEY (market_id, interval, bucket)
+            ) WITHOUT ROWID
+        """)
+        self._rebuild_candles(cursor.connection)
+
     # Wallet operations
 
+    _UPSERT_WALLET_SQL = """
+        INSERT INTO wallets (
+            address, first_seen, total_trades, total_volume, win_rate,
+            avg_position_size, tags, updated_at, total_wins, total_losses,
+            largest_trade, favorite_markets, risk_score
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(address) DO UPDATE SET
+            total_trades = excluded.total_trades,
+            total_volume = excluded.total_volume,
+            win_rate = excluded.win_rate,
+            avg_position_size = excluded.avg_position_size,
+            tags = excluded.tags,
+            updated_at = excluded.updated_at,
+            total_wins = excluded.total_wins,
+            total_losses = excluded.total_losses,
+            largest_trade = excluded.largest_trade,
+            favorite_markets = excluded.favorite_markets,
+            risk_score = excluded.risk_score
+    """
+
+    @staticmethod
+    def _wallet_params(wallet: Wallet) -> tuple:
+        return (
+            wallet.address,
+            wallet.first_seen.isoformat(),
+            wallet.total_trades,
+            wallet.total_volume,
+            wallet.win_rate,
+            wallet.avg_position_size,
+            json.dumps(wallet.tags),
+            wallet.updated_at.isoformat(),
+            wallet.total_wins,
+            wallet.total_losses,
+            wallet.largest_trade,
+            json.dumps(wallet.favorite_markets),
+            wallet.risk_score,
+        )
+
     def upsert_wallet(self, wallet: Wallet) -> None:
         """Insert or update a wallet"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO wallets (
-                    address, first_seen, total_trades, total_volume, win_rate,
-                    avg_position_size, tags, updated_at, total_wins, total_losses,
-                    largest_trade, favorite_markets, risk_score
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(address) DO UPDATE SET
-                    total_trades = excluded.total_trades,
-                    total_volume = excluded.total_volume,
-                    win_rate = excluded.win_rate,
-                    avg_position_size = excluded.avg_position_size,
-                    tags = excluded.tags,
-                    updated_at = excluded.updated_at,
-                    total_wins = excluded.total_wins,
-                    total_losses = excluded.total_losses,
-                    largest_trade = excluded.largest_trade,
-                    favorite_markets = excluded.favorite_markets,
-                    risk_score = excluded.risk_score
-            """, (
-                wallet.address,
-                wallet.first_seen.isoformat(),
-                wallet.total_trades,
-                wallet.total_volume,
-                wallet.win_rate,
-                wallet.avg_position_size,
-                json.dumps(wallet.tags),
-                wallet.updated_at.isoformat(),
-                wallet.total_wins,
-                wallet.total_losses,
-                wallet.largest_trade,
-                json.dumps(wallet.favorite_markets),
-                wallet.risk_score,
-            ))
+            conn.execute(self._UPSERT_WALLET_SQL, self._wallet_params(wallet))
+
+    def upsert_wallets_bulk(self, wallets: List[Wallet]) -> int:
+        """Insert or update many wallets in one transaction
+
+        Returns:
+            Number of wallets written
+        """
+        params = [self._wallet_params(wallet) for wallet in wallets]
+        if not params:
+            return 0
+        with self._get_connection() as conn:
+            conn.executemany(self._UPSERT_WALLET_SQL, params)
+        return len(params)
 
     def get_wallet(self, address: str) -> Optional[Wallet]:
         """Get a wallet by address"""
@@ -875,49 +1092,107 @@ class Database:
 
     # Trade operations
 
+    _INSERT_TRADE_SQL = """
+        INSERT INTO trades (
+            market_id, market_slug, wallet_address, side, outcome,
+            price, size, notional, timestamp, tx_hash,
+            maker_address, taker_address
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT DO NOTHING
+    """
+
+    @staticmethod
+    def _trade_params(trade: Trade) -> tuple:
+        return (
+            trade.market_id,
+            trade.market_slug,
+            trade.wallet_address,
+            trade.side,
+            trade.outcome,
+            trade.price,
+            trade.size,
+            trade.notional,
+            trade.timestamp.isoformat(),
+            trade.tx_hash,
+            trade.maker_address,
+            trade.taker_address,
+        )
+
     def insert_trade(self, trade: Trade) -> int:
         """Insert a trade and return its ID.
 
         Public API refreshes may see the same trade repeatedly. When a
         transaction hash is available, treat (tx_hash, wallet, market) as a
-        natural key so cache/log refreshes are idempotent.
+        natural key so cache/log refreshes are idempotent. New trades are
+        folded into the candle rollups in the same transaction.
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            if trade.tx_hash:
-                cursor.execute(
-                    """
-                    SELECT id FROM trades
-                    WHERE tx_hash = ? AND wallet_address = ? AND market_id = ?
-                    LIMIT 1
-                    """,
-                    (trade.tx_hash, trade.wallet_address, trade.market_id),
-                )
-                existing = cursor.fetchone()
-                if existing:
-                    return int(existing["id"])
+            cursor.execute(self._INSERT_TRADE_SQL, self._trade_params(trade))
+            if cursor.rowcount:
+                trade_id = cursor.lastrowid
+                self._fold_into_candles(conn, [trade])
+                return trade_id
 
-            cursor.execute("""
-                INSERT INTO trades (
-                    market_id, market_slug, wallet_address, side, outcome,
-                    price, size, notional, timestamp, tx_hash,
-                    maker_address, taker_address
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.market_id,
-                trade.market_slug,
-                trade.wallet_address,
-                trade.side,
-                trade.outcome,
-                trade.price,
-                trade.size,
-                trade.notional,
-                trade.timestamp.isoformat(),
-                trade.tx_hash,
-                trade.maker_address,
-                trade.taker_address,
-            ))
-            return cursor.lastrowid
+            cursor.execute(
+                """
+                SELECT id FROM trades
+                WHERE tx_hash = ? AND wallet_address = ? AND market_id = ?
+                LIMIT 1
+                """,
+                (trade.tx_hash, trade.wallet_address, trade.market_id),
+            )
+            existing = cursor.fetchone()
+            return int(existing["id"]) if existing else 0
+
+    def insert_trades_bulk(self, trades: List[Trade]) -> Dict[str, int]:
+        """Insert many trades in one transaction, skipping known trades.
+
+        Uses the same (tx_hash, wallet, market) natural key as
+        ``insert_trade``; trades without a hash are always inserted. Known
+        keys are looked up under the write lock, so only newly inserted
+        trades are folded into the candle rollups.
+
+        Returns:
+            Dict with ``inserted`` and ``duplicates`` counts
+        """
+        if not trades:
+            return {"inserted": 0, "duplicates": 0}
+        with self._get_connection() as conn:
+            if not conn.in_transaction:
+                # Hold the write lock from the key lookup to the insert
+                conn.execute("BEGIN IMMEDIATE")
+            seen = self._existing_trade_keys(conn, {trade.tx_hash for trade in trades if trade.tx_hash})
+            new_trades = []
+            for trade in trades:
+                if trade.tx_hash:
+                    key = (trade.tx_hash, trade.wallet_address, trade.market_id)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                new_trades.append(trade)
+
+            before = conn.total_changes
+            conn.executemany(self._INSERT_TRADE_SQL, [self._trade_params(trade) for trade in new_trades])
+            inserted = conn.total_changes - before
+            self._fold_into_candles(conn, new_trades)
+        return {"inserted": inserted, "duplicates": len(trades) - inserted}
+
+    @staticmethod
+    def _existing_trade_keys(conn: sqlite3.Connection, tx_hashes: set) -> set:
+        """Stored (tx_hash, wallet, market) keys for the given hashes"""
+        hashes = list(tx_hashes)
+        keys = set()
+        # Stay well under SQLite's bound-parameter limit.
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor = conn.execute(
+                f"SELECT tx_hash, wallet_address, market_id FROM trades WHERE tx_hash IN ({placeholders})",
+                chunk,
+            )
+            keys.update(tuple(row) for row in cursor.fetchall())
+        return keys
 
     def get_trades_by_wallet(
         self,
@@ -936,6 +1211,38 @@ class Database:
             """, (wallet_address, limit, offset))
             return [Trade.from_dict(dict(row)) for row in cursor.fetchall()]
 
+    def get_wallet_trade_points(
+        self,
+        wallet_addresses: List[str],
+        limit_per_wallet: int = 500,
+    ) -> List[Tuple[str, str, float]]:
+        """Get (wallet_address, market_id, size) rows for many wallets.
+
+        Returns the newest ``limit_per_wallet`` trades of every wallet, the
+        rows ``get_trades_by_wallet`` would return for each one, ordered by
+        wallet then time (newest first). Wallets without trades have no rows.
+        """
+        addresses = list(dict.fromkeys(wallet_addresses))
+        rows: List[Tuple[str, str, float]] = []
+        with self._get_connection() as conn:
+            for start in range(0, len(addresses), 500):
+                chunk = addresses[start:start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor = conn.execute(f"""
+                    SELECT wallet_address, market_id, size FROM (
+                        SELECT wallet_address, market_id, size, timestamp,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY wallet_address ORDER BY timestamp DESC
+                            ) AS wallet_rank
+                        FROM trades
+                        WHERE wallet_address IN ({placeholders})
+                    )
+                    WHERE wallet_rank <= ?
+                    ORDER BY wallet_address, timestamp DESC
+                """, (*chunk, limit_per_wallet))
+                rows.extend(tuple(row) for row in cursor.fetchall())
+        return rows
+
     def get_trades_by_market(
         self,
         market_id: str,
@@ -986,6 +1293,143 @@ class Database:
             """, (min_notional, since.isoformat()))
             return [Trade.from_dict(dict(row)) for row in cursor.fetchall()]
 
+    def get_trades_between(
+        self,
+        market_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[Trade]:
+        """Get a market's trades with ``start <= timestamp <= end``, oldest first"""
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM trades
+                WHERE market_id = ? AND timestamp >= ? AND timestamp <= ?
+                ORDER BY timestamp
+            """, (market_id, start.isoformat(), end.isoformat()))
+            return [Trade.from_dict(dict(row)) for row in cursor.fetchall()]
+
+    # Candle operations
+
+    # Merge a candle delta into the stored candle: extremes and sums
+    # combine, open/close come from whichever side traded first/last.
+    _MERGE_CANDLE_SQL = """
+        INSERT INTO candles (
+            market_id, interval, bucket, open, high, low, close,
+            volume, trade_count, first_ts, last_ts
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(market_id, interval, bucket) DO UPDATE SET
+            open = CASE WHEN excluded.first_ts < candles.first_ts
+                        THEN excluded.open ELSE candles.open END,
+            high = MAX(candles.high, excluded.high),
+            low = MIN(candles.low, excluded.low),
+            close = CASE WHEN excluded.last_ts >= candles.last_ts
+                         THEN excluded.close ELSE candles.close END,
+            volume = candles.volume + excluded.volume,
+            trade_count = candles.trade_count + excluded.trade_count,
+            first_ts = MIN(candles.first_ts, excluded.first_ts),
+            last_ts = MAX(candles.last_ts, excluded.last_ts)
+    """
+
+    @staticmethod
+    def _candle_params(market_id: str, candles: Dict[int, List[CandleRow]]) -> List[tuple]:
+        return [
+            (market_id, interval, *row)
+            for interval, rows in candles.items()
+            for row in rows
+        ]
+
+    def _fold_into_candles(self, conn: sqlite3.Connection, trades: List[Trade]) -> None:
+        """Merge newly inserted trades into every candle interval"""
+        by_market: Dict[str, Tuple[list, list, list]] = {}
+        for trade in trades:
+            epoch = to_epoch(trade.timestamp)
+            if epoch is None or not trade.price or trade.price <= 0:
+                continue
+            epochs, prices, notionals = by_market.setdefault(trade.market_id, ([], [], []))
+            epochs.append(epoch)
+            prices.append(trade.price)
+            notionals.append(trade.notional)
+
+        params = []
+        for market_id, columns in by_market.items():
+            params.extend(self._candle_params(market_id, build_candles(*columns)))
+        if params:
+            conn.executemany(self._MERGE_CANDLE_SQL, params)
+
+    def _rebuild_candles(self, conn: sqlite3.Connection, market_id: Optional[str] = None) -> int:
+        if market_id is None:
+            conn.execute("DELETE FROM candles")
+            cursor = conn.execute(
+                "SELECT market_id, timestamp, price, notional FROM trades "
+                "WHERE price > 0 ORDER BY market_id"
+            )
+        else:
+            conn.execute("DELETE FROM candles WHERE market_id = ?", (market_id,))
+            cursor = conn.execute(
+                "SELECT market_id, timestamp, price, notional FROM trades "
+                "WHERE market_id = ? AND price > 0",
+                (market_id,),
+            )
+
+        written = 0
+        for market, rows in groupby(cursor.fetchall(), key=itemgetter(0)):
+            epochs, prices, notionals = [], [], []
+            for _, timestamp, price, notional in rows:
+                epoch = to_epoch(timestamp)
+                if epoch is not None:
+                    epochs.append(epoch)
+                    prices.append(price)
+                    notionals.append(notional or 0.0)
+            params = self._candle_params(market, build_candles(epochs, prices, notionals))
+            conn.executemany(self._MERGE_CANDLE_SQL, params)
+            written += len(params)
+        return written
+
+    def rebuild_candles(self, market_id: Optional[str] = None) -> int:
+        """Recompute candle rollups from the trades table.
+
+        Args:
+            market_id: Market to rebuild; ``None`` rebuilds every market
+
+        Returns:
+            Number of candle rows written across all intervals
+        """
+        with self._get_connection() as conn:
+            return self._rebuild_candles(conn, market_id)
+
+    def get_candles(
+        self,
+        market_id: str,
+        interval: Any = '1h',
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[CandleRow]:
+        """Get stored candles for a market, oldest first.
+
+        Args:
+            market_id: Market ID
+            interval: One of ``CANDLE_INTERVALS`` (``'1h'``) or its seconds
+            start: Epoch seconds; candles containing or after it are included
+            end: Epoch seconds; candles starting after it are excluded
+
+        Returns:
+            ``(bucket, open, high, low, close, volume, trade_count,
+            first_ts, last_ts)`` tuples
+        """
+        seconds = parse_interval(interval) if isinstance(interval, str) else int(interval)
+        if seconds not in CANDLE_INTERVALS.values():
+            raise ValueError(f"Unsupported candle interval: {interval}")
+        low = int(start // seconds * seconds) if start is not None else -(2 ** 62)
+        high = int(end) if end is not None else 2 ** 62
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT bucket, open, high, low, close, volume, trade_count, first_ts, last_ts
+                FROM candles
+                WHERE market_id = ? AND interval = ? AND bucket >= ? AND bucket <= ?
+                ORDER BY bucket
+            """, (market_id, seconds, low, high))
+            return [tuple(row) for row in cursor.fetchall()]
+
     # Alert operations
 
     def insert_alert(self, alert: Alert) -> int:
@@ -1083,19 +1527,218 @@ class Database:
         self,
         market_id: str,
         hours: int = 24,
-        limit: int = 1000
+        limit: int = 1000,
+        resolution: Optional[int] = None,
     ) -> List[MarketSnapshot]:
-        """Get market snapshot history"""
+        """Get market snapshot history, newest first.
+
+        Raw snapshots are returned while they cover the window. Older parts
+        of the window come from the compacted aggregates (one point per
+        aggregate at its last sample). If raw rows alone would fill
+        ``limit`` before reaching the start of the window, the whole
+        window is downsampled to the finest tier that fits, so long
+        windows are not cut down to their most recent hours. Stretches
+        only held in a coarser tier (e.g. daily aggregates past the hourly
+        tier's retention) keep that tier's points.
+
+        Args:
+            market_id: Market ID
+            hours: Window length
+            limit: Maximum snapshots
+            resolution: Downsample to this many seconds per point (60,
+                3600 or 86400); ``None`` picks automatically
+        """
         since = datetime.now() - timedelta(hours=hours)
+        if resolution is None:
+            with self._get_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT * FROM market_snapshots
+                    WHERE market_id = ? AND timestamp >= ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """, (market_id, since.isoformat(), limit))
+                snapshots = [MarketSnapshot.from_dict(dict(row)) for row in cursor.fetchall()]
+            if len(snapshots) < limit:
+                before = snapshots[-1].timestamp.timestamp() if snapshots else None
+                rollups = self._snapshot_rollups(market_id, since.timestamp(), before, limit - len(snapshots))
+                return snapshots + [MarketSnapshot.from_dict(row) for row in rollups]
+            resolution = retention.pick_resolution(hours * 3600, limit)
+
+        rows = [(market_id, row) for row in self._raw_snapshot_aggregates(market_id, since)]
+        coarser = []
+        for tier, row in self._rollup_rows(market_id, since.timestamp()):
+            if tier <= resolution:
+                rows.append((market_id, row))
+            else:
+                coarser.append((tier, row))
+        points = [(resolution, row) for row in retention.compact(rows, resolution).values()] + coarser
+        points.sort(key=lambda point: point[1][-1], reverse=True)
+        return [
+            MarketSnapshot.from_dict(retention.row_dict(market_id, tier, row))
+            for tier, row in points[:limit]
+        ]
+
+    def get_snapshot_rollups(
+        self,
+        market_id: str,
+        resolution: int = 3600,
+        hours: int = 24 * 30,
+    ) -> List[Dict[str, Any]]:
+        """Get compacted snapshot aggregates of one tier, oldest first.
+
+        Each dict has the probability's ``open``/``close``/``low``/``high``,
+        the last ``volume_24h``/``liquidity``/``best_bid``/``best_ask``,
+        the mean ``spread``, ``samples`` and ``first_ts``/``last_ts``.
+        """
+        since = (datetime.now() - timedelta(hours=hours)).timestamp()
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM market_snapshots
-                WHERE market_id = ? AND timestamp >= ?
-                ORDER BY timestamp DESC
+            cursor = conn.execute(f"""
+                SELECT {", ".join(ROLLUP_COLUMNS)} FROM snapshot_rollups
+                WHERE market_id = ? AND resolution = ? AND last_ts >= ?
+                ORDER BY bucket
+            """, (market_id, resolution, since))
+            return [retention.row_dict(market_id, resolution, row) for row in cursor.fetchall()]
+
+    def _snapshot_rollups(
+        self,
+        market_id: str,
+        since: float,
+        before: Optional[float],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Aggregates of any tier between ``since`` and ``before``, newest first"""
+        with self._get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT resolution, {", ".join(ROLLUP_COLUMNS)} FROM snapshot_rollups
+                WHERE market_id = ? AND last_ts >= ? AND last_ts < ?
+                ORDER BY last_ts DESC
                 LIMIT ?
-            """, (market_id, since.isoformat(), limit))
-            return [MarketSnapshot.from_dict(dict(row)) for row in cursor.fetchall()]
+            """, (market_id, since, before if before is not None else float("inf"), limit))
+            return [retention.row_dict(market_id, row[0], row[1:]) for row in cursor.fetchall()]
+
+    def _rollup_rows(self, market_id: str, since: float) -> List[Tuple[int, tuple]]:
+        """``(resolution, aggregate)`` for every tier since ``since``"""
+        with self._get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT resolution, {", ".join(ROLLUP_COLUMNS)} FROM snapshot_rollups
+                WHERE market_id = ? AND last_ts >= ?
+            """, (market_id, since))
+            return [(row[0], tuple(row[1:])) for row in cursor.fetchall()]
+
+    # Raw snapshot columns in ``retention.from_snapshot`` argument order
+    _SNAPSHOT_AGGREGATE_COLUMNS = (
+        "COALESCE(market_slug, ''), COALESCE(title, ''), probability, "
+        "COALESCE(volume_24h, 0), COALESCE(liquidity, 0), COALESCE(best_bid, 0), "
+        "COALESCE(best_ask, 0), COALESCE(spread, 0)"
+    )
+
+    def _raw_snapshot_aggregates(self, market_id: str, since: datetime) -> List[tuple]:
+        with self._get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT timestamp, {self._SNAPSHOT_AGGREGATE_COLUMNS}
+                FROM market_snapshots
+                WHERE market_id = ? AND timestamp >= ?
+            """, (market_id, since.isoformat()))
+            return [
+                retention.from_snapshot(epoch, *row[1:])
+                for row in cursor.fetchall()
+                if (epoch := to_epoch(row[0])) is not None
+            ]
+
+    def get_market_price_points(
+        self,
+        market_ids: List[str],
+        hours: int = 24,
+    ) -> List[Tuple[str, str, float]]:
+        """Get (market_id, timestamp, probability) rows for many markets at once.
+
+        Rows are ordered by market then time. Used by batch analytics that
+        would otherwise call ``get_market_history`` once per market. Parts
+        of the window that have been compacted contribute one point per
+        aggregate (its close, at its last sample).
+        """
+        since = datetime.now() - timedelta(hours=hours)
+        ids = list(dict.fromkeys(str(market_id) for market_id in market_ids))
+        rows: List[Tuple[str, str, float]] = []
+        compacted = False
+        with self._get_connection() as conn:
+            # Stay well under SQLite's bound-parameter limit.
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor = conn.execute(f"""
+                    SELECT market_id, timestamp, probability FROM market_snapshots
+                    WHERE market_id IN ({placeholders}) AND timestamp >= ?
+                    ORDER BY market_id, timestamp
+                """, (*chunk, since.isoformat()))
+                rows.extend((row[0], row[1], row[2]) for row in cursor.fetchall())
+                cursor = conn.execute(f"""
+                    SELECT market_id, last_ts, close FROM snapshot_rollups
+                    WHERE market_id IN ({placeholders}) AND last_ts >= ?
+                """, (*chunk, since.timestamp()))
+                for market_id, last_ts, close in cursor.fetchall():
+                    rows.append((market_id, datetime.fromtimestamp(last_ts).isoformat(), close))
+                    compacted = True
+        if compacted:
+            rows.sort(key=lambda row: (row[0], row[1]))
+        return rows
+
+    def get_trade_points(
+        self,
+        market_ids: List[str],
+        hours: int = 24,
+    ) -> List[Tuple[str, str, str, str, float, float]]:
+        """Get (market_id, timestamp, side, outcome, price, notional) trade rows.
+
+        Rows are ordered by market then time. Like ``get_market_price_points``
+        this reads raw columns only, for analytics that bucket many markets.
+        """
+        since = datetime.now() - timedelta(hours=hours)
+        ids = list(dict.fromkeys(str(market_id) for market_id in market_ids))
+        rows: List[Tuple[str, str, str, str, float, float]] = []
+        with self._get_connection() as conn:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor = conn.execute(f"""
+                    SELECT market_id, timestamp, side, outcome, price, notional FROM trades
+                    WHERE market_id IN ({placeholders}) AND timestamp >= ?
+                    ORDER BY market_id, timestamp
+                """, (*chunk, since.isoformat()))
+                rows.extend(tuple(row) for row in cursor.fetchall())
+        return rows
+
+    def get_latest_trade_points(
+        self,
+        market_ids: List[str],
+        limit_per_market: int = 500,
+    ) -> List[Tuple[str, str, str, str, str, float]]:
+        """Get (market_id, timestamp, wallet_address, side, outcome, notional) rows.
+
+        Returns the newest ``limit_per_market`` trades of every market, the
+        rows ``get_trades_by_market`` would return for each one, ordered by
+        market then time (oldest first).
+        """
+        ids = list(dict.fromkeys(str(market_id) for market_id in market_ids))
+        rows: List[Tuple[str, str, str, str, str, float]] = []
+        with self._get_connection() as conn:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor = conn.execute(f"""
+                    SELECT market_id, timestamp, wallet_address, side, outcome, notional FROM (
+                        SELECT market_id, timestamp, wallet_address, side, outcome, notional,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY market_id ORDER BY timestamp DESC
+                            ) AS market_rank
+                        FROM trades
+                        WHERE market_id IN ({placeholders})
+                    )
+                    WHERE market_rank <= ?
+                    ORDER BY market_id, timestamp
+                """, (*chunk, limit_per_market))
+                rows.extend(tuple(row) for row in cursor.fetchall())
+        return rows
 
     def get_latest_snapshot(self, market_id: str) -> Optional[MarketSnapshot]:
         """Get the latest snapshot for a market"""
@@ -1110,7 +1753,9 @@ class Database:
             row = cursor.fetchone()
             if row:
                 return MarketSnapshot.from_dict(dict(row))
-            return None
+        # Every raw snapshot has been compacted; fall back to the newest aggregate
+        rollups = self._snapshot_rollups(market_id, float("-inf"), None, 1)
+        return MarketSnapshot.from_dict(rollups[0]) if rollups else None
 
     def get_recent_snapshots(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent market snapshots across all markets."""
@@ -1123,6 +1768,101 @@ class Database:
             """, (limit,))
             return [dict(row) for row in cursor.fetchall()]
 
+    # Snapshot retention
+
+    # Merge a batch aggregate into a stored one; see ``retention.merge``
+    _MERGE_ROLLUP_SQL = f"""
+        INSERT INTO snapshot_rollups (market_id, resolution, {", ".join(ROLLUP_COLUMNS)})
+        VALUES ({", ".join("?" * (len(ROLLUP_COLUMNS) + 2))})
+        ON CONFLICT(market_id, resolution, bucket) DO UPDATE SET
+            open = CASE WHEN excluded.first_ts < snapshot_rollups.first_ts
+                        THEN excluded.open ELSE snapshot_rollups.open END,
+            low = MIN(snapshot_rollups.low, excluded.low),
+            high = MAX(snapshot_rollups.high, excluded.high),
+            spread = (snapshot_rollups.spread * snapshot_rollups.samples
+                      + excluded.spread * excluded.samples)
+                     / (snapshot_rollups.samples + excluded.samples),
+            samples = snapshot_rollups.samples + excluded.samples,
+            first_ts = MIN(snapshot_rollups.first_ts, excluded.first_ts),
+            last_ts = MAX(snapshot_rollups.last_ts, excluded.last_ts),
+            {", ".join(
+                f"{column} = CASE WHEN excluded.last_ts >= snapshot_rollups.last_ts "
+                f"THEN excluded.{column} ELSE snapshot_rollups.{column} END"
+                for column in ("market_slug", "title", "close", "volume_24h", "liquidity", "best_bid", "best_ask")
+            )}
+    """
+
+    def _store_rollups(self, conn: sqlite3.Connection, resolution: int, merged: Dict[Tuple[str, int], tuple]) -> None:
+        conn.executemany(self._MERGE_ROLLUP_SQL, [
+            (market_id, resolution, *row) for (market_id, _), row in merged.items()
+        ])
+
+    def compact_snapshots(
+        self,
+        policy: RetentionPolicy = DEFAULT_RETENTION,
+        now: Optional[datetime] = None,
+        batch_size: int = COMPACT_BATCH_SIZE,
+    ) -> Dict[str, int]:
+        """Move aged snapshots down the retention tiers.
+
+        Raw snapshots older than ``policy.raw_days`` become 1-minute
+        aggregates, those older than ``minute_days`` hourly and those older
+        than ``hourly_days`` daily; daily aggregates older than
+        ``daily_days`` are deleted. Work is done ``batch_size`` rows per
+        transaction, so other connections are never blocked for long.
+
+        Returns:
+            Rows moved out of each tier: ``raw``, ``minute``, ``hourly``
+            and ``daily`` (deleted)
+        """
+        cutoffs = policy.cutoffs(now or datetime.now())
+        moved = {"raw": 0, "minute": 0, "hourly": 0, "daily": 0}
+
+        while True:
+            with self._get_connection() as conn:
+                rows = conn.execute(f"""
+                    SELECT id, market_id, timestamp, {self._SNAPSHOT_AGGREGATE_COLUMNS}
+                    FROM market_snapshots
+                    WHERE timestamp < ?
+                    LIMIT ?
+                """, (cutoffs[0].isoformat(), batch_size)).fetchall()
+                if not rows:
+                    break
+                aggregates = [
+                    (row[1], retention.from_snapshot(epoch, *row[3:]))
+                    for row in rows
+                    if (epoch := to_epoch(row[2])) is not None
+                ]
+                self._store_rollups(conn, 60, retention.compact(aggregates, 60))
+                conn.executemany("DELETE FROM market_snapshots WHERE id = ?", [(row[0],) for row in rows])
+            moved["raw"] += len(rows)
+
+        for name, source, target in (("minute", 60, 3600), ("hourly", 3600, 86400)):
+            cutoff = cutoffs[source].timestamp()
+            while True:
+                with self._get_connection() as conn:
+                    rows = conn.execute(f"""
+                        SELECT market_id, {", ".join(ROLLUP_COLUMNS)} FROM snapshot_rollups
+                        WHERE resolution = ? AND last_ts < ?
+                        LIMIT ?
+                    """, (source, cutoff, batch_size)).fetchall()
+                    if not rows:
+                        break
+                    self._store_rollups(conn, target, retention.compact(((row[0], row[1:]) for row in rows), target))
+                    conn.executemany(
+                        "DELETE FROM snapshot_rollups WHERE market_id = ? AND resolution = ? AND bucket = ?",
+                        [(row[0], source, row[1]) for row in rows],
+                    )
+                moved[name] += len(rows)
+
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM snapshot_rollups WHERE resolution = 86400 AND last_ts < ?",
+                (cutoffs[86400].timestamp(),),
+            )
+            moved["daily"] = cursor.rowcount
+        return moved
+
     # Research brief operations
 
     def insert_research_brief(self, payload: Dict[str, Any]) -> int:
@@ -1363,34 +2103,44 @@ class Database:
         self.upsert_wallet(wallet)
 
     def _auto_cleanup(self):
-        """Run cleanup on startup if database has grown large"""
+        """Start cleanup in the background if database has grown large"""
         try:
             stats = self.get_database_stats()
             total_rows = sum(stats.values())
             # Only run cleanup if database has significant data (>10k rows)
             if total_rows > 10000:
-                deleted = self.cleanup_old_data(days=30)
-                if deleted > 0:
-                    import logging
-                    logging.getLogger(__name__).info(f"Auto-cleanup removed {deleted} old records")
+                threading.Thread(
+                    target=self._run_cleanup,
+                    name="polyterm-db-cleanup",
+                    daemon=True,
+                ).start()
         except Exception:
             pass  # Don't fail startup over cleanup
 
+    def _run_cleanup(self) -> None:
+        """Background body of ``_auto_cleanup``; compaction runs in batches"""
+        try:
+            deleted = self.cleanup_old_data(days=30)
+            if deleted > 0:
+                import logging
+                logging.getLogger(__name__).info(f"Auto-cleanup compacted or removed {deleted} old records")
+        except Exception:
+            pass  # Closed or locked database; retry on the next start
+
     def cleanup_old_data(self, days: int = 30) -> int:
-        """Clean up old data to prevent database bloat"""
+        """Clean up old data to prevent database bloat
+
+        Snapshots are compacted down the retention tiers rather than
+        deleted (see ``compact_snapshots``); ``days`` applies to closed
+        arbitrage records. Returns the number of raw snapshot, alert and
+        arbitrage rows removed.
+        """
         cutoff = datetime.now() - timedelta(days=days)
-        deleted = 0
+        deleted = self.compact_snapshots()["raw"]
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Clean old snapshots (keep more recent)
-            cursor.execute(
-                "DELETE FROM market_snapshots WHERE timestamp < ?",
-                (cutoff.isoformat(),)
-            )
-            deleted += cursor.rowcount
-
             # Clean old alerts (keep acknowledged ones for less time)
             ack_cutoff = datetime.now() - timedelta(days=7)
             cursor.execute(
@@ -0,0 +1,118 @@
+"""Tiered retention for market snapshots
+
+Raw ``market_snapshots`` rows are not deleted when they age out. They are
+compacted into coarser aggregates: per-minute after ``raw_days``, hourly
+after ``minute_days``, daily after ``hourly_days``, and dropped only once
+daily aggregates pass ``daily_days``. Each aggregate keeps the
+probability's open, close, low and high, the last volume, liquidity and
+book values, the mean spread and the number of snapshots merged into it.
+
+An aggregate row is a tuple in ``ROLLUP_COLUMNS`` order. A raw snapshot is
+a one-sample aggregate, so the same ``merge`` compacts raw rows into
+minutes and minutes into hours or days. The ``Database`` upsert applies the
+same rule when a batch lands on an existing aggregate.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Sequence, Tuple
+
+ROLLUP_COLUMNS = (
+    'bucket', 'market_slug', 'title',
+    'open', 'close', 'low', 'high',
+    'volume_24h', 'liquidity', 'best_bid', 'best_ask', 'spread',
+    'samples', 'first_ts', 'last_ts',
+)
+
+RollupRow = Tuple
+
+# Column positions used by ``merge``
+_OPEN, _LOW, _HIGH = 3, 5, 6
+_SPREAD, _SAMPLES, _FIRST_TS, _LAST_TS = 11, 12, 13, 14
+
+# Raw snapshots, then 1-minute, 1-hour and 1-day aggregates
+SNAPSHOT_RESOLUTIONS = (60, 3600, 86400)
+
+# Rows compacted per transaction, so readers and writers interleave
+COMPACT_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long each snapshot tier is kept before moving to the next"""
+
+    raw_days: float = 2
+    minute_days: float = 14
+    hourly_days: float = 180
+    daily_days: float = 730
+
+    def cutoffs(self, now: datetime) -> Dict[int, datetime]:
+        """Tier resolution (0 = raw) to the age at which its rows move on"""
+        return {
+            0: now - timedelta(days=self.raw_days),
+            60: now - timedelta(days=self.minute_days),
+            3600: now - timedelta(days=self.hourly_days),
+            86400: now - timedelta(days=self.daily_days),
+        }
+
+
+DEFAULT_RETENTION = RetentionPolicy()
+
+
+def from_snapshot(epoch: float, slug: str, title: str, probability: float, volume_24h: float,
+                  liquidity: float, best_bid: float, best_ask: float, spread: float) -> RollupRow:
+    """One raw snapshot as a one-sample aggregate"""
+    return (
+        int(epoch), slug, title,
+        probability, probability, probability, probability,
+        volume_24h, liquidity, best_bid, best_ask, spread,
+        1, epoch, epoch,
+    )
+
+
+def merge(a: Sequence, b: Sequence) -> RollupRow:
+    """Combine two aggregates of the same bucket (in either time order)"""
+    first = a if a[_FIRST_TS] <= b[_FIRST_TS] else b
+    newest = b if b[_LAST_TS] >= a[_LAST_TS] else a
+    samples = a[_SAMPLES] + b[_SAMPLES]
+    row = list(newest)
+    row[0] = a[0]
+    row[_OPEN] = first[_OPEN]
+    row[_LOW] = min(a[_LOW], b[_LOW])
+    row[_HIGH] = max(a[_HIGH], b[_HIGH])
+    row[_SPREAD] = (a[_SPREAD] * a[_SAMPLES] + b[_SPREAD] * b[_SAMPLES]) / samples
+    row[_SAMPLES] = samples
+    row[_FIRST_TS] = first[_FIRST_TS]
+    row[_LAST_TS] = max(a[_LAST_TS], b[_LAST_TS])
+    return tuple(row)
+
+
+def compact(rows: Iterable[Tuple[str, Sequence]], resolution: int) -> Dict[Tuple[str, int], RollupRow]:
+    """Fold ``(market_id, aggregate)`` pairs into ``resolution`` buckets"""
+    merged: Dict[Tuple[str, int], RollupRow] = {}
+    for market_id, row in rows:
+        bucket = int(row[_FIRST_TS] // resolution * resolution)
+        row = (bucket,) + tuple(row[1:])
+        key = (market_id, bucket)
+        existing = merged.get(key)
+        merged[key] = row if existing is None else merge(existing, row)
+    return merged
+
+
+def pick_resolution(window_seconds: float, limit: int) -> int:
+    """Finest aggregate tier that fits ``window_seconds`` into ``limit`` points"""
+    for resolution in SNAPSHOT_RESOLUTIONS:
+        if window_seconds / resolution <= limit:
+            return resolution
+    return SNAPSHOT_RESOLUTIONS[-1]
+
+
+def row_dict(market_id: str, resolution: int, row: Sequence) -> Dict[str, object]:
+    """Aggregate row as a dict, with ``timestamp`` at its last sample"""
+    data = dict(zip(ROLLUP_COLUMNS, row))
+    data['market_id'] = market_id
+    data['resolution'] = resolution
+    data['probability'] = data['close']
+    data['timestamp'] = datetime.fromtimestamp(data['last_ts']).isoformat()
+    return data
+
@@ -0,0 +1,595 @@
+"""Append-only journal of CLOB order book ticks
+
+Records the market-channel messages that ``LiveOrderBook.handle_message``
+consumes (``book``, ``price_change``, ``last_trade_price``,
+``tick_size_change``, ``market_resolved``) so order book history can be
+replayed locally.
+
+Layout of a journal directory:
+
+- ``strings.txt``: append-only string table, one asset id (or outcome
+  name) per line; a record refers to a string by its line number.
+- ``segment-NNNNNN.ticks``: a 16-byte header followed by fixed-width
+  32-byte records in ``RECORD`` layout. A writer always starts a new
+  segment and rolls over after ``segment_records`` records.
+- ``segment-NNNNNN.idx``: sparse time index, one ``(timestamp, record)``
+  entry every ``INDEX_EVERY`` records.
+
+A ``book`` message is one ``KIND_BOOK`` record holding its level count,
+followed by one ``KIND_BID``/``KIND_ASK`` record per level. A
+``price_change`` with several ``price_changes`` entries becomes one record
+per entry. Prices are stored as ``PRICE_TICK_SCALE`` integer ticks, so
+replayed price and size strings are canonical (``"0.5"`` for ``"0.50"``).
+
+Timestamps are receive times in epoch seconds, kept non-decreasing per
+writer so the index can be bisected. ``record`` only timestamps and
+enqueues; encoding and file writes happen on a background thread.
+Replay maps segments with ``mmap`` and decodes them with
+``struct.iter_unpack``.
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+# Same fixed-point scale as ``LiveOrderBook`` price levels
+PRICE_TICK_SCALE = 1_000_000
+
+MAGIC = b"PTTICK01"
+HEADER = struct.Struct("<8sII")  # magic, format version, record size
+FORMAT_VERSION = 1
+
+# timestamp, string id, kind, side, reserved, price ticks (or count), size
+RECORD = struct.Struct("<dIBBHqd")
+INDEX_ENTRY = struct.Struct("<dQ")  # timestamp, record number
+
+KIND_BOOK = 1
+KIND_BID = 2
+KIND_ASK = 3
+KIND_TRADE = 4
+KIND_PRICE_CHANGE = 5
+KIND_TICK_SIZE = 6
+KIND_RESOLVED = 7
+
+SIDES = {"": 0, "BUY": 1, "SELL": 2}
+SIDE_NAMES = {code: name for name, code in SIDES.items()}
+
+# Records between time index entries
+INDEX_EVERY = 1024
+
+# Records per segment file (64 MiB)
+SEGMENT_RECORDS = 2_000_000
+
+# Records unpacked per slice of a mapped segment
+READ_CHUNK_RECORDS = 65536
+
+# Seconds between writer flushes while messages keep arriving
+FLUSH_SECONDS = 0.5
+
+_STOP = object()
+
+
+def default_journal_dir() -> Path:
+    return Path.home() / ".polyterm" / "ticks"
+
+
+def _to_tick(price: Any) -> int:
+    return int(round(float(price) * PRICE_TICK_SCALE))
+
+
+def _tick_str(tick: int) -> str:
+    return f"{tick / PRICE_TICK_SCALE:.6f}".rstrip("0").rstrip(".") or "0"
+
+
+def _size_str(size: float) -> str:
+    text = repr(float(size))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _asset_of(message: Dict[str, Any]) -> str:
+    return str(message.get("asset_id") or message.get("market") or "")
+
+
+class TickJournal:
+    """Reader and background writer for one journal directory.
+
+    ``record`` may be called from any thread (typically the WS event
+    loop); the writer thread and its lock on ``writer.lock`` are set up on
+    first use. Replay works while a writer is running and sees everything
+    flushed so far.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        segment_records: int = SEGMENT_RECORDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path) if path else default_journal_dir()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_records = max(int(segment_records), 1)
+        self._clock = clock
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.messages_recorded = 0
+        self.records_written = 0
+        self.errors = 0
+        self.failed = False
+
+        # Writer-thread state
+        self._strings: Dict[str, int] = {}
+        self._strings_file = None
+        self._lock_file = None
+        self._segment_file = None
+        self._index_file = None
+        self._segment_number = 0
+        self._segment_count = 0
+        self._last_ts = 0.0
+
+    # -- Recording --
+
+    def record(self, message: Dict[str, Any], received_at: Optional[float] = None) -> None:
+        """Queue one decoded WS message for the writer thread.
+
+        The message is encoded later, so callers must not mutate it (hub
+        messages are already shared read-only). If the writer cannot start
+        (another process holds the journal, or its files cannot be
+        opened), journaling is disabled for this instance instead of
+        raising into the caller's message loop.
+        """
+        if not isinstance(message, dict) or self.failed:
+            return
+        if self._thread is None:
+            try:
+                self._start_writer()
+            except (RuntimeError, OSError) as exc:
+                self.failed = True
+                logger.warning("Tick journal disabled: %s", exc)
+                return
+        self._queue.put((self._clock() if received_at is None else received_at, message))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is on disk"""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush, stop the writer thread and release the writer lock"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "TickJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> "TickJournal":
+        """Start the writer now instead of on the first ``record``.
+
+        Raises:
+            RuntimeError: Another process is writing to this journal
+        """
+        self._start_writer()
+        return self
+
+    def _start_writer(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._open_writer()
+            self._thread = threading.Thread(target=self._run, name="tick-journal", daemon=True)
+            self._thread.start()
+
+    def _open_writer(self) -> None:
+        self._lock_file = open(self.path / "writer.lock", "a")
+        if HAS_FCNTL:
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                self._lock_file.close()
+                self._lock_file = None
+                raise RuntimeError(f"Tick journal {self.path} already has a writer")
+
+        for index, name in enumerate(self._read_strings()):
+            self._strings.setdefault(name, index)
+        self._strings_file = open(self.path / "strings.txt", "a", encoding="utf-8")
+        numbers = [number for number, _ in self._segment_paths()]
+        self._segment_number = max(numbers, default=0)
+        self._roll_segment()
+
+    def _roll_segment(self) -> None:
+        for handle in (self._segment_file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._segment_number += 1
+        stem = self.path / f"segment-{self._segment_number:06d}"
+        self._segment_file = open(stem.with_suffix(".ticks"), "wb")
+        self._segment_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size))
+        self._index_file = open(stem.with_suffix(".idx"), "wb")
+        self._segment_count = 0
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        dirty = False
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=FLUSH_SECONDS if dirty else None)
+                except queue.Empty:
+                    self._flush_files()
+                    last_flush, dirty = time.monotonic(), False
+                    continue
+                batch = []
+                while True:
+                    if item is _STOP or isinstance(item, threading.Event):
+                        break
+                    batch.append(item)
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        item = None
+                        break
+
+                if batch:
+                    self._write_batch(batch)
+                    dirty = True
+                if item is not None or time.monotonic() - last_flush >= FLUSH_SECONDS:
+                    self._flush_files()
+                    last_flush, dirty = time.monotonic(), False
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+        except OSError as exc:
+            # Disk full or similar: stop recording rather than queue forever
+            self.failed = True
+            logger.warning("Tick journal writer stopped: %s", exc)
+        finally:
+            try:
+                self._flush_files()
+            except OSError:
+                pass
+            for handle in (self._segment_file, self._index_file, self._strings_file, self._lock_file):
+                if handle is not None:
+                    handle.close()
+            self._segment_file = self._index_file = self._strings_file = self._lock_file = None
+            self._release_waiters()
+
+    def _release_waiters(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _flush_files(self) -> None:
+        # Strings first, so a flushed record never names a missing string
+        for handle in (self._strings_file, self._segment_file, self._index_file):
+            if handle is not None:
+                handle.flush()
+
+    def _string_id(self, value: str) -> int:
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[value] = string_id
+            self._strings_file.write(value.replace("\n", " ") + "\n")
+        return string_id
+
+    def _write_batch(self, batch: List[Tuple[float, Dict[str, Any]]]) -> None:
+        for received_at, message in batch:
+            try:
+                records = self._encode(max(received_at, self._last_ts), message)
+            except (TypeError, ValueError, AttributeError):
+                self.errors += 1
+                continue
+            if not records:
+                continue
+            self._last_ts = records[0][0]
+            # Keep a book's header and levels in one segment
+            if self._segment_count and self._segment_count + len(records) > self.segment_records:
+                self._roll_segment()
+            chunk = bytearray(RECORD.size * len(records))
+            for offset, values in enumerate(records):
+                RECORD.pack_into(chunk, offset * RECORD.size, *values)
+            self._index_records(records)
+            self._segment_file.write(chunk)
+            self._segment_count += len(records)
+            self.records_written += len(records)
+            self.messages_recorded += 1
+
+    def _index_records(self, records: List[Tuple]) -> None:
+        """Index the group's first record if the group reaches an index boundary"""
+        first = self._segment_count
+        last = first + len(records) - 1
+        if first // INDEX_EVERY != last // INDEX_EVERY or first % INDEX_EVERY == 0:
+            self._index_file.write(INDEX_ENTRY.pack(records[0][0], first))
+
+    def _encode(self, ts: float, message: Dict[str, Any]) -> List[Tuple]:
+        """Records for one message, or [] for message types that are not journaled"""
+        msg_type = message.get("type", message.get("event_type", ""))
+        asset = _asset_of(message)
+
+        if msg_type == "book":
+            levels = []
+            for kind, entries in ((KIND_BID, message.get("bids") or []), (KIND_ASK, message.get("asks") or [])):
+                for entry in entries:
+                    price = entry.get("price") if isinstance(entry, dict) else None
+                    if price in (None, ""):
+                        continue
+                    levels.append((ts, 0, kind, 0, 0, _to_tick(price), float(entry.get("size", 0) or 0)))
+            string_id = self._string_id(asset)
+            header = (ts, string_id, KIND_BOOK, 0, 0, len(levels), 0.0)
+            return [header] + [(ts, string_id) + level[2:] for level in levels]
+
+        if msg_type == "price_change":
+            changes = [c for c in message.get("price_changes") or [] if isinstance(c, dict)]
+            if not changes:
+                changes = [message]
+            records = []
+            for change in changes:
+                price = change.get("price", change.get("new_price"))
+                if price in (None, ""):
+                    continue
+                records.append((
+                    ts, self._string_id(_asset_of(change) or asset), KIND_PRICE_CHANGE,
+                    SIDES.get(str(change.get("side", "")).upper(), 0), 0,
+                    _to_tick(price), float(change.get("size", 0) or 0),
+                ))
+            return records
+
+        if msg_type == "last_trade_price":
+            price = message.get("price", message.get("last_trade_price"))
+            if price in (None, ""):
+                return []
+            return [(
+                ts, self._string_id(asset), KIND_TRADE,
+                SIDES.get(str(message.get("side", "")).upper(), 0), 0,
+                _to_tick(price), float(message.get("size", 0) or 0),
+            )]
+
+        if msg_type == "tick_size_change":
+            new_tick = message.get("new_tick_size", message.get("tick_size"))
+            if new_tick in (None, ""):
+                return []
+            return [(ts, self._string_id(asset), KIND_TICK_SIZE, 0, 0, 0, float(new_tick))]
+
+        if msg_type == "market_resolved":
+            outcome = self._string_id(str(message.get("outcome", "")))
+            try:
+                price = float(message.get("price", message.get("winning_price", 1.0)))
+            except (TypeError, ValueError):
+                price = 1.0
+            return [(ts, self._string_id(asset), KIND_RESOLVED, 0, 0, outcome, price)]
+
+        return []
+
+    # -- Reading --
+
+    def _read_strings(self) -> List[str]:
+        try:
+            with open(self.path / "strings.txt", "r", encoding="utf-8") as f:
+                return f.read().split("\n")[:-1]
+        except FileNotFoundError:
+            return []
+
+    def _segment_paths(self) -> List[Tuple[int, Path]]:
+        segments = []
+        for segment in self.path.glob("segment-*.ticks"):
+            try:
+                segments.append((int(segment.stem.split("-")[1]), segment))
+            except (IndexError, ValueError):
+                continue
+        return sorted(segments)
+
+    def segments(self) -> List[Dict[str, Any]]:
+        """Per segment: ``path``, ``records``, ``first_ts`` and ``last_ts``"""
+        info = []
+        for _, segment in self._segment_paths():
+            with _SegmentView(segment) as view:
+                info.append({
+                    "path": str(segment),
+                    "records": view.count,
+                    "first_ts": view.timestamp(0) if view.count else None,
+                    "last_ts": view.timestamp(view.count - 1) if view.count else None,
+                })
+        return info
+
+    def asset_ids(self) -> List[str]:
+        """Every asset id named by a recorded message (plus outcome names)"""
+        return self._read_strings()
+
+    def replay(
+        self,
+        asset_ids: Optional[Iterable[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Tuple[float, Dict[str, Any]]]:
+        """Yield ``(timestamp, message)`` in recorded order.
+
+        Messages are rebuilt in the WS shape ``LiveOrderBook.handle_message``
+        accepts, with ``asset_id`` and a millisecond ``timestamp``.
+
+        Args:
+            asset_ids: Only these assets; every asset when omitted
+            start: Earliest receive time (epoch seconds), inclusive
+            end: Latest receive time (epoch seconds), inclusive
+        """
+        strings = self._read_strings()
+        wanted = set(asset_ids) if asset_ids is not None else None
+
+        for _, segment in self._segment_paths():
+            with _SegmentView(segment) as view:
+                if not view.count:
+                    continue
+                if start is not None and view.timestamp(view.count - 1) < start:
+                    continue
+                if end is not None and view.timestamp(0) > end:
+                    break
+                first = view.seek(start) if start is not None else 0
+                for ts, message in _decode(view.records(first), strings, wanted, self._read_strings):
+                    if end is not None and ts > end:
+                        return
+                    if start is not None and ts < start:
+                        continue
+                    yield ts, message
+
+    def replay_into(
+        self,
+        books: Dict[str, Any],
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speed: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> int:
+        """Feed recorded messages to ``LiveOrderBook`` instances by asset id.
+
+        Args:
+            books: Asset id to book (anything with ``handle_message``)
+            start: Earliest receive time, inclusive
+            end: Latest receive time, inclusive
+            speed: Pace replay at ``speed`` times recorded time; as fast
+                as possible when omitted
+
+        Returns:
+            Number of messages replayed
+        """
+        replayed = 0
+        previous = None
+        for ts, message in self.replay(asset_ids=books.keys(), start=start, end=end):
+            if speed and previous is not None and ts > previous:
+                sleep((ts - previous) / speed)
+            previous = ts
+            books[message["asset_id"]].handle_message(message)
+            replayed += 1
+        return replayed
+
+
+class _SegmentView:
+    """Read-only ``mmap`` of one segment file"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = None
+        self.count = 0
+        self.index_path = path.with_suffix(".idx")
+        if size > HEADER.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, record_size = HEADER.unpack_from(self._map, 0)
+            if magic == MAGIC and record_size == RECORD.size:
+                # A torn trailing record from a crash is ignored
+                self.count = (size - HEADER.size) // RECORD.size
+
+    def __enter__(self) -> "_SegmentView":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def timestamp(self, record: int) -> float:
+        return struct.unpack_from("<d", self._map, HEADER.size + record * RECORD.size)[0]
+
+    def seek(self, start: float) -> int:
+        """First record number that can hold ``timestamp >= start``"""
+        try:
+            data = self.index_path.read_bytes()
+        except OSError:
+            return 0
+        entries = list(INDEX_ENTRY.iter_unpack(data[:len(data) // INDEX_ENTRY.size * INDEX_ENTRY.size]))
+        stamps = [ts for ts, _ in entries]
+        position = bisect.bisect_left(stamps, start) - 1
+        if position < 0:
+            return 0
+        return min(entries[position][1], self.count)
+
+    def records(self, first: int = 0) -> Iterator[Tuple]:
+        """Unpack records from ``first`` on, ``READ_CHUNK_RECORDS`` at a time"""
+        stop = HEADER.size + self.count * RECORD.size
+        step = READ_CHUNK_RECORDS * RECORD.size
+        for offset in range(HEADER.size + first * RECORD.size, stop, step):
+            yield from RECORD.iter_unpack(self._map[offset:min(offset + step, stop)])
+
+
+def _decode(
+    records: Iterator[Tuple],
+    strings: List[str],
+    wanted: Optional[set],
+    reload: Callable[[], List[str]],
+) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    """Rebuild WS messages from records"""
+
+    def name(string_id: int) -> str:
+        nonlocal strings
+        if string_id >= len(strings):
+            strings = reload()
+        return strings[string_id] if string_id < len(strings) else ""
+
+    for ts, string_id, kind, side, _, price, size in records:
+        if kind in (KIND_BID, KIND_ASK):
+            continue  # levels are consumed by their KIND_BOOK record
+        asset = name(string_id)
+        if kind == KIND_BOOK:
+            bids, asks = [], []
+            for _ in range(price):
+                try:
+                    level = next(records)
+                except StopIteration:
+                    return  # book cut short by a crash
+                (bids if level[2] == KIND_BID else asks).append(
+                    {"price": _tick_str(level[5]), "size": _size_str(level[6])}
+                )
+            if wanted is not None and asset not in wanted:
+                continue
+            message = {"event_type": "book", "asset_id": asset, "bids": bids, "asks": asks}
+        elif wanted is not None and asset not in wanted:
+            continue
+        elif kind == KIND_PRICE_CHANGE:
+            message = {
+                "event_type": "price_change", "asset_id": asset,
+                "price": _tick_str(price), "size": _size_str(size), "side": SIDE_NAMES.get(side, ""),
+            }
+        elif kind == KIND_TRADE:
+            message = {
+                "event_type": "last_trade_price", "asset_id": asset,
+                "price": _tick_str(price), "size": _size_str(size), "side": SIDE_NAMES.get(side, ""),
+            }
+        elif kind == KIND_TICK_SIZE:
+            message = {"event_type": "tick_size_change", "asset_id": asset, "new_tick_size": _size_str(size)}
+        elif kind == KIND_RESOLVED:
+            message = {
+                "event_type": "market_resolved", "asset_id": asset,
+                "outcome": name(price), "price": _size_str(size),
+            }
+        else:
+            continue
+        message["timestamp"] = str(int(ts * 1000))
+        yield ts, message
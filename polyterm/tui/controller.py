@@ -5,6 +5,7 @@ from rich.console import Console
 from rich.prompt import Confirm
 from .logo import display_logo
 from .menu import MainMenu
+from .dispatch import close_app_context
 from ..utils.errors import handle_api_error
 from .screens import (
     monitor_screen,
@@ -294,6 +295,8 @@ class TUIController:
             # Handle Ctrl+C gracefully
             self.console.print("\n\n[yellow]Interrupted. Exiting...[/yellow]")
             self.running = False
+        finally:
+            close_app_context()
 
     def quit(self):
         """Exit TUI with farewell message"""
@@ -0,0 +1,192 @@
+"""In-process command dispatch for TUI screens
+
+Screens used to launch every action as ``python -m polyterm.cli.main ...``,
+paying interpreter start-up, imports, database initialisation and cold
+HTTP sessions on each menu hop. ``run_command`` instead invokes the lazily
+loaded Click command inside the TUI process against one shared
+``AppContext``: the loaded config, a pooled HTTP adapter that every API
+client a command builds mounts, and one already-initialised ``Database``
+that commands pick up through ``cli.context.shared_database``. Gamma
+clients also share the process-wide market catalog.
+
+Blocking live views (and anything run with ``--live``) still get their own
+process so their signal handlers, ``sys.exit`` calls and event loops stay
+contained.
+"""
+
+import contextlib
+import io
+import subprocess
+import sys
+from typing import List, Optional, Sequence
+
+import click
+
+from ..api.http_pool import disable_shared_pool, enable_shared_pool
+
+# Commands that own the terminal until interrupted
+ISOLATED_COMMANDS = frozenset({
+    "monitor",
+    "live-monitor",
+    "watch",
+    "watchdog",
+    "crypto15m",
+    "collect",
+    "agent",
+})
+ISOLATED_FLAGS = frozenset({"--live"})
+
+
+class AppContext:
+    """State shared by every command the TUI runs in-process"""
+
+    def __init__(self, config_path: Optional[str] = None, db_path: Optional[str] = None):
+        self._config_path = config_path
+        self._config = None
+        self._config_mtime: Optional[float] = None
+        self._db_path = db_path
+        self._database = None
+        enable_shared_pool()
+
+    def _load_mtime(self, config) -> Optional[float]:
+        try:
+            return config.config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    @property
+    def config(self):
+        """Loaded config, reloaded when the file changes (e.g. via Settings)"""
+        from ..utils.config import Config
+
+        if self._config is None:
+            self._config = Config(self._config_path)
+            self._config_mtime = self._load_mtime(self._config)
+        else:
+            mtime = self._load_mtime(self._config)
+            if mtime != self._config_mtime:
+                self._config = Config(self._config_path)
+                self._config_mtime = mtime
+        return self._config
+
+    @property
+    def database(self):
+        """Database shared by every command, opened on first use"""
+        from ..db.database import Database
+
+        if self._database is None:
+            self._database = Database(self._db_path)
+        return self._database
+
+    def obj(self) -> dict:
+        """Click ``ctx.obj`` for one command invocation"""
+        return {"config": self.config, "app": self}
+
+    def close(self) -> None:
+        if self._database is not None:
+            self._database.close_all()
+            self._database = None
+        disable_shared_pool()
+
+
+_app_context: Optional[AppContext] = None
+
+
+def get_app_context() -> AppContext:
+    """Return the TUI's shared context, creating it on first use."""
+    global _app_context
+    if _app_context is None:
+        _app_context = AppContext()
+    return _app_context
+
+
+def close_app_context() -> None:
+    """Release pooled resources held by the shared context."""
+    global _app_context
+    if _app_context is not None:
+        _app_context.close()
+        _app_context = None
+
+
+def should_isolate(args: Sequence[str]) -> bool:
+    """Whether ``args`` must run in a separate process."""
+    if not args:
+        return False
+    return args[0] in ISOLATED_COMMANDS or any(arg in ISOLATED_FLAGS for arg in args)
+
+
+def _run_subprocess(args: List[str], capture_output: bool, text: bool) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "polyterm.cli.main", *args],
+        capture_output=capture_output,
+        text=text,
+    )
+
+
+def _invoke(args: List[str]) -> int:
+    """Run the CLI group in-process and return an exit code."""
+    from ..cli.main import cli
+
+    try:
+        result = cli.main(
+            args=args,
+            prog_name="polyterm",
+            standalone_mode=False,
+            obj=get_app_context().obj(),
+        )
+        return result if isinstance(result, int) else 0
+    except click.exceptions.Abort as e:
+        if isinstance(e.__cause__, KeyboardInterrupt):
+            raise KeyboardInterrupt from e
+        click.echo("Aborted!", err=True)
+        return 1
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        click.echo(str(e.code), err=True)
+        return 1
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        # A crashing child process would print a traceback and exit 1.
+        click.echo(f"Error: {e}", err=True)
+        return 1
+
+
+def run_command(
+    args: Sequence[str],
+    capture_output: bool = False,
+    text: bool = False,
+) -> subprocess.CompletedProcess:
+    """Run a ``polyterm`` CLI command for a TUI screen.
+
+    Drop-in for ``subprocess.run([sys.executable, "-m", "polyterm.cli.main",
+    *args])``: returns a ``CompletedProcess`` with ``returncode`` and, when
+    ``capture_output`` is set, the command's stdout/stderr.
+
+    Args:
+        args: CLI arguments after ``polyterm`` (e.g. ``["hot", "--gainers"]``)
+        capture_output: Capture output instead of writing to the terminal
+        text: Return captured output as ``str`` rather than ``bytes``
+    """
+    args = [str(arg) for arg in args]
+    if should_isolate(args):
+        return _run_subprocess(args, capture_output, text)
+
+    if not capture_output:
+        return subprocess.CompletedProcess(args, _invoke(args))
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        returncode = _invoke(args)
+    out, err = stdout.getvalue(), stderr.getvalue()
+    if not text:
+        out, err = out.encode(), err.encode()
+    return subprocess.CompletedProcess(args, returncode, out, err)
@@ -1,10 +1,9 @@
 """TUI Screen for Alert Center"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_alertcenter_screen(console: Console):
@@ -33,16 +32,16 @@ def run_alertcenter_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "center"])
+        run_command(["center"])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "center", "--check"])
+        run_command(["center", "--check"])
 
     elif choice == "3":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "center", "--all"])
+        run_command(["center", "--all"])
 
     elif choice == "4":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "center", "--clear"])
+        run_command(["center", "--clear"])
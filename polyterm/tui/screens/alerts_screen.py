@@ -1,11 +1,10 @@
 """Alerts Screen - View and manage alerts"""
 
-import subprocess
-import sys
 from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.table import Table
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def alerts_screen(console: RichConsole):
@@ -52,7 +51,7 @@ def alerts_screen(console: RichConsole):
 
         console.print("[green]Fetching alerts...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "alerts", f"--limit={limit}"]
+        cmd = ["alerts", f"--limit={limit}"]
 
     elif choice == '2':
         # Unread only
@@ -66,7 +65,7 @@ def alerts_screen(console: RichConsole):
 
         console.print("[green]Fetching unread alerts...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "alerts", "--unread", f"--limit={limit}"]
+        cmd = ["alerts", "--unread", f"--limit={limit}"]
 
     elif choice == '3':
         # Filter by type
@@ -90,7 +89,7 @@ def alerts_screen(console: RichConsole):
 
         console.print(f"[green]Fetching {alert_type} alerts...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "alerts", f"--type={alert_type}", f"--limit={limit}"]
+        cmd = ["alerts", f"--type={alert_type}", f"--limit={limit}"]
 
     elif choice == '4':
         # Acknowledge alert
@@ -106,19 +105,19 @@ def alerts_screen(console: RichConsole):
             console.print("[red]Invalid alert ID[/red]")
             return
 
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "alerts", f"--ack={alert_id}"]
+        cmd = ["alerts", f"--ack={alert_id}"]
 
     elif choice == '5':
         # Test Telegram
         console.print("[green]Sending Telegram test notification...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "alerts", "--test-telegram"]
+        cmd = ["alerts", "--test-telegram"]
 
     elif choice == '6':
         # Test Discord
         console.print("[green]Sending Discord test notification...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "alerts", "--test-discord"]
+        cmd = ["alerts", "--test-discord"]
 
     elif choice == 'b':
         return
@@ -128,7 +127,7 @@ def alerts_screen(console: RichConsole):
         return
 
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled.[/yellow]")
     except Exception as e:
@@ -1,9 +1,8 @@
 """TUI Screen for Portfolio Analytics"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
+from ..dispatch import run_command
 
 
 def run_analyze_screen(console: Console):
@@ -17,4 +16,4 @@ def run_analyze_screen(console: Console):
     console.print("[dim]and recommendations for portfolio balance.[/dim]")
     console.print()
 
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "analyze"])
+    run_command(["analyze"])
@@ -1,11 +1,10 @@
 """Arbitrage Screen - Scan for arbitrage opportunities"""
 
-import subprocess
-import sys
 from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.table import Table
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def arbitrage_screen(console: RichConsole):
@@ -56,12 +55,12 @@ def arbitrage_screen(console: RichConsole):
     console.print()
 
     # Build and run command
-    cmd = [sys.executable, "-m", "polyterm.cli.main", "arbitrage", f"--min-spread={min_spread}", f"--limit={limit}"]
+    cmd = ["arbitrage", f"--min-spread={min_spread}", f"--limit={limit}"]
     if include_kalshi:
         cmd.append("--include-kalshi")
 
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Scan cancelled.[/yellow]")
     except Exception as e:
@@ -1,10 +1,9 @@
 """TUI Screen for Performance Attribution"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_attribution_screen(console: Console):
@@ -42,4 +41,4 @@ def run_attribution_screen(console: Console):
 
     period = period_map.get(choice, "month")
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "attribution", "--period", period])
+    run_command(["attribution", "--period", period])
@@ -1,10 +1,9 @@
 """TUI Screen for Strategy Backtesting"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_backtest_screen(console: Console):
@@ -35,12 +34,12 @@ def run_backtest_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "backtest", "-i"])
+        run_command(["backtest", "-i"])
     elif choice == "2":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "backtest", "-s", "momentum", "-p", "30d"])
+        run_command(["backtest", "-s", "momentum", "-p", "30d"])
     elif choice == "3":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "backtest", "-s", "mean-reversion", "-p", "30d"])
+        run_command(["backtest", "-s", "mean-reversion", "-p", "30d"])
     elif choice == "4":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "backtest", "-s", "whale-follow", "-p", "30d"])
+        run_command(["backtest", "-s", "whale-follow", "-p", "30d"])
     elif choice == "5":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "backtest", "-s", "contrarian", "-p", "30d"])
+        run_command(["backtest", "-s", "contrarian", "-p", "30d"])
@@ -1,11 +1,10 @@
 """Bookmarks TUI screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_bookmarks_screen(console: Console):
@@ -33,7 +32,7 @@ def run_bookmarks_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "bookmarks", "--list"]
+        cmd = ["bookmarks", "--list"]
     elif choice == "2":
         console.print()
         search = Prompt.ask("[cyan]Enter market name to bookmark[/cyan]")
@@ -41,16 +40,16 @@ def run_bookmarks_screen(console: Console):
             console.print("[yellow]No market specified.[/yellow]")
             Prompt.ask("[dim]Press Enter to return to menu[/dim]")
             return
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "bookmarks", "--add", search]
+        cmd = ["bookmarks", "--add", search]
     else:
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "bookmarks"]
+        cmd = ["bookmarks"]
 
     console.print()
     console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
     console.print()
 
     try:
-        subprocess.run(cmd, capture_output=False)
+        run_command(cmd)
     except Exception as e:
         handle_api_error(console, e, "bookmarks")
 
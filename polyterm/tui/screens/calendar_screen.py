@@ -1,11 +1,10 @@
 """Calendar Screen - View upcoming market resolutions"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_calendar_screen(console: Console):
@@ -28,6 +27,6 @@ def run_calendar_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "calendar", "--days", days])
+        run_command(["calendar", "--days", days])
     except Exception as e:
         handle_api_error(console, e, "calendar")
@@ -1,10 +1,9 @@
 """TUI Screen for Probability Calibration"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_calibrate_screen(console: Console):
@@ -34,13 +33,13 @@ def run_calibrate_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "calibrate", "--stats"])
+        run_command(["calibrate", "--stats"])
 
     elif choice == "2":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "calibrate", "--add"])
+        run_command(["calibrate", "--add"])
 
     elif choice == "3":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "calibrate", "--resolve"])
+        run_command(["calibrate", "--resolve"])
 
     elif choice == "4":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "calibrate", "--list"])
+        run_command(["calibrate", "--list"])
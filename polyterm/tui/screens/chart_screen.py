@@ -1,11 +1,10 @@
 """Chart Screen - View price history charts"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_chart_screen(console: Console):
@@ -44,11 +43,11 @@ def run_chart_screen(console: Console):
     console.print()
 
     # Build command
-    cmd = [sys.executable, "-m", "polyterm.cli.main", "chart", "-m", market, "-h", hours]
+    cmd = ["chart", "-m", market, "-h", hours]
     if view_type == "sparkline":
         cmd.append("--sparkline")
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except Exception as e:
         handle_api_error(console, e, "chart")
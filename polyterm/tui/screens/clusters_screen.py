@@ -1,10 +1,9 @@
 """Wallet Cluster Detection TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_clusters_screen(console: Console):
@@ -21,23 +20,26 @@ def run_clusters_screen(console: Console):
     console.print("[bold]Options:[/bold]")
     console.print("  [cyan]1[/cyan] - Detect clusters (default)")
     console.print("  [cyan]2[/cyan] - Custom minimum score")
+    console.print("  [cyan]3[/cyan] - Deep scan (30 days, 20k wallets)")
     console.print("  [cyan]b[/cyan] - Back to menu")
     console.print()
 
-    choice = Prompt.ask("[cyan]Choice[/cyan]", choices=["1", "2", "b"], default="1")
+    choice = Prompt.ask("[cyan]Choice[/cyan]", choices=["1", "2", "3", "b"], default="1")
 
     if choice == "b":
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "clusters"]
+        cmd = ["clusters"]
     elif choice == "2":
         score = Prompt.ask("[cyan]Min score (0-100)[/cyan]", default="60")
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "clusters", "--min-score", score]
+        cmd = ["clusters", "--min-score", score]
+    elif choice == "3":
+        cmd = ["clusters", "--hours", "720", "--wallets", "20000"]
 
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
@@ -1,10 +1,9 @@
 """Compare Screen - Compare markets side by side"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_compare_screen(console: Console):
@@ -22,6 +21,6 @@ def run_compare_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "compare", "-i"])
+        run_command(["compare", "-i"])
     except Exception as e:
         handle_api_error(console, e, "market comparison")
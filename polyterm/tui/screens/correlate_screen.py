@@ -1,10 +1,9 @@
 """TUI Screen for Market Correlation Finder"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_correlate_screen(console: Console):
@@ -24,6 +23,6 @@ def run_correlate_screen(console: Console):
         limit = Prompt.ask("[cyan]Number of results[/cyan]", default="10")
         console.print()
         try:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "correlate", "--market", search, "--limit", limit])
+            run_command(["correlate", "--market", search, "--limit", limit])
         except Exception:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "correlate", "--market", search])
+            run_command(["correlate", "--market", search])
@@ -1,10 +1,9 @@
 """15-Minute Crypto Markets TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_crypto15m_screen(console: Console):
@@ -35,17 +34,17 @@ def run_crypto15m_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "crypto15m"]
+        cmd = ["crypto15m"]
     elif choice == "2":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "crypto15m", "-c", "BTC"]
+        cmd = ["crypto15m", "-c", "BTC"]
     elif choice == "3":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "crypto15m", "-c", "ETH"]
+        cmd = ["crypto15m", "-c", "ETH"]
     elif choice == "4":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "crypto15m", "-c", "SOL"]
+        cmd = ["crypto15m", "-c", "SOL"]
     elif choice == "5":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "crypto15m", "-c", "XRP"]
+        cmd = ["crypto15m", "-c", "XRP"]
     elif choice == "6":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "crypto15m", "-i"]
+        cmd = ["crypto15m", "-i"]
 
     console.print()
     console.print("[dim]Launching 15M crypto monitor...[/dim]")
@@ -53,6 +52,6 @@ def run_crypto15m_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
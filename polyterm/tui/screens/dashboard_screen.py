@@ -1,20 +1,19 @@
 """Dashboard TUI screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_dashboard_screen(console: Console):
     """Quick dashboard overview screen"""
     console.clear()
 
-    cmd = [sys.executable, "-m", "polyterm.cli.main", "dashboard"]
+    cmd = ["dashboard"]
 
     try:
-        subprocess.run(cmd, capture_output=False)
+        run_command(cmd)
     except Exception as e:
         handle_api_error(console, e, "dashboard")
 
@@ -1,10 +1,9 @@
 """TUI Screen for Liquidity Depth Analyzer"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_depth_screen(console: Console):
@@ -24,6 +23,6 @@ def run_depth_screen(console: Console):
         size = Prompt.ask("[cyan]Trade size to analyze ($)[/cyan]", default="1000")
         console.print()
         try:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "depth", "--market", search, "--size", size])
+            run_command(["depth", "--market", search, "--size", size])
         except Exception:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "depth", "--market", search])
+            run_command(["depth", "--market", search])
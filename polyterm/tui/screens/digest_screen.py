@@ -1,10 +1,9 @@
 """TUI Screen for Digest Summary"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_digest_screen(console: Console):
@@ -40,4 +39,4 @@ def run_digest_screen(console: Console):
 
     period = period_map.get(choice, "today")
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "digest", "--period", period])
+    run_command(["digest", "--period", period])
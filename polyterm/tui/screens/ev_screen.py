@@ -1,10 +1,9 @@
 """TUI Screen for Expected Value Calculator"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_ev_screen(console: Console):
@@ -32,7 +31,7 @@ def run_ev_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "ev", "-i"])
+        run_command(["ev", "-i"])
 
     elif choice == "2":
         market = Prompt.ask("[cyan]Market name[/cyan]")
@@ -43,4 +42,4 @@ def run_ev_screen(console: Console):
         if not prob:
             return
 
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "ev", "-m", market, "-p", prob])
+        run_command(["ev", "-m", market, "-p", prob])
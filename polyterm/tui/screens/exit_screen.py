@@ -1,10 +1,9 @@
 """TUI Screen for Exit Strategy Planner"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_exit_screen(console: Console):
@@ -31,8 +30,8 @@ def run_exit_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "exit", "--interactive"])
+        run_command(["exit", "--interactive"])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "exit", "--list"])
+        run_command(["exit", "--list"])
@@ -4,9 +4,8 @@ from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.progress import Progress
 from ...utils.errors import handle_api_error
-import subprocess
-import sys
 import os
+from ..dispatch import run_command
 
 
 def export_screen(console: RichConsole):
@@ -46,7 +45,7 @@ def export_screen(console: RichConsole):
 
     # Build command
     cmd = [
-        sys.executable, "-m", "polyterm.cli.main", "export",
+        "export",
         "--market", market,
         "--format", format_choice,
         "--output", output_file,
@@ -54,7 +53,7 @@ def export_screen(console: RichConsole):
 
     # Launch export command with progress
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_command(cmd, capture_output=True, text=True)
 
         if result.returncode == 0:
             console.print(f"[green]Successfully exported![/green]")
@@ -1,10 +1,9 @@
 """Fees Screen - Calculate trading fees and slippage"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_fees_screen(console: Console):
@@ -18,6 +17,6 @@ def run_fees_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "fees", "-i"])
+        run_command(["fees", "-i"])
     except Exception as e:
         handle_api_error(console, e, "fee calculation")
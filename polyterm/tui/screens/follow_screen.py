@@ -1,11 +1,10 @@
 """Copy trading / wallet following TUI screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_follow_screen(console: Console):
@@ -36,7 +35,7 @@ def run_follow_screen(console: Console):
 
     if choice == "1":
         # List followed wallets
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "follow", "--list"]
+        cmd = ["follow", "--list"]
     elif choice == "2":
         # Follow a new wallet
         console.print()
@@ -50,7 +49,7 @@ def run_follow_screen(console: Console):
             console.print("[yellow]Invalid address.[/yellow]")
             Prompt.ask("[dim]Press Enter to return to menu[/dim]")
             return
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "follow", "--add", address]
+        cmd = ["follow", "--add", address]
     elif choice == "3":
         # Unfollow a wallet
         console.print()
@@ -59,10 +58,10 @@ def run_follow_screen(console: Console):
             console.print("[yellow]Invalid address.[/yellow]")
             Prompt.ask("[dim]Press Enter to return to menu[/dim]")
             return
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "follow", "--remove", address]
+        cmd = ["follow", "--remove", address]
     else:
         # Interactive mode
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "follow"]
+        cmd = ["follow"]
 
     console.print()
     console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
@@ -70,7 +69,7 @@ def run_follow_screen(console: Console):
 
     # Run command
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except Exception as e:
         handle_api_error(console, e, "followed wallets")
 
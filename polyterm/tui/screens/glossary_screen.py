@@ -1,11 +1,10 @@
 """Glossary Screen - Prediction market terminology"""
 
-import subprocess
-import sys
 from rich.console import Console as RichConsole
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def glossary_screen(console: RichConsole):
@@ -32,12 +31,12 @@ def glossary_screen(console: RichConsole):
     try:
         if choice == "1":
             # Show all terms
-            subprocess.run([sys.executable, "-m", "polyterm", "glossary"])
+            run_command(["glossary"])
         elif choice == "2":
             # Search for term
             search_term = Prompt.ask("[cyan]Enter search term[/cyan]")
             if search_term:
-                subprocess.run([sys.executable, "-m", "polyterm", "glossary", "--search", search_term])
+                run_command(["glossary", "--search", search_term])
         elif choice == "3":
             # Show categories first
             console.print()
@@ -46,7 +45,7 @@ def glossary_screen(console: RichConsole):
             console.print()
             category = Prompt.ask("[cyan]Enter category name[/cyan]")
             if category:
-                subprocess.run([sys.executable, "-m", "polyterm", "glossary", "--category", category])
+                run_command(["glossary", "--category", category])
 
     except Exception as e:
         handle_api_error(console, e, "glossary")
@@ -1,10 +1,9 @@
 """TUI Screen for Portfolio Health"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_health_screen(console: Console):
@@ -31,8 +30,8 @@ def run_health_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "health"])
+        run_command(["health"])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "health", "--detailed"])
+        run_command(["health", "--detailed"])
@@ -1,10 +1,9 @@
 """TUI Screen for Market History"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_history_screen(console: Console):
@@ -38,4 +37,4 @@ def run_history_screen(console: Console):
     period = period_map.get(period_choice, "week")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "history", market, "--period", period, "--chart"])
+    run_command(["history", market, "--period", period, "--chart"])
@@ -1,10 +1,9 @@
 """TUI Screen for Hot Markets"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_hot_screen(console: Console):
@@ -33,16 +32,16 @@ def run_hot_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "hot"])
+        run_command(["hot"])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "hot", "--gainers"])
+        run_command(["hot", "--gainers"])
 
     elif choice == "3":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "hot", "--losers"])
+        run_command(["hot", "--losers"])
 
     elif choice == "4":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "hot", "--volume"])
+        run_command(["hot", "--volume"])
@@ -1,10 +1,9 @@
 """TUI Screen for Trade Journal"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_journal_screen(console: Console):
@@ -33,20 +32,20 @@ def run_journal_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "journal", "--list"])
+        run_command(["journal", "--list"])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "journal", "--add"])
+        run_command(["journal", "--add"])
 
     elif choice == "3":
         query = Prompt.ask("[cyan]Search query[/cyan]", default="")
         if query:
             console.print()
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "journal", "--search", query])
+            run_command(["journal", "--search", query])
 
     elif choice == "4":
         tag = Prompt.ask("[cyan]Tag to filter[/cyan]", default="")
         if tag:
             console.print()
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "journal", "--tag", tag])
+            run_command(["journal", "--tag", tag])
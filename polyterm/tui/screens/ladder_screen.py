@@ -1,10 +1,9 @@
 """TUI Screen for Price Ladder"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_ladder_screen(console: Console):
@@ -37,4 +36,4 @@ def run_ladder_screen(console: Console):
     selected_side = side_map.get(side_choice, "both")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "ladder", market, "--side", selected_side])
+    run_command(["ladder", market, "--side", selected_side])
@@ -1,10 +1,9 @@
 """TUI Screen for Leaderboard"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_leaderboard_screen(console: Console):
@@ -35,7 +34,7 @@ def run_leaderboard_screen(console: Console):
     console.print()
 
     if choice == "5":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "leaderboard", "--me"])
+        run_command(["leaderboard", "--me"])
         return
 
     type_map = {
@@ -65,4 +64,4 @@ def run_leaderboard_screen(console: Console):
     period = period_map.get(period_choice, "7d")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "leaderboard", "-t", board_type, "-p", period])
+    run_command(["leaderboard", "-t", board_type, "-p", period])
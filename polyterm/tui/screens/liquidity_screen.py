@@ -1,10 +1,9 @@
 """TUI Screen for Liquidity Comparison"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_liquidity_screen(console: Console):
@@ -34,15 +33,15 @@ def run_liquidity_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "liquidity", "-s", "score"])
+        run_command(["liquidity", "-s", "score"])
 
     elif choice == "2":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "liquidity", "-s", "spread"])
+        run_command(["liquidity", "-s", "spread"])
 
     elif choice == "3":
         category = Prompt.ask("[cyan]Enter category[/cyan]")
         if category:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "liquidity", "-c", category])
+            run_command(["liquidity", "-c", category])
 
     elif choice == "4":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "liquidity", "-v", "10000", "-s", "score"])
+        run_command(["liquidity", "-v", "10000", "-s", "score"])
@@ -3,8 +3,7 @@
 from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.table import Table
-import subprocess
-import sys
+from ..dispatch import run_command
 
 
 # Category options with descriptions
@@ -150,7 +149,7 @@ def monitor_screen(console: RichConsole):
     
     # Build command
     cmd = [
-        sys.executable, "-m", "polyterm.cli.main", "monitor",
+        "monitor",
         "--limit", limit,
         "--refresh", refresh,
     ]
@@ -163,7 +162,7 @@ def monitor_screen(console: RichConsole):
     
     # Launch monitor command
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitor stopped[/yellow]")
 
@@ -1,10 +1,9 @@
 """My Wallet TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_mywallet_screen(console: Console):
@@ -35,23 +34,23 @@ def run_mywallet_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet", "--connect"]
+        cmd = ["mywallet", "--connect"]
     elif choice == "2":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet"]
+        cmd = ["mywallet"]
     elif choice == "3":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet", "-p"]
+        cmd = ["mywallet", "-p"]
     elif choice == "4":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet", "-h"]
+        cmd = ["mywallet", "-h"]
     elif choice == "5":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet", "--pnl"]
+        cmd = ["mywallet", "--pnl"]
     elif choice == "6":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet", "-i"]
+        cmd = ["mywallet", "-i"]
     elif choice == "7":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "mywallet", "--disconnect"]
+        cmd = ["mywallet", "--disconnect"]
 
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
@@ -1,10 +1,9 @@
 """NegRisk Arbitrage TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_negrisk_screen(console: Console):
@@ -30,14 +29,14 @@ def run_negrisk_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "negrisk"]
+        cmd = ["negrisk"]
     elif choice == "2":
         spread = Prompt.ask("[cyan]Min spread (e.g. 0.03)[/cyan]", default="0.02")
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "negrisk", "--min-spread", spread]
+        cmd = ["negrisk", "--min-spread", spread]
 
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
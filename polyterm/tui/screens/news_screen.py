@@ -1,10 +1,9 @@
 """News TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_news_screen(console: Console):
@@ -31,18 +30,18 @@ def run_news_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "news"]
+        cmd = ["news"]
     elif choice == "2":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "news", "--hours", "6"]
+        cmd = ["news", "--hours", "6"]
     elif choice == "3":
         market = Prompt.ask("[cyan]Market search term[/cyan]")
         if not market:
             return
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "news", "--market", market]
+        cmd = ["news", "--market", market]
 
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
@@ -1,10 +1,9 @@
 """TUI Screen for Market Notes"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_notes_screen(console: Console):
@@ -34,25 +33,25 @@ def run_notes_screen(console: Console):
     if choice == "1":
         # List all notes
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notes", "--list"])
+        run_command(["notes", "--list"])
 
     elif choice == "2":
         # Add note
         console.print()
         search = Prompt.ask("[cyan]Search for market[/cyan]", default="")
         if search:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notes", "--add", search])
+            run_command(["notes", "--add", search])
 
     elif choice == "3":
         # View note
         console.print()
         search = Prompt.ask("[cyan]Market ID or search term[/cyan]", default="")
         if search:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notes", "--view", search])
+            run_command(["notes", "--view", search])
 
     elif choice == "4":
         # Delete note
         console.print()
         market_id = Prompt.ask("[cyan]Market ID to delete note[/cyan]", default="")
         if market_id:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notes", "--delete", market_id])
+            run_command(["notes", "--delete", market_id])
@@ -1,10 +1,9 @@
 """TUI Screen for Notification Settings"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_notify_screen(console: Console):
@@ -36,29 +35,29 @@ def run_notify_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--status"])
+        run_command(["notify", "--status"])
 
     elif choice == "2":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--configure"])
+        run_command(["notify", "--configure"])
 
     elif choice == "3":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--test"])
+        run_command(["notify", "--test"])
 
     elif choice == "4":
         action = Prompt.ask("[cyan]Enable or disable?[/cyan]", choices=["enable", "disable"])
         if action == "enable":
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--enable", "desktop"])
+            run_command(["notify", "--enable", "desktop"])
         else:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--disable", "desktop"])
+            run_command(["notify", "--disable", "desktop"])
 
     elif choice == "5":
         action = Prompt.ask("[cyan]Enable or disable?[/cyan]", choices=["enable", "disable"])
         if action == "enable":
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--enable", "sound"])
+            run_command(["notify", "--enable", "sound"])
         else:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--disable", "sound"])
+            run_command(["notify", "--disable", "sound"])
 
     elif choice == "6":
         url = Prompt.ask("[cyan]Webhook URL[/cyan]")
         if url:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "notify", "--webhook", url])
+            run_command(["notify", "--webhook", url])
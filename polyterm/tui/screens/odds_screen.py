@@ -1,10 +1,9 @@
 """TUI Screen for Odds Converter"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_odds_screen(console: Console):
@@ -36,26 +35,26 @@ def run_odds_screen(console: Console):
         console.print()
         value = Prompt.ask("[cyan]Enter probability (e.g., 0.65 or 65%)[/cyan]")
         if value:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "odds", value])
+            run_command(["odds", value])
 
     elif choice == "2":
         console.print()
         value = Prompt.ask("[cyan]Enter decimal odds (e.g., 2.5)[/cyan]")
         if value:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "odds", value, "--from", "decimal"])
+            run_command(["odds", value, "--from", "decimal"])
 
     elif choice == "3":
         console.print()
         value = Prompt.ask("[cyan]Enter American odds (e.g., +150)[/cyan]")
         if value:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "odds", value, "--from", "american"])
+            run_command(["odds", value, "--from", "american"])
 
     elif choice == "4":
         console.print()
         market = Prompt.ask("[cyan]Enter market name[/cyan]")
         if market:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "odds", "--market", market])
+            run_command(["odds", "--market", market])
 
     elif choice == "5":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "odds", "-i"])
+        run_command(["odds", "-i"])
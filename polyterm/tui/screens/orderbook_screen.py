@@ -3,7 +3,6 @@
 import asyncio
 import os
 import select
-import subprocess
 import sys
 import termios
 import threading
@@ -24,6 +23,7 @@ from ...api.clob import CLOBClient
 from ...core.orderbook import OrderBookAnalyzer, LiveOrderBook
 from ...utils.config import Config
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 # ---------------------------------------------------------------------------
@@ -584,7 +584,7 @@ def _live_orderbook(console: RichConsole):
 
 
 def _static_orderbook(console: RichConsole):
-    """Run the original one-shot order book analysis via CLI subprocess."""
+    """Run the original one-shot order book analysis via the CLI command."""
     market_id = _select_market(console)
     if not market_id:
         return
@@ -634,14 +634,14 @@ def _static_orderbook(console: RichConsole):
     console.print()
 
     # Build and run command
-    cmd = [sys.executable, "-m", "polyterm.cli.main", "orderbook", market_id, f"--depth={depth}"]
+    cmd = ["orderbook", market_id, f"--depth={depth}"]
     if show_chart:
         cmd.append("--chart")
     if slippage:
         cmd.extend([f"--slippage={slippage}", f"--side={slippage_side}"])
 
     try:
-        subprocess.run(cmd, capture_output=False)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Analysis cancelled.[/yellow]")
     except Exception as e:
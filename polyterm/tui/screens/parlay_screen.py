@@ -1,11 +1,10 @@
 """Parlay calculator TUI screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_parlay_screen(console: Console):
@@ -38,7 +37,7 @@ def run_parlay_screen(console: Console):
 
     if choice == "1":
         # Interactive mode
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "parlay", "-i"]
+        cmd = ["parlay", "-i"]
     else:
         # Quick calculation
         console.print()
@@ -73,7 +72,7 @@ def run_parlay_screen(console: Console):
         except ValueError:
             amount = 100.0
 
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "parlay", "--markets", markets, "--amount", str(amount)]
+        cmd = ["parlay", "--markets", markets, "--amount", str(amount)]
 
     console.print()
     console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
@@ -81,7 +80,7 @@ def run_parlay_screen(console: Console):
 
     # Run command
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except Exception as e:
         handle_api_error(console, e, "parlay calculator")
 
@@ -1,10 +1,9 @@
 """TUI Screen for Pinned Markets"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_pin_screen(console: Console):
@@ -34,24 +33,24 @@ def run_pin_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "pin"])
+        run_command(["pin"])
 
     elif choice == "2":
         console.print()
         market = Prompt.ask("[cyan]Market to pin[/cyan]")
         if market:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "pin", market])
+            run_command(["pin", market])
 
     elif choice == "3":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "pin", "--refresh"])
+        run_command(["pin", "--refresh"])
 
     elif choice == "4":
         console.print()
         pin_id = Prompt.ask("[cyan]Pin ID to remove[/cyan]")
         if pin_id:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "pin", "--unpin", pin_id])
+            run_command(["pin", "--unpin", pin_id])
 
     elif choice == "5":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "pin", "--clear"])
+        run_command(["pin", "--clear"])
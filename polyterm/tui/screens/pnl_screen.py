@@ -1,10 +1,9 @@
 """TUI Screen for P&L Tracker"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_pnl_screen(console: Console):
@@ -36,4 +35,4 @@ def run_pnl_screen(console: Console):
     period = periods.get(choice, "month")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "pnl", "--period", period, "--detailed"])
+    run_command(["pnl", "--period", period, "--detailed"])
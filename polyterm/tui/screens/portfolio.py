@@ -2,8 +2,7 @@
 
 from rich.panel import Panel
 from rich.console import Console as RichConsole
-import subprocess
-import sys
+from ..dispatch import run_command
 
 
 def portfolio_screen(console: RichConsole):
@@ -28,14 +27,14 @@ def portfolio_screen(console: RichConsole):
     console.print()
     
     # Build command
-    cmd = [sys.executable, "-m", "polyterm.cli.main", "portfolio"]
+    cmd = ["portfolio"]
     
     if wallet:
         cmd.extend(["--wallet", wallet])
     
     # Launch portfolio command
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Portfolio view stopped[/yellow]")
 
@@ -1,10 +1,9 @@
 """TUI Screen for Position Tracking"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_position_screen(console: Console):
@@ -36,22 +35,22 @@ def run_position_screen(console: Console):
     if choice == "1":
         # List all positions
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "position", "--list"])
+        run_command(["position", "--list"])
 
     elif choice == "2":
         # Open positions
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "position", "--list", "--open"])
+        run_command(["position", "--list", "--open"])
 
     elif choice == "3":
         # Closed positions
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "position", "--list", "--closed"])
+        run_command(["position", "--list", "--closed"])
 
     elif choice == "4":
         # Add position interactively
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "position", "--interactive"])
+        run_command(["position", "--interactive"])
 
     elif choice == "5":
         # Close position
@@ -59,11 +58,11 @@ def run_position_screen(console: Console):
         pos_id = Prompt.ask("[cyan]Position ID to close[/cyan]", default="")
         if pos_id:
             try:
-                subprocess.run([sys.executable, "-m", "polyterm.cli.main", "position", "--close", pos_id])
+                run_command(["position", "--close", pos_id])
             except ValueError:
                 console.print("[red]Invalid position ID[/red]")
 
     elif choice == "6":
         # P&L summary
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "position", "--summary"])
+        run_command(["position", "--summary"])
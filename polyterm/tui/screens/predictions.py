@@ -1,12 +1,12 @@
 """Predictions Screen - Signal-based market predictions"""
 
-import subprocess
 from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.table import Table
 
 from .market_picker import pick_market, get_market_id, get_market_title
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def predictions_screen(console: RichConsole):
@@ -124,7 +124,7 @@ def predictions_screen(console: RichConsole):
 
     # Build and run command
     cmd = [
-        "polyterm", "predict",
+        "predict",
         f"--horizon={horizon}",
         f"--min-confidence={min_confidence}"
     ]
@@ -134,7 +134,7 @@ def predictions_screen(console: RichConsole):
         cmd.extend([f"--limit={limit}"])
 
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Prediction cancelled.[/yellow]")
     except Exception as e:
@@ -1,10 +1,9 @@
 """TUI Screen for Screener Presets"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_presets_screen(console: Console):
@@ -35,30 +34,30 @@ def run_presets_screen(console: Console):
     if choice == "1":
         # List presets
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "presets", "--list"])
+        run_command(["presets", "--list"])
 
     elif choice == "2":
         # Create preset interactively
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "presets", "--interactive"])
+        run_command(["presets", "--interactive"])
 
     elif choice == "3":
         # Run preset
         console.print()
         name = Prompt.ask("[cyan]Preset name to run[/cyan]", default="")
         if name:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "presets", "--run", name])
+            run_command(["presets", "--run", name])
 
     elif choice == "4":
         # View preset
         console.print()
         name = Prompt.ask("[cyan]Preset name to view[/cyan]", default="")
         if name:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "presets", "--view", name])
+            run_command(["presets", "--view", name])
 
     elif choice == "5":
         # Delete preset
         console.print()
         name = Prompt.ask("[cyan]Preset name to delete[/cyan]", default="")
         if name:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "presets", "--delete", name])
+            run_command(["presets", "--delete", name])
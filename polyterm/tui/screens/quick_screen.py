@@ -1,10 +1,9 @@
 """TUI Screen for Quick Actions"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_quick_screen(console: Console):
@@ -49,4 +48,4 @@ def run_quick_screen(console: Console):
     action = action_map.get(choice, "price")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "quick", action, market])
+    run_command(["quick", action, market])
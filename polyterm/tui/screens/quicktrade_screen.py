@@ -1,10 +1,9 @@
 """Quick Trade TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_quicktrade_screen(console: Console):
@@ -30,18 +29,18 @@ def run_quicktrade_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "quicktrade", "-i"]
+        cmd = ["quicktrade", "-i"]
     elif choice == "2":
         market = Prompt.ask("[cyan]Search for market[/cyan]")
         if not market:
             return
         side = Prompt.ask("[cyan]Side[/cyan]", choices=["yes", "no"], default="yes")
         amount = Prompt.ask("[cyan]Amount ($)[/cyan]", default="100")
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "quicktrade", "-m", market, "-s", side, "-a", amount]
+        cmd = ["quicktrade", "-m", market, "-s", side, "-a", amount]
 
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
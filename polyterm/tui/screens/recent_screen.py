@@ -1,10 +1,9 @@
 """Recent Screen - View recently viewed markets"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_recent_screen(console: Console):
@@ -19,6 +18,6 @@ def run_recent_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "recent"])
+        run_command(["recent"])
     except Exception as e:
         handle_api_error(console, e, "recent markets")
@@ -1,10 +1,9 @@
 """TUI Screen for Report Generation"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_report_screen(console: Console):
@@ -34,15 +33,15 @@ def run_report_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "report", "-t", "daily"])
+        run_command(["report", "-t", "daily"])
 
     elif choice == "2":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "report", "-t", "weekly"])
+        run_command(["report", "-t", "weekly"])
 
     elif choice == "3":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "report", "-t", "portfolio"])
+        run_command(["report", "-t", "portfolio"])
 
     elif choice == "4":
         market = Prompt.ask("[cyan]Enter market name[/cyan]")
         if market:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "report", "-t", "market", "-m", market])
+            run_command(["report", "-t", "market", "-m", market])
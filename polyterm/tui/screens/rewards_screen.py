@@ -1,10 +1,9 @@
 """Rewards TUI Screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_rewards_screen(console: Console):
@@ -30,13 +29,13 @@ def run_rewards_screen(console: Console):
         return
 
     if choice == "1":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "rewards"]
+        cmd = ["rewards"]
     elif choice == "2":
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "rewards", "--format", "json"]
+        cmd = ["rewards", "--format", "json"]
 
     console.print()
 
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Returned to menu[/yellow]")
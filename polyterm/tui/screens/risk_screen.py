@@ -1,11 +1,10 @@
 """Risk assessment TUI screen"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_risk_screen(console: Console):
@@ -38,7 +37,7 @@ def run_risk_screen(console: Console):
         return
 
     # Build command
-    cmd = [sys.executable, "-m", "polyterm.cli.main", "risk", "--market", market]
+    cmd = ["risk", "--market", market]
 
     console.print()
     console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
@@ -46,7 +45,7 @@ def run_risk_screen(console: Console):
 
     # Run command
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except Exception as e:
         handle_api_error(console, e, "risk assessment")
 
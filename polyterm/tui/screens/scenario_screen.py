@@ -1,10 +1,9 @@
 """TUI Screen for Scenario Analysis"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_scenario_screen(console: Console):
@@ -31,10 +30,10 @@ def run_scenario_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "scenario", "--portfolio"])
+        run_command(["scenario", "--portfolio"])
 
     elif choice == "2":
         console.print()
         market = Prompt.ask("[cyan]Enter market name[/cyan]")
         if market:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "scenario", "--market", market])
+            run_command(["scenario", "--market", market])
@@ -1,10 +1,9 @@
 """TUI Screen for Market Screener"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_screener_screen(console: Console):
@@ -34,10 +33,10 @@ def run_screener_screen(console: Console):
     console.print()
 
     if choice == "1":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "screener", "-i"])
+        run_command(["screener", "-i"])
     elif choice == "2":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "screener", "-v", "10000", "-s", "volume"])
+        run_command(["screener", "-v", "10000", "-s", "volume"])
     elif choice == "3":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "screener", "--min-change", "5", "-s", "change"])
+        run_command(["screener", "--min-change", "5", "-s", "change"])
     elif choice == "4":
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "screener", "--ending-within", "7", "-s", "end_date"])
+        run_command(["screener", "--ending-within", "7", "-s", "end_date"])
@@ -1,10 +1,9 @@
 """Search Screen - Advanced market search with filters"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_search_screen(console: Console):
@@ -18,6 +17,6 @@ def run_search_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "search", "-i"])
+        run_command(["search", "-i"])
     except Exception as e:
         handle_api_error(console, e, "search")
@@ -1,10 +1,9 @@
 """TUI Screen for Market Sentiment Analysis"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_sentiment_screen(console: Console):
@@ -21,4 +20,4 @@ def run_sentiment_screen(console: Console):
 
     if search:
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "sentiment", "--market", search])
+        run_command(["sentiment", "--market", search])
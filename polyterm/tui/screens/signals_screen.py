@@ -1,10 +1,9 @@
 """TUI Screen for Market Signals"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_signals_screen(console: Console):
@@ -35,16 +34,16 @@ def run_signals_screen(console: Console):
         console.print()
         market = Prompt.ask("[cyan]Market to analyze[/cyan]")
         if market:
-            subprocess.run([sys.executable, "-m", "polyterm.cli.main", "signals", "--market", market])
+            run_command(["signals", "--market", market])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "signals", "--scan", "--type", "entry"])
+        run_command(["signals", "--scan", "--type", "entry"])
 
     elif choice == "3":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "signals", "--scan", "--type", "exit"])
+        run_command(["signals", "--scan", "--type", "exit"])
 
     elif choice == "4":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "signals", "--scan"])
+        run_command(["signals", "--scan"])
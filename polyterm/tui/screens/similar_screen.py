@@ -1,10 +1,9 @@
 """TUI Screen for Similar Markets"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_similar_screen(console: Console):
@@ -37,4 +36,4 @@ def run_similar_screen(console: Console):
     selected_type = type_map.get(match_type, "all")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "similar", market, "--type", selected_type])
+    run_command(["similar", market, "--type", selected_type])
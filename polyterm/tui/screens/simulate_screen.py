@@ -1,10 +1,9 @@
 """Simulate Screen - Position P&L calculator"""
 
-import subprocess
-import sys
 from rich.console import Console as RichConsole
 from rich.panel import Panel
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def simulate_screen(console: RichConsole):
@@ -32,7 +31,7 @@ def simulate_screen(console: RichConsole):
 
     # Run the simulate command in interactive mode
     try:
-        subprocess.run([sys.executable, "-m", "polyterm", "simulate", "-i"])
+        run_command(["simulate", "-i"])
     except Exception as e:
         handle_api_error(console, e, "simulation")
         console.print("[dim]Try running: polyterm simulate -i[/dim]")
@@ -1,10 +1,9 @@
 """Size Screen - Position size calculator"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_size_screen(console: Console):
@@ -23,6 +22,6 @@ def run_size_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "size", "-i"])
+        run_command(["size", "-i"])
     except Exception as e:
         handle_api_error(console, e, "position sizing")
@@ -1,10 +1,9 @@
 """TUI Screen for Spread Analysis"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_spread_screen(console: Console):
@@ -24,4 +23,4 @@ def run_spread_screen(console: Console):
     amount = Prompt.ask("[cyan]Trade amount (USD)[/cyan]", default="100")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "spread", market, "--amount", amount])
+    run_command(["spread", market, "--amount", amount])
@@ -1,11 +1,10 @@
 """Stats Screen - View detailed market statistics"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def run_stats_screen(console: Console):
@@ -32,6 +31,6 @@ def run_stats_screen(console: Console):
     console.print()
 
     try:
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "stats", "-m", market])
+        run_command(["stats", "-m", market])
     except Exception as e:
         handle_api_error(console, e, "statistics")
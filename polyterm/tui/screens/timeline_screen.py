@@ -1,10 +1,9 @@
 """TUI Screen for Event Timeline"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_timeline_screen(console: Console):
@@ -33,16 +32,16 @@ def run_timeline_screen(console: Console):
 
     if choice == "1":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "timeline", "--days", "7"])
+        run_command(["timeline", "--days", "7"])
 
     elif choice == "2":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "timeline", "--days", "30"])
+        run_command(["timeline", "--days", "30"])
 
     elif choice == "3":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "timeline", "--days", "90"])
+        run_command(["timeline", "--days", "90"])
 
     elif choice == "4":
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "timeline", "--bookmarked"])
+        run_command(["timeline", "--bookmarked"])
@@ -1,10 +1,9 @@
 """TUI Screen for Timing Analysis"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_timing_screen(console: Console):
@@ -21,4 +20,4 @@ def run_timing_screen(console: Console):
         return
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "timing", market])
+    run_command(["timing", market])
@@ -1,10 +1,9 @@
 """TUI Screen for Quick Trade Calculator"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_trade_screen(console: Console):
@@ -24,4 +23,4 @@ def run_trade_screen(console: Console):
         side = Prompt.ask("[cyan]Side[/cyan]", choices=["yes", "no"], default="yes")
         amount = Prompt.ask("[cyan]Trade amount ($)[/cyan]", default="100")
         console.print()
-        subprocess.run([sys.executable, "-m", "polyterm.cli.main", "trade", "--market", search, "--side", side, "--amount", amount])
+        run_command(["trade", "--market", search, "--side", side, "--amount", amount])
@@ -1,11 +1,10 @@
 """Tutorial Screen - Interactive tutorial for new users"""
 
-import subprocess
-import sys
 from rich.console import Console as RichConsole
 from rich.panel import Panel
 from rich.prompt import Confirm
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def tutorial_screen(console: RichConsole):
@@ -32,9 +31,8 @@ def tutorial_screen(console: RichConsole):
 
         # Run the tutorial command
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "polyterm", "tutorial"],
-                capture_output=False
+            result = run_command(
+                ["tutorial"]
             )
             if result.returncode != 0:
                 console.print()
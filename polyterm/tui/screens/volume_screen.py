@@ -1,10 +1,9 @@
 """TUI Screen for Volume Profile Analysis"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_volume_screen(console: Console):
@@ -23,4 +22,4 @@ def run_volume_screen(console: Console):
     levels = Prompt.ask("[cyan]Number of price levels[/cyan]", default="10")
 
     console.print()
-    subprocess.run([sys.executable, "-m", "polyterm.cli.main", "volume", "-m", market, "-l", levels])
+    run_command(["volume", "-m", market, "-l", levels])
@@ -1,11 +1,10 @@
 """Wallets Screen - Smart money and whale wallet tracking"""
 
-import subprocess
-import sys
 from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.table import Table
 from ...utils.errors import handle_api_error
+from ..dispatch import run_command
 
 
 def wallets_screen(console: RichConsole):
@@ -52,7 +51,7 @@ def wallets_screen(console: RichConsole):
 
         console.print("[green]Fetching whale wallets...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "wallets", "--type=whales", f"--limit={limit}"]
+        cmd = ["wallets", "--type=whales", f"--limit={limit}"]
 
     elif choice == '2':
         # Smart money
@@ -66,7 +65,7 @@ def wallets_screen(console: RichConsole):
 
         console.print("[green]Fetching smart money wallets...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "wallets", "--type=smart", f"--limit={limit}"]
+        cmd = ["wallets", "--type=smart", f"--limit={limit}"]
 
     elif choice == '3':
         # Suspicious
@@ -80,7 +79,7 @@ def wallets_screen(console: RichConsole):
 
         console.print("[green]Fetching suspicious wallets...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "wallets", "--type=suspicious", f"--limit={limit}"]
+        cmd = ["wallets", "--type=suspicious", f"--limit={limit}"]
 
     elif choice == '4':
         # Analyze specific wallet
@@ -93,7 +92,7 @@ def wallets_screen(console: RichConsole):
 
         console.print("[green]Analyzing wallet...[/green]")
         console.print()
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "wallets", f"--analyze={address}"]
+        cmd = ["wallets", f"--analyze={address}"]
 
     elif choice == '5':
         # Track wallet
@@ -104,7 +103,7 @@ def wallets_screen(console: RichConsole):
             console.print("[red]No address provided[/red]")
             return
 
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "wallets", f"--track={address}"]
+        cmd = ["wallets", f"--track={address}"]
 
     elif choice == '6':
         # Untrack wallet
@@ -115,7 +114,7 @@ def wallets_screen(console: RichConsole):
             console.print("[red]No address provided[/red]")
             return
 
-        cmd = [sys.executable, "-m", "polyterm.cli.main", "wallets", f"--untrack={address}"]
+        cmd = ["wallets", f"--untrack={address}"]
 
     elif choice == 'b':
         return
@@ -125,7 +124,7 @@ def wallets_screen(console: RichConsole):
         return
 
     try:
-        result = subprocess.run(cmd, capture_output=False)
+        result = run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled.[/yellow]")
     except Exception as e:
@@ -3,8 +3,7 @@
 from rich.panel import Panel
 from rich.console import Console as RichConsole
 from rich.table import Table
-import subprocess
-import sys
+from ..dispatch import run_command
 
 
 def watch_screen(console: RichConsole):
@@ -59,7 +58,7 @@ def watch_screen(console: RichConsole):
     
     # Build command
     cmd = [
-        sys.executable, "-m", "polyterm.cli.main", "watch",
+        "watch",
         "--market", market_id,
         "--threshold", threshold,
         "--interval", refresh,
@@ -67,7 +66,7 @@ def watch_screen(console: RichConsole):
     
     # Launch watch command
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Watch stopped[/yellow]")
 
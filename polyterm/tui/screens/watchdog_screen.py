@@ -1,10 +1,9 @@
 """TUI Screen for Watchdog Monitoring"""
 
-import subprocess
-import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from ..dispatch import run_command
 
 
 def run_watchdog_screen(console: Console):
@@ -34,7 +33,7 @@ def run_watchdog_screen(console: Console):
         default="4"
     )
 
-    args = [sys.executable, "-m", "polyterm.cli.main", "watchdog", "-m", market]
+    args = ["watchdog", "-m", market]
 
     if cond_choice == "1":
         threshold = Prompt.ask("[cyan]Alert when above (e.g., 0.70)[/cyan]")
@@ -52,4 +51,4 @@ def run_watchdog_screen(console: Console):
     console.print("[dim]Press Ctrl+C to stop monitoring[/dim]")
     console.print()
 
-    subprocess.run(args)
+    run_command(args)
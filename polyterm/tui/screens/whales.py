@@ -2,8 +2,7 @@
 
 from rich.panel import Panel
 from rich.console import Console as RichConsole
-import subprocess
-import sys
+from ..dispatch import run_command
 
 
 def whales_screen(console: RichConsole):
@@ -28,7 +27,7 @@ def whales_screen(console: RichConsole):
     
     # Build command
     cmd = [
-        sys.executable, "-m", "polyterm.cli.main", "whales",
+        "whales",
         "--min-amount", min_amount,
         "--hours", hours,
         "--limit", limit,
@@ -36,7 +35,7 @@ def whales_screen(console: RichConsole):
     
     # Launch whales command
     try:
-        subprocess.run(cmd)
+        run_command(cmd)
     except KeyboardInterrupt:
         console.print("\n[yellow]Whale tracking stopped[/yellow]")
 
@@ -0,0 +1,310 @@
+"""Inverted-index title matching
+
+One tokenizer and one index for every place that matches market titles
+against other titles or headlines (correlated-market arbitrage, Kalshi and
+cross-venue matching, news and the ``similar`` command).
+
+Titles are normalised to lowercase alphanumeric tokens with stopwords
+removed and stored in posting lists. A query only scores documents that
+share a token with it, and with a Jaccard threshold only the rarest query
+tokens need to be looked up (prefix filtering), so common words such as
+``trump`` or ``2026`` never fan a query out to thousands of titles. Token
+IDF weights are available for ranking, and an optional MinHash LSH mode
+trades exactness for constant-size candidate buckets.
+"""
+
+import math
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Words that carry no topical signal in market titles and headlines
+STOPWORDS = frozenset({
+    'a', 'about', 'after', 'all', 'an', 'and', 'any', 'are', 'as', 'at',
+    'be', 'been', 'before', 'being', 'but', 'by', 'can', 'do', 'does',
+    'for', 'from', 'has', 'have', 'if', 'in', 'into', 'is', 'it', 'its',
+    'no', 'not', 'of', 'on', 'or', 'so', 'than', 'that', 'the', 'their',
+    'there', 'this', 'to', 'was', 'were', 'what', 'when', 'which', 'who',
+    'will', 'with', 'yes',
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+def tokenize(
+    text: str,
+    stopwords: Iterable[str] = STOPWORDS,
+    min_length: int = 1,
+) -> Set[str]:
+    """Lowercase alphanumeric tokens of ``text`` minus stopwords.
+
+    Punctuation splits tokens, so ``"$100K?"`` and ``"100k"`` agree.
+    """
+    tokens = set(_TOKEN_RE.findall((text or "").lower()))
+    tokens.difference_update(stopwords)
+    if min_length > 1:
+        tokens = {token for token in tokens if len(token) >= min_length}
+    return tokens
+
+
+class MinHasher:
+    """MinHash signatures split into LSH bands
+
+    Shared by ``TitleIndex`` (title tokens) and the wallet cluster
+    detector (market sets). Items are hashed with ``crc32`` of their
+    string form, and coefficients come from a fixed seed so signatures
+    are stable across runs.
+
+    Args:
+        bands: Number of LSH bands
+        rows: Rows (hash functions) per band
+    """
+
+    def __init__(self, bands: int, rows: int):
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(bands * 1000 + rows)
+        num_perm = bands * rows
+        self._coef_a = [rng.randrange(1, _MINHASH_PRIME) for _ in range(num_perm)]
+        self._coef_b = [rng.randrange(0, _MINHASH_PRIME) for _ in range(num_perm)]
+        if HAS_NUMPY:
+            self._column_a = np.asarray(self._coef_a, dtype=np.uint64)[:, None]
+            self._column_b = np.asarray(self._coef_b, dtype=np.uint64)[:, None]
+
+    def signature(self, items: Iterable[Any]) -> List[int]:
+        """Minimum hash of ``items`` under each permutation."""
+        hashes = [zlib.crc32(str(item).encode()) for item in items]
+        if HAS_NUMPY:
+            values = np.asarray(hashes, dtype=np.uint64)[None, :]
+            return ((self._column_a * values + self._column_b) % _MINHASH_PRIME).min(axis=1).tolist()
+        return [
+            min((a * value + b) % _MINHASH_PRIME for value in hashes)
+            for a, b in zip(self._coef_a, self._coef_b)
+        ]
+
+    def band_keys(self, items: Iterable[Any]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """``(band, rows)`` bucket keys; items agreeing on one are LSH candidates."""
+        signature = self.signature(items)
+        rows = self.rows
+        return [
+            (band, tuple(signature[band * rows:(band + 1) * rows]))
+            for band in range(self.bands)
+        ]
+
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    """Jaccard similarity of two token sets (0.0 when either is empty)."""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+class TitleIndex:
+    """Inverted index over short texts for candidate generation and scoring
+
+    Args:
+        stopwords: Tokens dropped during normalisation
+        min_token_length: Shortest token kept
+        minhash_bands: Enable MinHash LSH with this many bands (0 = off)
+        minhash_rows: Rows (hash functions) per LSH band
+    """
+
+    def __init__(
+        self,
+        stopwords: Iterable[str] = STOPWORDS,
+        min_token_length: int = 1,
+        minhash_bands: int = 0,
+        minhash_rows: int = 4,
+    ):
+        self.stopwords = frozenset(stopwords)
+        self.min_token_length = min_token_length
+        self._tokens: Dict[Hashable, FrozenSet[str]] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._next_order = 0
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+
+        self.minhash_bands = minhash_bands
+        self.minhash_rows = minhash_rows
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[Hashable]] = defaultdict(set)
+        self._minhasher = MinHasher(minhash_bands, minhash_rows) if minhash_bands else None
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tokens
+
+    def tokenize(self, text: str) -> Set[str]:
+        """Normalise ``text`` with this index's stopwords and length limit."""
+        return tokenize(text, self.stopwords, self.min_token_length)
+
+    def add(self, key: Hashable, text: str) -> FrozenSet[str]:
+        """Index ``text`` under ``key`` (re-adding a key replaces it)."""
+        if key in self._tokens:
+            self.remove(key)
+        tokens = frozenset(self.tokenize(text))
+        self._tokens[key] = tokens
+        # Monotonic so keys added after a remove never share a position
+        self._order[key] = self._next_order
+        self._next_order += 1
+        for token in tokens:
+            self._postings[token].add(key)
+        if self.minhash_bands and tokens:
+            for band in self._bands(tokens):
+                self._buckets[band].add(key)
+        return tokens
+
+    def add_many(self, items: Iterable[Tuple[Hashable, str]]) -> None:
+        for key, text in items:
+            self.add(key, text)
+
+    def remove(self, key: Hashable) -> None:
+        tokens = self._tokens.pop(key, None)
+        if tokens is None:
+            return
+        self._order.pop(key, None)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._postings[token]
+        if self.minhash_bands and tokens:
+            for band in self._bands(tokens):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(key)
+
+    def tokens(self, key: Hashable) -> FrozenSet[str]:
+        return self._tokens.get(key, frozenset())
+
+    def document_frequency(self, token: str) -> int:
+        return len(self._postings.get(token, ()))
+
+    def idf(self, token: str) -> float:
+        """Smoothed inverse document frequency of ``token``."""
+        return math.log((len(self._tokens) + 1) / (self.document_frequency(token) + 1)) + 1.0
+
+    def weighted_similarity(self, left: Iterable[str], right: Iterable[str]) -> float:
+        """IDF-weighted Jaccard: rare shared tokens count for more."""
+        left, right = set(left), set(right)
+        union = left | right
+        if not left or not right:
+            return 0.0
+        total = sum(self.idf(token) for token in union)
+        return sum(self.idf(token) for token in left & right) / total if total else 0.0
+
+    def candidates(self, text: str, threshold: float = 0.0) -> Dict[Hashable, int]:
+        """Keys that could reach Jaccard ``threshold`` against ``text``.
+
+        With ``threshold`` 0 every key sharing a token is returned. Above
+        0, only the query's rarest ``q - ceil(threshold * q) + 1`` tokens
+        are looked up: a document reaching the threshold must contain at
+        least one of them. In MinHash mode candidates come from LSH
+        buckets instead and are approximate.
+
+        Returns:
+            ``{key: shared_token_count}`` (counts are over looked-up tokens)
+        """
+        query = self.tokenize(text)
+        if not query:
+            return {}
+        if self.minhash_bands:
+            found: Dict[Hashable, int] = {}
+            for band in self._bands(query):
+                for key in self._buckets.get(band, ()):
+                    found[key] = found.get(key, 0) + 1
+            return found
+        return self._posting_candidates(query, threshold)
+
+    def _posting_candidates(self, query: Set[str], threshold: float) -> Dict[Hashable, int]:
+        ordered = sorted(query, key=lambda token: (self.document_frequency(token), token))
+        if threshold > 0:
+            min_overlap = max(1, math.ceil(threshold * len(ordered) - 1e-9))
+            ordered = ordered[:len(ordered) - min_overlap + 1]
+        found: Dict[Hashable, int] = {}
+        for token in ordered:
+            for key in self._postings.get(token, ()):
+                found[key] = found.get(key, 0) + 1
+        return found
+
+    def search(
+        self,
+        text: str,
+        threshold: float = 0.0,
+        limit: Optional[int] = None,
+        weighted: bool = False,
+    ) -> List[Tuple[Hashable, float]]:
+        """Score candidates for ``text`` and return the best matches.
+
+        Args:
+            text: Query text
+            threshold: Minimum score; with plain Jaccard it also prunes
+                candidate generation
+            limit: Maximum results
+            weighted: Rank by IDF-weighted Jaccard instead of plain Jaccard
+
+        Returns:
+            ``(key, score)`` pairs, best first, ties in insertion order
+        """
+        query = self.tokenize(text)
+        if not query:
+            return []
+        if self.minhash_bands:
+            keys = self.candidates(text)
+        else:
+            keys = self._posting_candidates(query, 0.0 if weighted else threshold)
+
+        scored = []
+        for key in keys:
+            tokens = self._tokens[key]
+            score = self.weighted_similarity(query, tokens) if weighted else jaccard(query, tokens)
+            if score > 0 and score >= threshold:
+                scored.append((key, score))
+        scored.sort(key=lambda item: (-item[1], self._order[item[0]]))
+        return scored[:limit] if limit else scored
+
+    def similar_pairs(self, threshold: float) -> List[Tuple[Hashable, Hashable, float]]:
+        """All indexed pairs with Jaccard >= ``threshold`` (self-join).
+
+        Pairs are ``(earlier_key, later_key, score)`` by insertion order.
+        """
+        pairs = []
+        for key, tokens in self._tokens.items():
+            if not tokens:
+                continue
+            position = self._order[key]
+            for other in self._posting_candidates(set(tokens), threshold):
+                if self._order[other] <= position:
+                    continue
+                score = jaccard(tokens, self._tokens[other])
+                if score > 0 and score >= threshold:
+                    pairs.append((key, other, score))
+        pairs.sort(key=lambda pair: (self._order[pair[0]], self._order[pair[1]]))
+        return pairs
+
+    # -- MinHash --
+
+    def _bands(self, tokens: Iterable[str]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return self._minhasher.band_keys(tokens)
+
+
+def build_index(
+    items: Iterable[Tuple[Hashable, str]],
+    **kwargs: Any,
+) -> TitleIndex:
+    """Build a ``TitleIndex`` from ``(key, text)`` pairs."""
+    index = TitleIndex(**kwargs)
+    index.add_many(items)
+    return index
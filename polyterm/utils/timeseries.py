@@ -0,0 +1,96 @@
+"""Time-series alignment helpers
+
+As-of joins for ``(timestamp, value)`` series. Both sides are walked once
+with a merge cursor, so aligning two series costs O(n + m) instead of
+scanning the right-hand series for every left-hand point.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+DIRECTIONS = ("backward", "forward", "nearest")
+
+
+def _ordered(series: Iterable[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+    """Return the series sorted by key, skipping the sort when already ascending."""
+    points = list(series)
+    if any(points[i][0] > points[i + 1][0] for i in range(len(points) - 1)):
+        points.sort(key=lambda point: point[0])
+    return points
+
+
+def asof_join(
+    left: Iterable[Tuple[Any, Any]],
+    right: Iterable[Tuple[Any, Any]],
+    tolerance: Optional[Any] = None,
+    direction: str = "nearest",
+    inclusive: bool = True,
+) -> List[Tuple[Any, Any, Any]]:
+    """Match every left point with a right point by key.
+
+    Keys may be datetimes or numbers; ``tolerance`` must be of the matching
+    difference type (``timedelta`` or number). Inputs are sorted by key if
+    they are not already ascending.
+
+    Args:
+        left: ``(key, value)`` pairs to keep
+        right: ``(key, value)`` pairs to match against
+        tolerance: Maximum key distance; unlimited when None
+        direction: ``backward`` takes the last right key <= left key,
+            ``forward`` the first right key >= left key, ``nearest`` the
+            closer of the two (the earlier one on ties)
+        inclusive: Whether a match exactly ``tolerance`` away is kept
+
+    Returns:
+        ``(left_key, left_value, right_value)`` tuples in ascending key
+        order, for left points that found a match
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {', '.join(DIRECTIONS)}")
+
+    left_points = _ordered(left)
+    right_points = _ordered(right)
+    if not left_points or not right_points:
+        return []
+
+    joined = []
+    last = len(right_points) - 1
+    cursor = 0  # index of the first right key >= current left key
+
+    for key, value in left_points:
+        while cursor <= last and right_points[cursor][0] < key:
+            cursor += 1
+
+        before = right_points[cursor - 1] if cursor > 0 else None
+        if cursor <= last and right_points[cursor][0] == key:
+            before = right_points[cursor]
+        after = right_points[cursor] if cursor <= last else None
+
+        if direction == "backward":
+            match = before
+        elif direction == "forward":
+            match = after
+        elif before is None or after is None:
+            match = before or after
+        else:
+            match = before if key - before[0] <= after[0] - key else after
+
+        if match is None:
+            continue
+        if tolerance is not None:
+            distance = abs(key - match[0])
+            if distance > tolerance or (distance == tolerance and not inclusive):
+                continue
+        joined.append((key, value, match[1]))
+
+    return joined
+
+
+def align_values(
+    left: Sequence[Tuple[Any, Any]],
+    right: Sequence[Tuple[Any, Any]],
+    tolerance: Optional[Any] = None,
+    direction: str = "nearest",
+) -> Tuple[List[Any], List[Any]]:
+    """``asof_join`` returning just the two aligned value lists."""
+    joined = asof_join(left, right, tolerance=tolerance, direction=direction)
+    return [row[1] for row in joined], [row[2] for row in joined]
@@ -0,0 +1,51 @@
+"""Shared pytest configuration"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_market_catalog(monkeypatch):
+    """Keep tests off the user's shared Gamma market catalog and rate limits."""
+    monkeypatch.setenv("POLYTERM_MARKET_CATALOG", "0")
+    monkeypatch.setenv("POLYTERM_RATE_LIMITS", "0")
+
+
+class FakeSocket:
+    """Minimal market websocket: replays frames, then idles until closed.
+
+    A frame that is an exception instance is raised from ``recv`` instead
+    of returned; ``close_error`` makes ``close`` raise after closing.
+    """
+
+    def __init__(self, frames=(), close_error=None):
+        self.frames = list(frames)
+        self.sent = []
+        self.closed = False
+        self.close_error = close_error
+        self._closed_event = asyncio.Event()
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def recv(self):
+        if self.frames:
+            frame = self.frames.pop(0)
+            if isinstance(frame, BaseException):
+                raise frame
+            return frame
+        await self._closed_event.wait()
+        raise ConnectionError("closed")
+
+    async def close(self):
+        self.closed = True
+        self._closed_event.set()
+        if self.close_error is not None:
+            raise self.close_error
+
+
+@pytest.fixture
+def fake_socket():
+    """The ``FakeSocket`` class, for tests that drive ``MarketStreamHub``."""
+    return FakeSocket
@@ -0,0 +1,136 @@
+"""Server-scoped agent client registry and response cache tests."""
+
+import threading
+import time
+
+import pytest
+
+from polyterm.agent.mcp import clients
+from polyterm.agent.mcp.clients import ClientRegistry, ResponseCache, acquire, release
+from polyterm.agent.mcp.tools import live
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingGamma:
+    instances = 0
+
+    def __init__(self):
+        CountingGamma.instances += 1
+        self.calls = 0
+        self.closed = False
+
+    def get_trending_markets(self, limit):
+        self.calls += 1
+        return [{"id": str(i), "question": f"M{i}", "volume24hr": i} for i in range(limit)]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def registry():
+    clients.start_client_registry()
+    yield clients.get_client_registry()
+    clients.stop_client_registry()
+
+
+def test_cache_serves_fresh_entries_and_expires():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_fetch("k", fetch, ttl=5) == 1
+    assert cache.get_or_fetch("k", fetch, ttl=5) == 1
+    clock.now += 6
+    assert cache.get_or_fetch("k", fetch, ttl=5) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_errors_are_not_cached():
+    cache = ResponseCache()
+
+    def failing():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("k", failing, ttl=5)
+    assert cache.get_or_fetch("k", lambda: "ok", ttl=5) == "ok"
+
+
+def test_concurrent_identical_calls_share_one_fetch():
+    cache = ResponseCache()
+    started = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return "book"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("k", slow_fetch, ttl=5)))
+        for _ in range(8)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["book"] * 8
+    assert cache.stats()["coalesced"] == 7
+
+
+def test_cached_client_returns_isolated_copies():
+    registry = ClientRegistry(ttls={"CountingGamma": {"get_trending_markets": 30}})
+    try:
+        gamma = registry.get(CountingGamma)
+        first = gamma.get_trending_markets(limit=2)
+        first[0]["question"] = "mutated"
+        second = gamma.get_trending_markets(limit=2)
+
+        assert gamma.client.calls == 1
+        assert second[0]["question"] == "M0"
+        assert gamma.get_trending_markets(limit=3) and gamma.client.calls == 2
+    finally:
+        registry.close()
+
+
+def test_acquire_without_registry_builds_and_closes_a_client():
+    client = acquire(CountingGamma)
+    release(client)
+    assert isinstance(client, CountingGamma)
+    assert client.closed
+
+
+def test_tools_reuse_warm_clients_inside_a_server(registry, monkeypatch):
+    CountingGamma.instances = 0
+    monkeypatch.setitem(clients.CACHE_TTLS, "CountingGamma", {"get_trending_markets": 30})
+    monkeypatch.setattr(live, "GammaClient", CountingGamma)
+
+    first = live.top_markets(limit=2)
+    second = live.top_markets(limit=2)
+
+    assert first["data"]["markets"] == second["data"]["markets"]
+    assert CountingGamma.instances == 1
+    gamma = registry.get(CountingGamma)
+    assert gamma.client.calls == 1
+    assert not gamma.client.closed
+
+    clients.stop_client_registry()
+    assert gamma.client.closed
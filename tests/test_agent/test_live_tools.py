@@ -21,7 +21,9 @@ class FakeGamma:
 
 
 class FakeDataAPI:
-    def get_trades(self, limit):
+    def get_recent_trades(self, limit, offset=0, **kwargs):
+        if offset:
+            return []
         return [
             {
                 "proxyWallet": "0xabc",
@@ -130,6 +132,22 @@ def test_whale_trades_filters_by_notional(monkeypatch):
     assert payload["success"] is True
     assert len(payload["data"]["trades"]) == 1
     assert payload["data"]["trades"][0]["wallet"] == "0xabc"
+    assert "sample_capped_at_tape_depth" not in payload["data"]["quality_flags"]
+
+
+def test_whale_trades_flags_samples_past_the_tape_depth(monkeypatch):
+    api = FakeDataAPI()
+    offsets = []
+    fetch = api.get_recent_trades
+    api.get_recent_trades = lambda limit, offset=0, **kwargs: offsets.append(offset) or fetch(limit, offset, **kwargs)
+    monkeypatch.setattr(live, "DataAPIClient", lambda: api)
+    monkeypatch.setattr(live.time, "time", lambda: 2100)
+
+    payload = live.whale_trades(limit=5, hours=1, sample_size=10000)
+
+    assert max(offsets) <= 3000
+    assert payload["data"]["sample_size"] == 10000
+    assert "sample_capped_at_tape_depth" in payload["data"]["quality_flags"]
 
 
 def test_top_traders_calculates_closed_position_win_rate(monkeypatch):
@@ -168,3 +186,18 @@ def test_market_flips_detects_crossing_with_explicit_clob_window(monkeypatch):
     assert fake_clob.history_calls[0]["fidelity"] == 3600
     assert fake_clob.history_calls[0]["start_ts"] is not None
     assert fake_clob.history_calls[0]["end_ts"] is not None
+
+
+def test_market_flips_fans_out_and_reports_stage_timings(monkeypatch):
+    fake_clob = FakeFlipCLOB()
+    monkeypatch.setattr(flips, "GammaClient", lambda: FakeFlipGamma())
+    monkeypatch.setattr(flips, "CLOBClient", lambda: fake_clob)
+
+    payload = flips.market_flips(hours=72, limit=3, sample_size=10, max_workers=100)
+
+    assert payload["success"] is True
+    assert payload["data"]["skipped"]["no_50_percent_crossing"] == 1
+    assert sorted(call["token_id"] for call in fake_clob.history_calls) == ["token-a", "token-b"]
+    meta = payload["meta"]
+    assert meta["max_workers"] == flips.MAX_WORKERS_LIMIT
+    assert set(meta["timings_ms"]) == {"gamma_markets", "clob_fanout", "rank", "total"}
@@ -66,6 +66,9 @@ def test_all_schemas_returns_rich_schema_for_every_registered_tool():
     assert schemas["market.explain_move"]["input_schema"]["required"] == ["market"]
     assert schemas["market.compare"]["input_schema"]["properties"]["markets"] == {"type": "array", "items": {"type": "string"}}
     assert schemas["market.compare"]["output_schema"]["properties"]["data"]["properties"]["pairwise"]["type"] == "array"
+    pair_properties = schemas["market.compare"]["output_schema"]["properties"]["data"]["properties"]["pairwise"]["items"]["properties"]
+    assert pair_properties["aligned_points"] == {"type": "integer"}
+    assert pair_properties["history_correlation"] == {"type": ["number", "null"]}
     assert schemas["wallet.smart_money"]["input_schema"]["properties"]["min_win_rate"] == {"type": "number"}
     assert schemas["wallet.whale_trades"]["input_schema"]["properties"]["sample_size"] == {"type": "integer"}
     assert schemas["agent.answer"]["input_schema"]["required"] == ["query"]
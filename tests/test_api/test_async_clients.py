@@ -0,0 +1,182 @@
+"""Tests for the aiohttp-based async API clients"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from polyterm.api import async_clients
+from polyterm.api.async_clients import (
+    AsyncCLOBClient,
+    AsyncDataAPIClient,
+    AsyncGammaClient,
+    close_shared_session,
+    shared_session,
+)
+from polyterm.api.data_api import DataAPIClient
+from polyterm.api.gamma import GammaClient
+from polyterm.api.rate_limit import Budget, TokenBucketLimiter
+
+
+class FakeAPI:
+    """Local aiohttp app standing in for Gamma, CLOB and the Data API."""
+
+    def __init__(self):
+        self.requests = []
+        self.failures = {}
+        app = web.Application()
+        app.router.add_get("/markets/keyset", self.keyset)
+        app.router.add_get("/markets/{market_id}", self.market)
+        app.router.add_get("/book", self.book)
+        app.router.add_get("/trades", self.trades)
+        self.server = TestServer(app)
+
+    @property
+    def url(self):
+        return str(self.server.make_url("")).rstrip("/")
+
+    def _record(self, request):
+        self.requests.append((request.path, dict(request.query)))
+        remaining = self.failures.get(request.path, [])
+        if remaining:
+            return web.Response(status=remaining.pop(0), headers={"Retry-After": "0"})
+        return None
+
+    async def keyset(self, request):
+        failure = self._record(request)
+        if failure:
+            return failure
+        if request.query.get("after_cursor") == "page2":
+            return web.json_response({"markets": [{"id": "3"}], "next_cursor": None})
+        return web.json_response({"markets": [{"id": "1"}, {"id": "2"}], "next_cursor": "page2"})
+
+    async def market(self, request):
+        failure = self._record(request)
+        if failure:
+            return failure
+        await asyncio.sleep(0.05)
+        return web.json_response({"id": request.match_info["market_id"]})
+
+    async def book(self, request):
+        self._record(request)
+        levels = [{"price": str(p / 100), "size": "10"} for p in range(1, 30)]
+        return web.json_response({"bids": levels, "asks": levels})
+
+    async def trades(self, request):
+        self._record(request)
+        return web.json_response([{"transactionHash": "0x1", "market": request.query.get("market")}])
+
+
+@pytest_asyncio.fixture
+async def api():
+    fake = FakeAPI()
+    await fake.server.start_server()
+    yield fake
+    await close_shared_session()
+    await fake.server.close()
+
+
+@pytest.mark.asyncio
+async def test_gamma_keyset_paginates_with_sync_defaults(api):
+    gamma = AsyncGammaClient(base_url=api.url)
+
+    markets = await gamma.get_markets(limit=3)
+
+    assert [m["id"] for m in markets] == ["1", "2", "3"]
+    first_query = api.requests[0][1]
+    assert first_query["active"] == "true" and first_query["closed"] == "false"
+    assert api.requests[1][1]["after_cursor"] == "page2"
+
+
+@pytest.mark.asyncio
+async def test_server_errors_and_429_are_retried(api):
+    api.failures["/markets/abc123"] = [500, 429]
+    gamma = AsyncGammaClient(base_url=api.url)
+
+    market = await gamma.get_market("abc123")
+
+    assert market == {"id": "abc123"}
+    assert len(api.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_every_retry_acquires_a_token(api):
+    api.failures["/markets/abc123"] = [500, 429]
+    acquired = []
+
+    class CountingLimiter(TokenBucketLimiter):
+        async def acquire_async(self, service, endpoint=""):
+            acquired.append(endpoint)
+
+    gamma = AsyncGammaClient(base_url=api.url, rate_limiter=CountingLimiter())
+
+    await gamma.get_market("abc123")
+
+    assert len(acquired) == len(api.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_raise(api):
+    api.failures["/markets/abc123"] = [404]
+    gamma = AsyncGammaClient(base_url=api.url)
+
+    with pytest.raises(Exception, match="404"):
+        await gamma.get_market("abc123")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_polls_share_one_session(api):
+    limiter = TokenBucketLimiter(budgets={"gamma:markets": Budget(rate=1000, burst=1000)})
+    gamma = AsyncGammaClient(base_url=api.url, rate_limiter=limiter)
+    clob = AsyncCLOBClient(rest_endpoint=api.url)
+
+    started = time.monotonic()
+    markets = await gamma.get_many_markets([str(i) for i in range(40)])
+    elapsed = time.monotonic() - started
+
+    assert len(markets) == 40
+    # 40 requests of 50 ms each, overlapped instead of run back to back
+    assert elapsed < 1.0
+    assert gamma.transport.session is clob.transport.session is shared_session()
+
+
+@pytest.mark.asyncio
+async def test_clob_order_book_is_trimmed_to_depth(api):
+    book = await AsyncCLOBClient(rest_endpoint=api.url).get_order_book("tok", depth=5)
+    assert len(book["bids"]) == 5 and len(book["asks"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_data_api_omits_unset_params(api):
+    trades = await AsyncDataAPIClient(base_url=api.url).get_trades(market="0xabc", limit=50)
+
+    assert trades[0]["market"] == "0xabc"
+    assert api.requests[-1][1] == {"limit": "50", "market": "0xabc"}
+
+
+@pytest.mark.asyncio
+async def test_async_requests_draw_from_token_buckets(api):
+    limiter = TokenBucketLimiter(budgets={"data:trades": Budget(rate=20, burst=2)})
+    data_api = AsyncDataAPIClient(base_url=api.url, rate_limiter=limiter)
+    started = time.monotonic()
+
+    await asyncio.gather(*(data_api.get_trades(limit=1) for _ in range(4)))
+
+    # Two requests ride the burst, the next two wait 50 ms each
+    assert time.monotonic() - started >= 0.09
+    assert limiter.stats()["data:trades"]["delayed"] == 2
+
+
+def test_sync_clients_hand_out_async_twins(tmp_path):
+    gamma = GammaClient(base_url="https://gamma.example", api_key="k", use_catalog=False)
+    twin = gamma.async_client()
+    assert isinstance(twin, AsyncGammaClient)
+    assert twin.transport.base_url == "https://gamma.example"
+    assert twin.transport.headers["Authorization"] == "Bearer k"
+
+    data_twin = DataAPIClient(base_url="https://data.example").async_client()
+    assert data_twin.transport.base_url == "https://data.example"
+    assert async_clients.HAS_AIOHTTP
@@ -1,5 +1,6 @@
 """Comprehensive tests for CLOB API client"""
 
+import json
 import pytest
 import responses
 import requests
@@ -40,6 +41,9 @@ class TestCLOBClientRequest:
             status=200,
         )
 
+        # With time.sleep mocked the 429 penalty never elapses, so keep the
+        # limiter's own waits out of the sleep count
+        client.rate_limiter = MagicMock()
         resp = client._request("GET", f"{CLOB_ENDPOINT}/test", retries=3)
         assert resp.status_code == 200
         assert resp.json() == {"ok": True}
@@ -47,6 +51,19 @@ class TestCLOBClientRequest:
         # Verify sleep was called for the two 429 retries
         assert mock_sleep.call_count == 2
 
+    @responses.activate
+    @patch("time.sleep", return_value=None)
+    def test_request_acquires_a_token_per_attempt(self, mock_sleep, client):
+        """Test that each retry goes through the rate limiter again"""
+        responses.add(responses.GET, f"{CLOB_ENDPOINT}/test", status=503)
+        responses.add(responses.GET, f"{CLOB_ENDPOINT}/test", status=429)
+        responses.add(responses.GET, f"{CLOB_ENDPOINT}/test", json={"ok": True}, status=200)
+        client.rate_limiter = MagicMock()
+
+        client._request("GET", f"{CLOB_ENDPOINT}/test", retries=3)
+
+        assert client.rate_limiter.acquire.call_count == 3
+
     @responses.activate
     @patch("time.sleep", return_value=None)
     def test_request_429_retry_after_header_valid_int(self, mock_sleep, client):
@@ -415,6 +432,92 @@ class TestCLOBPricingEndpoints:
         assert "token_id=token123" in responses.calls[0].request.url
 
 
+class TestCLOBGetMidpoints:
+    """Test the batched POST /midpoints helper"""
+
+    @pytest.fixture
+    def client(self):
+        return CLOBClient(rest_endpoint=CLOB_ENDPOINT)
+
+    @responses.activate
+    def test_get_midpoints_posts_token_list(self, client):
+        responses.add(
+            responses.POST,
+            f"{CLOB_ENDPOINT}/midpoints",
+            json={"t1": "0.45", "t2": "bad"},
+            status=200,
+        )
+
+        assert client.get_midpoints(["t1", "t2", "t1"]) == {"t1": 0.45}
+        assert len(responses.calls) == 1
+        assert json.loads(responses.calls[0].request.body) == [{"token_id": "t1"}, {"token_id": "t2"}]
+
+    @responses.activate
+    def test_get_midpoints_chunks_large_requests(self, client):
+        client.MIDPOINT_BATCH_SIZE = 2
+        responses.add(responses.POST, f"{CLOB_ENDPOINT}/midpoints", json={"a": 0.1, "b": 0.2}, status=200)
+        responses.add(responses.POST, f"{CLOB_ENDPOINT}/midpoints", json={"c": 0.3}, status=200)
+
+        assert client.get_midpoints(["a", "b", "c"]) == {"a": 0.1, "b": 0.2, "c": 0.3}
+        assert len(responses.calls) == 2
+
+    def test_get_midpoints_empty_makes_no_request(self, client):
+        with patch.object(client, "_request") as mock_request:
+            assert client.get_midpoints([]) == {}
+        mock_request.assert_not_called()
+
+
+class TestCLOBBatchBooks:
+    """Test the batched POST /books and POST /last-trades-prices helpers"""
+
+    @pytest.fixture
+    def client(self):
+        return CLOBClient(rest_endpoint=CLOB_ENDPOINT)
+
+    @responses.activate
+    def test_get_order_books_keys_by_asset_and_limits_depth(self, client):
+        responses.add(
+            responses.POST,
+            f"{CLOB_ENDPOINT}/books",
+            json=[
+                {"asset_id": "t1", "bids": [{"price": "0.4", "size": "1"}] * 5, "asks": []},
+                {"bids": [], "asks": []},
+            ],
+            status=200,
+        )
+
+        books = client.get_order_books(["t1", "t2"], depth=2)
+
+        assert list(books) == ["t1"]
+        assert len(books["t1"]["bids"]) == 2
+        assert json.loads(responses.calls[0].request.body) == [{"token_id": "t1"}, {"token_id": "t2"}]
+
+    @responses.activate
+    def test_get_order_books_chunks_large_requests(self, client):
+        client.BOOK_BATCH_SIZE = 2
+        responses.add(responses.POST, f"{CLOB_ENDPOINT}/books", json=[{"asset_id": "a"}, {"asset_id": "b"}], status=200)
+        responses.add(responses.POST, f"{CLOB_ENDPOINT}/books", json=[{"asset_id": "c"}], status=200)
+
+        assert sorted(client.get_order_books(["a", "b", "c"])) == ["a", "b", "c"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_last_trade_prices(self, client):
+        responses.add(
+            responses.POST,
+            f"{CLOB_ENDPOINT}/last-trades-prices",
+            json=[{"token_id": "t1", "price": "0.52", "side": "SELL"}],
+            status=200,
+        )
+
+        assert client.get_last_trade_prices(["t1", "t2"]) == {"t1": {"price": "0.52", "side": "SELL"}}
+
+    def test_batch_request_failure_raises(self, client):
+        with patch.object(client, "_request", side_effect=requests.exceptions.ConnectionError("down")):
+            with pytest.raises(Exception, match="Failed to get books"):
+                client.get_order_books(["t1"])
+
+
 class TestCLOBGetRecentTrades:
     """Test get_recent_trades method"""
 
@@ -824,6 +927,23 @@ class TestCLOBClientInit:
         client = CLOBClient(rest_endpoint="https://example.com/")
         assert client.rest_endpoint == "https://example.com"
 
+    def test_market_hub_created_lazily_on_ws_endpoint(self):
+        """Test that the market hub is built on first use and reused"""
+        client = CLOBClient(ws_endpoint="wss://custom-ws.example.com")
+        assert client._market_hub is None
+        hub = client.market_hub()
+        assert hub.ws_endpoint == "wss://custom-ws.example.com"
+        assert client.market_hub() is hub
+        assert not hub.connected
+
+    def test_websocket_state_starts_clear(self):
+        """Test that no feeds, listener task or failure flag exist at start"""
+        client = CLOBClient()
+        assert client._hub_feeds == []
+        assert client._hub_task is None
+        assert client._ws_permanently_failed is False
+        assert client.subscriptions == {}
+
     def test_session_created(self):
         """Test that a requests.Session is created"""
         client = CLOBClient()
@@ -837,10 +957,9 @@ class TestCLOBClientInit:
             mock_close.assert_called_once()
 
     def test_close_runs_websocket_teardown_when_connections_exist(self):
-        """close() should trigger async websocket teardown when sockets are active."""
+        """close() should trigger async websocket teardown when hub feeds are active."""
         client = CLOBClient()
-        client.ws_connection = object()
-        client.clob_ws = object()
+        client._hub_feeds = [(object(), object())]
 
         with (
             patch.object(client.session, "close") as mock_session_close,
@@ -1074,6 +1193,9 @@ class TestCLOBGetPriceHistory:
             status=200,
         )
 
+        # With time.sleep mocked the 429 penalty never elapses, so keep the
+        # limiter's own waits out of the sleep count
+        client.rate_limiter = MagicMock()
         history = client.get_price_history("token123")
         assert len(history) == 1
         assert len(responses.calls) == 2
@@ -1165,283 +1287,3 @@ class TestCLOBGetPriceHistory:
         assert "fidelity=300" in url
         assert "startTs=1700000000" in url
         assert "endTs=1700100000" in url
-
-
-class TestCLOBWebSocketOrderBook:
-    """Test CLOB WebSocket order book streaming functionality"""
-
-    @pytest.fixture
-    def client(self):
-        return CLOBClient(rest_endpoint=CLOB_ENDPOINT)
-
-    @pytest.mark.asyncio
-    async def test_close_websocket_closes_rtds_and_orderbook_connections(self, client):
-        """close_websocket should close both trade and orderbook sockets."""
-        rtds_ws = AsyncMock()
-        orderbook_ws = AsyncMock()
-        client.ws_connection = rtds_ws
-        client.clob_ws = orderbook_ws
-        client.subscriptions = {"_all": MagicMock()}
-        client._ob_callback = MagicMock()
-        client._ob_token_ids = ["token1"]
-
-        await client.close_websocket()
-
-        rtds_ws.close.assert_awaited_once()
-        orderbook_ws.close.assert_awaited_once()
-        assert client.ws_connection is None
-        assert client.clob_ws is None
-        assert client.subscriptions == {}
-        assert client._ob_callback is None
-        assert client._ob_token_ids == []
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_connect_clob_websocket_success(self, mock_websockets, client):
-        """Test successful connection to CLOB order book WebSocket"""
-        mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-
-        result = await client.connect_clob_websocket()
-
-        assert result is True
-        assert client.clob_ws == mock_ws
-        mock_websockets.connect.assert_called_once_with(client.CLOB_WS_ENDPOINT)
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", False)
-    async def test_connect_clob_websocket_without_websockets_raises(self, client):
-        """Test that connecting without websockets library raises exception"""
-        with pytest.raises(Exception, match="websockets library not installed"):
-            await client.connect_clob_websocket()
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_subscribe_orderbook_sends_correct_message(self, mock_websockets, client):
-        """Test that subscribe_orderbook sends correct subscription message"""
-        mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-        client.clob_ws = mock_ws
-
-        token_ids = ["token1", "token2"]
-        callback = MagicMock()
-
-        await client.subscribe_orderbook(token_ids, callback)
-
-        # Verify subscription message was sent
-        mock_ws.send.assert_called_once()
-        sent_message = mock_ws.send.call_args[0][0]
-        import json
-        msg_data = json.loads(sent_message)
-        assert msg_data == {"assets_ids": ["token1", "token2"], "type": "market", "custom_feature_enabled": True}
-        assert client._ob_callback == callback
-        assert client._ob_token_ids == token_ids
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_subscribe_orderbook_auto_connects(self, mock_websockets, client):
-        """Test that subscribe_orderbook auto-connects if not connected"""
-        mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-
-        token_ids = ["token1"]
-        callback = MagicMock()
-
-        await client.subscribe_orderbook(token_ids, callback)
-
-        # Should have called connect
-        mock_websockets.connect.assert_called_once_with(client.CLOB_WS_ENDPOINT)
-        assert client.clob_ws == mock_ws
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    async def test_listen_orderbook_processes_book_messages(self, client):
-        """Test that listen_orderbook processes 'book' message type"""
-        received_messages = []
-
-        def callback(data):
-            received_messages.append(data)
-
-        book_message = '{"type": "book", "asset_id": "token1", "bids": [], "asks": []}'
-
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=[book_message, Exception("Test complete")])
-
-        client.clob_ws = mock_ws
-        client._ob_callback = callback
-
-        # listen_orderbook will catch the exception and exit
-        await client.listen_orderbook(max_reconnects=0)
-
-        assert len(received_messages) == 1
-        assert received_messages[0]["type"] == "book"
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    async def test_listen_orderbook_processes_last_trade_price_messages(self, client):
-        """Test that listen_orderbook processes 'last_trade_price' message type"""
-        received_messages = []
-
-        def callback(data):
-            received_messages.append(data)
-
-        trade_message = '{"type": "last_trade_price", "asset_id": "token1", "price": "0.65"}'
-
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=[trade_message, Exception("Test complete")])
-
-        client.clob_ws = mock_ws
-        client._ob_callback = callback
-
-        await client.listen_orderbook(max_reconnects=0)
-
-        assert len(received_messages) == 1
-        assert received_messages[0]["type"] == "last_trade_price"
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    async def test_listen_orderbook_skips_empty_messages(self, client):
-        """Test that listen_orderbook skips empty messages"""
-        received_messages = []
-
-        def callback(data):
-            received_messages.append(data)
-
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=[
-            "",
-            "   ",
-            '{"type": "book", "asset_id": "token1"}',
-            Exception("Test complete"),
-        ])
-
-        client.clob_ws = mock_ws
-        client._ob_callback = callback
-
-        await client.listen_orderbook(max_reconnects=0)
-
-        # Should only receive the valid message
-        assert len(received_messages) == 1
-        assert received_messages[0]["type"] == "book"
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    async def test_listen_orderbook_handles_json_decode_errors(self, client):
-        """Test that listen_orderbook handles JSON decode errors gracefully"""
-        received_messages = []
-
-        def callback(data):
-            received_messages.append(data)
-
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=[
-            "not valid json",
-            '{"type": "book", "asset_id": "token1"}',
-            Exception("Test complete"),
-        ])
-
-        client.clob_ws = mock_ws
-        client._ob_callback = callback
-
-        await client.listen_orderbook(max_reconnects=0)
-
-        # Should only receive the valid message
-        assert len(received_messages) == 1
-        assert received_messages[0]["type"] == "book"
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_listen_orderbook_reconnects_on_disconnection(self, mock_websockets, client):
-        """Test that listen_orderbook sets clob_ws to None on disconnection"""
-        # Start with a connection that will fail
-        initial_ws = AsyncMock()
-        initial_ws.recv = AsyncMock(side_effect=Exception("Connection lost"))
-
-        client.clob_ws = initial_ws
-        client._ob_callback = MagicMock()
-        client._ob_token_ids = ["token1"]
-
-        # Mock reconnection attempts
-        reconnect_mock = AsyncMock()
-        reconnect_mock.send = AsyncMock()
-        reconnect_mock.recv = AsyncMock(side_effect=Exception("Still failing"))
-
-        mock_websockets.connect = AsyncMock(return_value=reconnect_mock)
-
-        # Patch asyncio.sleep to avoid actual delay
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            await client.listen_orderbook(max_reconnects=1)
-
-        # After failure, clob_ws should have been set to None
-        assert client.clob_ws is None
-        # Should have attempted reconnection
-        assert mock_websockets.connect.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_listen_orderbook_raises_if_not_connected(self, client):
-        """Test that listen_orderbook raises if WebSocket not connected"""
-        client.clob_ws = None
-
-        with pytest.raises(Exception, match="CLOB WebSocket not connected"):
-            await client.listen_orderbook(max_reconnects=0)
-
-    def test_clob_ws_endpoint_has_correct_url(self, client):
-        """Test that CLOB_WS_ENDPOINT has the correct URL"""
-        assert client.CLOB_WS_ENDPOINT == "wss://ws-subscriptions-clob.polymarket.com/ws/market"
-
-    def test_clob_ws_initialized_to_none(self, client):
-        """Test that clob_ws is initialized to None"""
-        assert client.clob_ws is None
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_subscribe_stores_callback(self, mock_websockets, client):
-        """Test that subscribe_orderbook stores the callback"""
-        mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-        client.clob_ws = mock_ws
-
-        callback = MagicMock()
-        await client.subscribe_orderbook(["token1"], callback)
-
-        assert client._ob_callback == callback
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_subscribe_stores_token_ids(self, mock_websockets, client):
-        """Test that subscribe_orderbook stores the token IDs"""
-        mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-        client.clob_ws = mock_ws
-
-        token_ids = ["token1", "token2", "token3"]
-        await client.subscribe_orderbook(token_ids, MagicMock())
-
-        assert client._ob_token_ids == token_ids
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_listen_handles_max_reconnects_limit(self, mock_websockets, client):
-        """Test that listen_orderbook respects max_reconnects limit"""
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=Exception("Connection failed"))
-
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-
-        client.clob_ws = mock_ws
-        client._ob_callback = MagicMock()
-        client._ob_token_ids = ["token1"]
-
-        # Patch asyncio.sleep to avoid actual delay
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            await client.listen_orderbook(max_reconnects=2)
-
-        # Should have attempted to reconnect 2 times (attempts 1 and 2)
-        assert mock_websockets.connect.call_count == 2
@@ -3,7 +3,7 @@
 import pytest
 import responses
 import requests
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from polyterm.api.data_api import DataAPIClient
 
 
@@ -40,6 +40,9 @@ class TestDataAPIClientRequest:
             status=200,
         )
 
+        # With time.sleep mocked the 429 penalty never elapses, so keep the
+        # limiter's own waits out of the sleep count
+        client.rate_limiter = MagicMock()
         resp = client._request("GET", "/test", retries=3)
         assert resp.status_code == 200
         assert resp.json() == {"ok": True}
@@ -7,6 +7,7 @@ import responses
 import requests
 from unittest.mock import patch, MagicMock
 from polyterm.api.gamma import GammaClient, RateLimiter, SharedRateLimiter
+from polyterm.api.rate_limit import TokenBucketLimiter
 
 
 GAMMA_ENDPOINT = "https://gamma-api.polymarket.com"
@@ -182,10 +183,10 @@ class TestSharedRateLimiter:
         stored = float(lock_file.read_text().strip())
         assert before <= stored <= after + 0.1
 
-    def test_gamma_client_uses_shared_limiter(self):
-        """Test that GammaClient uses SharedRateLimiter by default"""
+    def test_gamma_client_uses_token_bucket_limiter(self):
+        """Test that GammaClient uses the token-bucket limiter by default"""
         client = GammaClient()
-        assert isinstance(client.rate_limiter, SharedRateLimiter)
+        assert isinstance(client.rate_limiter, TokenBucketLimiter)
         client.close()
 
 
@@ -946,10 +947,10 @@ class TestGammaClientInit:
         assert "Authorization" not in client.session.headers
 
     def test_rate_limiter_created(self):
-        """Test that rate limiter is created (shared by default)"""
+        """Test that rate limiter is created with the default budgets"""
         client = GammaClient()
-        assert isinstance(client.rate_limiter, SharedRateLimiter)
-        assert client.rate_limiter.requests_per_minute == 60
+        assert isinstance(client.rate_limiter, TokenBucketLimiter)
+        assert client.rate_limiter.budgets["gamma"].rate == 40
 
     def test_close_session(self):
         """Test that close() closes the session"""
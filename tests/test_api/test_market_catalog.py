@@ -0,0 +1,171 @@
+"""Tests for the local Gamma market catalog"""
+
+import pytest
+import responses
+
+from polyterm.api.gamma import GammaClient
+from polyterm.api.market_catalog import MarketCatalog
+
+
+GAMMA_ENDPOINT = "https://gamma-api.polymarket.com"
+
+
+def _market(market_id, **extra):
+    market = {
+        "id": market_id,
+        "slug": f"market-{market_id}",
+        "conditionId": f"0xcond{market_id}",
+        "clobTokenIds": f'["yes-{market_id}", "no-{market_id}"]',
+        "events": [{"id": "e1", "slug": "event-one"}],
+        "tags": [{"slug": "Crypto"}],
+        "endDate": "2026-12-31T00:00:00Z",
+        "active": True,
+        "closed": False,
+    }
+    market.update(extra)
+    return market
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = MarketCatalog(str(tmp_path / "catalog.db"))
+    yield catalog
+    catalog.close()
+
+
+@pytest.fixture
+def client(catalog):
+    client = GammaClient(base_url=GAMMA_ENDPOINT, catalog=catalog)
+    client.rate_limiter.wait_if_needed = lambda: None
+    return client
+
+
+class TestMarketCatalog:
+    """Indexed lookups and listing storage"""
+
+    def test_lookup_by_every_identifier(self, catalog):
+        catalog.upsert_markets([_market("1")])
+
+        for identifier in ("1", "market-1", "0xcond1", "no-1"):
+            assert catalog.get_market(identifier)["id"] == "1"
+        assert catalog.get_market("missing") is None
+
+    def test_batch_lookup_mixes_identifiers(self, catalog):
+        catalog.upsert_markets([_market("1"), _market("2"), _market("3")])
+
+        found = catalog.get_markets(["1", "market-2", "0xcond3", "no-1", "missing"])
+
+        assert {key: m["id"] for key, m in found.items()} == {
+            "1": "1", "market-2": "2", "0xcond3": "3", "no-1": "1",
+        }
+
+    def test_ttl_expires_entries(self, catalog):
+        catalog.upsert_markets([_market("1")], fetched_at=0)
+        assert catalog.get_market("1") is None
+        assert catalog.get_market("1", max_age=float("inf"))["id"] == "1"
+
+    def test_find_by_tag_event_and_end_date(self, catalog):
+        catalog.upsert_markets([
+            _market("1"),
+            _market("2", tags=[{"slug": "politics"}], endDate="2026-06-01T00:00:00Z"),
+        ])
+
+        assert [m["id"] for m in catalog.find_markets(tag="crypto")] == ["1"]
+        assert len(catalog.find_markets(event_id="e1")) == 2
+        assert [m["id"] for m in catalog.find_markets(end_before="2026-07-01")] == ["2"]
+
+    def test_short_incomplete_listing_is_a_miss(self, catalog):
+        catalog.store_listing("k", [_market("1")], next_cursor="c1")
+        assert catalog.get_listing("k", limit=1) == [_market("1")]
+        assert catalog.get_listing("k", limit=2) is None
+
+        catalog.store_listing("k", [_market("2")], next_cursor=None, append=True)
+        assert [m["id"] for m in catalog.get_listing("k", limit=5)] == ["1", "2"]
+
+
+class TestGammaClientCatalog:
+    """GammaClient served from the catalog"""
+
+    @responses.activate
+    def test_second_client_is_served_from_catalog(self, client, catalog):
+        responses.add(
+            responses.GET, f"{GAMMA_ENDPOINT}/markets/keyset",
+            json={"markets": [_market("1"), _market("2")]}, status=200,
+        )
+        assert len(client.get_markets(limit=10)) == 2
+
+        other = GammaClient(base_url=GAMMA_ENDPOINT, catalog=catalog)
+        assert [m["id"] for m in other.get_markets(limit=10)] == ["1", "2"]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_repeat_calls_on_one_client_refresh_live(self, client):
+        responses.add(
+            responses.GET, f"{GAMMA_ENDPOINT}/markets/keyset",
+            json={"markets": [_market("1")]}, status=200,
+        )
+        client.get_markets(limit=10)
+        client.get_markets(limit=10)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_short_listing_resumes_from_saved_cursor(self, client, catalog):
+        responses.add(
+            responses.GET, f"{GAMMA_ENDPOINT}/markets/keyset",
+            json={"markets": [_market("1")], "next_cursor": "cursor-1"}, status=200,
+        )
+        responses.add(
+            responses.GET, f"{GAMMA_ENDPOINT}/markets/keyset",
+            json={"markets": [_market("2")]}, status=200,
+        )
+        client.get_markets(limit=1)
+
+        other = GammaClient(base_url=GAMMA_ENDPOINT, catalog=catalog)
+        other.rate_limiter.wait_if_needed = lambda: None
+        markets = other.get_markets(limit=2)
+
+        assert [m["id"] for m in markets] == ["1", "2"]
+        assert "after_cursor=cursor-1" in responses.calls[1].request.url
+
+    @responses.activate
+    def test_get_market_uses_catalog_and_writes_through(self, client, catalog):
+        responses.add(
+            responses.GET, f"{GAMMA_ENDPOINT}/markets/slug/market-7",
+            json=_market("7"), status=200,
+        )
+        assert client.get_market("market-7")["id"] == "7"
+
+        other = GammaClient(base_url=GAMMA_ENDPOINT, catalog=catalog)
+        assert other.get_market("0xcond7")["id"] == "7"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_markets_by_ids_batches_catalog_misses(self, client, catalog):
+        catalog.upsert_markets([_market("1")])
+        responses.add(
+            responses.GET, f"{GAMMA_ENDPOINT}/markets",
+            json=[_market("2"), _market("3")], status=200,
+        )
+
+        found = client.get_markets_by_ids(["0xcond1", "0xcond2", "0xcond3"])
+
+        assert {key: m["id"] for key, m in found.items()} == {"0xcond1": "1", "0xcond2": "2", "0xcond3": "3"}
+        assert len(responses.calls) == 1
+        url = responses.calls[0].request.url
+        assert "condition_ids=0xcond2" in url and "condition_ids=0xcond3" in url
+        assert "0xcond1" not in url
+        assert catalog.get_market("0xcond3")["id"] == "3"
+
+    @responses.activate
+    def test_get_markets_by_ids_falls_back_for_unmatched(self, client):
+        responses.add(responses.GET, f"{GAMMA_ENDPOINT}/markets", json=[], status=200)
+        responses.add(responses.GET, f"{GAMMA_ENDPOINT}/markets/9", json=_market("9"), status=200)
+
+        found = client.get_markets_by_ids(["9"])
+
+        assert found["9"]["id"] == "9"
+        assert "id=9" in responses.calls[0].request.url
+
+    def test_catalog_can_be_disabled(self, catalog):
+        assert GammaClient(catalog=catalog, use_catalog=False).catalog is None
+        assert GammaClient().catalog is None  # POLYTERM_MARKET_CATALOG=0 in tests
@@ -0,0 +1,504 @@
+"""Tests for the shared CLOB market-channel hub"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from polyterm.api.market_hub import MarketStreamHub, ORDERBOOK_EVENTS
+from polyterm.core.orderbook import OrderBookAnalyzer
+
+
+def _frame(*messages):
+    return json.dumps(list(messages))
+
+
+class TestDispatch:
+    """Decoding and fan-out without a socket"""
+
+    def test_routes_by_asset_and_event_type(self):
+        hub = MarketStreamHub()
+        books = hub.subscribe(["a", "b"], event_types=ORDERBOOK_EVENTS)
+        trades = hub.subscribe(["a"], event_types={"last_trade_price"})
+
+        hub.dispatch_frame(_frame(
+            {"event_type": "book", "asset_id": "a", "bids": []},
+            {"event_type": "last_trade_price", "asset_id": "a", "price": "0.5"},
+            {"event_type": "last_trade_price", "asset_id": "b", "price": "0.4"},
+        ))
+
+        assert books.queue.qsize() == 3
+        assert trades.queue.qsize() == 1
+        assert trades.queue.get_nowait()["asset_id"] == "a"
+
+    def test_price_change_routes_by_nested_asset_ids(self):
+        hub = MarketStreamHub()
+        sub = hub.subscribe(["b"])
+        other = hub.subscribe(["z"])
+
+        hub.dispatch({
+            "event_type": "price_change",
+            "market": "0xcondition",
+            "price_changes": [{"asset_id": "b", "price": "0.4"}],
+        })
+
+        assert sub.queue.qsize() == 1
+        assert other.queue.qsize() == 0
+
+    def test_shared_message_is_decoded_once(self):
+        hub = MarketStreamHub()
+        first = hub.subscribe(["a"])
+        second = hub.subscribe(["a"])
+        hub.dispatch_frame(_frame({"event_type": "book", "asset_id": "a"}))
+        assert first.queue.get_nowait() is second.queue.get_nowait()
+
+    def test_bounded_queue_drops_oldest(self):
+        hub = MarketStreamHub(queue_size=2)
+        sub = hub.subscribe(["a"])
+        for index in range(3):
+            hub.dispatch({"event_type": "book", "asset_id": "a", "seq": index})
+
+        assert sub.dropped == 1
+        assert [sub.queue.get_nowait()["seq"] for _ in range(2)] == [1, 2]
+
+    def test_invalid_frames_are_ignored(self):
+        hub = MarketStreamHub()
+        hub.subscribe(["a"])
+        assert hub.dispatch_frame("not json") == 0
+        assert hub.dispatch_frame("") == 0
+
+    def test_events_for_unsubscribed_assets_are_dropped(self):
+        hub = MarketStreamHub()
+        kept = hub.subscribe(["a"])
+        gone = hub.subscribe(["b"])
+        hub.unsubscribe(gone)
+
+        # In flight after the unsubscribe
+        assert hub.dispatch({"event_type": "book", "asset_id": "b", "market": "0xb"}) == 0
+        assert kept.queue.qsize() == 0
+
+    def test_events_without_asset_id_reach_every_asset_subscriber(self):
+        hub = MarketStreamHub()
+        first = hub.subscribe(["a"])
+        second = hub.subscribe(["b"])
+
+        hub.dispatch({"topic": "activity", "type": "trades", "payload": {}})
+
+        assert first.queue.qsize() == 1
+        assert second.queue.qsize() == 1
+
+    def test_asset_refcounts_across_subscribers(self):
+        hub = MarketStreamHub()
+        first = hub.subscribe(["a", "b"])
+        second = hub.subscribe(["b"])
+        hub.unsubscribe(first)
+        assert hub.asset_ids == ["b"]
+        assert first.closed
+        hub.update(second, add=["c"], remove=["b"])
+        assert hub.asset_ids == ["c"]
+
+
+class TestSocketLoop:
+    """Connection, dynamic subscriptions and shutdown"""
+
+    @pytest.mark.asyncio
+    async def test_run_subscribes_and_fans_out(self, fake_socket):
+        socket = fake_socket([
+            "PING",
+            _frame({"event_type": "book", "asset_id": "a"}),
+        ])
+
+        async def connect(url):
+            return socket
+
+        hub = MarketStreamHub(connect=connect)
+        sub = hub.subscribe(["a"])
+        runner = asyncio.create_task(hub.run())
+
+        message = await asyncio.wait_for(sub.get(), timeout=1)
+        assert message["asset_id"] == "a"
+        assert json.loads(socket.sent[0])["assets_ids"] == ["a"]
+        assert "PONG" in socket.sent
+
+        late = hub.subscribe(["new"])
+        await asyncio.sleep(0)
+        assert json.loads(socket.sent[-1]) == {"assets_ids": ["new"], "operation": "subscribe"}
+        hub.unsubscribe(late)
+        await asyncio.sleep(0)
+        assert json.loads(socket.sent[-1]) == {"assets_ids": ["new"], "operation": "unsubscribe"}
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+        assert socket.closed
+        assert await sub.get() is None
+
+    @pytest.mark.asyncio
+    async def test_run_marks_failed_when_connects_exhausted(self, monkeypatch):
+        async def connect(url):
+            raise OSError("refused")
+
+        async def no_sleep(_seconds):
+            return None
+
+        monkeypatch.setattr("polyterm.api.market_hub.asyncio.sleep", no_sleep)
+        hub = MarketStreamHub(connect=connect)
+        sub = hub.subscribe(["a"])
+        await hub.run(max_reconnects=2)
+
+        assert hub.failed
+        assert await sub.get() is None
+
+    @pytest.mark.asyncio
+    async def test_supervisor_restarts_before_giving_up(self, monkeypatch):
+        connects, errors = [], []
+
+        async def connect(url):
+            connects.append(url)
+            raise OSError("refused")
+
+        async def no_sleep(_seconds):
+            return None
+
+        monkeypatch.setattr("polyterm.api.market_hub.asyncio.sleep", no_sleep)
+        hub = MarketStreamHub(connect=connect)
+        sub = hub.subscribe(["a"])
+        await hub.run(max_reconnects=1, supervisor_retries=2, on_error=errors.append)
+
+        assert len(connects) == 6
+        assert len(errors) == 3
+        assert hub.failed
+        assert await sub.get() is None
+
+    @pytest.mark.asyncio
+    async def test_connect_listeners_fire_once_subscribed(self, fake_socket):
+        socket = fake_socket([])
+        events = []
+
+        async def connect(url):
+            events.append("open")
+            return socket
+
+        hub = MarketStreamHub(connect=connect)
+        hub.subscribe(["a"])
+        hub.add_connect_listener(lambda: events.append(("connected", len(socket.sent))))
+        runner = asyncio.create_task(hub.run())
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Fired after the subscribe message went out, not before the socket opened
+        assert events == ["open", ("connected", 1)]
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_run_fails_at_once_without_websockets(self, monkeypatch):
+        errors = []
+        monkeypatch.setattr("polyterm.api.market_hub.HAS_WEBSOCKETS", False)
+        hub = MarketStreamHub()
+        sub = hub.subscribe(["a"])
+
+        await asyncio.wait_for(hub.run(on_error=errors.append), timeout=1)
+
+        assert hub.failed
+        assert "websockets" in str(errors[0])
+        assert await sub.get() is None
+
+    @pytest.mark.asyncio
+    async def test_live_orderbook_feed_attaches_to_hub(self):
+        hub = MarketStreamHub()
+        analyzer = OrderBookAnalyzer(clob_client=None)
+        books = await analyzer.start_live_feed(["a"], hub=hub)
+
+        hub.dispatch({
+            "event_type": "book",
+            "asset_id": "a",
+            "market": "a",
+            "bids": [{"price": "0.55", "size": "10"}],
+            "asks": [{"price": "0.57", "size": "5"}],
+        })
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert books["a"].get_top_of_book()["best_bid"] == 0.55
+        analyzer.stop_live_feed()
+        assert hub.asset_ids == []
+
+
+def _hub_with_sockets(*sockets, message_timeout=60.0):
+    """Hub whose connects return the given sockets in turn, then refuse."""
+    connects = []
+    pending = list(sockets)
+
+    async def connect(url):
+        connects.append(url)
+        if not pending:
+            raise OSError("refused")
+        socket = pending.pop(0)
+        if isinstance(socket, BaseException):
+            raise socket
+        return socket
+
+    hub = MarketStreamHub(connect=connect, message_timeout=message_timeout)
+    return hub, connects
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff and cooldown sleeps without waiting on them."""
+    recorded = []
+    real_sleep = asyncio.sleep
+
+    async def record(seconds):
+        recorded.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr("polyterm.api.market_hub.asyncio.sleep", record)
+    return recorded
+
+
+async def _wait_for(predicate, rounds=200):
+    for _ in range(rounds):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class TestReconnection:
+    """Inner reconnect loop: backoff, resubscription and attempt counting"""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_connection_drops(self, fake_socket, sleeps):
+        first = fake_socket([_frame({"event_type": "book", "asset_id": "a", "seq": 1}), ConnectionError("gone")])
+        second = fake_socket([_frame({"event_type": "book", "asset_id": "a", "seq": 2})])
+        hub, connects = _hub_with_sockets(first, second)
+        sub = hub.subscribe(["a"])
+        runner = asyncio.create_task(hub.run())
+
+        assert (await asyncio.wait_for(sub.get(), timeout=1))["seq"] == 1
+        assert (await asyncio.wait_for(sub.get(), timeout=1))["seq"] == 2
+        assert len(connects) == 2
+        assert first.closed
+        assert not hub.failed
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_generic_exception_triggers_reconnect(self, fake_socket, sleeps):
+        first = fake_socket([ValueError("bad frame")])
+        second = fake_socket([_frame({"event_type": "book", "asset_id": "a"})])
+        hub, connects = _hub_with_sockets(first, second)
+        sub = hub.subscribe(["a"])
+        runner = asyncio.create_task(hub.run())
+
+        assert (await asyncio.wait_for(sub.get(), timeout=1))["asset_id"] == "a"
+        assert len(connects) == 2
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_exponential_backoff_is_capped(self, sleeps):
+        hub, connects = _hub_with_sockets()
+        hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=6)
+
+        assert sleeps == [2, 4, 8, 16, 30, 30]
+        assert len(connects) == 7
+        assert hub.failed
+
+    @pytest.mark.asyncio
+    async def test_failed_connects_increment_attempts(self, sleeps):
+        hub, connects = _hub_with_sockets(RuntimeError("handshake"), OSError("refused"))
+        hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=2)
+
+        assert len(connects) == 3
+        assert sleeps == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_attempts_reset_after_a_received_frame(self, fake_socket, sleeps):
+        first = fake_socket([_frame({"event_type": "book", "asset_id": "a"}), ConnectionError("gone")])
+        second = fake_socket([_frame({"event_type": "book", "asset_id": "a"}), ConnectionError("gone")])
+        hub, connects = _hub_with_sockets(first, second)
+        hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=2)
+
+        # Each socket that delivered a frame restarts the backoff at 2s
+        assert sleeps == [2, 2, 4]
+        assert len(connects) == 4
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resubscribes_current_assets(self, fake_socket, sleeps):
+        first = fake_socket()
+        second = fake_socket()
+        hub, connects = _hub_with_sockets(first, second)
+        kept = hub.subscribe(["a"])
+        gone = hub.subscribe(["b"])
+        runner = asyncio.create_task(hub.run())
+        await _wait_for(lambda: first.sent)
+
+        hub.update(kept, add=["c"])
+        hub.unsubscribe(gone)
+        await asyncio.sleep(0)
+        await first.close()
+        await _wait_for(lambda: second.sent)
+
+        assert json.loads(first.sent[0])["assets_ids"] == ["a", "b"]
+        assert json.loads(second.sent[0]) == {
+            "assets_ids": ["a", "c"],
+            "type": "market",
+            "custom_feature_enabled": True,
+        }
+        assert len(connects) == 2
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_connect_listeners_fire_on_every_reconnect(self, fake_socket, sleeps):
+        first = fake_socket([ConnectionError("gone")])
+        second = fake_socket()
+        hub, _ = _hub_with_sockets(first, second)
+        hub.subscribe(["a"])
+        connected = []
+        hub.add_connect_listener(lambda: connected.append(hub.connected))
+        hub.add_connect_listener(Mock(side_effect=RuntimeError("boom")))
+        runner = asyncio.create_task(hub.run())
+        await _wait_for(lambda: len(connected) == 2)
+
+        assert connected == [True, True]
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+
+class TestMessageTimeout:
+    """A quiet socket is dropped and replaced"""
+
+    @pytest.mark.asyncio
+    async def test_timeout_drops_socket_and_reconnects(self, fake_socket, sleeps):
+        quiet = fake_socket()
+        second = fake_socket([_frame({"event_type": "book", "asset_id": "a"})])
+        hub, connects = _hub_with_sockets(quiet, second, message_timeout=0.01)
+        sub = hub.subscribe(["a"])
+        runner = asyncio.create_task(hub.run())
+
+        assert (await asyncio.wait_for(sub.get(), timeout=1))["asset_id"] == "a"
+        assert quiet.closed
+        assert len(connects) == 2
+        assert sleeps[0] == 2
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_close_error_on_timeout_is_swallowed(self, fake_socket, sleeps):
+        quiet = fake_socket(close_error=RuntimeError("close failed"))
+        second = fake_socket([_frame({"event_type": "book", "asset_id": "a"})])
+        hub, connects = _hub_with_sockets(quiet, second, message_timeout=0.01)
+        sub = hub.subscribe(["a"])
+        runner = asyncio.create_task(hub.run())
+
+        assert (await asyncio.wait_for(sub.get(), timeout=1))["asset_id"] == "a"
+        assert len(connects) == 2
+        assert quiet.closed
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_frame_after_timeouts_resets_backoff(self, fake_socket, sleeps):
+        sockets = [
+            fake_socket(),
+            fake_socket(),
+            fake_socket([_frame({"event_type": "book", "asset_id": "a"})]),
+        ]
+        hub, connects = _hub_with_sockets(*sockets, message_timeout=0.01)
+        hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=3)
+
+        # 2s, 4s for the quiet sockets; the frame resets to 2s; then refusals
+        assert sleeps == [2, 4, 2, 4, 8]
+        assert len(connects) == 6
+        assert all(socket.closed for socket in sockets)
+
+
+class TestSupervisor:
+    """Outer restarts once the inner reconnect loop gives up"""
+
+    @pytest.mark.asyncio
+    async def test_cooldown_between_restarts(self, sleeps):
+        hub, connects = _hub_with_sockets()
+        hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=1, supervisor_retries=1, supervisor_cooldown=45)
+
+        assert sleeps == [2, 45, 2]
+        assert len(connects) == 4
+
+    @pytest.mark.asyncio
+    async def test_restart_begins_with_a_fresh_socket(self, fake_socket, sleeps):
+        first = fake_socket([ConnectionError("gone")])
+        second = fake_socket([_frame({"event_type": "book", "asset_id": "a"})])
+        hub, connects = _hub_with_sockets(first, OSError("refused"), second)
+        sub = hub.subscribe(["a"])
+        states = []
+        hub.add_connect_listener(lambda: states.append(hub._ws))
+        runner = asyncio.create_task(hub.run(max_reconnects=1, supervisor_retries=1, supervisor_cooldown=5))
+
+        assert (await asyncio.wait_for(sub.get(), timeout=1))["asset_id"] == "a"
+        assert states == [first, second]
+        assert 5 in sleeps
+        assert first.closed
+
+        await hub.close()
+        await asyncio.wait_for(runner, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_zero_retries_fails_after_first_cycle(self, sleeps):
+        errors = []
+        hub, connects = _hub_with_sockets()
+        hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=0, on_error=errors.append)
+
+        assert len(connects) == 1
+        assert sleeps == []
+        assert len(errors) == 1
+        assert "permanently failed" in str(errors[0])
+
+    @pytest.mark.asyncio
+    async def test_on_error_exceptions_are_swallowed(self, sleeps):
+        hub, _ = _hub_with_sockets()
+        sub = hub.subscribe(["a"])
+
+        await hub.run(max_reconnects=0, supervisor_retries=1, on_error=Mock(side_effect=RuntimeError("boom")))
+
+        assert hub.failed
+        assert await sub.get() is None
+
+    @pytest.mark.asyncio
+    async def test_close_during_cooldown_ends_without_failure(self, monkeypatch):
+        hub, _ = _hub_with_sockets()
+        sub = hub.subscribe(["a"])
+        real_sleep = asyncio.sleep
+
+        async def close_on_cooldown(seconds):
+            if seconds == 60.0:
+                await hub.close()
+            await real_sleep(0)
+
+        monkeypatch.setattr("polyterm.api.market_hub.asyncio.sleep", close_on_cooldown)
+        await asyncio.wait_for(hub.run(max_reconnects=0, supervisor_retries=2), timeout=1)
+
+        assert not hub.failed
+        assert not hub.running
+        assert await sub.get() is None
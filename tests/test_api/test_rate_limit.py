@@ -0,0 +1,143 @@
+"""Tests for the token-bucket rate limiter"""
+
+import pytest
+
+from polyterm.api import rate_limit
+from polyterm.api.rate_limit import (
+    Budget,
+    TokenBucketLimiter,
+    endpoint_class,
+    get_rate_limiter,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze ``time.time`` inside the limiter so waits are deterministic."""
+
+    class Clock:
+        now = 1_000_000.0
+
+    monkeypatch.setattr(rate_limit.time, "time", lambda: Clock.now)
+    return Clock
+
+
+class TestEndpointClass:
+    def test_paths_map_to_classes(self):
+        assert endpoint_class("gamma", "/markets/keyset") == "markets"
+        assert endpoint_class("gamma", "/public-search") == "search"
+        assert endpoint_class("clob", "/prices-history") == "history"
+        assert endpoint_class("data", "/positions") == "wallet"
+
+    def test_full_urls_use_their_path(self):
+        assert endpoint_class("clob", "https://clob.polymarket.com/book") == "book"
+
+    def test_unknown_paths_fall_into_other(self):
+        assert endpoint_class("gamma", "/tags") == "other"
+        assert endpoint_class("unknown", "/anything") == "other"
+
+
+class TestTokenBucketLimiter:
+    def test_burst_runs_without_waiting(self, clock):
+        limiter = TokenBucketLimiter()
+
+        # Ten keyset pages fit inside the gamma:markets burst of 30
+        waits = [limiter.reserve("gamma", "/markets/keyset") for _ in range(10)]
+
+        assert waits == [0.0] * 10
+
+    def test_sustained_traffic_is_paced_at_the_rate(self, clock):
+        limiter = TokenBucketLimiter(budgets={"data:trades": Budget(rate=10, burst=3)})
+
+        waits = [limiter.reserve("data", "/trades") for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1)
+        assert waits[4] == pytest.approx(0.2)
+
+    def test_bucket_refills_over_time(self, clock):
+        limiter = TokenBucketLimiter(budgets={"data:trades": Budget(rate=10, burst=2)})
+        limiter.reserve("data", "/trades")
+        limiter.reserve("data", "/trades")
+        assert limiter.tokens("data:trades") == pytest.approx(0.0, abs=1e-6)
+
+        clock.now += 0.1
+
+        assert limiter.tokens("data:trades") == pytest.approx(1.0)
+        assert limiter.reserve("data", "/trades") == 0.0
+
+    def test_host_budget_caps_all_classes(self, clock):
+        limiter = TokenBucketLimiter(budgets={
+            "clob": Budget(rate=10, burst=2),
+            "clob:book": Budget(rate=100, burst=100),
+            "clob:pricing": Budget(rate=100, burst=100),
+        })
+
+        limiter.reserve("clob", "/book")
+        limiter.reserve("clob", "/price")
+
+        # Both classes have tokens left, but the host bucket is empty
+        assert limiter.reserve("clob", "/midpoint") == pytest.approx(0.1)
+
+    def test_classes_do_not_starve_each_other(self, clock):
+        limiter = TokenBucketLimiter(budgets={"gamma:search": Budget(rate=1, burst=1)})
+
+        limiter.reserve("gamma", "/public-search")
+
+        assert limiter.reserve("gamma", "/public-search") == pytest.approx(1.0)
+        assert limiter.reserve("gamma", "/markets/1") == 0.0
+
+    def test_penalize_holds_bucket_until_retry_after(self, clock):
+        limiter = TokenBucketLimiter()
+
+        limiter.penalize("gamma", "/markets", retry_after=5)
+
+        assert limiter.tokens("gamma:markets") == 0.0
+        assert limiter.reserve("gamma", "/markets") == pytest.approx(5.0)
+        assert limiter.stats()["gamma:markets"]["throttled"] == 1
+
+    def test_stats_track_waits_and_tokens(self, clock):
+        limiter = TokenBucketLimiter(budgets={"data:wallet": Budget(rate=10, burst=1)})
+
+        limiter.reserve("data", "/positions")
+        limiter.reserve("data", "/activity")
+
+        stats = limiter.stats()["data:wallet"]
+        assert stats["requests"] == 2
+        assert stats["delayed"] == 1
+        assert stats["wait_seconds"] == pytest.approx(0.1)
+        assert stats["max_wait"] == pytest.approx(0.1)
+        assert stats["tokens"] == 0.0
+
+
+class TestSharedState:
+    def test_limiters_share_buckets_through_sqlite(self, clock, tmp_path):
+        db_path = str(tmp_path / "rate_limits.db")
+        budgets = {"data:trades": Budget(rate=10, burst=2)}
+        first = TokenBucketLimiter(budgets=budgets, db_path=db_path)
+        second = TokenBucketLimiter(budgets=budgets, db_path=db_path)
+
+        assert first.reserve("data", "/trades") == 0.0
+        assert second.reserve("data", "/trades") == 0.0
+        assert first.reserve("data", "/trades") == pytest.approx(0.1)
+
+    def test_penalty_is_visible_to_other_limiters(self, clock, tmp_path):
+        db_path = str(tmp_path / "rate_limits.db")
+        first = TokenBucketLimiter(db_path=db_path)
+        second = TokenBucketLimiter(db_path=db_path)
+
+        first.penalize("clob", "/book", retry_after=2)
+
+        assert second.reserve("clob", "/book") == pytest.approx(2.0)
+
+    def test_unusable_db_path_falls_back_to_memory(self, clock, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        limiter = TokenBucketLimiter(db_path=str(blocker / "rate_limits.db"))
+
+        assert limiter.reserve("gamma", "/markets") == 0.0
+
+    def test_disabled_env_gives_private_limiters(self, monkeypatch):
+        monkeypatch.setenv("POLYTERM_RATE_LIMITS", "0")
+
+        assert get_rate_limiter() is not get_rate_limiter()
@@ -0,0 +1,178 @@
+"""Tests for the concurrent, cached Data API trade tape reader"""
+
+import threading
+import time
+
+from polyterm.api.data_api import DataAPIClient
+from polyterm.api.trade_tape import TradeTape
+
+NOW = 1_800_000_000
+
+
+class FakeTapeAPI:
+    """Newest-first tape with one trade every 100 seconds."""
+
+    def __init__(self, rows=3600, delay=0.0):
+        self.rows = [self._row(i, NOW - i * 100) for i in range(rows)]
+        self.delay = delay
+        self.calls = []
+        self.failing_offsets = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _row(index, timestamp):
+        return {
+            "proxyWallet": f"0x{str(index)[-1]}",
+            "size": 100,
+            "price": 0.5,
+            "timestamp": timestamp,
+            "transactionHash": f"0xtx{index}",
+        }
+
+    def push(self, count):
+        """New trades land at the head of the tape."""
+        newest = self.rows[0]["timestamp"]
+        self.rows[:0] = [self._row(f"new{i}", newest + 100 * (count - i)) for i in range(count)]
+
+    def get_recent_trades(self, limit=1000, offset=0, **kwargs):
+        with self._lock:
+            self.calls.append(offset)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if offset in self.failing_offsets:
+            raise RuntimeError(f"timeout at offset {offset}")
+        return [dict(row) for row in self.rows[offset:offset + limit]]
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_read_stops_once_the_cutoff_is_crossed():
+    api = FakeTapeAPI()
+    tape = TradeTape(api)
+
+    window = tape.read(NOW - 24 * 3600)
+
+    assert api.calls == [0]
+    assert len(window.rows) == 865
+    # The whole first page was read to find the cutoff
+    assert window.rows_scanned == 1000
+    assert window.covered
+    assert window.rows[0]["timestamp"] == NOW
+
+
+def test_pages_are_fetched_concurrently():
+    api = FakeTapeAPI(delay=0.05)
+    tape = TradeTape(api, concurrency=4)
+
+    window = tape.read(NOW - 100 * 3600)
+
+    assert sorted(api.calls) == [0, 1000, 2000, 3000]
+    assert len(window.rows) == 3600
+    # Waves of 1, 2, then the last page: the second wave overlaps
+    assert api.peak_in_flight == 2
+
+
+def test_pages_are_fetched_without_holding_the_cache_lock():
+    api = FakeTapeAPI()
+    clock = Clock()
+    tape = TradeTape(api, clock=clock)
+    locked = []
+    fetch = api.get_recent_trades
+    api.get_recent_trades = lambda **kwargs: locked.append(tape._lock.locked()) or fetch(**kwargs)
+
+    tape.read(NOW - 24 * 3600)
+    clock.now += 60
+    api.push(5)
+    tape.read(NOW - 48 * 3600)
+
+    assert len(locked) == 3
+    assert not any(locked)
+
+
+def test_rows_are_deduped_by_transaction_hash():
+    api = FakeTapeAPI(rows=1500)
+    api.rows.insert(1000, dict(api.rows[999]))
+    tape = TradeTape(api)
+
+    window = tape.read(NOW - 100 * 3600)
+
+    hashes = [row["transactionHash"] for row in window.rows]
+    assert len(hashes) == len(set(hashes)) == 1500
+
+
+def test_widening_windows_fetch_only_the_missing_delta():
+    api = FakeTapeAPI()
+    clock = Clock()
+    tape = TradeTape(api, clock=clock)
+    tape.read(NOW - 24 * 3600)
+
+    clock.now += 60
+    api.push(5)
+    api.calls.clear()
+    window = tape.read(NOW - 48 * 3600)
+
+    # Head refresh finds the cache on page 0; the tail resumes past it
+    assert api.calls == [0, 1005]
+    # The first read cached its whole page, all of it inside 48h
+    assert window.cached_rows == 1000
+    assert len(window.rows) == 5 + 1729
+
+    clock.now += 60
+    api.calls.clear()
+    window = tape.read(NOW - 72 * 3600)
+
+    assert api.calls == [0, 2005]
+    assert len(window.rows) == 5 + 2593
+
+
+def test_fresh_cache_answers_narrower_windows_without_fetching():
+    api = FakeTapeAPI()
+    clock = Clock()
+    tape = TradeTape(api, clock=clock)
+    tape.read(NOW - 48 * 3600)
+    api.calls.clear()
+
+    window = tape.read(NOW - 24 * 3600)
+
+    assert api.calls == []
+    assert len(window.rows) == window.cached_rows == 865
+
+
+def test_failed_page_keeps_earlier_pages_and_reports_the_error():
+    api = FakeTapeAPI()
+    api.failing_offsets = {1000}
+    tape = TradeTape(api)
+
+    window = tape.read(NOW - 72 * 3600)
+
+    assert window.errors == [{"offset": 1000, "error": "timeout at offset 1000"}]
+    assert len(window.rows) == 1000
+    assert not window.covered
+
+
+def test_offset_cap_limits_the_window():
+    api = FakeTapeAPI(rows=6000)
+    tape = TradeTape(api)
+
+    window = tape.read(NOW - 200 * 3600)
+
+    assert max(api.calls) == 3000
+    assert len(window.rows) == 4000
+    assert not window.covered
+
+
+def test_data_api_client_shares_one_tape():
+    client = DataAPIClient(base_url="https://data.example")
+
+    assert client.trade_tape() is client.trade_tape()
@@ -0,0 +1,61 @@
+"""CLI regressions for the depth command."""
+
+import json
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+
+from polyterm.cli.main import cli
+
+
+BOOK = {
+    "bids": [
+        {"price": "0.49", "size": "2000"},
+        {"price": "0.48", "size": "5000"},
+    ],
+    "asks": [
+        {"price": "0.52", "size": "3000"},
+        {"price": "0.51", "size": "1500"},
+    ],
+}
+
+
+def _invoke(args):
+    mock_config = Mock()
+    mock_config.gamma_base_url = "https://gamma.example.com"
+    mock_config.gamma_api_key = "test-key"
+    mock_config.clob_rest_endpoint = "https://clob.example.com"
+    mock_config.clob_endpoint = "wss://clob.example.com/ws"
+
+    with (
+        patch("polyterm.cli.main.Config", return_value=mock_config),
+        patch("polyterm.cli.commands.depth.GammaClient") as mock_gamma_cls,
+        patch("polyterm.cli.commands.depth.CLOBClient") as mock_clob_cls,
+    ):
+        mock_gamma_cls.return_value.search_markets.return_value = [{
+            "id": "market-1",
+            "question": "Will BTC hit 100k?",
+            "clobTokenIds": '["token-1", "token-2"]',
+        }]
+        mock_clob_cls.return_value.get_order_book.return_value = BOOK
+        return CliRunner().invoke(cli, ["depth", "--market", "bitcoin", *args])
+
+
+def test_depth_table_mode_renders_every_section():
+    result = _invoke(["--size", "1000"])
+
+    assert result.exit_code == 0, result.output
+    assert "Liquidity Summary" in result.output
+    assert "ASKS (sell pressure)" in result.output
+    assert "Slippage Analysis" in result.output
+    assert "Trade Size Recommendations" in result.output
+    assert "Liquidity Score" in result.output
+
+
+def test_depth_json_mode_uses_best_level_first():
+    result = _invoke(["--size", "500", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    analysis = json.loads(result.output)["analysis"]
+    assert analysis["buy_slippage"]["avg_price"] == 0.51
+    assert analysis["buy_slippage"]["fillable"]
@@ -117,3 +117,58 @@ def test_live_dashboard_status_messages_are_capped():
     assert "message 2" in output
     assert "message 5" in output
     assert "message 0" not in output
+
+
+class _FailingHubClient:
+    """CLOB client double whose hub never connects."""
+
+    def __init__(self):
+        self._ws_permanently_failed = False
+        self.closed = False
+
+    async def subscribe_to_trades(self, token_ids, callback):
+        return None
+
+    async def listen_for_trades(self, on_error=None, on_connect=None):
+        on_error(Exception("refused"))
+        self._ws_permanently_failed = True
+
+    async def close_websocket(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_websocket_monitor_falls_back_to_polling_when_hub_fails():
+    monitor = make_monitor()
+    monitor._ws_status = "disconnected"
+    monitor.clob_client = _FailingHubClient()
+    polled = []
+
+    async def fake_polling(market_ids, market_titles):
+        polled.append(market_ids)
+
+    monitor._run_polling_monitor = fake_polling
+
+    await monitor._run_websocket_monitor(["tok"], {"m1": "Market"})
+
+    assert polled == [["m1"]]
+    assert monitor._ws_status == "polling"
+    assert monitor.clob_client.closed
+
+
+@pytest.mark.asyncio
+async def test_websocket_monitor_reports_connected_from_hub_callback():
+    monitor = make_monitor()
+    monitor._ws_status = "disconnected"
+    seen = []
+
+    class ConnectingClient(_FailingHubClient):
+        async def listen_for_trades(self, on_error=None, on_connect=None):
+            seen.append(monitor._ws_status)
+            on_connect()
+            seen.append(monitor._ws_status)
+
+    monitor.clob_client = ConnectingClient()
+    await monitor._run_websocket_monitor(["tok"], {"m1": "Market"})
+
+    assert seen == ["disconnected", "connected"]
@@ -1,6 +1,14 @@
-"""Tests for portfolio command field normalization helpers."""
+"""Tests for the portfolio command."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
 
 from polyterm.cli.commands.portfolio import _extract_position_fields
+from polyterm.cli.main import cli
+from polyterm.db.database import Database
+from polyterm.db.models import Trade, Wallet
 
 
 def test_extract_position_fields_supports_lowercase_l_pnl_keys():
@@ -33,3 +41,34 @@ def test_extract_position_fields_prefers_explicit_pnl_when_present():
     )
 
     assert normalized["total_pnl"] == 42.0
+
+
+def test_local_portfolio_prices_tracked_positions_with_clob_midpoints(tmp_path):
+    """`portfolio --local` should price local positions through the CLOB client."""
+    db = Database(str(tmp_path / "test.db"))
+    db.upsert_wallet(Wallet(address="0xw", first_seen=datetime.now()))
+    db.insert_trade(Trade(
+        market_id="0xcond1", wallet_address="0xw", side="BUY", outcome="YES",
+        price=0.4, size=100, notional=40, timestamp=datetime.now(), tx_hash="0xtx1",
+    ))
+    gamma = Mock()
+    gamma.get_markets_by_ids.return_value = {"0xcond1": {
+        "id": "1",
+        "question": "Will it happen?",
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": '["0.30", "0.70"]',
+        "clobTokenIds": '["yes-1", "no-1"]',
+    }}
+    clob = Mock()
+    clob.get_midpoints.return_value = {"yes-1": 0.55}
+
+    with patch("polyterm.cli.commands.portfolio.Database", return_value=db), \
+            patch("polyterm.cli.commands.portfolio.GammaClient", return_value=gamma), \
+            patch("polyterm.cli.commands.portfolio.CLOBClient", return_value=clob):
+        result = CliRunner().invoke(cli, ["portfolio", "--local", "--wallet", "0xw"])
+
+    assert result.exit_code == 0, result.output
+    clob.get_midpoints.assert_called_once_with(["yes-1"])
+    assert "Will it happen?" in result.output
+    assert "$55.00" in result.output
+    clob.close.assert_called_once()
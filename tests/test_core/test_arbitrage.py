@@ -10,6 +10,7 @@ from polyterm.db.database import Database
 from polyterm.core.arbitrage import (
     ArbitrageScanner,
     ArbitrageResult,
+    IncrementalArbitrage,
 )
 from polyterm.core.orderbook import OrderBookAnalyzer, LiveOrderBook
 
@@ -250,8 +251,11 @@ class TestLivePriceIntegration:
         analyzer = OrderBookAnalyzer(clob)
         for tid, data in books_data.items():
             book = LiveOrderBook(tid)
-            book._bids = {str(p): str(s) for p, s in data.get("bids", {}).items()}
-            book._asks = {str(p): str(s) for p, s in data.get("asks", {}).items()}
+            book.handle_message({
+                "type": "book",
+                "bids": [{"price": str(p), "size": str(s)} for p, s in data.get("bids", {}).items()],
+                "asks": [{"price": str(p), "size": str(s)} for p, s in data.get("asks", {}).items()],
+            })
             analyzer._live_books[tid] = book
         return analyzer
 
@@ -463,3 +467,117 @@ class TestLivePriceIntegration:
         assert prices is not None
         assert abs(prices['yes'] - 0.44) < 0.01  # mid price
         assert abs(prices['no'] - 0.56) < 0.01  # derived: 1 - 0.44
+
+
+def _binary_event(index, yes='0.50', no='0.50'):
+    return {
+        'id': f'event{index}',
+        'title': f'Event {index}',
+        'markets': [{
+            'id': f'market{index}',
+            'conditionId': f'cond{index}',
+            'clobTokenIds': [f'yes{index}', f'no{index}'],
+            'outcomePrices': [yes, no],
+        }],
+    }
+
+
+def _quote(book, bid, ask):
+    """Replace the book's quote with one bid and one ask level"""
+    snapshot = book.get_snapshot()
+    book.handle_message({
+        "type": "book",
+        "bids": [{"price": level["price"], "size": "0"} for level in snapshot["bids"]]
+        + [{"price": str(bid), "size": "100"}],
+        "asks": [{"price": level["price"], "size": "0"} for level in snapshot["asks"]]
+        + [{"price": str(ask), "size": "100"}],
+    })
+
+
+class TestIncrementalArbitrage:
+    """Test the live-book driven intra-market evaluator"""
+
+    @pytest.fixture
+    def scanner(self, temp_db):
+        return ArbitrageScanner(database=temp_db, gamma_client=None, clob_client=None, min_spread=0.025)
+
+    @pytest.fixture
+    def incremental(self, scanner):
+        incremental = IncrementalArbitrage(scanner)
+        incremental.track([_binary_event(i) for i in range(3)])
+        return incremental
+
+    @pytest.fixture
+    def books(self, incremental):
+        books = {tid: LiveOrderBook(tid) for tid in incremental.token_ids}
+        incremental.attach(books)
+        return books
+
+    def test_tracks_both_tokens_of_each_market(self, incremental):
+        assert incremental.token_ids == ['yes0', 'no0', 'yes1', 'no1', 'yes2', 'no2']
+        assert incremental.best() is None
+
+    def test_gamma_prices_seed_the_table(self, scanner):
+        incremental = IncrementalArbitrage(scanner)
+        incremental.track([_binary_event(0, '0.45', '0.50')])
+
+        best = incremental.best()
+        assert best.market1_id == 'market0'
+        assert best.market1_yes_price == 0.45
+
+    def test_book_update_reprices_only_its_market(self, incremental, books, scanner, monkeypatch):
+        calls = []
+        original = scanner._intra_market_result
+        monkeypatch.setattr(scanner, '_intra_market_result', lambda *args: calls.append(args[2]) or original(*args))
+
+        _quote(books['yes1'], 0.43, 0.45)
+
+        assert calls == ['market1']
+
+    def test_matches_full_scan(self, incremental, books, scanner, temp_db):
+        _quote(books['yes0'], 0.43, 0.45)
+        _quote(books['no0'], 0.50, 0.52)
+        _quote(books['yes2'], 0.40, 0.42)
+        _quote(books['no2'], 0.50, 0.52)
+
+        analyzer = OrderBookAnalyzer(MagicMock())
+        analyzer._live_books.update(books)
+        scanner.ob_analyzer = analyzer
+        scan = scanner.scan_intra_market_arbitrage([_binary_event(i) for i in range(3)])
+
+        live = incremental.opportunities()
+        assert [o.market1_id for o in live] == [o.market1_id for o in scan] == ['market2', 'market0']
+        assert [o.net_profit for o in live] == pytest.approx([o.net_profit for o in scan])
+        assert incremental.best().market1_id == 'market2'
+
+    def test_opportunities_persist_on_state_change_only(self, incremental, books, temp_db):
+        _quote(books['no0'], 0.50, 0.52)
+        _quote(books['yes0'], 0.43, 0.45)
+        _quote(books['yes0'], 0.42, 0.44)
+        _quote(books['yes0'], 0.43, 0.45)
+
+        open_arbs = temp_db.get_open_arbitrage()
+        assert len(open_arbs) == 1
+        assert open_arbs[0].market1_id == 'market0'
+
+        _quote(books['yes0'], 0.48, 0.50)
+
+        assert temp_db.get_open_arbitrage() == []
+        assert incremental.best() is None
+
+    def test_unchanged_price_is_skipped(self, incremental, books):
+        _quote(books['yes0'], 0.43, 0.45)
+        updates = incremental.updates
+
+        books['yes0'].handle_message({"type": "last_trade_price", "price": "0.44"})
+
+        assert incremental.updates == updates
+
+    def test_heap_stays_bounded(self, incremental, books):
+        _quote(books['no0'], 0.50, 0.52)
+        for i in range(200):
+            bid = 0.40 + (i % 3) * 0.01
+            _quote(books['yes0'], bid, bid + 0.02)
+
+        assert len(incremental._heap) <= 64
+        assert len(incremental.opportunities(limit=5)) == 1
@@ -0,0 +1,173 @@
+"""Tests for the historical backtest engine"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from polyterm.core.backtest import (
+    BacktestData,
+    BacktestEngine,
+    MarketSeries,
+    STRATEGIES,
+    load_backtest_data,
+    target_positions,
+)
+from polyterm.core.fees import GENERIC_FEE_SCHEDULE, ZERO_FEE_SCHEDULE
+from polyterm.db.database import Database
+from polyterm.db.models import MarketSnapshot, Trade, Wallet
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Database(os.path.join(tmpdir, "test.db"))
+
+
+def _series(prices, volume=None, whale_flow=None, fee_schedule=ZERO_FEE_SCHEDULE):
+    prices = np.asarray(prices, dtype=float)
+    bars = len(prices)
+    return MarketSeries(
+        market_id="m1",
+        title="Market 1",
+        price=prices,
+        volume=np.zeros(bars) if volume is None else np.asarray(volume, dtype=float),
+        whale_flow=np.zeros(bars) if whale_flow is None else np.asarray(whale_flow, dtype=float),
+        fee_schedule=fee_schedule,
+    )
+
+
+def _engine(series, **kwargs):
+    data = BacktestData(start_ts=0, bar_seconds=3600, bars=len(series.price), markets=[series])
+    return BacktestEngine(data, **kwargs)
+
+
+class TestSignals:
+    """Vectorized signals and position holding"""
+
+    def test_momentum_fills_one_bar_after_signal_and_holds(self):
+        series = _series([0.5, 0.5, 0.6, 0.6, 0.6, 0.6, 0.6])
+        positions = target_positions(series, "momentum", {"lookback": 1, "threshold": 0.05, "hold": 2})
+        assert positions.tolist() == [0, 0, 0, 1, 1, 0, 0]
+
+    def test_contrarian_fades_the_move(self):
+        series = _series([0.5, 0.5, 0.6, 0.6])
+        positions = target_positions(series, "contrarian", {"lookback": 1, "threshold": 0.05, "hold": 1})
+        assert positions.tolist() == [0, 0, 0, -1]
+
+    def test_whale_follow_uses_signed_flow(self):
+        series = _series([0.5] * 4, whale_flow=[0, -20000, 0, 0])
+        positions = target_positions(series, "whale-follow", {"window": 1, "min_flow": 10000, "hold": 1})
+        assert positions.tolist() == [0, 0, -1, 0]
+
+    def test_no_position_before_first_price(self):
+        series = _series([np.nan, np.nan, 0.5, 0.7, 0.7])
+        positions = target_positions(series, "momentum", {"lookback": 1, "threshold": 0.05, "hold": 5})
+        assert positions.tolist() == [0, 0, 0, 0, 1]
+
+
+class TestExecution:
+    """Fills, fees and metrics"""
+
+    def test_winning_long_trade_pnl(self):
+        series = _series([0.5, 0.5, 0.6, 0.6, 0.8, 0.8])
+        result = _engine(series, capital=1000, position_size=0.5).run(
+            "momentum", {"lookback": 1, "threshold": 0.05, "hold": 2},
+        )
+
+        # Enter at 0.6 with $500, exit at 0.8: 833.33 shares * 0.2 = +166.67
+        assert result["total_trades"] == 1
+        assert result["trades"][0]["side"] == "BUY"
+        assert result["trades"][0]["pnl"] == pytest.approx(500 / 0.6 * 0.2)
+        assert result["final_capital"] == pytest.approx(1000 + 500 / 0.6 * 0.2)
+        assert result["win_rate"] == 100
+
+    def test_short_trade_buys_no(self):
+        series = _series([0.5, 0.5, 0.4, 0.4, 0.2, 0.2])
+        result = _engine(series, capital=1000, position_size=0.5).run(
+            "momentum", {"lookback": 1, "threshold": 0.05, "hold": 2},
+        )
+
+        # Buy NO at 0.6, exit at 0.8
+        assert result["trades"][0]["side"] == "SELL"
+        assert result["trades"][0]["pnl"] == pytest.approx(500 / 0.6 * 0.2)
+
+    def test_fees_reduce_pnl(self):
+        prices = [0.5, 0.5, 0.6, 0.6, 0.8, 0.8]
+        params = {"lookback": 1, "threshold": 0.05, "hold": 2}
+        free = _engine(_series(prices)).run("momentum", params)
+        charged = _engine(_series(prices, fee_schedule=GENERIC_FEE_SCHEDULE)).run("momentum", params)
+
+        assert charged["fees_paid"] > 0
+        assert charged["final_capital"] == pytest.approx(free["final_capital"] - charged["fees_paid"], rel=1e-3)
+
+    def test_flat_market_has_no_trades(self):
+        for strategy in STRATEGIES:
+            result = _engine(_series([0.5] * 50)).run(strategy)
+            assert result["total_trades"] == 0
+            assert result["final_capital"] == pytest.approx(1000)
+            assert result["max_drawdown"] == 0
+
+    def test_sweep_ranks_by_sharpe(self):
+        rng = np.random.default_rng(7)
+        prices = np.clip(0.5 + np.cumsum(rng.normal(0, 0.01, 300)), 0.05, 0.95)
+        engine = _engine(_series(prices))
+        grid = {"lookback": [1, 3], "threshold": [0.01, 0.02], "hold": [2, 6]}
+
+        ranked = engine.sweep("momentum", grid=grid, workers=1, top=0)
+
+        assert len(ranked) == 8
+        sharpes = [result["sharpe_ratio"] for result in ranked]
+        assert sharpes == sorted(sharpes, reverse=True)
+        assert "trades" not in ranked[0]
+        best = engine.run("momentum", ranked[0]["params"])
+        assert best["sharpe_ratio"] == pytest.approx(sharpes[0])
+
+
+class TestLoading:
+    """Snapshots, trades and CLOB fallback onto the bar grid"""
+
+    def test_loads_snapshots_and_trades(self, temp_db):
+        now = datetime.now()
+        for hours_ago, price in [(5, 0.40), (4, 0.45), (2, 0.50)]:
+            temp_db.insert_snapshot(MarketSnapshot(
+                market_id="m1", title="Market 1", probability=price,
+                timestamp=now - timedelta(hours=hours_ago, minutes=30),
+            ))
+        temp_db.upsert_wallet(Wallet(address="0xw", first_seen=now))
+        temp_db.insert_trade(Trade(
+            market_id="0xcond1", wallet_address="0xw", side="BUY", outcome="NO",
+            price=0.55, size=40000, notional=22000, timestamp=now - timedelta(hours=2, minutes=30),
+        ))
+        market = {"id": "m1", "question": "Market 1", "conditionId": "0xcond1"}
+
+        data = load_backtest_data(temp_db, [market], days=1, now=now.timestamp())
+
+        series = data.markets[0]
+        assert data.bars == 24
+        assert data.sources == ["snapshots"]
+        assert np.isnan(series.price[17])
+        assert series.price[18:].tolist() == pytest.approx([0.40, 0.45, 0.45, 0.50, 0.50, 0.50])
+        assert series.volume[21] == pytest.approx(22000)
+        assert series.whale_flow[21] == pytest.approx(-22000)
+
+    def test_falls_back_to_clob_history(self, temp_db):
+        now = int(datetime.now().timestamp())
+
+        class FakeClob:
+            def get_price_history(self, token_id, **kwargs):
+                assert token_id == "yes-1"
+                return [{"t": now - 7200, "p": 0.3}, {"t": now - 3600, "p": 0.35}]
+
+        market = {"id": "m1", "clobTokenIds": '["yes-1", "no-1"]'}
+        data = load_backtest_data(temp_db, [market], days=1, clob_client=FakeClob(), now=now)
+
+        assert data.sources == ["clob"]
+        assert data.markets[0].price[-2:].tolist() == [0.3, 0.35]
+
+    def test_markets_without_history_are_skipped(self, temp_db):
+        data = load_backtest_data(temp_db, [{"id": "m1"}], days=1)
+        assert data.markets == []
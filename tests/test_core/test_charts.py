@@ -131,3 +131,12 @@ class TestGeneratePriceChart:
         assert isinstance(result, str)
         assert "Market A" in result
         assert "Market B" in result
+
+    def test_comparison_chart_aligns_series(self):
+        """Market 2 should be read at market 1's timestamps"""
+        now = datetime.now()
+        m1 = [(now + timedelta(hours=i), 0.5) for i in range(4)]
+        m2 = [(now - timedelta(hours=1), 0.2), (now + timedelta(hours=2, minutes=30), 0.8)]
+        result = generate_comparison_chart(m1, m2, "Market A", "Market B")
+        # Last aligned market 2 value is 0.8 and it started from 0.2.
+        assert "80% (+300.0%)" in result
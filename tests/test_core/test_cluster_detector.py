@@ -4,16 +4,27 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
-from polyterm.core.cluster_detector import WalletClusterDetector
+from polyterm.core.cluster_detector import WalletClusterDetector, WalletProfile
 from polyterm.db.models import Trade, Wallet
 
 
+def _mock_db():
+    """MagicMock database whose bulk wallet loader delegates to get_trades_by_wallet."""
+    db = MagicMock()
+    db.get_wallet_trade_points.side_effect = lambda addresses, limit_per_wallet: [
+        (address, trade.market_id, trade.size)
+        for address in addresses
+        for trade in db.get_trades_by_wallet(address, limit_per_wallet)
+    ]
+    return db
+
+
 class TestTimingClusters:
     """Tests for timing correlation detection"""
 
     def test_detects_correlated_trades(self):
         """Should detect wallets trading within time window"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         # Two wallets trading within 10 seconds of each other, 3 times
@@ -37,7 +48,7 @@ class TestTimingClusters:
 
     def test_ignores_same_wallet_trades(self):
         """Should not correlate trades from same wallet"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         trades = [
@@ -54,7 +65,7 @@ class TestTimingClusters:
 
     def test_returns_empty_when_no_trades(self):
         """Should return empty list when no trades"""
-        db = MagicMock()
+        db = _mock_db()
         db.get_recent_trades.return_value = []
 
         detector = WalletClusterDetector(db)
@@ -64,7 +75,7 @@ class TestTimingClusters:
 
     def test_filters_below_threshold(self):
         """Should filter pairs with less than 3 correlated trades"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         # Only 2 correlated trades
@@ -83,7 +94,7 @@ class TestTimingClusters:
 
     def test_respects_time_window(self):
         """Should only detect trades within specified time window"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         # Trades outside 10-second window
@@ -108,7 +119,7 @@ class TestMarketOverlapClusters:
 
     def test_detects_high_overlap(self):
         """Should detect wallets trading same markets"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -132,7 +143,7 @@ class TestMarketOverlapClusters:
 
     def test_filters_low_overlap(self):
         """Should filter wallets with low market overlap"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -163,7 +174,7 @@ class TestMarketOverlapClusters:
 
     def test_requires_at_least_two_markets(self):
         """Should skip wallets with less than 2 markets"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -191,7 +202,7 @@ class TestMarketOverlapClusters:
 
     def test_returns_empty_for_single_wallet(self):
         """Should return empty when only one wallet"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [Wallet(address="0xAAA", first_seen=now)]
@@ -204,7 +215,7 @@ class TestMarketOverlapClusters:
 
     def test_boundary_overlap_70_percent(self):
         """Should detect exactly 70% overlap when min_overlap=0.7"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -236,7 +247,7 @@ class TestSizePatternClusters:
 
     def test_detects_matching_sizes(self):
         """Should detect wallets using same trade sizes"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -260,7 +271,7 @@ class TestSizePatternClusters:
 
     def test_returns_empty_when_no_matches(self):
         """Should return empty when no matching sizes"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -291,7 +302,7 @@ class TestSizePatternClusters:
 
     def test_returns_empty_for_few_wallets(self):
         """Should return empty when less than 2 wallets"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [Wallet(address="0xAAA", first_seen=now)]
@@ -304,7 +315,7 @@ class TestSizePatternClusters:
 
     def test_filters_zero_size_trades(self):
         """Should filter out zero-size trades"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         wallets = [
@@ -331,7 +342,7 @@ class TestClusterScore:
 
     def test_high_score_all_signals(self):
         """Should give high score when all signals present"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         # Setup timing correlation
@@ -359,7 +370,7 @@ class TestClusterScore:
 
     def test_low_score_no_correlation(self):
         """Should give low score when no correlation"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         db.get_recent_trades.return_value = []
@@ -381,7 +392,7 @@ class TestClusterScore:
 
     def test_medium_score_partial_correlation(self):
         """Should give medium score for partial correlation"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         db.get_recent_trades.return_value = []
@@ -400,7 +411,7 @@ class TestClusterScore:
 
     def test_returns_low_score_for_no_trades(self):
         """Should return low score when wallets have no trades"""
-        db = MagicMock()
+        db = _mock_db()
 
         db.get_recent_trades.return_value = []
         db.get_trades_by_wallet.return_value = []
@@ -412,13 +423,29 @@ class TestClusterScore:
         assert result['risk'] == 'low'
         assert len(result['signals']) == 0
 
+    def test_missing_profiles_load_in_one_query(self):
+        """Wallets absent from profiles should be fetched together"""
+        db = _mock_db()
+        db.get_trades_by_wallet.return_value = []
+        profiles = {"0xAAA": WalletProfile({"m1"}, set())}
+
+        detector = WalletClusterDetector(db)
+        detector.calculate_cluster_score("0xAAA", "0xBBB", timing_lookup={}, profiles=profiles)
+        detector.calculate_cluster_score("0xCCC", "0xDDD", timing_lookup={}, profiles=profiles)
+
+        assert [call.args[0] for call in db.get_wallet_trade_points.call_args_list] == [
+            ["0xBBB"],
+            ["0xCCC", "0xDDD"],
+        ]
+        assert set(profiles) == {"0xAAA", "0xBBB", "0xCCC", "0xDDD"}
+
 
 class TestDetectClusters:
     """Tests for full cluster detection"""
 
     def test_combines_all_methods(self):
         """Should combine results from all detection methods"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         # Setup timing
@@ -454,7 +481,7 @@ class TestDetectClusters:
 
     def test_reuses_precomputed_timing_during_scoring(self):
         """Should not recompute expensive timing scan per wallet pair."""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         timing_trades = []
@@ -483,7 +510,7 @@ class TestDetectClusters:
 
     def test_filters_by_min_score(self):
         """Should filter clusters below minimum score"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         db.get_recent_trades.return_value = []
@@ -496,7 +523,7 @@ class TestDetectClusters:
 
     def test_returns_empty_for_empty_database(self):
         """Should return empty when no wallet data"""
-        db = MagicMock()
+        db = _mock_db()
 
         db.get_recent_trades.return_value = []
         db.get_all_wallets.return_value = []
@@ -508,7 +535,7 @@ class TestDetectClusters:
 
     def test_sorts_by_score_descending(self):
         """Should sort results by score (highest first)"""
-        db = MagicMock()
+        db = _mock_db()
         now = datetime.now()
 
         # Create multiple wallet pairs with different correlation levels
@@ -536,3 +563,54 @@ class TestDetectClusters:
 
         if len(results) >= 2:
             assert results[0]['score'] >= results[1]['score']
+
+
+class TestIndexedDetection:
+    """Per-market windows and inverted-index candidate generation"""
+
+    def test_timing_only_pairs_trades_in_same_market(self):
+        """Trades in different markets within the window should not pair"""
+        db = _mock_db()
+        now = datetime.now()
+        trades = []
+        for i in range(4):
+            trades.extend([
+                Trade(wallet_address="0xAAA", market_id="m1", timestamp=now + timedelta(minutes=i), size=10.0, price=0.5),
+                Trade(wallet_address="0xBBB", market_id="m2", timestamp=now + timedelta(minutes=i, seconds=2), size=10.0, price=0.5),
+            ])
+        db.get_recent_trades.return_value = trades
+
+        detector = WalletClusterDetector(db)
+
+        assert detector.find_timing_clusters(window_seconds=30) == []
+
+    def test_minhash_path_finds_high_overlap_pairs(self, monkeypatch):
+        """LSH candidates should still surface near-identical market sets"""
+        monkeypatch.setattr("polyterm.core.cluster_detector.EXACT_PAIR_BUDGET", 0)
+        shared = {f"m{i}" for i in range(20)}
+        profiles = {
+            "0xAAA": WalletProfile(shared, set()),
+            "0xBBB": WalletProfile(shared | {"extra"}, set()),
+            "0xCCC": WalletProfile({f"z{i}" for i in range(20)}, set()),
+        }
+
+        detector = WalletClusterDetector(_mock_db())
+        results = detector.find_market_overlap_clusters(min_overlap=0.7, profiles=profiles)
+
+        assert [(w1, w2) for w1, w2, _ in results] == [("0xAAA", "0xBBB")]
+        assert results[0][2] == round(20 / 21, 3)
+
+    def test_ubiquitous_sizes_are_ignored(self, monkeypatch):
+        """Sizes shared by too many wallets should not create pairs"""
+        monkeypatch.setattr("polyterm.core.cluster_detector.MAX_SIZE_BUCKET_WALLETS", 2)
+        common = {1.0, 2.0, 3.0}
+        profiles = {
+            "0xAAA": WalletProfile(set(), common | {7.77, 8.88, 9.99}),
+            "0xBBB": WalletProfile(set(), common | {7.77, 8.88, 9.99}),
+            "0xCCC": WalletProfile(set(), common),
+        }
+
+        detector = WalletClusterDetector(_mock_db())
+        results = detector.find_size_pattern_clusters(profiles=profiles)
+
+        assert results == [("0xAAA", "0xBBB", 3)]
@@ -0,0 +1,133 @@
+"""Tests for the market correlation engine"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from polyterm.core import correlation
+from polyterm.core.correlation import CorrelationEngine
+from polyterm.db.database import Database
+from polyterm.db.models import MarketSnapshot
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Database(os.path.join(tmpdir, "test.db"))
+
+
+def _seed(db, market_id, prices, start, step_minutes=5):
+    for index, price in enumerate(prices):
+        db.insert_snapshot(MarketSnapshot(
+            market_id=market_id,
+            title=f"Market {market_id}",
+            probability=price,
+            timestamp=start + timedelta(minutes=step_minutes * index),
+        ))
+
+
+class TestCorrelationMatrix:
+    """Vectorized matrix against the pairwise path"""
+
+    def test_matrix_matches_pairwise_correlation(self, temp_db):
+        start = datetime.now() - timedelta(hours=2)
+        base = [0.40, 0.42, 0.45, 0.43, 0.48, 0.50, 0.47, 0.52, 0.55, 0.53]
+        _seed(temp_db, "a", base, start)
+        _seed(temp_db, "b", [p + 0.1 for p in base], start)
+        _seed(temp_db, "c", [1 - p for p in base], start)
+        _seed(temp_db, "d", [0.3, 0.35, 0.3, 0.35, 0.3, 0.35, 0.3, 0.35, 0.3, 0.35], start)
+        engine = CorrelationEngine(temp_db)
+
+        matrix = engine.calculate_correlation_matrix(["a", "b", "c", "d"], hours=4)
+
+        assert matrix["a"]["a"] == 1.0
+        assert matrix["a"]["b"] == pytest.approx(1.0)
+        assert matrix["a"]["c"] == pytest.approx(-1.0)
+        assert matrix["b"]["a"] == matrix["a"]["b"]
+        pairwise = engine.calculate_correlation("a", "d", hours=4)
+        assert matrix["a"]["d"] == pytest.approx(pairwise.correlation, abs=1e-9)
+
+    def test_missing_or_sparse_markets_read_as_zero(self, temp_db):
+        start = datetime.now() - timedelta(hours=1)
+        _seed(temp_db, "a", [0.1, 0.2, 0.3, 0.4, 0.5, 0.6], start)
+        _seed(temp_db, "sparse", [0.5, 0.6], start)
+        engine = CorrelationEngine(temp_db)
+
+        matrix = engine.calculate_correlation_matrix(["a", "sparse", "unknown"], hours=4)
+
+        assert matrix["a"]["sparse"] == 0.0
+        assert matrix["a"]["unknown"] == 0.0
+        assert matrix["unknown"]["unknown"] == 1.0
+
+    def test_panel_is_cached_per_window(self, temp_db):
+        start = datetime.now() - timedelta(hours=1)
+        _seed(temp_db, "a", [0.1, 0.2, 0.3, 0.4, 0.5], start)
+        engine = CorrelationEngine(temp_db)
+
+        first = engine.load_price_panel(["a"], hours=4)
+        assert engine.load_price_panel(["a"], hours=4) is first
+        assert engine.load_price_panel(["a"], hours=8) is not first
+
+    def test_panel_cache_is_bounded_and_drops_expired_panels(self, temp_db, monkeypatch):
+        monkeypatch.setattr(correlation, "PANEL_CACHE_SIZE", 2)
+        engine = CorrelationEngine(temp_db)
+
+        first = engine.load_price_panel(["a"], hours=1)
+        engine.load_price_panel(["a"], hours=2)
+        assert engine.load_price_panel(["a"], hours=1) is first
+        engine.load_price_panel(["a"], hours=3)
+
+        # hours=2 was least recently used
+        assert [key[0] for key in engine._panel_cache] == [1, 3]
+
+        engine._cache_ttl = 0
+        engine.load_price_panel(["a"], hours=4)
+        assert [key[0] for key in engine._panel_cache] == [4]
+
+
+class TestAlignSeries:
+    def test_tolerance_is_strict(self, temp_db):
+        start = datetime(2026, 1, 1)
+        series1 = [(start, 0.5), (start + timedelta(hours=1), 0.6)]
+        series2 = [(start + timedelta(minutes=15), 0.4), (start + timedelta(hours=1, minutes=14), 0.3)]
+
+        aligned = CorrelationEngine(temp_db)._align_series(series1, series2)
+
+        assert aligned == [(start + timedelta(hours=1), 0.6, 0.3)]
+
+
+class TestCorrelationBreaks:
+    """Batch break scan"""
+
+    def test_scan_flags_pairs_whose_recent_correlation_flipped(self, temp_db):
+        # 66 points ten minutes apart; only the last six fall in the last hour.
+        start = datetime.now() - timedelta(minutes=655)
+        older = [0.3 + 0.003 * i for i in range(60)]
+        recent = [0.5, 0.55, 0.52, 0.58, 0.54, 0.6]
+        _seed(temp_db, "a", older + recent, start, step_minutes=10)
+        _seed(temp_db, "b", older + [1 - p for p in recent], start, step_minutes=10)
+        engine = CorrelationEngine(temp_db)
+
+        breaks = engine.scan_correlation_breaks(["a", "b"], short_window=1, long_window=12, threshold=0.5)
+
+        assert len(breaks) == 1
+        assert breaks[0]["direction"] == "weakening"
+        assert breaks[0]["short_term_correlation"] < 0
+
+    def test_pair_detection_reads_the_panel_and_matches_the_scan(self, temp_db, monkeypatch):
+        start = datetime.now() - timedelta(minutes=655)
+        older = [0.3 + 0.003 * i for i in range(60)]
+        recent = [0.5, 0.55, 0.52, 0.58, 0.54, 0.6]
+        _seed(temp_db, "a", older + recent, start, step_minutes=10)
+        _seed(temp_db, "b", older + [1 - p for p in recent], start, step_minutes=10)
+        engine = CorrelationEngine(temp_db)
+        monkeypatch.setattr(engine.db, "get_market_history", None)
+
+        result = engine.detect_correlation_breaks("a", "b", short_window=1, long_window=12, threshold=0.5)
+        scanned = engine.scan_correlation_breaks(["a", "b"], short_window=1, long_window=12, threshold=0.5)
+
+        assert result == scanned[0]
+        assert engine.detect_correlation_breaks("a", "missing", short_window=1, long_window=12) is None
@@ -0,0 +1,150 @@
+"""Tests for order book ladders and impact curves"""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from polyterm.core import impact
+from polyterm.core.impact import Ladder
+from polyterm.core.orderbook import LiveOrderBook, OrderBookAnalyzer
+
+
+BOOK = {
+    # REST books are not guaranteed best-first
+    'asks': [
+        {'price': '0.62', 'size': '50'},
+        {'price': '0.60', 'size': '100'},
+        {'price': '0.65', 'size': '200'},
+    ],
+    'bids': [
+        {'price': '0.55', 'size': '100'},
+        {'price': '0.58', 'size': '40'},
+        {'price': 'bad', 'size': '10'},
+    ],
+}
+
+
+def walk(levels, size):
+    """Reference level-by-level fill"""
+    remaining, cost, used = size, 0.0, 0
+    for price, level_size in levels:
+        if remaining <= 0:
+            break
+        take = min(remaining, level_size)
+        cost += take * price
+        remaining -= take
+        used += 1
+    return size - remaining, cost, used
+
+
+class TestLadder:
+    def test_levels_are_sorted_best_first(self):
+        asks = Ladder.from_book(BOOK, 'buy')
+        bids = Ladder.from_book(BOOK, 'sell')
+
+        assert asks.prices == [0.60, 0.62, 0.65]
+        assert asks.cumulative_size == [100, 150, 350]
+        assert asks.cumulative_notional == pytest.approx([60, 91, 221])
+        assert bids.prices == [0.58, 0.55]
+        assert bids.best_price == 0.58
+
+    def test_fill_in_shares(self):
+        point = Ladder.from_book(BOOK, 'buy').fill(120)
+
+        assert point['cost'] == pytest.approx(72.4)
+        assert point['avg_price'] == pytest.approx(72.4 / 120)
+        assert point['slippage'] == pytest.approx(72.4 / 120 - 0.60)
+        assert point['slippage_pct'] == pytest.approx((72.4 / 120 - 0.60) / 0.60 * 100)
+        assert point['levels_used'] == 2
+        assert point['fillable']
+
+    def test_fill_in_notional(self):
+        point = Ladder.from_book(BOOK, 'buy').fill(91, by='notional')
+
+        assert point['shares'] == pytest.approx(150)
+        assert point['levels_used'] == 2
+
+    def test_level_boundary_uses_exact_levels(self):
+        assert Ladder.from_book(BOOK, 'buy').fill(100)['levels_used'] == 1
+
+    def test_unfillable_size_reports_what_is_available(self):
+        point = Ladder.from_book(BOOK, 'buy').fill(500)
+
+        assert not point['fillable']
+        assert point['shares'] == 350
+        assert point['available'] == 350
+        assert point['levels_used'] == 3
+
+    def test_zero_size_and_empty_ladder(self):
+        assert Ladder.from_book(BOOK, 'buy').fill(0)['avg_price'] is None
+        empty = Ladder.from_levels([], 'buy').impact_curve([10, 20])
+        assert [p['fillable'] for p in empty] == [False, False]
+        assert empty[0]['shares'] == 0
+
+    def test_reference_price_for_mid_slippage(self):
+        point = Ladder.from_book(BOOK, 'buy').fill(100, reference=0.59)
+
+        assert point['slippage'] == pytest.approx(0.01)
+
+    def test_unknown_unit_is_rejected(self):
+        with pytest.raises(ValueError):
+            Ladder.from_book(BOOK, 'buy').fill(10, by='contracts')
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_curve_matches_level_walk(self, monkeypatch, use_numpy):
+        if use_numpy and not impact.HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(impact, 'HAS_NUMPY', use_numpy and impact.HAS_NUMPY)
+        rng = random.Random(7)
+        levels = [(round(0.30 + i * 0.01, 2), rng.uniform(10, 300)) for i in range(40)]
+        ladder = Ladder('buy', [p for p, _ in levels], [s for _, s in levels])
+        sizes = [rng.uniform(0, ladder.depth * 1.1) for _ in range(300)]
+
+        curve = ladder.impact_curve(sizes)
+
+        for size, point in zip(sizes, curve):
+            shares, cost, used = walk(levels, size)
+            assert point['shares'] == pytest.approx(shares)
+            assert point['cost'] == pytest.approx(cost)
+            assert point['levels_used'] == used
+
+
+class TestBookIntegration:
+    def test_live_book_ladder(self):
+        book = LiveOrderBook('tok')
+        book.handle_message({'type': 'book', 'asks': BOOK['asks'], 'bids': BOOK['bids'][:2]})
+
+        asks = Ladder.from_book(book, 'buy')
+
+        assert asks.prices == Ladder.from_book(BOOK, 'buy').prices
+        assert asks.fill(120)['cost'] == pytest.approx(72.4)
+        assert book.ladder('sell').prices == [0.58, 0.55]
+
+    def test_calculate_slippage_uses_best_level_first(self):
+        clob = MagicMock()
+        clob.get_order_book.return_value = BOOK
+        result = OrderBookAnalyzer(clob).calculate_slippage('tok', 'buy', 120)
+
+        assert result['best_price'] == 0.60
+        assert result['total_cost'] == pytest.approx(72.4)
+        assert result['levels_used'] == 2
+
+    def test_calculate_slippage_insufficient_liquidity(self):
+        clob = MagicMock()
+        clob.get_order_book.return_value = BOOK
+        result = OrderBookAnalyzer(clob).calculate_slippage('tok', 'sell', 500)
+
+        assert result == {'error': 'Insufficient liquidity', 'available': 140}
+
+    def test_analyzer_curve_prefers_live_book(self):
+        clob = MagicMock()
+        analyzer = OrderBookAnalyzer(clob)
+        live = LiveOrderBook('tok')
+        live.handle_message({'type': 'book', 'asks': [{'price': '0.50', 'size': '1000'}]})
+        analyzer._live_books['tok'] = live
+
+        curve = analyzer.impact_curve('tok', 'buy', [10, 100])
+
+        assert [p['avg_price'] for p in curve] == [0.50, 0.50]
+        clob.get_order_book.assert_not_called()
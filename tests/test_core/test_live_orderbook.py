@@ -217,6 +217,71 @@ class TestLiveOrderBookDepth:
         assert isinstance(populated_book.last_update, datetime)
 
 
+class TestLiveOrderBookLevelStore:
+    """Test the tick-indexed level store and version counter"""
+
+    def test_version_bumps_only_on_changes(self):
+        book = LiveOrderBook("token-1")
+        assert book.version == 0
+        book.handle_message({"type": "book", "bids": [{"price": "0.55", "size": "100"}]})
+        assert book.version == 1
+        # Removing a level that does not exist is a no-op
+        book.handle_message({"type": "book", "bids": [{"price": "0.40", "size": "0"}]})
+        assert book.version == 1
+        book.handle_message({"type": "tick_size_change"})
+        assert book.version == 1
+        book.handle_message({"type": "last_trade_price", "price": "0.55"})
+        assert book.version == 2
+
+    def test_equivalent_price_strings_share_a_level(self):
+        book = LiveOrderBook("token-1")
+        book.handle_message({"type": "book", "asks": [{"price": "0.56", "size": "100"}]})
+        book.handle_message({"type": "book", "asks": [{"price": "0.560", "size": "250"}]})
+        asks = book.get_snapshot()["asks"]
+        assert len(asks) == 1
+        assert asks[0]["size"] == "250"
+
+    def test_top_of_book_tracks_removals(self):
+        book = LiveOrderBook("token-1")
+        book.handle_message({
+            "type": "book",
+            "bids": [{"price": "0.55", "size": "1"}, {"price": "0.50", "size": "1"}],
+            "asks": [{"price": "0.60", "size": "1"}, {"price": "0.58", "size": "1"}],
+        })
+        book.handle_message({
+            "type": "book",
+            "bids": [{"price": "0.55", "size": "0"}],
+            "asks": [{"price": "0.58", "size": "0"}],
+        })
+        tob = book.get_top_of_book()
+        assert tob["best_bid"] == 0.50
+        assert tob["best_ask"] == 0.60
+
+    def test_cumulative_depth_refreshes_after_update(self):
+        book = LiveOrderBook("token-1")
+        book.handle_message({"type": "book", "bids": [{"price": "0.55", "size": "10"}]})
+        assert book.get_depth()["bid_depth"] == 10.0
+        book.handle_message({"type": "book", "bids": [{"price": "0.54", "size": "5"}]})
+        assert book.get_depth()["bid_depth"] == 15.0
+
+    def test_invalid_size_is_skipped(self):
+        book = LiveOrderBook("token-1")
+        book.handle_message({"type": "book", "bids": [{"price": "0.55", "size": "bad"}]})
+        assert not book.is_ready
+
+    def test_cost_to_fill_walks_levels(self):
+        book = LiveOrderBook("token-1")
+        book.handle_message({
+            "type": "book",
+            "bids": [{"price": "0.50", "size": "100"}],
+            "asks": [{"price": "0.62", "size": "50"}, {"price": "0.60", "size": "100"}],
+        })
+        assert book.cost_to_fill(100) == (pytest.approx(60.0), 1)
+        assert book.cost_to_fill(120) == (pytest.approx(72.4), 2)
+        assert book.cost_to_fill(50, side="sell") == (pytest.approx(25.0), 1)
+        assert book.cost_to_fill(151) is None
+
+
 # ── OrderBookAnalyzer live methods ────────────────────────────────────────
 
 
@@ -6,7 +6,8 @@ from datetime import datetime
 
 import pytest
 
-from polyterm.core.negrisk import NegRiskAnalyzer
+from polyterm.core.negrisk import NegRiskAnalyzer, NegRiskMonitor
+from polyterm.core.orderbook import LiveOrderBook
 
 
 # Fixtures
@@ -495,3 +496,127 @@ class TestNegRiskEdgeCases:
         # Should be parseable as ISO datetime
         dt = datetime.fromisoformat(result['timestamp'])
         assert isinstance(dt, datetime)
+
+
+def ask_book(token_id, *levels):
+    """LiveOrderBook holding the given (price, size) asks"""
+    book = LiveOrderBook(token_id)
+    book.handle_message({
+        'type': 'book',
+        'asks': [{'price': str(price), 'size': str(size)} for price, size in levels],
+    })
+    return book
+
+
+class TestNegRiskMonitor:
+    """Test the streaming basket monitor"""
+
+    @pytest.fixture
+    def event(self):
+        return create_event('e1', 'Who wins?', [
+            create_market('m1', 'A', 0.30),
+            create_market('m2', 'B', 0.30),
+            create_market('m3', 'C', 0.30),
+        ])
+
+    @pytest.fixture
+    def signals(self):
+        return []
+
+    @pytest.fixture
+    def monitor(self, analyzer, event, signals):
+        monitor = NegRiskMonitor(analyzer, basket_size=100, min_edge=0.02, on_signal=signals.append)
+        monitor.add_event(event)
+        return monitor
+
+    def test_tracks_yes_token_of_every_outcome(self, monitor):
+        assert monitor.token_ids == ['token_m1', 'token_m2', 'token_m3']
+
+    def test_skips_event_with_missing_token(self, analyzer, event):
+        event['markets'][1]['clobTokenIds'] = '[]'
+        monitor = NegRiskMonitor(analyzer)
+
+        assert not monitor.add_event(event)
+        assert monitor.token_ids == []
+
+    def test_signal_fires_when_executable_edge_crosses(self, monitor, signals):
+        monitor.on_book(ask_book('token_m1', (0.30, 500)))
+        monitor.on_book(ask_book('token_m2', (0.30, 500)))
+        assert signals == []  # basket not fully quoted yet
+
+        monitor.on_book(ask_book('token_m3', (0.30, 500)))
+
+        assert len(signals) == 1
+        signal = signals[0]
+        assert signal['executable_price'] == pytest.approx(0.90)
+        # 0.10 below $1.00 less 2% fee on the 0.70 winnings
+        assert signal['fee_adjusted_profit'] == pytest.approx(0.086)
+        assert signal['expected_profit'] == pytest.approx(8.6)
+        assert signal['basket_cost'] == pytest.approx(90.0)
+
+    def test_thin_ladder_prices_deeper_levels(self, monitor, signals):
+        monitor.on_book(ask_book('token_m1', (0.30, 500)))
+        monitor.on_book(ask_book('token_m2', (0.30, 500)))
+        # Top of book sums to 0.90, but only 10 shares are offered there
+        monitor.on_book(ask_book('token_m3', (0.30, 10), (0.40, 500)))
+
+        assert signals == []
+        basket = monitor.baskets()[0]
+        assert basket['top_of_book_sum'] == pytest.approx(0.90)
+        assert basket['executable']['executable_price'] == pytest.approx(0.99)
+        assert basket['executable']['outcomes'][2]['levels_used'] == 2
+
+    def test_unfillable_basket_does_not_signal(self, monitor, signals):
+        monitor.on_book(ask_book('token_m1', (0.30, 500)))
+        monitor.on_book(ask_book('token_m2', (0.30, 500)))
+        monitor.on_book(ask_book('token_m3', (0.30, 50)))
+
+        assert signals == []
+        assert monitor.baskets()[0]['executable'] is None
+
+    def test_signals_once_per_crossing(self, monitor, signals):
+        books = [ask_book(f'token_m{i}', (0.30, 500)) for i in (1, 2, 3)]
+        for book in books:
+            monitor.on_book(book)
+        monitor.on_book(books[0])
+        assert len(signals) == 1
+
+        books[0].handle_message({'type': 'book', 'asks': [
+            {'price': '0.30', 'size': '0'}, {'price': '0.45', 'size': '500'},
+        ]})
+        monitor.on_book(books[0])
+        assert monitor.baskets()[0]['executable'] is None
+
+        books[0].handle_message({'type': 'book', 'asks': [{'price': '0.30', 'size': '500'}]})
+        monitor.on_book(books[0])
+        assert len(signals) == 2
+
+    def test_running_sum_follows_best_ask(self, monitor):
+        book = ask_book('token_m1', (0.40, 100))
+        monitor.on_book(book)
+        monitor.on_book(ask_book('token_m2', (0.35, 100)))
+        monitor.on_book(ask_book('token_m3', (0.35, 100)))
+        assert monitor.baskets()[0]['top_of_book_sum'] == pytest.approx(1.10)
+
+        book.handle_message({'type': 'book', 'asks': [{'price': '0.38', 'size': '100'}]})
+        monitor.on_book(book)
+
+        assert monitor.baskets()[0]['top_of_book_sum'] == pytest.approx(1.08)
+        assert monitor.baskets()[0]['quoted'] == 3
+
+    @pytest.mark.asyncio
+    async def test_start_subscribes_all_legs(self, monitor, signals):
+        ob_analyzer = Mock()
+
+        async def start_live_feed(token_ids, on_update=None, hub=None):
+            books = {tid: LiveOrderBook(tid) for tid in token_ids}
+            for book in books.values():
+                book.set_on_update(on_update)
+            return books
+
+        ob_analyzer.start_live_feed = start_live_feed
+        books = await monitor.start(ob_analyzer)
+        for book in books.values():
+            book.handle_message({'type': 'book', 'asks': [{'price': '0.30', 'size': '500'}]})
+
+        assert len(signals) == 1
@@ -0,0 +1,154 @@
+"""Tests for batched position pricing in PortfolioAnalytics"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from polyterm.core.portfolio import DEFAULT_PRICE, PortfolioAnalytics
+from polyterm.db.database import Database
+from polyterm.db.models import Trade, Wallet
+
+
+WALLET = "0xwallet"
+
+
+def _market(index):
+    return {
+        "id": str(index),
+        "question": f"Market {index}?",
+        "conditionId": f"0xcond{index}",
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": '["0.30", "0.70"]',
+        "clobTokenIds": f'["yes-{index}", "no-{index}"]',
+    }
+
+
+class FakeGamma:
+    def __init__(self, markets):
+        self.markets = markets
+        self.calls = []
+
+    def get_markets_by_ids(self, market_ids):
+        self.calls.append(list(market_ids))
+        return {market_id: self.markets[market_id] for market_id in market_ids if market_id in self.markets}
+
+    def get_markets(self, **kwargs):
+        raise AssertionError("per-market Gamma lookups should not be used")
+
+
+class FakeCLOB:
+    def __init__(self, midpoints):
+        self.midpoints = midpoints
+        self.calls = []
+
+    def get_midpoints(self, token_ids):
+        self.calls.append(list(token_ids))
+        return {token_id: self.midpoints[token_id] for token_id in token_ids if token_id in self.midpoints}
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(os.path.join(tmpdir, "test.db"))
+        yield db
+
+
+@pytest.fixture
+def wallet_db(temp_db):
+    """A wallet holding 60 open positions, alternating YES and NO"""
+    base_time = datetime.now() - timedelta(days=1)
+    temp_db.upsert_wallet(Wallet(address=WALLET, first_seen=base_time))
+    for i in range(60):
+        temp_db.insert_trade(Trade(
+            market_id=f"0xcond{i}",
+            market_slug=f"market-{i}",
+            wallet_address=WALLET,
+            side="BUY",
+            outcome="YES" if i % 2 == 0 else "NO",
+            price=0.4,
+            size=100,
+            notional=40,
+            timestamp=base_time + timedelta(minutes=i),
+            tx_hash=f"0xtx{i}",
+        ))
+    return temp_db
+
+
+def _markets():
+    return {f"0xcond{i}": _market(i) for i in range(60)}
+
+
+class TestBatchPricing:
+    """get_portfolio prices every position with one Gamma and one CLOB call"""
+
+    def test_sixty_positions_cost_two_requests(self, wallet_db):
+        gamma = FakeGamma(_markets())
+        midpoints = {f"yes-{i}": 0.25 for i in range(60)}
+        midpoints.update({f"no-{i}": 0.75 for i in range(60)})
+        clob = FakeCLOB(midpoints)
+        analytics = PortfolioAnalytics(wallet_db, gamma_client=gamma, clob_client=clob)
+
+        portfolio = analytics.get_portfolio(WALLET)
+
+        assert portfolio.total_positions == 60
+        assert len(gamma.calls) == 1 and len(gamma.calls[0]) == 60
+        assert len(clob.calls) == 1 and len(clob.calls[0]) == 60
+        by_market = {p.market_id: p for p in portfolio.positions}
+        assert by_market["0xcond0"].current_price == 0.25
+        assert by_market["0xcond1"].current_price == 0.75
+        assert by_market["0xcond0"].market_title == "Market 0?"
+        assert by_market["0xcond0"].price_source == "clob"
+        assert portfolio.total_current_value == pytest.approx(60 * 100 * 0.5)
+
+    def test_gamma_prices_fill_tokens_without_midpoint(self, wallet_db):
+        gamma = FakeGamma(_markets())
+        analytics = PortfolioAnalytics(wallet_db, gamma_client=gamma, clob_client=FakeCLOB({"yes-0": 0.2}))
+
+        quotes = analytics.resolve_prices([("0xcond0", "YES"), ("0xcond1", "NO")])
+
+        assert quotes[("0xcond0", "YES")].source == "clob"
+        assert quotes[("0xcond1", "NO")].price == 0.70
+        assert quotes[("0xcond1", "NO")].source == "gamma"
+
+    def test_unknown_market_uses_stale_default(self, wallet_db):
+        analytics = PortfolioAnalytics(wallet_db, gamma_client=FakeGamma({}), clob_client=FakeCLOB({}))
+
+        quote = analytics.resolve_prices([("0xmissing", "YES")])[("0xmissing", "YES")]
+
+        assert quote.price == DEFAULT_PRICE
+        assert quote.stale
+        assert quote.title == "0xmissing"
+
+    def test_fresh_quotes_are_served_from_cache(self, wallet_db):
+        gamma = FakeGamma(_markets())
+        clob = FakeCLOB({"yes-0": 0.2})
+        analytics = PortfolioAnalytics(wallet_db, gamma_client=gamma, clob_client=clob)
+
+        analytics.resolve_prices([("0xcond0", "YES")])
+        quotes = analytics.resolve_prices([("0xcond0", "YES"), ("0xcond2", "YES")])
+
+        assert gamma.calls == [["0xcond0"], ["0xcond2"]]
+        assert quotes[("0xcond0", "YES")].price == 0.2
+        assert quotes[("0xcond0", "YES")].age_seconds < analytics._cache_ttl
+
+    def test_works_without_clob_client(self, wallet_db):
+        analytics = PortfolioAnalytics(wallet_db, gamma_client=FakeGamma(_markets()))
+
+        assert analytics._get_current_price("0xcond3", "YES") == 0.30
+        assert analytics._get_market_title("0xcond3") == "Market 3?"
+
+    def test_midpoint_failure_is_logged_and_falls_back_to_gamma(self, wallet_db, caplog, capsys):
+        clob = Mock()
+        clob.get_midpoints.side_effect = ConnectionError("down")
+        analytics = PortfolioAnalytics(wallet_db, gamma_client=FakeGamma(_markets()), clob_client=clob)
+
+        with caplog.at_level("WARNING", logger="polyterm.core.portfolio"):
+            quote = analytics.resolve_prices([("0xcond0", "YES")])[("0xcond0", "YES")]
+
+        assert quote.source == "gamma"
+        assert "Error fetching midpoints: down" in caplog.text
+        assert capsys.readouterr().out == ""
@@ -286,3 +286,125 @@ class TestPredictionEngine:
         assert "5.5%" in formatted or "+5.5" in formatted
         assert "75%" in formatted
         assert "momentum" in formatted.lower()
+
+
+@pytest.fixture
+def multi_market_db(populated_db):
+    """Three markets with snapshots, trades, whale trades and smart money"""
+    base_time = datetime.now()
+    for m, drift in (("m_up", 0.01), ("m_down", -0.01)):
+        for i in range(20):
+            populated_db.insert_snapshot(MarketSnapshot(
+                market_id=m,
+                market_slug=m,
+                title=m,
+                probability=0.5 + i * drift,
+                volume_24h=10000,
+                liquidity=5000,
+                timestamp=base_time - timedelta(hours=20 - i),
+            ))
+        for i in range(15):
+            populated_db.insert_trade(Trade(
+                market_id=m,
+                wallet_address="0xsmart" if i % 3 == 0 else f"0xwallet{i % 5}",
+                side="BUY" if (i % 2 == 0) == (drift > 0) else "SELL",
+                outcome="YES",
+                price=0.5,
+                size=1000,
+                notional=20000 if i == 14 else 400 + i * 30,
+                timestamp=base_time - timedelta(hours=15 - i),
+            ))
+    return populated_db
+
+
+def _comparable(prediction):
+    data = prediction.to_dict()
+    data.pop('created_at')
+    return data
+
+
+class TestBatchPredictions:
+    """Test PredictionEngine.generate_predictions"""
+
+    MARKETS = ["test_market", "m_up", "m_down", "unknown_market"]
+
+    def test_batch_matches_single_market_predictions(self, multi_market_db):
+        engine = PredictionEngine(multi_market_db)
+
+        batch = engine.generate_predictions(self.MARKETS, horizon_hours=12)
+
+        assert [p.market_id for p in batch] == self.MARKETS
+        for prediction in batch:
+            single = engine.generate_prediction(prediction.market_id, horizon_hours=12)
+            assert _comparable(prediction) == _comparable(single)
+        types = {s.signal_type for s in batch[1].signals}
+        assert {SignalType.WHALE, SignalType.SMART_MONEY, SignalType.TECHNICAL} <= types
+
+    def test_queries_are_shared_across_markets(self, multi_market_db, monkeypatch):
+        engine = PredictionEngine(multi_market_db)
+        calls = []
+        for name in ("get_market_history", "get_trades_by_market", "get_large_trades",
+                     "get_smart_money_wallets", "get_market_price_points", "get_latest_trade_points"):
+            original = getattr(multi_market_db, name)
+            monkeypatch.setattr(
+                multi_market_db, name,
+                lambda *a, _name=name, _original=original, **kw: calls.append(_name) or _original(*a, **kw),
+            )
+
+        engine.generate_predictions(self.MARKETS)
+
+        assert sorted(calls) == sorted([
+            "get_smart_money_wallets", "get_market_price_points",
+            "get_latest_trade_points", "get_large_trades",
+        ])
+
+    def test_api_data_takes_precedence_and_skips_snapshots(self, multi_market_db, monkeypatch):
+        engine = PredictionEngine(multi_market_db)
+        market_data = {
+            "m_up": {
+                "question": "Will it go up?",
+                "oneDayPriceChange": -0.05,
+                "volume24hr": 50000,
+                "outcomePrices": ["0.5", "0.5"],
+            },
+        }
+        loaded = []
+        original = multi_market_db.get_market_price_points
+        monkeypatch.setattr(
+            multi_market_db, "get_market_price_points",
+            lambda ids, hours: loaded.extend(ids) or original(ids, hours=hours),
+        )
+
+        prediction, = engine.generate_predictions(["m_up"], market_data=market_data)
+
+        momentum = next(s for s in prediction.signals if s.signal_type == SignalType.MOMENTUM)
+        assert prediction.market_title == "Will it go up?"
+        assert momentum.direction == Direction.BEARISH
+        assert loaded == []
+
+    def test_process_pool_matches_inline(self, multi_market_db):
+        engine = PredictionEngine(multi_market_db)
+
+        inline = engine.generate_predictions(self.MARKETS)
+        pooled = engine.generate_predictions(self.MARKETS, workers=2)
+
+        assert [_comparable(p) for p in pooled] == [_comparable(p) for p in inline]
+
+    def test_dense_history_is_downsampled_like_get_market_history(self, temp_db):
+        now = datetime.now()
+        for i in range(1200):
+            temp_db.insert_snapshot(MarketSnapshot(
+                market_id="dense",
+                market_slug="dense",
+                title="Dense",
+                probability=0.5 + (i % 60) / 1000,
+                volume_24h=0,
+                liquidity=0,
+                timestamp=now - timedelta(minutes=1200 - i),
+            ))
+        engine = PredictionEngine(temp_db)
+
+        batch, = engine.generate_predictions(["dense"])
+        single = engine.generate_prediction("dense")
+
+        assert _comparable(batch) == _comparable(single)
@@ -198,6 +198,142 @@ class TestMarketScanner:
         assert len(history) == 5
 
 
+class TestBulkSnapshots:
+    """Test MarketScanner's batched snapshot pipeline"""
+
+    @staticmethod
+    def _market(market_id, price, updated_at="2026-01-01T00:00:00Z", volume=10000):
+        return {
+            "id": market_id,
+            "question": f"Market {market_id}",
+            "outcomePrices": f'["{price}", "{1 - price}"]',
+            "clobTokenIds": f'["tok-{market_id}", "no-{market_id}"]',
+            "volume": volume,
+            "liquidity": 5000,
+            "updatedAt": updated_at,
+        }
+
+    @pytest.fixture
+    def clients(self):
+        gamma = Mock()
+        gamma.get_markets_by_ids.return_value = {
+            str(i): self._market(str(i), 0.50) for i in range(200)
+        }
+        clob = Mock()
+        clob.get_order_books.side_effect = lambda tokens: {
+            token: {"bids": [{"price": "0.49", "size": "10"}], "asks": [{"price": "0.51", "size": "10"}]}
+            for token in tokens
+        }
+        clob.get_last_trade_prices.side_effect = lambda tokens: {
+            token: {"price": "0.50", "side": "BUY"} for token in tokens
+        }
+        clob.calculate_spread.return_value = 4.08
+        return gamma, clob
+
+    def test_cycle_uses_bulk_requests(self, clients):
+        gamma, clob = clients
+        scanner = MarketScanner(gamma, clob)
+
+        scanner.scan_markets([str(i) for i in range(200)], {"probability": 10.0})
+
+        gamma.get_markets_by_ids.assert_called_once()
+        gamma.get_market.assert_not_called()
+        clob.get_order_book.assert_not_called()
+        assert clob.get_order_books.call_count == 1
+        assert len(clob.get_order_books.call_args[0][0]) == 200
+        snapshot = scanner.snapshots["7"][-1]
+        assert snapshot.price == 0.50
+        assert snapshot.data["last_trade_price"] == 0.50
+        assert snapshot.data["spread"] == 4.08
+
+    def test_unchanged_markets_skip_clob_requests(self, clients):
+        gamma, clob = clients
+        scanner = MarketScanner(gamma, clob)
+        ids = [str(i) for i in range(200)]
+        scanner.scan_markets(ids, {"probability": 10.0})
+
+        gamma.get_markets_by_ids.return_value["3"] = self._market("3", 0.70, updated_at="2026-01-01T00:01:00Z")
+        shifts = scanner.scan_markets(ids, {"probability": 10.0})
+
+        assert clob.get_order_books.call_args[0][0] == ["tok-3"]
+        assert [shift["market_id"] for shift in shifts] == ["3"]
+        assert len(scanner.snapshots["5"]) == 2
+        assert scanner.snapshots["5"][-1].data == scanner.snapshots["5"][0].data
+
+    def test_gamma_fields_refresh_while_clob_data_is_reused(self, clients):
+        gamma, clob = clients
+        scanner = MarketScanner(gamma, clob)
+        scanner.get_market_snapshots(["1"])
+
+        # Same updatedAt, so only the Gamma-derived fields may change
+        gamma.get_markets_by_ids.return_value = {"1": self._market("1", 0.62, volume=25000)}
+        snapshot = scanner.get_market_snapshots(["1"])["1"]
+
+        assert clob.get_order_books.call_count == 1
+        assert snapshot.price == 0.62
+        assert snapshot.volume == 25000
+        assert snapshot.data["spread"] == 4.08
+        assert snapshot.data["last_trade_price"] == 0.50
+
+    def test_clob_data_refreshes_after_interval(self, clients, monkeypatch):
+        gamma, clob = clients
+        scanner = MarketScanner(gamma, clob)
+        clock = [1000.0]
+        monkeypatch.setattr("polyterm.core.scanner.time.time", lambda: clock[0])
+
+        scanner.get_market_snapshots(["1"])
+        clock[0] += scanner.clob_refresh_interval - 1
+        scanner.get_market_snapshots(["1"])
+        assert clob.get_order_books.call_count == 1
+
+        clob.get_last_trade_prices.side_effect = lambda tokens: {token: {"price": "0.55"} for token in tokens}
+        clock[0] += 1
+        snapshot = scanner.get_market_snapshots(["1"])["1"]
+        assert clob.get_order_books.call_count == 2
+        assert snapshot.data["last_trade_price"] == 0.55
+
+    def test_payload_hash_when_updated_at_missing(self, clients):
+        gamma, clob = clients
+        market = self._market("1", 0.50, updated_at=None)
+        scanner = MarketScanner(gamma, clob)
+
+        scanner.get_market_snapshots(["1"], markets={"1": market})
+        scanner.get_market_snapshots(["1"], markets={"1": dict(market)})
+        assert clob.get_order_books.call_count == 1
+
+        scanner.get_market_snapshots(["1"], markets={"1": dict(market, volume=20000)})
+        assert clob.get_order_books.call_count == 2
+
+    def test_shift_compares_against_last_stored_snapshot(self, clients):
+        gamma, clob = clients
+        scanner = MarketScanner(gamma, clob)
+        callback = Mock()
+        scanner.add_shift_callback(callback)
+
+        scanner.scan_market("1", {"probability": 10.0})
+        gamma.get_markets_by_ids.return_value = {"1": self._market("1", 0.65, updated_at="later")}
+        shift = scanner.scan_market("1", {"probability": 10.0})
+
+        assert shift["changes"]["probability_change"] == pytest.approx(15.0)
+        callback.assert_called_once_with(shift)
+
+    def test_clob_failure_still_builds_snapshots(self, clients):
+        gamma, clob = clients
+        clob.get_order_books.side_effect = Exception("down")
+        scanner = MarketScanner(gamma, clob)
+
+        snapshots = scanner.get_market_snapshots(["1", "missing"])
+
+        assert list(snapshots) == ["1"]
+        assert snapshots["1"].data["spread"] == 0
+
+        # The failed CLOB data is not cached, so the next cycle retries it
+        clob.get_order_books.side_effect = lambda tokens: {token: {"bids": [1], "asks": [1]} for token in tokens}
+        snapshots = scanner.get_market_snapshots(["1"])
+        assert clob.get_order_books.call_count == 2
+        assert snapshots["1"].data["spread"] == 4.08
+
+
 class TestMarketOpportunityScanner:
     """Test agent-native one-shot opportunity scans."""
 
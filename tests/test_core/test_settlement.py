@@ -1,5 +1,6 @@
 """Tests for real-time settlement detection via CLOB WebSocket market_resolved event (POL-13)"""
 
+import asyncio
 import json
 import pytest
 import tempfile
@@ -94,7 +95,7 @@ class TestLiveOrderBookResolution:
 # ---------------------------------------------------------------------------
 
 class TestCLOBClientResolutionCallback:
-    """Test that listen_orderbook routes market_resolved to the resolution callback."""
+    """Test that the order book feed routes market_resolved to the resolution callback."""
 
     @pytest.fixture
     def client(self):
@@ -104,34 +105,25 @@ class TestCLOBClientResolutionCallback:
             ws_endpoint="wss://ws.example.com",
         )
 
+    @staticmethod
+    async def _drain():
+        for _ in range(5):
+            await asyncio.sleep(0)
+
     @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
     async def test_market_resolved_invokes_resolution_callback(self, client):
-        """market_resolved messages should invoke _ob_resolution_callback, not _ob_callback."""
+        """market_resolved messages should reach the resolution callback, not the book callback."""
         ob_messages = []
         res_messages = []
 
-        def ob_callback(data):
-            ob_messages.append(data)
-
-        def res_callback(data):
-            res_messages.append(data)
-
-        resolved_msg = json.dumps({
+        await client.subscribe_orderbook(["token1"], ob_messages.append, resolution_callback=res_messages.append)
+        client.market_hub().dispatch_frame(json.dumps({
             "type": "market_resolved",
             "market": "token1",
             "outcome": "YES",
             "price": "1.0",
-        })
-
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=[resolved_msg, Exception("done")])
-
-        client.clob_ws = mock_ws
-        client._ob_callback = ob_callback
-        client._ob_resolution_callback = res_callback
-
-        await client.listen_orderbook(max_reconnects=0)
+        }))
+        await self._drain()
 
         # Resolution callback should receive the message
         assert len(res_messages) == 1
@@ -140,67 +132,39 @@ class TestCLOBClientResolutionCallback:
 
         # Normal callback should NOT receive it
         assert len(ob_messages) == 0
+        await client.close_websocket()
 
     @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
     async def test_market_resolved_without_resolution_callback(self, client):
         """market_resolved messages should be silently ignored when no resolution callback is set."""
         ob_messages = []
 
-        def ob_callback(data):
-            ob_messages.append(data)
-
-        resolved_msg = json.dumps({
-            "type": "market_resolved",
-            "market": "token1",
-            "outcome": "YES",
-        })
-        book_msg = json.dumps({
-            "type": "book",
-            "market": "token1",
-            "bids": [],
-            "asks": [],
-        })
-
-        mock_ws = AsyncMock()
-        mock_ws.recv = AsyncMock(side_effect=[resolved_msg, book_msg, Exception("done")])
-
-        client.clob_ws = mock_ws
-        client._ob_callback = ob_callback
-        client._ob_resolution_callback = None
-
-        await client.listen_orderbook(max_reconnects=0)
+        await client.subscribe_orderbook(["token1"], ob_messages.append)
+        client.market_hub().dispatch_frame(json.dumps([
+            {"type": "market_resolved", "market": "token1", "outcome": "YES"},
+            {"type": "book", "market": "token1", "bids": [], "asks": []},
+        ]))
+        await self._drain()
 
         # Only the book message should reach the ob callback
         assert len(ob_messages) == 1
         assert ob_messages[0]["type"] == "book"
+        await client.close_websocket()
 
     @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_subscribe_orderbook_sets_resolution_callback(self, mock_websockets, client):
-        """subscribe_orderbook should store the resolution_callback."""
-        mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-        client.clob_ws = mock_ws
-
-        res_cb = MagicMock()
-        await client.subscribe_orderbook(["t1"], MagicMock(), resolution_callback=res_cb)
-
-        assert client._ob_resolution_callback is res_cb
-
-    @pytest.mark.asyncio
-    @patch("polyterm.api.clob.HAS_WEBSOCKETS", True)
-    @patch("polyterm.api.clob.websockets")
-    async def test_subscribe_sends_custom_feature_enabled(self, mock_websockets, client):
+    async def test_subscribe_sends_custom_feature_enabled(self, client):
         """Subscription message should include custom_feature_enabled: true."""
+        from polyterm.api.market_hub import MarketStreamHub
+
         mock_ws = AsyncMock()
-        mock_websockets.connect = AsyncMock(return_value=mock_ws)
-        client.clob_ws = mock_ws
+        mock_ws.recv = AsyncMock(side_effect=ConnectionError("done"))
+        client._market_hub = MarketStreamHub(connect=AsyncMock(return_value=mock_ws))
 
         await client.subscribe_orderbook(["t1", "t2"], MagicMock())
+        await client.listen_orderbook(max_reconnects=0)
 
-        sent = json.loads(mock_ws.send.call_args[0][0])
+        sent = json.loads(mock_ws.send.call_args_list[0][0][0])
+        assert sent["assets_ids"] == ["t1", "t2"]
         assert sent["custom_feature_enabled"] is True
 
 
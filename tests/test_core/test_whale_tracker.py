@@ -14,7 +14,7 @@ class TestWhaleTracker:
 
     @pytest.fixture
     def mock_db(self):
-        db = Mock()
+        db = MagicMock()
         db.get_wallet.return_value = None
         db.insert_trade.return_value = None
         db.upsert_wallet.return_value = None
@@ -982,3 +982,31 @@ class TestInsiderDetector:
         alert = detector.check_trade_for_insider_signals(trade, wallet)
         assert alert is not None
         assert alert.severity <= 100
+
+
+class TestWhaleTrackerMarketHub:
+    """WhaleTracker attached to a shared market hub"""
+
+    @pytest.mark.asyncio
+    async def test_hub_trades_flow_through_process_trade(self):
+        from polyterm.api.market_hub import MarketStreamHub
+
+        tracker = WhaleTracker(database=MagicMock(), clob_client=Mock())
+        tracker.process_trade = AsyncMock()
+        hub = MarketStreamHub()
+
+        monitor = asyncio.create_task(tracker.start_monitoring(["token-1"], hub=hub))
+        await asyncio.sleep(0)
+        assert hub.asset_ids == ["token-1"]
+
+        hub.dispatch({"event_type": "book", "asset_id": "token-1"})
+        hub.dispatch({"event_type": "last_trade_price", "asset_id": "token-1", "price": "0.6", "size": "10"})
+        await asyncio.sleep(0)
+
+        tracker.stop_monitoring()
+        await asyncio.wait_for(monitor, timeout=1)
+
+        tracker.process_trade.assert_awaited_once()
+        payload = tracker.process_trade.await_args.args[0]["payload"]
+        assert payload["asset_id"] == "token-1"
+        assert hub.asset_ids == []
@@ -0,0 +1,204 @@
+"""Tests for OHLCV candle rollups"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from polyterm.core.historical import HistoricalDataAPI
+from polyterm.db import candles
+from polyterm.db.candles import build_candles, rollup
+from polyterm.db.database import Database
+from polyterm.db.models import Trade, Wallet
+
+T0 = 1_700_006_400  # a UTC day boundary
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    database.upsert_wallet(Wallet(address="0xw", first_seen=datetime.now()))
+    yield database
+    database.close()
+
+
+def make_trade(offset, price, notional, market_id="m1", tx_hash=""):
+    return Trade(
+        market_id=market_id,
+        wallet_address="0xw",
+        side="BUY",
+        price=price,
+        size=notional / price if price else 0,
+        notional=notional,
+        timestamp=datetime.fromtimestamp(T0 + offset),
+        tx_hash=tx_hash,
+    )
+
+
+class TestBuildCandles:
+    def test_trades_fold_into_one_minute_candles(self):
+        result = build_candles([T0 + 5, T0 + 50, T0 + 70], [0.5, 0.7, 0.6], [10, 20, 30])
+
+        assert result[60] == [
+            (T0, 0.5, 0.7, 0.5, 0.7, 30.0, 2, T0 + 5, T0 + 50),
+            (T0 + 60, 0.6, 0.6, 0.6, 0.6, 30.0, 1, T0 + 70, T0 + 70),
+        ]
+        assert result[3600] == [(T0, 0.5, 0.7, 0.5, 0.6, 60.0, 3, T0 + 5, T0 + 70)]
+
+    def test_unsorted_input_and_zero_prices(self):
+        result = build_candles([T0 + 30, T0 + 10, T0 + 20], [0.4, 0.6, 0.0], [1, 2, 3])
+
+        assert result[60] == [(T0, 0.6, 0.6, 0.4, 0.4, 3.0, 2, T0 + 10, T0 + 30)]
+
+    def test_numpy_and_python_paths_agree(self, monkeypatch):
+        epochs = [T0 + i * 37 for i in range(500)]
+        prices = [0.3 + (i % 17) / 50 for i in range(500)]
+        notionals = [float(i % 9 + 1) for i in range(500)]
+
+        vectorized = build_candles(epochs, prices, notionals)
+        monkeypatch.setattr(candles, "HAS_NUMPY", False)
+        looped = build_candles(epochs, prices, notionals)
+
+        assert vectorized.keys() == looped.keys()
+        for interval in looped:
+            assert vectorized[interval] == pytest.approx(looped[interval])
+
+    def test_rollup_merges_to_custom_intervals(self):
+        hourly = build_candles([T0 + i * 3600 for i in range(4)], [0.1, 0.4, 0.2, 0.3], [1, 1, 1, 1])[3600]
+
+        merged = rollup(hourly, 7200)
+
+        assert [(c[0], c[1], c[2], c[3], c[4], c[6]) for c in merged] == [
+            (T0, 0.1, 0.4, 0.1, 0.4, 2),
+            (T0 + 7200, 0.2, 0.3, 0.2, 0.3, 2),
+        ]
+
+
+class TestCandleStore:
+    def test_inserted_trades_update_every_interval(self, db):
+        db.insert_trade(make_trade(10, 0.5, 10))
+        db.insert_trade(make_trade(400, 0.7, 5))
+
+        assert len(db.get_candles("m1", "1m")) == 2
+        assert len(db.get_candles("m1", "5m")) == 2
+        day = db.get_candles("m1", "1d")
+        assert day == [(T0, 0.5, 0.7, 0.5, 0.7, 15.0, 2, T0 + 10.0, T0 + 400.0)]
+
+    def test_late_trades_keep_open_and_close_in_time_order(self, db):
+        db.insert_trade(make_trade(30, 0.6, 1))
+        db.insert_trade(make_trade(50, 0.8, 1))
+        db.insert_trade(make_trade(10, 0.4, 1))
+
+        candle = db.get_candles("m1", "1m")[0]
+        assert candle[1:5] == (0.4, 0.8, 0.4, 0.8)
+
+    def test_duplicate_trades_are_not_counted_twice(self, db):
+        trade = make_trade(10, 0.5, 10, tx_hash="0xabc")
+        db.insert_trade(trade)
+        db.insert_trade(trade)
+        db.insert_trades_bulk([trade, make_trade(20, 0.6, 5, tx_hash="0xdef")])
+
+        candle = db.get_candles("m1", "1m")[0]
+        assert candle[6] == 2
+        assert candle[5] == 15.0
+
+    def test_bulk_insert_folds_only_new_rows_inside_a_transaction(self, db):
+        with db.transaction():
+            db.insert_trade(make_trade(5, 0.4, 1, tx_hash="0x1"))
+            result = db.insert_trades_bulk([
+                make_trade(5, 0.4, 1, tx_hash="0x1"),
+                make_trade(15, 0.5, 2, tx_hash="0x2"),
+                make_trade(15, 0.5, 2, tx_hash="0x2"),
+                make_trade(25, 0.6, 4),
+            ])
+
+        assert result == {"inserted": 2, "duplicates": 2}
+        candle = db.get_candles("m1", "1m")[0]
+        assert candle[5:7] == (7.0, 3)
+
+    def test_range_reads_include_the_candle_holding_start(self, db):
+        db.insert_trades_bulk([make_trade(h * 3600, 0.5, 1) for h in range(5)])
+
+        rows = db.get_candles("m1", "1h", start=T0 + 3600 + 120, end=T0 + 3 * 3600)
+
+        assert [row[0] for row in rows] == [T0 + 3600, T0 + 7200, T0 + 3 * 3600]
+
+    def test_unsupported_interval_raises(self, db):
+        with pytest.raises(ValueError):
+            db.get_candles("m1", "2h")
+
+    def test_existing_trades_are_backfilled(self, tmp_path):
+        path = str(tmp_path / "old.db")
+        database = Database(path)
+        database.upsert_wallet(Wallet(address="0xw", first_seen=datetime.now()))
+        database.insert_trades_bulk([make_trade(i * 60, 0.5, 2) for i in range(3)])
+        database.close()
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE candles")
+        conn.commit()
+        conn.close()
+
+        reopened = Database(path)
+
+        assert [row[6] for row in reopened.get_candles("m1", "1m")] == [1, 1, 1]
+        assert reopened.get_candles("m1", "1h")[0][6] == 3
+        reopened.close()
+
+    def test_rebuild_matches_incremental_candles(self, db):
+        db.insert_trades_bulk([make_trade(i * 45, 0.3 + i / 100, i + 1) for i in range(30)])
+        incremental = db.get_candles("m1", "15m")
+
+        db.rebuild_candles("m1")
+
+        assert db.get_candles("m1", "15m") == pytest.approx(incremental)
+
+
+class TestHistoricalCandles:
+    def test_ohlcv_reads_stored_and_merged_intervals(self, db):
+        db.insert_trades_bulk([make_trade(h * 3600 + 60, 0.1 * (h + 1), 1) for h in range(4)])
+        api = HistoricalDataAPI(db)
+
+        hourly = api.generate_ohlcv("m1", interval="1h")
+        two_hour = api.generate_ohlcv("m1", interval="2h")
+
+        assert len(hourly) == 4
+        assert hourly[0].timestamp == datetime.fromtimestamp(T0)
+        assert [(c.open, c.close, c.trade_count) for c in two_hour] == [
+            (pytest.approx(0.1), pytest.approx(0.2), 2),
+            (pytest.approx(0.3), pytest.approx(0.4), 2),
+        ]
+
+    def test_ohlcv_clips_edge_candles_to_the_time_range(self, db):
+        db.insert_trades_bulk([make_trade(m * 600, 0.1 * (m + 1), 1) for m in range(6)])
+        api = HistoricalDataAPI(db)
+
+        hourly = api.generate_ohlcv(
+            "m1",
+            interval="1h",
+            start_time=datetime.fromtimestamp(T0 + 1500),
+            end_time=datetime.fromtimestamp(T0 + 2400),
+        )
+
+        assert [(c.timestamp, c.open, c.close, c.trade_count) for c in hourly] == [
+            (datetime.fromtimestamp(T0), pytest.approx(0.4), pytest.approx(0.5), 2),
+        ]
+
+    def test_statistics_use_every_trade(self, db):
+        db.insert_trades_bulk([
+            make_trade(0, 0.5, 10),
+            make_trade(10, 0.7, 5),
+            make_trade(60, 0.6, 20),
+            make_trade(90, 0, 0),
+            make_trade(120, 0.4, 30),
+        ])
+
+        stats = HistoricalDataAPI(db).get_statistics("m1")
+
+        assert stats["trade_count"] == 5
+        assert stats["total_volume"] == 65
+        assert stats["price"]["high"] == 0.7
+        assert stats["price"]["avg"] == pytest.approx(0.55)
+        assert stats["price"]["change"] == pytest.approx(-0.1)
+
+    def test_statistics_without_trades(self, db):
+        assert HistoricalDataAPI(db).get_statistics("missing")["trade_count"] == 0
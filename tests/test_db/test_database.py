@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import os
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -353,9 +354,11 @@ class TestDatabase:
         deleted = temp_db.cleanup_old_data(days=30)
         assert deleted >= 1
 
+        # The old snapshot is compacted into an hourly aggregate, not lost
+        assert temp_db.get_database_stats()['market_snapshots'] == 1
         history = temp_db.get_market_history("market1", hours=24*365)
-        assert len(history) == 1
-        assert history[0].probability == 0.60
+        assert [s.probability for s in history] == [0.60, 0.50]
+        assert history[1].id is None
 
 
 class TestWalletModel:
@@ -443,3 +446,177 @@ class TestWalletModel:
         assert restored.address == wallet.address
         assert restored.total_trades == wallet.total_trades
         assert restored.tags == wallet.tags
+
+
+class TestConnectionReuse:
+    """Test the long-lived connection and transaction batching"""
+
+    def test_connection_is_reused_and_tuned(self, temp_db):
+        with temp_db._get_connection() as first:
+            mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+        with temp_db._get_connection() as second:
+            pass
+        assert first is second
+        assert mode == "wal"
+
+    def test_transaction_commits_once(self, temp_db):
+        now = datetime.now()
+        with temp_db.transaction() as conn:
+            temp_db.upsert_wallet(Wallet(address="0xbatch", first_seen=now))
+            temp_db.insert_trade(Trade(
+                market_id="m1", wallet_address="0xbatch", side="BUY",
+                price=0.5, size=10, notional=5, timestamp=now,
+            ))
+            assert conn.in_transaction
+
+        assert temp_db.get_wallet("0xbatch") is not None
+        assert len(temp_db.get_trades_by_wallet("0xbatch")) == 1
+
+    def test_transaction_rolls_back_nested_writes(self, temp_db):
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.upsert_wallet(Wallet(address="0xrollback", first_seen=datetime.now()))
+                raise RuntimeError("boom")
+
+        assert temp_db.get_wallet("0xrollback") is None
+
+    def test_close_releases_connections(self, temp_db):
+        with temp_db._get_connection() as conn:
+            pass
+        temp_db.close()
+        with pytest.raises(Exception):
+            conn.execute("SELECT 1")
+        assert temp_db.get_database_stats()["wallets"] == 0
+
+    def test_connections_of_finished_threads_are_pruned(self, temp_db):
+        def use_db():
+            temp_db.get_database_stats()
+
+        use_db()
+        workers = [threading.Thread(target=use_db) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+            worker.join()
+
+        # Each new thread's connection prunes the previous, finished one
+        assert list(temp_db._connections) == [threading.current_thread(), workers[-1]]
+
+    def test_close_only_closes_the_calling_threads_connection(self, temp_db):
+        opened = threading.Event()
+        release = threading.Event()
+        worker_conn = []
+
+        def worker():
+            with temp_db._get_connection() as conn:
+                worker_conn.append(conn)
+            opened.set()
+            release.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        opened.wait()
+        try:
+            temp_db.close()
+            assert worker_conn[0].execute("SELECT 1").fetchone()[0] == 1
+
+            temp_db.close_all()
+            with pytest.raises(Exception):
+                worker_conn[0].execute("SELECT 1")
+        finally:
+            release.set()
+            thread.join()
+
+    def test_auto_cleanup_runs_once_per_file(self, temp_db, monkeypatch):
+        calls = []
+        monkeypatch.setattr(Database, "_auto_cleanup", lambda self: calls.append(self))
+
+        Database(str(temp_db.db_path))
+        assert calls == []
+
+        Database(str(temp_db.db_path.parent / "other.db"))
+        assert len(calls) == 1
+
+
+class TestBulkIngestion:
+    """Test executemany-backed bulk wallet and trade writes"""
+
+    def _trade(self, tx_hash, wallet="0xbulk", market="m1"):
+        return Trade(
+            market_id=market,
+            wallet_address=wallet,
+            side="BUY",
+            price=0.5,
+            size=100,
+            notional=50.0,
+            timestamp=datetime.now(),
+            tx_hash=tx_hash,
+        )
+
+    def test_upsert_wallets_bulk(self, temp_db):
+        now = datetime.now()
+        written = temp_db.upsert_wallets_bulk([
+            Wallet(address="0xa", first_seen=now, total_trades=1),
+            Wallet(address="0xb", first_seen=now, total_trades=2),
+        ])
+        assert written == 2
+        assert temp_db.upsert_wallets_bulk([Wallet(address="0xa", first_seen=now, total_trades=5)]) == 1
+        assert temp_db.get_wallet("0xa").total_trades == 5
+        assert temp_db.upsert_wallets_bulk([]) == 0
+
+    def test_insert_trades_bulk_counts_duplicates(self, temp_db):
+        temp_db.upsert_wallet(Wallet(address="0xbulk", first_seen=datetime.now()))
+        first = temp_db.insert_trades_bulk([self._trade("0x1"), self._trade("0x2"), self._trade("0x1")])
+        assert first == {"inserted": 2, "duplicates": 1}
+
+        second = temp_db.insert_trades_bulk([self._trade("0x2"), self._trade("0x3"), self._trade("")])
+        assert second == {"inserted": 2, "duplicates": 1}
+        assert len(temp_db.get_trades_by_wallet("0xbulk")) == 4
+
+    def test_natural_key_index_dedupes_existing_rows(self, tmp_path):
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        db = Database(str(db_path))
+        db.upsert_wallet(Wallet(address="0xbulk", first_seen=datetime.now()))
+        db.close()
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DROP INDEX idx_trades_natural_key")
+        for _ in range(3):
+            conn.execute(
+                "INSERT INTO trades (market_id, wallet_address, side, price, size, timestamp, tx_hash) "
+                "VALUES ('m1', '0xbulk', 'BUY', 0.5, 1, '2026-01-01', '0xdup')"
+            )
+        conn.commit()
+        conn.close()
+
+        reopened = Database(str(db_path))
+        assert len(reopened.get_trades_by_wallet("0xbulk")) == 1
+        assert reopened.insert_trades_bulk([self._trade("0xdup")])["duplicates"] == 1
+
+    def test_get_wallet_trade_points_caps_per_wallet(self, temp_db):
+        for wallet in ("0xa", "0xb"):
+            temp_db.upsert_wallet(Wallet(address=wallet, first_seen=datetime.now()))
+        temp_db.insert_trades_bulk(
+            [self._trade(f"0xa{i}", wallet="0xa") for i in range(5)]
+            + [self._trade("0xb0", wallet="0xb")]
+        )
+
+        rows = temp_db.get_wallet_trade_points(["0xa", "0xb", "0xnone"], limit_per_wallet=3)
+
+        assert [wallet for wallet, _, _ in rows] == ["0xa"] * 3 + ["0xb"]
+        assert rows[-1] == ("0xb", "m1", 100.0)
+
+    def test_get_latest_trade_points_caps_per_market(self, temp_db):
+        temp_db.upsert_wallet(Wallet(address="0xbulk", first_seen=datetime.now()))
+        temp_db.insert_trades_bulk(
+            [self._trade(f"0xm1{i}", market="m1") for i in range(5)]
+            + [self._trade("0xm20", market="m2")]
+        )
+
+        rows = temp_db.get_latest_trade_points(["m1", "m2", "none"], limit_per_market=3)
+
+        assert [row[0] for row in rows] == ["m1", "m1", "m1", "m2"]
+        newest = [t.timestamp.isoformat() for t in temp_db.get_trades_by_market("m1", limit=3)]
+        assert [row[1] for row in rows[:3]] == newest[::-1]
+        assert rows[-1][2:] == ("0xbulk", "BUY", "", 50.0)
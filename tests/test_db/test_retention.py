@@ -0,0 +1,186 @@
+"""Tests for tiered snapshot retention"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from polyterm.db import retention
+from polyterm.db.database import Database
+from polyterm.db.models import MarketSnapshot
+from polyterm.db.retention import RetentionPolicy
+
+NOW = datetime.now().replace(second=0, microsecond=0)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+
+def snapshot(age, probability, spread=0.02, volume=1000.0, market_id="m1"):
+    return MarketSnapshot(
+        market_id=market_id,
+        probability=probability,
+        volume_24h=volume,
+        spread=spread,
+        timestamp=NOW - age,
+    )
+
+
+class TestMerge:
+    def test_merge_keeps_time_order_regardless_of_argument_order(self):
+        early = retention.from_snapshot(100.0, "s", "t", 0.4, 10, 0, 0, 0, 0.02)
+        late = retention.from_snapshot(130.0, "s", "t", 0.6, 20, 0, 0, 0, 0.04)
+
+        for merged in (retention.merge(early, late), retention.merge(late, early)):
+            row = dict(zip(retention.ROLLUP_COLUMNS, merged))
+            assert (row["open"], row["close"], row["low"], row["high"]) == (0.4, 0.6, 0.4, 0.6)
+            assert row["volume_24h"] == 20
+            assert row["spread"] == pytest.approx(0.03)
+            assert row["samples"] == 2
+
+    def test_pick_resolution_fits_window_into_limit(self):
+        assert retention.pick_resolution(24 * 3600, 1000) == 3600
+        assert retention.pick_resolution(12 * 3600, 1000) == 60
+        assert retention.pick_resolution(5 * 365 * 86400, 1000) == 86400
+
+
+class TestCompaction:
+    def test_recent_snapshots_stay_raw(self, db):
+        db.insert_snapshot(snapshot(timedelta(hours=1), 0.5))
+
+        moved = db.compact_snapshots(now=NOW)
+
+        assert moved == {"raw": 0, "minute": 0, "hourly": 0, "daily": 0}
+        assert db.get_database_stats()["market_snapshots"] == 1
+
+    def test_aged_snapshots_become_minute_aggregates(self, db):
+        base = timedelta(days=3)
+        for seconds, probability in ((20, 0.40), (30, 0.55), (40, 0.35), (50, 0.50)):
+            db.insert_snapshot(snapshot(base - timedelta(seconds=seconds), probability))
+
+        moved = db.compact_snapshots(now=NOW, batch_size=3)
+
+        assert moved["raw"] == 4
+        rows = db.get_snapshot_rollups("m1", resolution=60, hours=24 * 365 * 10)
+        assert sum(row["samples"] for row in rows) == 4
+        merged = rows[-1]
+        assert merged["close"] == 0.50
+        assert merged["low"] == 0.35
+
+    def test_tiers_cascade_and_expire(self, db):
+        db.insert_snapshot(snapshot(timedelta(days=20), 0.3))
+        db.insert_snapshot(snapshot(timedelta(days=200), 0.4))
+        db.insert_snapshot(snapshot(timedelta(days=1000), 0.5))
+
+        moved = db.compact_snapshots(now=NOW)
+
+        assert moved["raw"] == 3
+        assert moved["daily"] == 1
+        hourly = db.get_snapshot_rollups("m1", resolution=3600, hours=24 * 365 * 10)
+        daily = db.get_snapshot_rollups("m1", resolution=86400, hours=24 * 365 * 10)
+        assert [row["close"] for row in hourly] == [0.3]
+        assert [row["close"] for row in daily] == [0.4]
+
+    def test_repeated_compaction_merges_into_existing_aggregates(self, db):
+        policy = RetentionPolicy(raw_days=1)
+        db.insert_snapshot(snapshot(timedelta(days=2, seconds=-10), 0.6))
+        db.compact_snapshots(policy=policy, now=NOW)
+        # A late-arriving, earlier snapshot lands in the same minute
+        db.insert_snapshot(snapshot(timedelta(days=2, seconds=-5), 0.7))
+        db.compact_snapshots(policy=policy, now=NOW)
+
+        rows = db.get_snapshot_rollups("m1", resolution=60, hours=24 * 30)
+        assert len(rows) == 1
+        assert rows[0]["samples"] == 2
+        assert (rows[0]["open"], rows[0]["close"]) == (0.7, 0.6)
+
+
+class TestTieredQueries:
+    def test_history_spans_raw_and_compacted_tiers(self, db):
+        db.insert_snapshot(snapshot(timedelta(days=10), 0.2))
+        db.compact_snapshots()
+        db.insert_snapshot(MarketSnapshot(market_id="m1", probability=0.8, timestamp=datetime.now()))
+
+        history = db.get_market_history("m1", hours=24 * 30)
+
+        assert [s.probability for s in history] == [0.8, 0.2]
+        assert history[0].timestamp > history[1].timestamp
+
+    def test_long_windows_downsample_instead_of_truncating(self, db):
+        now = datetime.now()
+        for minutes in range(0, 600, 2):
+            db.insert_snapshot(MarketSnapshot(
+                market_id="m1", probability=minutes / 1000, timestamp=now - timedelta(minutes=minutes),
+            ))
+
+        history = db.get_market_history("m1", hours=12, limit=100)
+
+        # 300 raw points do not fit; 12 hourly points cover the whole window
+        assert 10 <= len(history) <= 13
+        assert history[-1].timestamp < now - timedelta(hours=8)
+
+    def test_explicit_resolution(self, db):
+        now = datetime.now().replace(second=30, microsecond=0)
+        for seconds in (0, 5, 10):
+            db.insert_snapshot(MarketSnapshot(
+                market_id="m1", probability=0.1 + seconds / 100, timestamp=now - timedelta(seconds=seconds),
+            ))
+
+        history = db.get_market_history("m1", hours=1, resolution=60)
+
+        assert len(history) == 1
+        assert history[0].probability == pytest.approx(0.1)
+
+    def test_downsampled_window_keeps_daily_tier_past_hourly_retention(self, db):
+        now = datetime.now()
+        for days in (1, 100, 200, 250):
+            db.insert_snapshot(MarketSnapshot(
+                market_id="m1", probability=days / 1000, timestamp=now - timedelta(days=days),
+            ))
+        db.compact_snapshots(now=now)
+        assert len(db.get_snapshot_rollups("m1", resolution=86400, hours=24 * 300)) == 2
+
+        history = db.get_market_history("m1", hours=24 * 300, resolution=3600)
+
+        # Hourly points for the recent part, daily ones past 180 days
+        assert [s.probability for s in history] == [0.001, 0.1, 0.2, 0.25]
+
+    def test_price_points_include_compacted_history(self, db):
+        db.insert_snapshot(snapshot(timedelta(days=5), 0.25, market_id="m2"))
+        db.compact_snapshots()
+        db.insert_snapshot(MarketSnapshot(market_id="m2", probability=0.3, timestamp=datetime.now()))
+
+        points = db.get_market_price_points(["m2"], hours=24 * 30)
+
+        assert [p[2] for p in points] == [0.25, 0.3]
+
+    def test_latest_snapshot_falls_back_to_aggregates(self, db):
+        db.insert_snapshot(snapshot(timedelta(days=5), 0.45))
+        db.compact_snapshots()
+
+        latest = db.get_latest_snapshot("m1")
+
+        assert latest is not None
+        assert latest.probability == 0.45
+
+
+def test_auto_cleanup_runs_in_a_background_thread(tmp_path, monkeypatch):
+    threads = []
+    done = threading.Event()
+
+    def fake_cleanup(self, days=30):
+        threads.append(threading.current_thread().name)
+        done.set()
+        return 0
+
+    monkeypatch.setattr(Database, "get_database_stats", lambda self: {"market_snapshots": 20000})
+    monkeypatch.setattr(Database, "cleanup_old_data", fake_cleanup)
+
+    Database(str(tmp_path / "large.db"))
+
+    assert done.wait(5)
+    assert threads == ["polyterm-db-cleanup"]
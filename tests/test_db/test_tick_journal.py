@@ -0,0 +1,233 @@
+"""Tests for the order book tick journal"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from polyterm.core.orderbook import LiveOrderBook, OrderBookAnalyzer, detect_replenishment
+from polyterm.db import tick_journal
+from polyterm.db.tick_journal import HEADER, RECORD, TickJournal
+
+T0 = 1_700_000_000.0
+
+
+def book(asset, bids, asks):
+    return {
+        "event_type": "book",
+        "asset_id": asset,
+        "bids": [{"price": p, "size": s} for p, s in bids],
+        "asks": [{"price": p, "size": s} for p, s in asks],
+    }
+
+
+def session(asset="tok-a"):
+    """A short feed: snapshot, deltas, trades and a price_changes batch"""
+    return [
+        book(asset, [("0.48", "100"), ("0.47", "250.5")], [("0.52", "80"), ("0.53", "120")]),
+        {"event_type": "book", "asset_id": asset, "bids": [{"price": "0.49", "size": "40"}], "asks": []},
+        {"event_type": "last_trade_price", "asset_id": asset, "price": "0.52", "size": "10", "side": "BUY"},
+        {"event_type": "price_change", "asset_id": asset, "price": "0.53", "size": "0", "side": "SELL"},
+        {"event_type": "price_change", "asset_id": asset, "price_changes": [
+            {"asset_id": asset, "price": "0.470", "size": "300", "side": "BUY"},
+            {"asset_id": asset, "price": "0.51", "size": "15", "side": "SELL"},
+        ]},
+        {"event_type": "last_trade_price", "asset_id": asset, "price": "0.51", "size": "15", "side": "BUY"},
+    ]
+
+
+def record_all(journal, messages, start=T0, step=1.0):
+    for offset, message in enumerate(messages):
+        journal.record(message, received_at=start + offset * step)
+    journal.flush(timeout=5)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    j = TickJournal(str(tmp_path / "ticks"))
+    yield j
+    j.close()
+
+
+class TestReplay:
+    def test_replay_rebuilds_the_same_book(self, journal):
+        live = LiveOrderBook("tok-a")
+        for message in session():
+            live.handle_message(message)
+        record_all(journal, session())
+
+        replayed = LiveOrderBook("tok-a")
+        count = journal.replay_into({"tok-a": replayed})
+
+        assert count == 7  # the price_changes batch becomes two messages
+        expected, actual = live.get_snapshot(), replayed.get_snapshot()
+        assert actual["bids"] == expected["bids"]
+        assert actual["asks"] == expected["asks"]
+        assert actual["last_trade_price"] == expected["last_trade_price"]
+
+    def test_messages_carry_receive_time(self, journal):
+        record_all(journal, session()[:2], start=T0 + 0.25)
+
+        stamps = [(ts, message["timestamp"]) for ts, message in journal.replay()]
+
+        assert stamps == [(T0 + 0.25, str(int((T0 + 0.25) * 1000))), (T0 + 1.25, str(int((T0 + 1.25) * 1000)))]
+
+    def test_asset_filter(self, journal):
+        messages = [m for pair in zip(session("tok-a"), session("tok-b")) for m in pair]
+        record_all(journal, messages)
+
+        assets = {message["asset_id"] for _, message in journal.replay(asset_ids=["tok-b"])}
+
+        assert assets == {"tok-b"}
+        assert set(journal.asset_ids()) >= {"tok-a", "tok-b"}
+
+    def test_time_window_uses_index_across_segments(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tick_journal, "INDEX_EVERY", 8)
+        trades = [
+            {"event_type": "last_trade_price", "asset_id": "tok-a", "price": "0.5", "size": str(i), "side": "BUY"}
+            for i in range(500)
+        ]
+        with TickJournal(str(tmp_path / "ticks"), segment_records=64) as journal:
+            record_all(journal, trades)
+
+            window = list(journal.replay(start=T0 + 100, end=T0 + 199))
+
+            assert len(journal.segments()) > 1
+        assert [ts for ts, _ in window] == [T0 + i for i in range(100, 200)]
+        assert window[0][1]["size"] == "100"
+
+    def test_new_writer_starts_a_new_segment(self, tmp_path):
+        path = str(tmp_path / "ticks")
+        with TickJournal(path) as first:
+            record_all(first, session()[:1])
+        with TickJournal(path) as second:
+            record_all(second, session()[2:3], start=T0 + 10)
+
+            assert len(second.segments()) == 2
+            kinds = [message["event_type"] for _, message in second.replay()]
+        assert kinds == ["book", "last_trade_price"]
+
+    def test_torn_trailing_record_is_ignored(self, tmp_path):
+        path = tmp_path / "ticks"
+        with TickJournal(str(path)) as journal:
+            record_all(journal, session()[2:3])
+        segment = sorted(path.glob("*.ticks"))[0]
+        with open(segment, "ab") as handle:
+            handle.write(b"\x01" * (RECORD.size // 2))
+
+        messages = list(TickJournal(str(path)).replay())
+
+        assert segment.stat().st_size > HEADER.size + RECORD.size
+        assert len(messages) == 1
+
+    def test_second_writer_is_refused(self, journal):
+        journal.start()
+        other = TickJournal(str(journal.path))
+
+        if not tick_journal.HAS_FCNTL:
+            pytest.skip("writer lock needs fcntl")
+        with pytest.raises(RuntimeError):
+            other.start()
+
+    def test_record_disables_itself_when_another_writer_holds_the_journal(self, journal, caplog):
+        if not tick_journal.HAS_FCNTL:
+            pytest.skip("writer lock needs fcntl")
+        journal.start()
+        other = TickJournal(str(journal.path))
+
+        other.record(session()[0], received_at=T0)
+        other.record(session()[1], received_at=T0 + 1)
+
+        assert other.failed
+        assert other._thread is None
+        assert "already has a writer" in caplog.text
+
+    def test_paced_replay_sleeps_scaled_gaps(self, journal):
+        record_all(journal, session(), step=2.0)
+        pauses = []
+
+        journal.replay_into({"tok-a": LiveOrderBook("tok-a")}, speed=4.0, sleep=pauses.append)
+
+        assert pauses == [0.5] * 5  # the split batch shares one receive time
+
+
+class TestReplenishment:
+    def test_refilling_level_is_flagged(self):
+        messages = [book("tok-a", [("0.40", "500")], [])]
+        for _ in range(3):
+            messages.append(book("tok-a", [("0.40", "100")], []))
+            messages.append(book("tok-a", [("0.40", "500")], []))
+
+        flagged = detect_replenishment(messages)
+
+        assert len(flagged) == 1
+        assert flagged[0]["side"] == "bid"
+        assert flagged[0]["price"] == 0.40
+        assert flagged[0]["count"] == 3
+        assert flagged[0]["hidden_volume"] == pytest.approx(1200)
+
+    def test_draining_level_is_not_flagged(self):
+        messages = [book("tok-a", [], [("0.60", str(size))]) for size in (500, 300, 100, 0)]
+
+        assert detect_replenishment(messages) == []
+
+    def test_level_missing_from_next_snapshot_counts_as_drawn_down(self):
+        resting = ("0.30", "1000")
+        messages = [book("tok-a", [("0.40", "500"), resting], [])]
+        for _ in range(3):
+            messages.append(book("tok-a", [resting], []))
+            messages.append(book("tok-a", [("0.40", "500"), resting], []))
+
+        flagged = detect_replenishment(messages)
+
+        assert [(item["price"], item["count"]) for item in flagged] == [(0.40, 3)]
+        assert flagged[0]["hidden_volume"] == pytest.approx(1500)
+
+    def test_price_change_refills_are_counted(self):
+        messages = [book("tok-a", [], [("0.60", "400")])]
+        for _ in range(3):
+            messages.append({"event_type": "price_change", "asset_id": "tok-a", "price_changes": [
+                {"asset_id": "tok-a", "price": "0.60", "size": "50", "side": "SELL"},
+            ]})
+            messages.append({"event_type": "price_change", "asset_id": "tok-a", "price": "0.60", "size": "400", "side": "SELL"})
+
+        flagged = detect_replenishment(messages)
+
+        assert len(flagged) == 1
+        assert flagged[0]["side"] == "ask"
+        assert flagged[0]["count"] == 3
+        assert flagged[0]["hidden_volume"] == pytest.approx(1050)
+
+    def test_detect_iceberg_orders_reads_the_journal(self, journal):
+        messages = [book("tok-a", [], [("0.55", "200")])]
+        for _ in range(4):
+            messages.append(book("tok-a", [], [("0.55", "50")]))
+            messages.append(book("tok-a", [], [("0.55", "200")]))
+        record_all(journal, messages)
+        clob = MagicMock()
+
+        flagged = OrderBookAnalyzer(clob).detect_iceberg_orders("tok-a", journal=journal)
+
+        assert flagged[0]["side"] == "ask"
+        assert flagged[0]["count"] == 4
+        clob.get_order_book.assert_not_called()
+
+
+class TestLiveFeedRecording:
+    @pytest.mark.asyncio
+    async def test_start_live_feed_records_messages(self, journal):
+        async def subscribe(token_ids, callback, **kwargs):
+            subscribe.callback = callback
+
+        clob = MagicMock()
+        clob.subscribe_orderbook = subscribe
+        analyzer = OrderBookAnalyzer(clob)
+        await analyzer.start_live_feed(["tok-a"], journal=journal)
+
+        for message in session():
+            subscribe.callback(message)
+        journal.flush(timeout=5)
+
+        replayed = LiveOrderBook("tok-a")
+        journal.replay_into({"tok-a": replayed})
+        assert replayed.get_snapshot()["bids"] == analyzer.get_live_book("tok-a").get_snapshot()["bids"]
+        assert journal.messages_recorded == len(session())
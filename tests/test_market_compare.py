@@ -67,11 +67,29 @@ def test_compare_returns_structured_market_divergence():
     assert result["markets"][0]["move"]["absolute_change"] == 0.07
     assert result["pairwise"][0]["probability_gap"] == 0.2
     assert result["pairwise"][0]["liquidity_gap"] == 700.0
+    assert result["pairwise"][0]["aligned_points"] == 0
+    assert result["pairwise"][0]["history_correlation"] is None
     assert result["headline"] == "Compared 2 markets; widest YES gap is 20.0 points."
     assert "price_history_available" in result["quality_flags"]
     assert result["evidence_sources"][0]["source"] == "gamma_api"
 
 
+def test_compare_correlates_aligned_price_history():
+    class TimedCLOBClient(FakeCLOBClient):
+        def get_price_history(self, token_id, interval="1h", fidelity=60):
+            base = [0.50, 0.52, 0.55, 0.53, 0.58]
+            offset = 0 if token_id == "yes-1" else 120
+            prices = base if token_id == "yes-1" else [1 - p for p in base]
+            return [{"t": 3600 * i + offset, "p": p} for i, p in enumerate(prices)]
+
+    engine = MarketComparisonEngine(gamma_client=FakeGammaClient(), clob_client=TimedCLOBClient())
+
+    pair = engine.compare(["bitcoin-100k", "bitcoin-90k"], hours=24)["pairwise"][0]
+
+    assert pair["aligned_points"] == 5
+    assert pair["history_correlation"] == -1.0
+
+
 def test_compare_requires_at_least_two_markets():
     engine = MarketComparisonEngine(gamma_client=FakeGammaClient(), clob_client=FakeCLOBClient())
 
@@ -0,0 +1,126 @@
+"""Tests for in-process TUI command dispatch"""
+
+from unittest.mock import patch
+
+import click
+import pytest
+
+from polyterm.api.gamma import GammaClient
+from polyterm.api.http_pool import shared_pool_enabled
+from polyterm.tui import dispatch
+from polyterm.tui.dispatch import get_app_context, run_command, should_isolate
+
+
+@pytest.fixture(autouse=True)
+def app_context(tmp_path):
+    dispatch._app_context = dispatch.AppContext(
+        config_path=str(tmp_path / "config.toml"),
+        db_path=str(tmp_path / "data.db"),
+    )
+    yield dispatch._app_context
+    dispatch.close_app_context()
+
+
+class TestRunCommand:
+    """Commands run inside the TUI process"""
+
+    def test_runs_command_in_process_and_captures_output(self):
+        with patch("polyterm.tui.dispatch.subprocess.run") as mock_run:
+            result = run_command(["glossary", "--search", "spread"], capture_output=True, text=True)
+
+        mock_run.assert_not_called()
+        assert result.returncode == 0
+        assert "Spread" in result.stdout
+
+    def test_usage_errors_return_exit_code(self):
+        result = run_command(["no-such-command"], capture_output=True, text=True)
+        assert result.returncode == 2
+        assert "No such command" in result.stderr
+
+    def test_commands_share_the_app_context(self):
+        seen = []
+
+        @click.command()
+        @click.pass_context
+        def probe(ctx):
+            seen.append(ctx.obj)
+
+        with patch("polyterm.cli.main.cli.get_command", return_value=probe):
+            run_command(["probe"])
+            run_command(["probe"])
+
+        assert seen[0]["app"] is seen[1]["app"] is get_app_context()
+        assert seen[0]["config"] is seen[1]["config"]
+
+    def test_commands_share_the_app_database(self, app_context):
+        seen = []
+
+        @click.command()
+        def probe():
+            from polyterm.cli.context import shared_database
+            from polyterm.db.database import Database
+
+            seen.append(shared_database(Database))
+
+        with patch("polyterm.cli.main.cli.get_command", return_value=probe):
+            run_command(["probe"])
+            run_command(["probe"])
+
+        assert seen[0] is seen[1] is app_context.database
+
+    def test_exceptions_become_a_failed_result(self):
+        @click.command()
+        def boom():
+            raise RuntimeError("kaboom")
+
+        with patch("polyterm.cli.main.cli.get_command", return_value=boom):
+            result = run_command(["boom"], capture_output=True, text=True)
+
+        assert result.returncode == 1
+        assert "kaboom" in result.stderr
+
+    def test_live_views_run_in_their_own_process(self):
+        assert should_isolate(["monitor"])
+        assert should_isolate(["orderbook", "abc", "--live"])
+        assert not should_isolate(["hot", "--gainers"])
+
+        with patch("polyterm.tui.dispatch.subprocess.run") as mock_run:
+            run_command(["watch", "--market", "abc"])
+
+        argv = mock_run.call_args[0][0]
+        assert argv[1:] == ["-m", "polyterm.cli.main", "watch", "--market", "abc"]
+
+
+class TestAppContext:
+    """Shared state across invocations"""
+
+    def test_api_clients_share_one_connection_pool(self):
+        assert shared_pool_enabled()
+        first, second = GammaClient(), GammaClient()
+        adapter = first.session.get_adapter("https://gamma-api.polymarket.com")
+
+        first.close()
+
+        assert second.session.get_adapter("https://clob.polymarket.com") is adapter
+
+    def test_config_reloads_after_the_file_changes(self, app_context):
+        config = app_context.config
+        assert app_context.config is config
+
+        config.set("display.refresh_rate", 7)
+        config.save()
+
+        assert app_context.config is not config
+        assert app_context.config.get("display.refresh_rate") == 7
+
+    def test_database_outside_the_tui_is_built_per_command(self, tmp_path):
+        from polyterm.cli.context import shared_database
+        from polyterm.db.database import Database
+
+        factory = lambda: Database(str(tmp_path / "own.db"))
+        assert shared_database(factory).db_path == tmp_path / "own.db"
+
+    def test_close_releases_the_pool(self):
+        dispatch.close_app_context()
+        assert not shared_pool_enabled()
+        assert GammaClient().session.get_adapter("https://x").__class__.__name__ == "HTTPAdapter"
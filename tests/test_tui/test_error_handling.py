@@ -205,11 +205,11 @@ class TestScreenErrorHandlingIntegration:
         assert args[2] == "market analytics"
 
     @patch('polyterm.tui.screens.predictions.handle_api_error')
-    @patch('polyterm.tui.screens.predictions.subprocess.run')
+    @patch('polyterm.tui.screens.predictions.run_command')
     def test_predictions_screen_calls_handle_api_error_on_failure(
         self, mock_run, mock_handle
     ):
-        """Predictions screen routes subprocess errors through handle_api_error"""
+        """Predictions screen routes command errors through handle_api_error"""
         from polyterm.tui.screens.predictions import predictions_screen
 
         mock_run.side_effect = Exception("Connection refused")
@@ -14,7 +14,7 @@ from polyterm.tui.screens import (
 )
 
 
-@patch('polyterm.tui.screens.monitor.subprocess.run')
+@patch('polyterm.tui.screens.monitor.run_command')
 def test_monitor_screen(mock_run):
     """Test monitor screen launches with parameters"""
     mock_console = Mock()
@@ -28,7 +28,7 @@ def test_monitor_screen(mock_run):
     assert mock_console.input.call_count == 4
 
 
-@patch('polyterm.tui.screens.whales.subprocess.run')
+@patch('polyterm.tui.screens.whales.run_command')
 def test_whales_screen(mock_run):
     """Test whales screen launches with parameters"""
     mock_console = Mock()
@@ -42,7 +42,7 @@ def test_whales_screen(mock_run):
     assert mock_console.input.call_count == 3
 
 
-@patch('polyterm.tui.screens.watch.subprocess.run')
+@patch('polyterm.tui.screens.watch.run_command')
 def test_watch_screen(mock_run):
     """Test watch screen launches with market ID"""
     mock_console = Mock()
@@ -116,7 +116,7 @@ def test_analytics_screen_coming_soon():
     assert any("coming soon" in str(call).lower() for call in calls)
 
 
-@patch('polyterm.tui.screens.portfolio.subprocess.run')
+@patch('polyterm.tui.screens.portfolio.run_command')
 def test_portfolio_screen(mock_run):
     """Test portfolio screen launches"""
     mock_console = Mock()
@@ -128,7 +128,7 @@ def test_portfolio_screen(mock_run):
     assert mock_console.print.call_count >= 2
 
 
-@patch('polyterm.tui.screens.export.subprocess.run')
+@patch('polyterm.tui.screens.export.run_command')
 def test_export_screen_json(mock_run):
     """Test export screen with JSON format"""
     mock_run.return_value = Mock(returncode=0, stderr="")
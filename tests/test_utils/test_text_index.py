@@ -0,0 +1,109 @@
+"""Tests for the shared inverted-index title matcher"""
+
+import random
+
+from polyterm.utils.text_index import MinHasher, TitleIndex, build_index, jaccard, tokenize
+
+
+class TestTokenize:
+    """Title normalisation"""
+
+    def test_lowercases_and_splits_on_punctuation(self):
+        assert tokenize("Will Bitcoin reach $100K?") == {"bitcoin", "reach", "100k"}
+
+    def test_min_length_drops_short_tokens(self):
+        assert tokenize("Fed cuts rates in June", min_length=4) == {"cuts", "rates", "june"}
+
+    def test_jaccard(self):
+        assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+        assert jaccard(set(), {"a"}) == 0.0
+
+
+class TestTitleIndex:
+    """Candidate generation and scoring"""
+
+    def _index(self):
+        return build_index([
+            ("btc", "Will Bitcoin reach $100k by 2025?"),
+            ("eth", "Will Ethereum reach $10k by 2025?"),
+            ("fed", "Will the Fed cut rates in March?"),
+            ("btc2", "Bitcoin above $100k on December 31?"),
+        ])
+
+    def test_candidates_share_a_token(self):
+        assert set(self._index().candidates("Bitcoin price")) == {"btc", "btc2"}
+
+    def test_stopword_only_overlap_is_not_a_candidate(self):
+        assert self._index().candidates("Will it be the one?") == {}
+
+    def test_prefix_filter_keeps_every_match_above_threshold(self):
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(60)]
+        docs = [(i, " ".join(rng.sample(vocab, rng.randint(3, 8)))) for i in range(300)]
+        index = build_index(docs)
+
+        for _, query in docs[:40]:
+            query_tokens = tokenize(query)
+            expected = {key for key, text in docs if jaccard(query_tokens, tokenize(text)) >= 0.5}
+            assert {key for key, _ in index.search(query, threshold=0.5)} == expected
+
+    def test_search_orders_best_first(self):
+        results = self._index().search("Bitcoin reach $100k", threshold=0.15)
+        assert [key for key, _ in results] == ["btc", "btc2", "eth"]
+        assert results[0][1] > results[1][1]
+
+    def test_similar_pairs_self_join(self):
+        pairs = self._index().similar_pairs(0.25)
+        assert [(a, b) for a, b, _ in pairs] == [("btc", "eth"), ("btc", "btc2")]
+
+    def test_idf_weighting_favours_rare_tokens(self):
+        index = build_index((i, f"trump news {i}") for i in range(20))
+        index.add("rare", "greenland purchase deal")
+
+        plain = index.search("greenland trump news", limit=1)
+        weighted = index.search("greenland trump news", limit=1, weighted=True)
+
+        assert index.idf("greenland") > index.idf("trump")
+        assert plain[0][0] == 0
+        assert weighted[0][0] == "rare"
+
+    def test_remove_and_replace(self):
+        index = self._index()
+        index.remove("btc")
+        index.add("fed", "Ethereum staking yields")
+        assert "btc" not in index
+        assert set(index.candidates("Ethereum")) == {"eth", "fed"}
+        assert index.document_frequency("rates") == 0
+
+    def test_similar_pairs_after_remove_keeps_later_keys_distinct(self):
+        index = build_index([
+            ("a", "Fed cuts rates"),
+            ("b", "Bitcoin hits 100k"),
+            ("c", "Ethereum hits 10k"),
+        ])
+        index.remove("a")
+        index.add("d", "Ethereum hits 10k again")
+
+        pairs = index.similar_pairs(0.5)
+
+        assert [(a, b) for a, b, _ in pairs] == [("c", "d")]
+
+
+class TestMinHash:
+    """Approximate LSH mode"""
+
+    def test_finds_near_duplicates(self):
+        index = TitleIndex(minhash_bands=16, minhash_rows=2)
+        index.add("a", "Will Bitcoin close above 100k on December 31 2025")
+        index.add("b", "Bitcoin close above 100k December 31 2025")
+        index.add("c", "Who wins the Super Bowl halftime coin toss")
+
+        results = dict(index.search("Will Bitcoin close above 100k on December 31 2025"))
+        assert "a" in results and "b" in results
+        assert "c" not in results
+
+    def test_signature_ignores_item_order(self):
+        hasher = MinHasher(bands=4, rows=2)
+
+        assert hasher.signature(["m1", "m2", "m3"]) == hasher.signature(["m3", "m1", "m2"])
+        assert len(hasher.band_keys(["m1"])) == 4
@@ -0,0 +1,66 @@
+"""Tests for time-series as-of joins"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from polyterm.utils.timeseries import align_values, asof_join
+
+
+LEFT = [(10, "a"), (20, "b"), (30, "c")]
+RIGHT = [(8, 1), (19, 2), (26, 3)]
+
+
+class TestAsofJoin:
+    """Direction, tolerance and ordering"""
+
+    def test_backward_takes_last_known_value(self):
+        assert asof_join(LEFT, RIGHT, direction="backward") == [
+            (10, "a", 1), (20, "b", 2), (30, "c", 3),
+        ]
+
+    def test_forward_takes_next_value(self):
+        assert asof_join(LEFT, RIGHT, direction="forward") == [
+            (10, "a", 2), (20, "b", 3),
+        ]
+
+    def test_nearest_prefers_earlier_on_ties(self):
+        assert asof_join([(5, "x")], [(3, 1), (7, 2)]) == [(5, "x", 1)]
+        assert asof_join(LEFT, RIGHT) == [(10, "a", 1), (20, "b", 2), (30, "c", 3)]
+
+    def test_exact_key_matches_in_every_direction(self):
+        for direction in ("backward", "forward", "nearest"):
+            assert asof_join([(19, "x")], RIGHT, direction=direction) == [(19, "x", 2)]
+
+    def test_tolerance_is_inclusive_and_drops_far_points(self):
+        assert asof_join(LEFT, RIGHT, tolerance=2) == [(10, "a", 1), (20, "b", 2)]
+
+    def test_exclusive_tolerance_drops_points_exactly_at_the_limit(self):
+        assert asof_join(LEFT, RIGHT, tolerance=1, inclusive=False) == []
+        assert asof_join(LEFT, RIGHT, tolerance=2, inclusive=False) == [(20, "b", 2)]
+
+    def test_datetime_keys_and_unsorted_input(self):
+        now = datetime(2026, 1, 1, 12, 0)
+        left = [(now + timedelta(minutes=10), 0.6), (now, 0.5)]
+        right = [(now + timedelta(minutes=4), 0.3)]
+        joined = asof_join(left, right, tolerance=timedelta(minutes=5))
+        assert joined == [(now, 0.5, 0.3)]
+
+    def test_empty_inputs_and_bad_direction(self):
+        assert asof_join([], RIGHT) == []
+        assert asof_join(LEFT, []) == []
+        with pytest.raises(ValueError):
+            asof_join(LEFT, RIGHT, direction="sideways")
+
+    def test_align_values_splits_columns(self):
+        assert align_values(LEFT, RIGHT, direction="backward") == (["a", "b", "c"], [1, 2, 3])
+
+    def test_72h_five_minute_pair_is_linear(self):
+        start = datetime(2026, 1, 1)
+        left = [(start + timedelta(minutes=5 * i), 0.5) for i in range(864)]
+        right = [(start + timedelta(minutes=5 * i, seconds=40), 0.4) for i in range(864)]
+        began = time.perf_counter()
+        joined = asof_join(left, right, tolerance=timedelta(minutes=15))
+        assert len(joined) == 864
+        assert time.perf_counter() - began < 0.05
@@ -33,13 +33,17 @@ class FakeDatabase:
     def get_large_trades(self, min_notional=10000, hours=24):
         return []
 
-    def insert_trade(self, trade):
-        self.trades.append(trade)
-        return len(self.trades)
+    def insert_trades_bulk(self, trades):
+        self.trades.extend(trades)
+        return {"inserted": len(trades), "duplicates": 0}
 
     def upsert_wallet(self, wallet):
         self.wallets.append(wallet)
 
+    def upsert_wallets_bulk(self, wallets):
+        self.wallets.extend(wallets)
+        return len(wallets)
+
     def get_smart_money_wallets(self, min_win_rate=0.70, min_trades=10):
         return [
             wallet
@@ -117,7 +121,7 @@ def test_live_whales_paginates_public_trades_until_limit_or_cutoff():
 
     result = engine.live_whales(min_notional=100_000, hours=72, limit=5, now=now, page_size=1000)
 
-    assert [call["offset"] for call in api.calls] == [0, 1000, 2000]
+    assert sorted(call["offset"] for call in api.calls) == [0, 1000, 2000]
     assert api.calls[0]["filter_type"] == "CASH"
     assert api.calls[0]["filter_amount"] == 100_000
     assert result["trade_count"] == 1
@@ -260,7 +264,7 @@ def test_whale_trades_scans_pages_and_ranks_by_notional_not_recency():
 
     result = engine.whale_trades(min_notional=10_000, hours=48, limit=2, sample_size=3000, now=now)
 
-    assert [call["offset"] for call in api.calls] == [0, 1000, 2000]
+    assert sorted(call["offset"] for call in api.calls) == [0, 1000, 2000]
     assert api.calls[0]["filter_type"] == "CASH"
     assert api.calls[0]["filter_amount"] == 10_000
     assert result["trades"][0]["wallet"] == "0xbig"
@@ -286,3 +290,39 @@ def test_whale_trades_reports_api_errors_and_window_limits():
     assert result["errors"] == [{"offset": 1000, "error": "timeout at offset 1000"}]
     assert "data_api_page_error" in result["quality_flags"]
     assert "data_api_recent_tape_window_limited" in result["quality_flags"]
+
+
+def test_live_whales_reuse_the_client_tape_for_wider_windows():
+    from polyterm.api.trade_tape import TradeTape
+
+    now = datetime(2026, 6, 2, 17, 0, 0, tzinfo=timezone.utc)
+    pages = {
+        0: [
+            {"proxyWallet": "0xaaa", "size": 200_000, "price": 1, "timestamp": int((now - timedelta(hours=h)).timestamp()), "transactionHash": f"0x{h}"}
+            for h in (1, 30)
+        ],
+        2: [
+            {"proxyWallet": "0xbbb", "size": 300_000, "price": 1, "timestamp": int((now - timedelta(hours=h)).timestamp()), "transactionHash": f"0x{h}"}
+            for h in (60, 90)
+        ],
+    }
+
+    class TapeDataAPI(FakeDataAPI):
+        def __init__(self, pages):
+            super().__init__(pages)
+            self.tape = TradeTape(self, refresh_seconds=0)
+
+        def trade_tape(self):
+            return self.tape
+
+    api = TapeDataAPI(pages)
+    engine = WalletIntelligence(data_api=api, database=FakeDatabase())
+
+    narrow = engine.live_whales(min_notional=100_000, hours=24, limit=5, now=now, page_size=2)
+    wide = engine.live_whales(min_notional=100_000, hours=72, limit=5, now=now, page_size=2)
+
+    assert narrow["trade_count"] == 1
+    assert wide["trade_count"] == 3
+    assert wide["tape_cached_rows"] == 2
+    # The second call re-checks the head, then resumes after the cached page
+    assert [call["offset"] for call in api.calls] == [0, 0, 2]